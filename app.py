@@ -19,15 +19,15 @@ _FST_DIR = os.path.join(_BASE_DIR, "turkmen-fst")
 if _FST_DIR not in sys.path:
     sys.path.insert(0, _FST_DIR)
 
-from turkmen_fst.lexicon import Lexicon
 from turkmen_fst.generator import MorphologicalGenerator
+from turkmen_fst.paradigm import ParadigmCache
+from turkmen_fst.preload import shared_lexicon, warm
 
-# Global generator instance
-_lexicon = Lexicon()
-_dict_path = os.path.join(_FST_DIR, "data", "turkmence_sozluk.txt")
-if os.path.exists(_dict_path):
-    _lexicon.load(_dict_path)
+# Global generator instance (sözlük parser.py ile paylaşılır; gunicorn
+# önyüklemesi için bkz. gunicorn.conf.py)
+_lexicon = shared_lexicon()
 _generator = MorphologicalGenerator(_lexicon)
+_paradigms = ParadigmCache(_generator)
 
 app = Flask(__name__)
 
@@ -211,13 +211,13 @@ def _build_paradigma(stem, ptype):
         poss_codes_sg = [None, "A1", "A2", "A3"]
         poss_codes_pl = [None, "B1", "B2", "A3"]
 
+        table = _paradigms.noun(s)
+
         def gen_row(plural, case, poss_codes):
             code, name = CASE_NAMES[case]
             row = {"code": code, "name": name, "forms": []}
             for poss in poss_codes:
-                r = _generator.generate_noun(s, plural=plural,
-                                              possessive=poss, case=case)
-                row["forms"].append(r.word if r.is_valid else "—")
+                row["forms"].append(table.form(plural, poss, case) or "—")
             return row
 
         return {
@@ -231,16 +231,15 @@ def _build_paradigma(stem, ptype):
 
     def _build_verb(s):
         persons = ["A1", "A2", "A3", "B1", "B2", "B3"]
+        table = _paradigms.verb(s)
         tenses = []
         for t_code in ["1", "2", "3", "4", "5", "6", "7"]:
             rows = []
             for p_code in persons:
-                pos_r = _generator.generate_verb(s, t_code, p_code, negative=False)
-                neg_r = _generator.generate_verb(s, t_code, p_code, negative=True)
                 rows.append({
                     "person": PERSON_NAMES[p_code],
-                    "positive": pos_r.word if pos_r.is_valid else "—",
-                    "negative": neg_r.word if neg_r.is_valid else "—",
+                    "positive": table.form(t_code, p_code, False) or "—",
+                    "negative": table.form(t_code, p_code, True) or "—",
                 })
             tenses.append({
                 "code": t_code,
@@ -288,7 +287,26 @@ def _build_paradigma(stem, ptype):
 # ==============================================================================
 
 from turkmen_fst.analyzer import MorphologicalAnalyzer
-_analyzer = MorphologicalAnalyzer(_lexicon)
+from turkmen_fst.cache import AnalysisCache
+from turkmen_fst.fuzzy import SymSpellIndex, MAX_DISTANCE
+from turkmen_fst.known_forms import KnownForms
+from turkmen_fst.suggest import SuggestionEngine
+_analysis_cache = AnalysisCache(maxsize=16384, max_bytes=64 * 1024 * 1024)
+_analyzer = MorphologicalAnalyzer(_lexicon, cache=_analysis_cache)
+
+# Yazım denetiminin bilinen form kümesi (python -m turkmen_fst index --pos known)
+_known_forms_path = os.environ.get("TURKMEN_FST_KNOWN_FORMS", "")
+if _known_forms_path:
+    _analyzer.known_forms = KnownForms.load(_known_forms_path, _lexicon)
+
+# Uzun ömürlü süreçte (python app.py) sözlüğe bağlı yapılar ilk istekten
+# önce kurulabilir (TURKMEN_FST_WARM=1; soğuk ilk yazım denetimi ~7 sn).
+# Varsayılan kapalı: vercel'de her soğuk başlangıç yalnızca hazır snapshot'ı
+# eşler, yapılar gerektikçe kurulur. gunicorn'da when_ready'deki preload()
+# bunları ana süreçte kurar.
+if os.environ.get("TURKMEN_FST_WARM", "") == "1":
+    warm(_lexicon)
+    _analyzer.prepare()
 
 # Tokenizer
 _WORD_RE = re.compile(r"[a-zA-ZçÇäÄöÖüÜňŇýÝşŞžŽîÎ'-]+", re.UNICODE)
@@ -312,6 +330,9 @@ def _edit_distance(a, b):
     return prev[-1]
 
 def _find_similar_roots(word, max_distance=2, max_results=10):
+    if max_distance <= MAX_DISTANCE:
+        index = SymSpellIndex.for_lexicon(_lexicon)
+        return [key for _, key in index.lookup(word, max_distance, max_results)]
     w = word.lower()
     wlen = len(w)
     candidates = []
@@ -328,7 +349,7 @@ def _generate_suggestions(wrong_word, max_suggestions=5):
     multi = _analyzer.parse(wrong_word)
     if multi.success and any(r.word_type != "unknown" for r in multi.results):
         return []
-    return _find_similar_roots(wrong_word, max_distance=2, max_results=max_suggestions)
+    return SuggestionEngine(_analyzer).suggest(wrong_word, max_suggestions)
 
 def _format_morphemes(morphemes, possessive=None):
     result = []
@@ -351,7 +372,9 @@ def _format_morphemes(morphemes, possessive=None):
 def api_health():
     """API sağlık kontrolü."""
     entries = len(_lexicon._entries) if hasattr(_lexicon, '_entries') else 0
-    return jsonify({"status": "ok", "lexicon_entries": entries})
+    return jsonify({"status": "ok", "lexicon_entries": entries,
+                    "analysis_cache": _analysis_cache.stats(),
+                    "paradigm_cache": _paradigms.stats()})
 
 
 @app.route('/api/generate/noun', methods=['POST'])
@@ -501,23 +524,34 @@ def api_lexicon(word):
 
 @app.route('/api/spellcheck', methods=['POST'])
 def api_spellcheck():
-    """Yazım denetimi API endpoint'i."""
+    """
+    Yazım denetimi API endpoint'i.
+
+    Doğruluk is_known() ile denetlenir; doğru kelimelerin çözümlemesi
+    yalnızca "include_analysis": true ile tam parse() yapılarak döner.
+    """
     data = request.get_json(silent=True) or {}
     text = data.get("text", "").strip()
     if not text:
         return jsonify({"error": "text alanı zorunludur"}), 400
+    include_analysis = bool(data.get("include_analysis", False))
 
     tokens = _tokenize(text)
     results = []
     error_count = 0
 
-    for tok in tokens:
+    if include_analysis:
+        multis = _analyzer.parse_many(tok["word"] for tok in tokens)
+    else:
+        multis = [None] * len(tokens)
+    for tok, multi in zip(tokens, multis):
         w = tok["word"]
-        multi = _analyzer.parse(w)
         is_correct = False
         analysis_str = None
 
-        if multi.success and multi.results:
+        if multi is None:
+            is_correct = _analyzer.is_known(w)
+        elif multi.success and multi.results:
             for r in multi.results:
                 if r.word_type != "unknown":
                     is_correct = True
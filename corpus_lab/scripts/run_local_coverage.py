@@ -5,10 +5,21 @@ Local Corpus Coverage Test — yerel metbugat_corpus.txt üzerinden çalışır.
 
 Büyük corpus'u rastgele örnekleyerek (veya ilk N kelime) hızlı coverage ölçer.
 Kategorize edilmiş hata raporu üretir.
+
+Kullanım:
+    python corpus_lab/scripts/run_local_coverage.py [--file X] [--sample N] [--workers N]
+
+--workers N: type'ları N süreçlik havuza paylaştırır (0 → CPU sayısı).
+Sonuçlar seri çalışmayla birebir aynıdır.
+
+Corpus satır satır okunur; token listesi belleğe alınmaz. --sample N
+tek geçişli reservoir örnekleme kullanır (tohum 42, aynı corpus → aynı örnek).
 """
 
 import json
+import multiprocessing
 import os
+import random
 import re
 import sys
 import time
@@ -63,7 +74,21 @@ def _build_two_letter_whitelist(lexicon: Lexicon | None = None):
                 _TWO_LETTER_WHITELIST.add(e.word.lower())
 
 
+# Corpus dosyasındaki makale ayırıcıları
+ARTICLE_HEADER_RE = re.compile(r"=== ARTICLE \d+ ===")
+
+# --sample için reservoir örnekleme tohumu
+SAMPLE_SEED = 42
+
+
 def tokenize(text: str) -> list[str]:
+    tokens, ordinals = _tokenize(text)
+    tokens.extend(ordinals)
+    return tokens
+
+
+def _tokenize(text: str) -> tuple[list[str], list[str]]:
+    """Kelime token'ları ve sıra sayıları (ayrı listeler)."""
     tokens = []
 
     # 0. Soft-hyphen (U+00AD) temizle — corpus'ta 47K+ görünmez kesme işareti var
@@ -113,9 +138,47 @@ def tokenize(text: str) -> list[str]:
         if len(w_lower) >= 3 or w_lower in _TWO_LETTER_WHITELIST:
             tokens.append(w_lower)
 
-    # Sıra sayılarını ayrı token olarak ekle
-    tokens.extend(ordinals_found)
-    return tokens
+    return tokens, ordinals_found
+
+
+def iter_corpus_tokens(corpus_path: str):
+    """
+    Corpus'u satır satır okuyup token üretir; metin ve token listesi
+    belleğe alınmaz. Makale başlıkları (=== ARTICLE n ===) atlanır.
+
+    Sıra sayıları, tüm metni tek seferde tokenize() etmekle aynı sırayı
+    vermek için sona bırakılır (corpus'ta az sayıdadır).
+    """
+    ordinals = []
+    with open(corpus_path, "r", encoding="utf-8") as f:
+        for line in f:
+            tokens, found = _tokenize(ARTICLE_HEADER_RE.sub("", line))
+            yield from tokens
+            ordinals.extend(found)
+    yield from ordinals
+
+
+def reservoir_sample(tokens, k: int, seed: int = SAMPLE_SEED) -> tuple[list[str], int]:
+    """
+    Tek geçişte k token'lık düzgün örnek (Algorithm R).
+
+    Returns:
+        (örnek, toplam token sayısı) — örnek corpus sırasıyla; toplam ≤ k
+        ise tüm token'lar
+    """
+    rng = random.Random(seed)
+    reservoir: list[tuple[int, str]] = []
+    count = 0
+    for token in tokens:
+        if count < k:
+            reservoir.append((count, token))
+        else:
+            j = rng.randrange(count + 1)
+            if j < k:
+                reservoir[j] = (count, token)
+        count += 1
+    reservoir.sort()
+    return [token for _, token in reservoir], count
 
 
 # ==============================================================================
@@ -203,14 +266,106 @@ def categorize_unrecognized(word: str) -> str:
     return "diger"
 
 
+# ==============================================================================
+#  Type analizi (seri / paralel)
+# ==============================================================================
+
+# İşçi başına gönderilen type sayısı
+CHUNK_SIZE = 500
+
+# İşçi süreçteki analizör: fork ile ana süreçten miras alınır; fork yoksa
+# _init_worker() sözlüğü (varsa snapshot'tan) süreç başına bir kez yükler.
+_WORKER_ANALYZER: MorphologicalAnalyzer | None = None
+
+
+def _summarize(result) -> dict | None:
+    """İlk çözümleme bilinen bir türse özetini, değilse None döndürür."""
+    first = result.results[0] if result.results else None
+    if first and first.word_type != "unknown":
+        return {
+            "word_type": first.word_type,
+            "stem": first.stem,
+            "breakdown": first.breakdown,
+        }
+    return None
+
+
+def _init_worker(dict_path: str):
+    global _WORKER_ANALYZER
+    if _WORKER_ANALYZER is None:
+        lexicon = Lexicon()
+        if os.path.exists(dict_path):
+            lexicon.load(dict_path, use_snapshot=True)
+        _WORKER_ANALYZER = MorphologicalAnalyzer(lexicon)
+
+
+def _analyze_chunk(words: list[str]) -> tuple[int, float, list]:
+    start = time.perf_counter()
+    analyses = [_summarize(r) for r in _WORKER_ANALYZER.parse_many(words)]
+    return os.getpid(), time.perf_counter() - start, analyses
+
+
+def analyze_types(words: list[str], analyzer: MorphologicalAnalyzer,
+                  dict_path: str, workers: int = 1) -> tuple[list, list[dict]]:
+    """
+    Type'ları seri veya `workers` süreçle analiz eder.
+
+    Returns:
+        (analizler, işçi istatistikleri) — analizler `words` ile aynı sırada;
+        istatistikler işçi başına {"worker", "types", "busy_s", "types_per_s"}
+    """
+    stats: dict[int, list] = {}
+    analyses: list = []
+    total = len(words)
+
+    def _progress(before: int):
+        if len(analyses) // 1000 > before // 1000:
+            done = len(analyses)
+            print(f"  {done:,}/{total:,} type ({done / total * 100:.0f}%)...")
+
+    if workers <= 1:
+        start = time.perf_counter()
+        for result in analyzer.iter_parse(words):
+            analyses.append(_summarize(result))
+            _progress(len(analyses) - 1)
+        stats[os.getpid()] = [total, time.perf_counter() - start]
+    else:
+        global _WORKER_ANALYZER
+        _WORKER_ANALYZER = analyzer  # fork ile işçilere miras kalır
+        if analyzer.lexicon:
+            analyzer.stem_trie  # kök trie'si fork öncesi bir kez kurulur
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        # Küçük girdilerde de her işçiye birkaç parça düşsün
+        size = max(1, min(CHUNK_SIZE, -(-total // (workers * 4))))
+        chunks = [words[i:i + size] for i in range(0, total, size)]
+        with ctx.Pool(workers, initializer=_init_worker, initargs=(dict_path,)) as pool:
+            # imap sırayı korur → birleşik sonuç seri çalışmayla aynı
+            for chunk, (pid, busy, part) in zip(chunks, pool.imap(_analyze_chunk, chunks)):
+                entry = stats.setdefault(pid, [0, 0.0])
+                entry[0] += len(chunk)
+                entry[1] += busy
+                before = len(analyses)
+                analyses.extend(part)
+                _progress(before)
+
+    worker_stats = [
+        {"worker": i, "types": n, "busy_s": round(busy, 2),
+         "types_per_s": round(n / busy, 1) if busy > 0 else 0.0}
+        for i, (n, busy) in enumerate(stats.values(), 1)
+    ]
+    return analyses, worker_stats
+
+
 # ==============================================================================
 #  Ana analiz
 # ==============================================================================
 
-def run_coverage(corpus_path: str, sample_size: int = 0):
+def run_coverage(corpus_path: str, sample_size: int = 0, workers: int = 1):
     """
     Corpus dosyasından coverage testi yap.
     sample_size=0 → tüm corpus
+    workers>1 → type'lar süreç havuzunda analiz edilir (sonuç aynı)
     """
     print("=" * 70)
     print("  TurkmenFST — Local Corpus Coverage Test")
@@ -229,60 +384,45 @@ def run_coverage(corpus_path: str, sample_size: int = 0):
         print(f"  UYARI: Sözlük bulunamadı: {dict_path}")
     analyzer = MorphologicalAnalyzer(lexicon)
 
-    # 2. Corpus oku
+    # 2-3. Corpus'u akış halinde oku ve tokenize et
     print(f"\n[2/4] Corpus okunuyor: {corpus_path}")
-    with open(corpus_path, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    # Makale başlıklarını temizle
-    text = re.sub(r"=== ARTICLE \d+ ===", "", text)
-
-    # 3. Tokenize
-    print(f"\n[3/4] Tokenize ediliyor...")
-    all_tokens = tokenize(text)
-    print(f"  Toplam token: {len(all_tokens):,}")
-
-    if sample_size > 0 and sample_size < len(all_tokens):
-        import random
-        random.seed(42)
-        tokens = random.sample(all_tokens, sample_size)
-        print(f"  Örnekleme: {sample_size:,} token")
+    print(f"\n[3/4] Tokenize ediliyor (akış)...")
+    tokens = iter_corpus_tokens(corpus_path)
+
+    if sample_size > 0:
+        sample, corpus_words = reservoir_sample(tokens, sample_size)
+        type_counter = Counter(sample)
+        total_tokens = len(sample)
+        print(f"  Toplam token: {corpus_words:,}")
+        if sample_size < corpus_words:
+            print(f"  Örnekleme: {sample_size:,} token (reservoir, tohum {SAMPLE_SEED})")
+        else:
+            print(f"  Tüm corpus kullanılıyor")
     else:
-        tokens = all_tokens
+        type_counter = Counter(tokens)
+        total_tokens = corpus_words = sum(type_counter.values())
+        print(f"  Toplam token: {corpus_words:,}")
         print(f"  Tüm corpus kullanılıyor")
 
-    type_counter = Counter(tokens)
-    total_tokens = len(tokens)
     total_types = len(type_counter)
     print(f"  Benzersiz form (type): {total_types:,}")
 
     # 4. Analiz
-    print(f"\n[4/4] Morfolojik analiz...")
+    print(f"\n[4/4] Morfolojik analiz..." + (f" ({workers} işçi)" if workers > 1 else ""))
     start_time = time.time()
 
     recognized_types = {}
     unrecognized_types = {}
 
-    done = 0
-    for word, count in type_counter.items():
-        result = analyzer.parse(word)
-        first = result.results[0] if result.results else None
-
-        if first and first.word_type != "unknown":
-            recognized_types[word] = {
-                "count": count,
-                "word_type": first.word_type,
-                "stem": first.stem,
-                "breakdown": first.breakdown,
-            }
+    words = list(type_counter)
+    analyses, worker_stats = analyze_types(words, analyzer, dict_path, workers)
+    for word, analysis in zip(words, analyses):
+        count = type_counter[word]
+        if analysis is not None:
+            recognized_types[word] = {"count": count, **analysis}
         else:
             unrecognized_types[word] = count
 
-        done += 1
-        if done % 1000 == 0:
-            pct = done / total_types * 100
-            print(f"  {done:,}/{total_types:,} type ({pct:.0f}%)...")
-
     elapsed = time.time() - start_time
 
     # Token-level
@@ -315,6 +455,11 @@ def run_coverage(corpus_path: str, sample_size: int = 0):
     print("=" * 70)
     print(f"\n  Corpus: {os.path.basename(corpus_path)}")
     print(f"  Analiz süresi: {elapsed:.1f}s ({total_types / elapsed:.0f} type/s)")
+    if workers > 1:
+        print(f"\n  İŞÇİ BAŞINA HIZ ({workers} işçi):")
+        for ws in worker_stats:
+            print(f"    işçi {ws['worker']:2d}: {ws['types']:>7,} type  "
+                  f"{ws['busy_s']:>7.1f}s  {ws['types_per_s']:>7.1f} type/s")
 
     print(f"\n  TOKEN-LEVEL COVERAGE:")
     print(f"    Toplam:     {total_tokens:>10,}")
@@ -356,8 +501,14 @@ def run_coverage(corpus_path: str, sample_size: int = 0):
     output = {
         "test_date": datetime.now().isoformat(),
         "corpus_file": os.path.basename(corpus_path),
-        "total_corpus_words": len(all_tokens),
-        "sample_size": len(tokens),
+        "total_corpus_words": corpus_words,
+        "sample_size": total_tokens,
+        "analysis": {
+            "workers": max(workers, 1),
+            "elapsed_s": round(elapsed, 2),
+            "types_per_s": round(total_types / elapsed, 1) if elapsed > 0 else 0.0,
+            "per_worker": worker_stats,
+        },
         "results": {
             "total_tokens": total_tokens,
             "total_types": total_types,
@@ -397,14 +548,17 @@ if __name__ == "__main__":
     corpus_path = os.path.join(_SCRIPT_DIR, "..", "data", "metbugat_corpus.txt")
 
     sample = 0  # varsayılan: tamamı
+    workers = 1  # varsayılan: seri
     for i, arg in enumerate(sys.argv[1:]):
         if arg == "--sample" and i + 1 < len(sys.argv[1:]):
             sample = int(sys.argv[i + 2])
         elif arg == "--file" and i + 1 < len(sys.argv[1:]):
             corpus_path = sys.argv[i + 2]
+        elif arg == "--workers" and i + 1 < len(sys.argv[1:]):
+            workers = int(sys.argv[i + 2]) or (os.cpu_count() or 1)
 
     if not os.path.exists(corpus_path):
         print(f"HATA: Corpus dosyası bulunamadı: {corpus_path}")
         sys.exit(1)
 
-    run_coverage(corpus_path, sample_size=sample)
+    run_coverage(corpus_path, sample_size=sample, workers=workers)
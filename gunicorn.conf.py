@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+gunicorn yapılandırması — Flask uygulaması (app.py)
+
+    gunicorn app:app            # bu dosya çalışma dizininden otomatik okunur
+
+Uygulama ana süreçte bir kez yüklenir; sözlük ve türetilmiş yapılar
+işçiler fork edilmeden önce kurulur (bkz. turkmen-fst/turkmen_fst/preload.py).
+İşçi eklemek belleği çoğaltmaz, yeniden başlayan işçi hemen hazırdır.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "turkmen-fst"))
+
+from turkmen_fst.preload import when_ready, pre_fork  # noqa: E402,F401
+
+preload_app = True
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("GUNICORN_WORKERS", "2"))
@@ -16,8 +16,8 @@ _FST_DIR = os.path.join(_BASE_DIR, "turkmen-fst")
 if _FST_DIR not in sys.path:
     sys.path.insert(0, _FST_DIR)
 
-from turkmen_fst.lexicon import Lexicon
 from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.preload import shared_lexicon
 
 # ===== GLOBAL MOTOR =====
 _lexicon = None
@@ -25,12 +25,10 @@ _analyzer = None
 
 
 def _get_analyzer():
-    """Tek seferlik sözlük yükleme ve analyzer oluşturma."""
+    """Tek seferlik analyzer oluşturma (sözlük app.py ile paylaşılır)."""
     global _lexicon, _analyzer
     if _analyzer is None:
-        _lexicon = Lexicon()
-        dict_path = os.path.join(_FST_DIR, "data", "turkmence_sozluk.txt")
-        _lexicon.load(dict_path)
+        _lexicon = shared_lexicon()
         _analyzer = MorphologicalAnalyzer(_lexicon)
     return _analyzer
 
@@ -170,9 +168,12 @@ def parse_cumle(metin):
             "tokenlar": [{"kelime": metin, "sonuc": sonuc}]
         }
     
-    # ── Fallback: token-by-token çözümleme ──
+    # ── Fallback: token-by-token çözümleme (toplu analiz) ──
     tokenlar = []
     any_success = False
+    cozulecek = [t for t in tokens
+                 if t.lower() not in _OLUMSUZ_PARCACIKLARI and t.lower() not in _ZAMIRLER]
+    analizler = dict(zip(cozulecek, analyzer.parse_many(cozulecek)))
     for token in tokens:
         t_lower = token.lower()
         if t_lower in _OLUMSUZ_PARCACIKLARI:
@@ -194,7 +195,7 @@ def parse_cumle(metin):
                 "tur": "zamyr"
             }
         else:
-            sonuc = parse_kelime(token)
+            sonuc = _kelime_sonucu(token, analizler[token])
         
         if sonuc.get("basarili"):
             any_success = True
@@ -238,8 +239,11 @@ def parse_kelime(kelime):
         }
     
     analyzer = _get_analyzer()
-    multi = analyzer.parse(kelime)
-    
+    return _kelime_sonucu(kelime, analyzer.parse(kelime))
+
+
+def _kelime_sonucu(kelime, multi):
+    """parse_kelime() gövdesi: hazır analiz sonucunu şablon formatına çevirir."""
     if multi.success and multi.results:
         # En iyi sonucu seç: ek sayısı fazla olan önce, sonra isim tercih et
         best = multi.results[0]
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""
+gunicorn yapılandırması — FastAPI uygulaması (turkmen_fst/api.py)
+
+    gunicorn turkmen_fst.api:app    # turkmen-fst/ dizininden
+
+Uygulama ana süreçte bir kez yüklenir; sözlük ve türetilmiş yapılar
+işçiler fork edilmeden önce kurulur (bkz. turkmen_fst/preload.py).
+İşçi eklemek belleği çoğaltmaz, yeniden başlayan işçi hemen hazırdır.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from turkmen_fst.preload import when_ready, pre_fork  # noqa: E402,F401
+
+preload_app = True
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", "2"))
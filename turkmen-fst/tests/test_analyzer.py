@@ -5,6 +5,8 @@ TurkmenFST — Analiz (Ayrıştırma) Testleri
 İsim ve fiil çözümleme testleri.
 parse_noun() → list[AnalysisResult]
 parse()      → MultiAnalysisResult (çoklu sonuç)
+
+Tüm testler hem MorphologicalAnalyzer hem FSTAnalyzer ile çalışır.
 """
 
 import sys
@@ -13,19 +15,22 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import pytest
 from turkmen_fst.analyzer import MorphologicalAnalyzer, AnalysisResult, MultiAnalysisResult
+from turkmen_fst.fst import FSTAnalyzer
 from turkmen_fst.lexicon import Lexicon
 
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
 
 
-@pytest.fixture(scope="module")
-def analyzer():
-    """Sözlük yüklü analiz motoru."""
+@pytest.fixture(scope="module", params=["generator", "fst"])
+def analyzer(request):
+    """Sözlük yüklü analiz motoru (generate-and-compare veya FST)."""
     lexicon = Lexicon()
     dict_path = os.path.join(DATA_DIR, "turkmence_sozluk.txt")
     if os.path.exists(dict_path):
         lexicon.load(dict_path)
+    if request.param == "fst":
+        return FSTAnalyzer(lexicon)
     return MorphologicalAnalyzer(lexicon)
 
 
@@ -126,6 +131,21 @@ class TestVerbAnalysis:
         assert len(results) == 0
 
 
+class TestMultiWordVerb:
+    """Zamir + fiil (+ däl) girişleri: parse() her çözümlemeyi döndürür."""
+
+    def test_negative_copula_keeps_all(self, analyzer):
+        breakdowns = [r.breakdown for r in analyzer.parse("men geljek däl").results]
+        assert "Gel (Kök) + jek (G1) + däl (Olumsuz)" in breakdowns
+        assert "Gel (Kök) + jek (G1)" in breakdowns
+
+    @pytest.mark.parametrize("phrase", ["biz geljek däl", "sen aljak däl", "olar görjek däl"])
+    def test_parse_verb_not_truncated(self, analyzer, phrase):
+        if not hasattr(analyzer, "parse_verb"):
+            pytest.skip("parse_verb yok")
+        assert len(analyzer.parse_verb(phrase)) == 2
+
+
 class TestAutoDetect:
     """Otomatik tür algılama testi."""
 
@@ -198,3 +218,32 @@ class TestMultiResult:
         assert hasattr(multi, 'success')
         assert hasattr(multi, 'original')
         assert multi.original == "kitap"
+
+
+class TestParseMany:
+    """Toplu analiz: parse_many() / iter_parse()."""
+
+    WORDS = ["kitabym", " Kitabym", "geldim", "kitabym", "KITAPLAR", "qqq", "", "BMG-niň"]
+
+    def test_same_as_parse(self, analyzer):
+        assert analyzer.parse_many(self.WORDS) == [analyzer.parse(w) for w in self.WORDS]
+
+    def test_input_order_and_spelling(self, analyzer):
+        multis = analyzer.parse_many(self.WORDS)
+        assert [m.original for m in multis] == [w.strip() for w in self.WORDS]
+
+    def test_streaming(self, analyzer):
+        """Sonsuz girişten de ilk sonuçlar alınabilir (pencere kadar bellek)."""
+        import itertools
+
+        def words():
+            while True:
+                yield "kitap"
+
+        stream = analyzer.iter_parse(words(), chunk_size=8)
+        assert len(list(itertools.islice(stream, 20))) == 20
+        stream.close()
+
+    def test_process_pool(self, analyzer):
+        words = self.WORDS * 3
+        assert analyzer.parse_many(words, workers=2) == [analyzer.parse(w) for w in words]
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — API Yardımcıları Testleri
+
+FastAPI'ye bağlı olmayan yardımcılar: artımlı tokenizer'ların tek
+seferlik tokenize() ile aynı sonucu vermesi ve akış satır biçimi.
+FastAPI kuruluysa /analyze/stream uç noktası TestClient ile, ilk satırın
+gövde bitmeden yazılması ise doğrudan ASGI çağrısıyla denetlenir.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import asyncio
+import json
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.api import (
+    HAS_FASTAPI, tokenize, IncrementalTokenizer, NDJSONTokenizer, _stream_record
+)
+
+
+TEXT = "Men kitabymy okadym, Hem-de mekdebe gitdim. BMG-niň ýygnagy... ýedinji"
+
+
+def _feed_all(tokenizer, chunks):
+    tokens = []
+    for chunk in chunks:
+        tokens.extend(tokenizer.feed(chunk))
+    return tokens + tokenizer.close()
+
+
+class TestIncrementalTokenizer:
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+    def test_same_as_tokenize(self, size):
+        chunks = [TEXT[i:i + size] for i in range(0, len(TEXT), size)]
+        assert _feed_all(IncrementalTokenizer(), chunks) == tokenize(TEXT)
+
+    def test_offsets(self):
+        for tok in _feed_all(IncrementalTokenizer(), [TEXT[:10], TEXT[10:]]):
+            assert TEXT[tok["start"]:tok["end"]] == tok["word"]
+
+
+class TestNDJSONTokenizer:
+
+    def test_lines(self):
+        body = '{"text": "kitabym okadym"}\n"mekdep"\n\n{"text": "gel'
+        tokenizer = NDJSONTokenizer()
+        tokens = _feed_all(tokenizer, [body[:5], body[5:], 'dim"}'])
+        assert [(t["line"], t["word"]) for t in tokens] == [
+            (0, "kitabym"), (0, "okadym"), (1, "mekdep"), (3, "geldim")]
+        assert tokens[1]["start"] == 8
+
+    def test_invalid_line(self):
+        tokens = _feed_all(NDJSONTokenizer(), ['{"text": 5}\n', 'not json\n'])
+        assert [t["line"] for t in tokens] == [0, 1]
+        assert all("error" in t for t in tokens)
+
+
+def test_stream_record():
+    token = {"word": "kitabym", "start": 0, "end": 7}
+    multi = MorphologicalAnalyzer().parse("kitabym")
+    record = json.loads(_stream_record(token, multi))
+    assert record["word"] == "kitabym"
+    assert record["count"] == multi.count == len(record["results"])
+
+
+@pytest.fixture(scope="module")
+def client():
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+    from turkmen_fst.api import app
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _lines(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.skipif(not HAS_FASTAPI, reason="fastapi kurulu değil")
+class TestAnalyzeStream:
+    """/analyze/stream: kelime başına bir JSON satırı."""
+
+    def test_text_body(self, client):
+        response = client.post("/analyze/stream", content=TEXT.encode("utf-8"),
+                               headers={"content-type": "text/plain; charset=utf-8"})
+        records = _lines(response)
+        assert [r["word"] for r in records] == [t["word"] for t in tokenize(TEXT)]
+        assert records[1]["success"] and records[1]["count"] == len(records[1]["results"])
+
+    def test_chunked_body(self, client):
+        data = TEXT.encode("utf-8")
+        chunks = (data[i:i + 5] for i in range(0, len(data), 5))
+        response = client.post("/analyze/stream", content=chunks,
+                               headers={"content-type": "text/plain"})
+        assert [r["word"] for r in _lines(response)] == [t["word"] for t in tokenize(TEXT)]
+
+    def test_ndjson_body(self, client):
+        body = '{"text": "kitabym okadym"}\n"mekdep"\nnot json\n'
+        response = client.post("/analyze/stream", content=body.encode("utf-8"),
+                               headers={"content-type": "application/x-ndjson"})
+        records = _lines(response)
+        assert [(r["line"], r.get("word")) for r in records] == [
+            (0, "kitabym"), (0, "okadym"), (1, "mekdep"), (2, None)]
+        assert "error" in records[-1]
+
+    def test_empty_body(self, client):
+        response = client.post("/analyze/stream", content=b"",
+                               headers={"content-type": "text/plain"})
+        assert _lines(response) == []
+
+    @pytest.mark.parametrize("spec_version", ["2.3", "2.4"])
+    def test_first_line_before_body_ends(self, client, spec_version):
+        """Gövdenin ikinci parçası ancak ilk satır yazıldıktan sonra gönderilir."""
+        from turkmen_fst.api import app
+        chunks = [b"kitabym okadym ", b"mekdebe"]
+        body = []
+
+        async def run():
+            first_line = asyncio.Event()
+
+            async def receive():
+                if chunks:
+                    if len(chunks) == 1:
+                        await asyncio.wait_for(first_line.wait(), 5)
+                    chunk = chunks.pop(0)
+                    return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+                await asyncio.Event().wait()  # istemci bağlı kalır
+
+            async def send(message):
+                if message["type"] == "http.response.body" and message["body"]:
+                    body.append(message["body"])
+                    first_line.set()
+
+            scope = {
+                "type": "http", "asgi": {"version": "3.0", "spec_version": spec_version},
+                "http_version": "1.1", "method": "POST", "scheme": "http",
+                "path": "/analyze/stream", "raw_path": b"/analyze/stream",
+                "query_string": b"", "root_path": "", "client": ("test", 1),
+                "server": ("test", 80), "headers": [(b"content-type", b"text/plain")],
+            }
+            await asyncio.wait_for(app(scope, receive, send), 10)
+
+        asyncio.run(run())
+        records = [json.loads(line) for line in b"".join(body).decode("utf-8").splitlines()]
+        assert [r["word"] for r in records] == ["kitabym", "okadym", "mekdebe"]
+
+
+@pytest.mark.skipif(not HAS_FASTAPI, reason="fastapi kurulu değil")
+def test_startup_warms_lexicon():
+    """Paylaşılan yapılar ilk istekten önce, uygulama açılışında kurulur."""
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+    from turkmen_fst import api, fuzzy, stem_trie, suggest, tail_automaton
+    modules = (stem_trie, tail_automaton, fuzzy, suggest)
+    for module in modules:
+        module._SHARED.pop(api._lexicon, None)
+    with TestClient(api.app):
+        assert all(api._lexicon in module._SHARED for module in modules)
+
+
+@pytest.mark.skipif(not HAS_FASTAPI, reason="fastapi kurulu değil")
+class TestShadowEndpoints:
+    """Gölge mod isteğe hizmet eden yolu denetler; canlı önbelleği bozmaz."""
+
+    @pytest.fixture
+    def shadow(self, client, monkeypatch):
+        from turkmen_fst import api
+        from turkmen_fst.shadow import ShadowChecker
+        checker = ShadowChecker(api._analyzer, sample_rate=1.0)
+        monkeypatch.setattr(api, "_shadow", checker)
+        return checker
+
+    def test_spellcheck_known(self, client, shadow):
+        from turkmen_fst import api
+        cached = len(api._analysis_cache)
+        response = client.post("/spellcheck", json={"text": "mekdepdäki qqqz Mekdepdäki"})
+        assert response.status_code == 200
+        shadow.join()
+        stats = shadow.stats()
+        assert stats["checks"]["known"]["checked"] == 2
+        assert stats["checks"]["analysis"]["checked"] == 0
+        assert stats["mismatches"] == 0
+        assert len(api._analysis_cache) == cached  # is_known ve gölge yol önbelleğe yazmaz
+
+    def test_analyze(self, client, shadow):
+        response = client.post("/analyze", json={"word": "kitaplarymyzdan"})
+        assert response.status_code == 200
+        shadow.join()
+        stats = shadow.stats()["checks"]["analysis"]
+        assert stats["checked"] == 1 and stats["mismatches"] == 0
+        assert stats["fast_seconds"] > 0
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Hız Ölçümü Testleri
+
+İş yükünün belirlenimli olduğunu, geçmiş dosyasını ve gerileme
+karşılaştırmasını doğrular (süreler doğrulanmaz).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from turkmen_fst import benchmark
+from turkmen_fst.lexicon import Lexicon
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+DICT_PATH = os.path.join(DATA_DIR, "turkmence_sozluk.txt")
+
+needs_report = pytest.mark.skipif(not os.path.exists(benchmark.REPORT_PATH),
+                                  reason="kapsam raporu yok")
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    lex = Lexicon()
+    lex.load(DICT_PATH)
+    return lex
+
+
+def _run(label, **stats):
+    return {"label": label, "workload": "w", "benchmarks": {
+        name: {"p50_us": p50, "ops_per_sec": 1e6 / p50} for name, p50 in stats.items()}}
+
+
+class TestWorkload:
+    """Kelime kümeleri ve kökler belirlenimli."""
+
+    @needs_report
+    def test_word_sets(self):
+        sets = benchmark.load_word_sets(size=10)
+        assert set(sets) == set(benchmark.PARSE_SETS) | {"top"}
+        for words in sets.values():
+            assert 0 < len(words) <= 10
+            assert len(set(words)) == len(words)
+        assert sets == benchmark.load_word_sets(size=10)
+
+    def test_sample_stems(self, lexicon):
+        stems = benchmark.sample_stems(lexicon, ("v",), count=15)
+        assert len(stems) == 15
+        assert stems == sorted(stems)
+        assert all(any(e.pos == "v" for e in lexicon.lookup(s)) for s in stems)
+
+    def test_digest_depends_on_content(self):
+        assert benchmark.workload_digest({"a": [1]}) == benchmark.workload_digest({"a": [1]})
+        assert benchmark.workload_digest({"a": [1]}) != benchmark.workload_digest({"a": [2]})
+
+
+class TestTiming:
+
+    def test_time_ops_fields(self):
+        calls = []
+        stats = benchmark.time_ops(calls.append, [1, 2, 3], rounds=2, min_round_seconds=0)
+        assert stats["ops"] == 3 and stats["rounds"] == 2
+        assert len(calls) == 9  # ısınma + 2 tur
+        assert stats["p50_us"] <= stats["p95_us"]
+        assert stats["ops_per_sec"] > 0
+
+    @needs_report
+    def test_run_subset(self):
+        record = benchmark.run_benchmarks(DICT_PATH, rounds=1, only=["generate.verb"],
+                                          label="t")
+        assert list(record["benchmarks"]) == ["generate.verb"]
+        assert record["label"] == "t" and record["workload"]
+
+
+class TestCompare:
+    """Geçmiş dosyası ve gerileme eşiği."""
+
+    def test_regression_detected(self):
+        rows = benchmark.compare_runs(_run("a", x=100.0, y=100.0), _run("b", x=125.0, y=101.0),
+                                      threshold=0.10)
+        regressed = {(r["benchmark"], r["metric"]) for r in rows if r["regressed"]}
+        assert regressed == {("x", "p50_us"), ("x", "ops_per_sec")}
+
+    def test_improvement_and_missing_benchmark(self):
+        rows = benchmark.compare_runs(_run("a", x=100.0), _run("b", x=50.0, z=10.0))
+        assert {r["benchmark"] for r in rows} == {"x"}
+        assert not any(r["regressed"] for r in rows)
+
+    def test_history_and_exit_codes(self, tmp_path, capsys):
+        path = str(tmp_path / "history.json")
+        assert benchmark.load_history(path) == []
+        assert benchmark.append_history(_run("base", x=100.0), path) == 0
+        assert benchmark.append_history(_run("fast", x=95.0), path) == 1
+        assert benchmark.append_history(_run("slow", x=150.0), path) == 2
+        assert benchmark.select_run(benchmark.load_history(path), "fast")["label"] == "fast"
+
+        assert benchmark.main_compare(path, "base", "fast") == 0
+        assert benchmark.main_compare(path) == 1            # fast → slow
+        assert benchmark.main_compare(path, "0", "-1", threshold=1.0) == 0
+        assert benchmark.main_compare(path, "missing") == 2
+        assert "GERİLEME" in capsys.readouterr().out
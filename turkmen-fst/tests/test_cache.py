@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Analiz Önbelleği Testleri
+
+LRU sırası, kayıt/bellek sınırları, sayaçlar, sözlük yeniden
+yüklendiğinde geçersizleme ve önbellekli parse() sonuçlarının
+önbelleksiz çalışmayla aynı olması.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import threading
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer, MultiAnalysisResult
+from turkmen_fst.cache import AnalysisCache, estimate_size
+from turkmen_fst.lexicon import Lexicon
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+DICT_PATH = os.path.join(DATA_DIR, "turkmence_sozluk.txt")
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    lexicon = Lexicon()
+    lexicon.load(DICT_PATH)
+    return lexicon
+
+
+class TestAnalysisCache:
+    """LRU davranışı ve sayaçlar."""
+
+    def test_lru_eviction(self):
+        cache = AnalysisCache(maxsize=2)
+        for key in ("a", "b"):
+            cache.put(key, MultiAnalysisResult(original=key))
+        cache.get("a")
+        cache.put("c", MultiAnalysisResult(original="c"))
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_byte_budget(self):
+        entry = MultiAnalysisResult(original="x")
+        cache = AnalysisCache(maxsize=100, max_bytes=estimate_size(entry) * 3)
+        for key in "abcde":
+            cache.put(key, MultiAnalysisResult(original="x"))
+        stats = cache.stats()
+        assert stats["size"] == 3
+        assert stats["bytes"] <= stats["max_bytes"]
+
+    def test_counters(self):
+        cache = AnalysisCache(maxsize=4)
+        assert cache.get("a") is None
+        cache.put("a", MultiAnalysisResult(original="a"))
+        assert cache.get("a") is not None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+class TestCachedParse:
+    """Önbellekli MorphologicalAnalyzer.parse()."""
+
+    WORDS = ["kitabym", "Kitabym", "KITAP", "geldim", "BMG-niň", "degişlidir",
+             "ýedinji", "Hem-de", " okuwçylar ", "qqq"]
+
+    def test_identical_results(self, lexicon):
+        reference = MorphologicalAnalyzer(lexicon)
+        cached = MorphologicalAnalyzer(lexicon, cache=AnalysisCache(64))
+        for word in self.WORDS * 2:
+            assert cached.parse(word) == reference.parse(word), word
+        assert cached.cache.stats()["hits"] > 0
+
+    def test_case_insensitive_key(self, lexicon):
+        analyzer = MorphologicalAnalyzer(lexicon, cache=AnalysisCache(64))
+        analyzer.parse("kitabym")
+        multi = analyzer.parse("Kitabym")
+        assert analyzer.cache.stats()["hits"] == 1
+        assert multi.original == "Kitabym"
+        assert all(r.original == "Kitabym" for r in multi.results)
+
+    def test_results_not_shared(self, lexicon):
+        analyzer = MorphologicalAnalyzer(lexicon, cache=AnalysisCache(64))
+        analyzer.parse("kitabym").results[0].suffixes.clear()
+        assert analyzer.parse("kitabym").results[0].suffixes
+
+    def test_invalidated_on_reload(self):
+        lexicon = Lexicon()
+        lexicon.load(DICT_PATH)
+        analyzer = MorphologicalAnalyzer(lexicon, cache=AnalysisCache(64))
+        analyzer.parse("kitabym")
+        lexicon.load(DICT_PATH)
+        analyzer.parse("kitabym")
+        stats = analyzer.cache.stats()
+        assert stats["invalidations"] == 1
+        assert stats["hits"] == 0
+
+    def test_threads(self, lexicon):
+        analyzer = MorphologicalAnalyzer(lexicon, cache=AnalysisCache(4))
+        words = ["kitap", "at", "göz", "gel", "oka", "mekdep"]
+        errors = []
+
+        def work():
+            try:
+                for word in words * 5:
+                    assert analyzer.parse(word).original == word
+            except AssertionError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert len(analyzer.cache) <= 4
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Sınırlı İş Havuzu Testleri
+
+Kuyruk derinliği aşıldığında reddetme, zaman aşımı, yer boşaltma ve
+süreç havuzunda analiz.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import asyncio
+import threading
+import pytest
+from turkmen_fst.executor import BoundedExecutor, ExecutorSaturated
+from turkmen_fst.phonology import PhonologyRules
+
+
+def _wait(event: threading.Event) -> str:
+    event.wait(5)
+    return "ok"
+
+
+class TestBoundedExecutor:
+
+    def test_run(self):
+        executor = BoundedExecutor(workers=2)
+        assert asyncio.run(executor.run(PhonologyRules.get_vowel_quality, "kitap")) == "yogyn"
+        assert executor.stats()["completed"] == 1
+        executor.shutdown()
+
+    def test_saturated(self):
+        executor = BoundedExecutor(workers=1, max_pending=2)
+        event = threading.Event()
+        futures = [executor.submit(_wait, event) for _ in range(2)]
+        with pytest.raises(ExecutorSaturated):
+            executor.submit(_wait, event)
+        assert executor.stats()["rejected"] == 1
+        event.set()
+        assert [f.result() for f in futures] == ["ok", "ok"]
+        # Biten işlerin yeri boşalır
+        assert executor.submit(_wait, event).result() == "ok"
+        assert executor.stats()["pending"] == 0
+        executor.shutdown()
+
+    def test_timeout(self):
+        executor = BoundedExecutor(workers=1, max_pending=4, timeout=0.05)
+        event = threading.Event()
+
+        async def scenario():
+            with pytest.raises(asyncio.TimeoutError):
+                await executor.run(_wait, event)
+            # Başlamamış iş zaman aşımında iptal edilir
+            with pytest.raises(asyncio.TimeoutError):
+                await executor.run(_wait, event)
+
+        asyncio.run(scenario())
+        event.set()
+        executor.shutdown()
+        stats = executor.stats()
+        assert stats["timeouts"] == 2
+        assert stats["pending"] == 0
+
+    def test_event_loop_not_blocked(self):
+        executor = BoundedExecutor(workers=1)
+        event = threading.Event()
+
+        async def scenario():
+            job = asyncio.ensure_future(executor.run(_wait, event))
+            await asyncio.sleep(0)
+            # İş havuzda beklerken döngü başka işleri yürütür
+            event.set()
+            return await job
+
+        assert asyncio.run(scenario()) == "ok"
+        executor.shutdown()
+
+    def test_process_pool(self):
+        executor = BoundedExecutor(workers=1, kind="process")
+        assert asyncio.run(executor.run(PhonologyRules.get_vowel_quality, "mekdep")) == "ince"
+        executor.shutdown()
+
+    def test_invalid_kind(self):
+        with pytest.raises(ValueError):
+            BoundedExecutor(kind="fiber")
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Yüzey Formu Dizini Testleri
+
+Dizinli parse_noun() / parse_verb() sonuçlarının dizinsiz
+generate-and-compare döngüsüyle birebir aynı olduğunu doğrular.
+Dizin süre için küçük bir sözlük alt kümesi üzerinde oluşturulur.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.form_index import NounFormIndex, VerbFormIndex, NOUN_COMBOS, VERB_COMBOS
+from turkmen_fst.generator import NounGenerator, VerbGenerator
+from turkmen_fst.lexicon import Lexicon
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+SUBSET = {"kitap", "at", "ot", "burun", "göz", "mekdep", "okuwçy", "agyz", "göl", "alma", "adam",
+          "gel", "git", "oka", "et"}
+VERBS = ("gel", "git", "oka", "et", "at")
+
+
+@pytest.fixture(scope="module")
+def small_lexicon(tmp_path_factory):
+    """Sözlükten seçilmiş köklerle küçük bir sözlük dosyası oluşturur."""
+    path = tmp_path_factory.mktemp("lex") / "sozluk.txt"
+    lines = []
+    with open(os.path.join(DATA_DIR, "turkmence_sozluk.txt"), encoding="utf-8") as f:
+        for line in f:
+            if line.split("\t", 1)[0].strip() in SUBSET:
+                lines.append(line)
+    path.write_text("".join(lines), encoding="utf-8")
+    lexicon = Lexicon()
+    lexicon.load(str(path))
+    return lexicon
+
+
+@pytest.fixture(scope="module")
+def index(small_lexicon):
+    return NounFormIndex.build(small_lexicon)
+
+
+@pytest.fixture(scope="module")
+def verb_index(small_lexicon):
+    return VerbFormIndex.build(small_lexicon)
+
+
+def _signature(results):
+    return [(r.stem, r.breakdown, r.word_type, r.meaning) for r in results]
+
+
+def _sample_words(lexicon):
+    gen = NounGenerator(lexicon)
+    words = []
+    for stem in sorted(SUBSET):
+        for plural, poss, poss_type, case, daky in NOUN_COMBOS[::3]:
+            words.append(gen.generate(stem, plural, poss, poss_type, case, daky=daky).word)
+        words.append(stem)
+    return words
+
+
+class TestNounFormIndex:
+    """Dizin içeriği."""
+
+    def test_covers_lexicon_nouns(self, index):
+        assert index.covers("kitap")
+        assert index.covers("at")
+        assert not index.covers("kitapçy")
+
+    def test_lookup_finds_combination(self, index):
+        """kitabym → kitap + A1 (tekil)."""
+        hits = index.lookup("kitabym", "kitap")
+        combos = [NOUN_COMBOS[ci] for _, ci in hits]
+        assert (False, "A1", "tek", None, False) in combos
+
+    def test_lookup_other_stem_empty(self, index):
+        assert index.lookup("kitabym", "at") == []
+
+    def test_homonym_variants(self, index):
+        """ot → iki anlam, iki ayrı varyant."""
+        variants = {vi for vi, _ in index.lookup("oduň", "ot")} | \
+                   {vi for vi, _ in index.lookup("otuň", "ot")}
+        assert variants == {0, 1}
+
+    def test_save_load_roundtrip(self, index, small_lexicon, tmp_path):
+        path = str(tmp_path / "index.pkl")
+        index.save(path)
+        loaded = NounFormIndex.load(path, small_lexicon)
+        assert len(loaded) == len(index)
+        assert loaded.lookup("kitabym", "kitap") == index.lookup("kitabym", "kitap")
+
+    def test_load_rejects_other_lexicon(self, index, tmp_path):
+        path = str(tmp_path / "index.pkl")
+        index.save(path)
+        with pytest.raises(ValueError):
+            NounFormIndex.load(path, Lexicon())
+
+    @pytest.mark.parametrize("kind", ["noun", "verb"])
+    def test_load_rejects_edited_lexicon(self, index, verb_index, small_lexicon, tmp_path, kind):
+        """Kelime sayısı aynı kalsa da değişmiş sözlükle yüklenmez (SHA-256)."""
+        built = index if kind == "noun" else verb_index
+        path = str(tmp_path / "index.pkl")
+        built.save(path)
+        edited = tmp_path / "sozluk.txt"
+        with open(small_lexicon.source_path, encoding="utf-8") as f:
+            edited.write_text(f.read().replace("adam\t", "adym\t", 1), encoding="utf-8")
+        other = Lexicon()
+        other.load(str(edited))
+        assert other.word_count == small_lexicon.word_count
+        with pytest.raises(ValueError):
+            type(built).load(path, other)
+
+
+class TestIndexedParseNoun:
+    """Dizinli ve dizinsiz parse_noun() eşdeğerliği."""
+
+    def test_identical_results(self, small_lexicon, index):
+        reference = MorphologicalAnalyzer(small_lexicon)
+        indexed = MorphologicalAnalyzer(small_lexicon, noun_index=index)
+        for word in _sample_words(small_lexicon) + ["mekdepdäki", "okuwçylar", "burny"]:
+            assert _signature(indexed.parse_noun(word)) == \
+                   _signature(reference.parse_noun(word)), word
+
+    def test_build_noun_index(self, small_lexicon):
+        analyzer = MorphologicalAnalyzer(small_lexicon)
+        index = analyzer.build_noun_index()
+        assert analyzer.noun_index is index
+        assert len(index) > 0
+
+
+class TestVerbFormIndex:
+    """Fiil dizini içeriği."""
+
+    def test_covers_only_verbs(self, verb_index):
+        assert verb_index.covers("gel")
+        assert verb_index.covers("at")
+        assert not verb_index.covers("kitap")
+
+    def test_lookup_pronoun_stripped(self, verb_index):
+        """geldim → gel + Ö1 + A1; anahtar zamirsiz formdur."""
+        combos = [VERB_COMBOS[ci] for ci in verb_index.lookup("geldim", "gel")]
+        assert ("1", "A1", False) in combos
+
+    def test_uncovered_stem_without_generator(self, verb_index):
+        assert verb_index.lookup("kitap", "kitap") is None
+
+    def test_uncovered_stem_cached(self, small_lexicon):
+        index = VerbFormIndex()
+        gen = VerbGenerator(small_lexicon)
+        first = index.lookup("kitap", "kitap", gen)
+        assert first == index.lookup("kitap", "kitap")
+        assert "kitap" in index._extra
+
+
+class TestIndexedParseVerb:
+    """Dizinli ve dizinsiz parse_verb() eşdeğerliği."""
+
+    def test_identical_results(self, small_lexicon, verb_index):
+        reference = MorphologicalAnalyzer(small_lexicon)
+        indexed = MorphologicalAnalyzer(small_lexicon, verb_index=verb_index)
+        gen = VerbGenerator(small_lexicon)
+        words = ["kitap", "gözüm", "men geljek däl", "biz geldik"]
+        for stem in VERBS:
+            for tense, person, neg in VERB_COMBOS[::7]:
+                words.append(gen.generate(stem, tense, person, neg).word.split()[-1])
+        for word in words:
+            assert _signature(indexed.parse_verb(word)) == \
+                   _signature(reference.parse_verb(word)), word
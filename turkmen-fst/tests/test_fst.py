@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Harf Düzeyinde Dönüştürücü Testleri
+
+Derleme, yürüyüş (transduce), kalıcılık ve FSTAnalyzer'ın
+MorphologicalAnalyzer ile birebir aynı sonuç vermesi.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.fst import TurkmenFST, FSTAnalyzer, NOUN_LABELS, VERB_LABELS
+from turkmen_fst.form_index import NOUN_COMBOS, VERB_COMBOS, rounding_key
+from turkmen_fst.lexicon import Lexicon
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+STEMS = ["kitap", "mekdep", "burun", "ogul", "at", "ot", "göz", "gel", "oka", "git"]
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    lexicon = Lexicon()
+    lexicon.load(os.path.join(DATA_DIR, "turkmence_sozluk.txt"))
+    return lexicon
+
+
+@pytest.fixture(scope="module")
+def fst(lexicon):
+    return TurkmenFST.compile(lexicon, stems=STEMS)
+
+
+def _tail_walk_paths(fst, word):
+    """Her kök allomorfu sonundan kuyruk trie'sini ayrıca yürüyen (karesel) yol."""
+    key = rounding_key(word)
+    out = []
+    q = TurkmenFST.STEM_ROOT
+    for i in range(len(key) + 1):
+        t = TurkmenFST.TAIL_ROOT
+        for ch in key[i:]:
+            t = fst._delta.get((t << 16) | ord(ch))
+            if t is None:
+                break
+        if t is not None:
+            for arc, cid in fst._stem_finals.get(q, ()):
+                cis = fst._classes[cid].get(t)
+                if cis:
+                    out.append((arc, cis))
+        if i == len(key):
+            break
+        q = fst._delta.get((q << 16) | ord(key[i]))
+        if q is None:
+            break
+    return out
+
+
+class TestLabels:
+    """Etiket kümesi morfotaktik modelden."""
+
+    def test_all_noun_combos_accepted(self):
+        assert NOUN_LABELS == list(range(len(NOUN_COMBOS)))
+
+    def test_all_verb_combos_accepted(self):
+        assert VERB_LABELS == list(range(len(VERB_COMBOS)))
+
+
+class TestCompile:
+    """Derleme ve yürüyüş."""
+
+    def test_compiled_kinds(self, fst):
+        assert fst.covers("kitap", "n")
+        assert fst.covers("gel", "v")
+        assert not fst.covers("kitap", "v")
+        assert fst.covers("at", "n") and fst.covers("at", "v")
+
+    def test_classes_shared(self, fst):
+        """Devam sınıfları kökler arasında paylaşılır."""
+        assert len(fst._classes) < len(fst._arcs) * 2
+
+    def test_transduce_softening(self, fst):
+        """kitabym → kitap + A1 (p→b yumuşama kök trie'sinde)."""
+        out = fst.transduce("kitabym")
+        combos = [NOUN_COMBOS[ci] for stem, kind, _, ci in out if stem == "kitap" and kind == "n"]
+        assert (False, "A1", "tek", None, False) in combos
+
+    def test_transduce_vowel_drop(self, fst):
+        out = fst.transduce("burny")
+        assert any(stem == "burun" for stem, _, _, _ in out)
+
+    def test_transduce_verb(self, fst):
+        out = fst.transduce("geldim")
+        combos = [VERB_COMBOS[ci] for stem, kind, _, ci in out if stem == "gel" and kind == "v"]
+        assert ("1", "A1", False) in combos
+
+    def test_transduce_rounding(self, fst):
+        """Yuvarlaklaşma farkı (u/y) yok sayılır."""
+        assert fst.transduce("oglumyz") == fst.transduce("oglymyz")
+
+    def test_unknown_word(self, fst):
+        assert fst.transduce("qqq") == []
+
+    @pytest.mark.parametrize("word", [
+        "kitabym", "kitaplarymyzdan", "burny", "oglumyz", "atlarynyň", "gitjek",
+        "okaýarys", "at", "a", "", "geldimiz", "kitapkitap",
+    ])
+    def test_paths_match_tail_walks(self, fst, word):
+        """Tek geçişli _paths() her kök sonundan ayrı kuyruk yürüyüşüyle aynı."""
+        assert list(fst._paths(word)) == _tail_walk_paths(fst, word)
+
+    def test_lazy_extension(self, lexicon):
+        fst = TurkmenFST(lexicon)
+        assert fst.lookup("kitaplar", "kitap", "n")
+        assert fst.covers("kitap", "n")
+
+
+class TestPersistence:
+    """Kaydet / yükle."""
+
+    def test_roundtrip(self, fst, lexicon, tmp_path):
+        path = str(tmp_path / "turkmen.fst")
+        fst.save(path)
+        loaded = TurkmenFST.load(path, lexicon)
+        assert loaded.num_states == fst.num_states
+        for word in ("kitabym", "burny", "geldim", "atlarymyz"):
+            assert loaded.transduce(word) == fst.transduce(word)
+
+    def test_lexicon_mismatch(self, fst, tmp_path):
+        path = str(tmp_path / "turkmen.fst")
+        fst.save(path)
+        with pytest.raises(ValueError):
+            TurkmenFST.load(path, Lexicon())
+
+    def test_edited_lexicon_same_count(self, fst, lexicon, tmp_path):
+        """Kelime sayısı aynı kalsa da değişmiş sözlükle yüklenmez (SHA-256)."""
+        path = str(tmp_path / "turkmen.fst")
+        fst.save(path)
+        edited = tmp_path / "sozluk.txt"
+        with open(os.path.join(DATA_DIR, "turkmence_sozluk.txt"), encoding="utf-8") as f:
+            text = f.read()
+        edited.write_text(text.replace("\nkitap\t", "\nkitab\t", 1), encoding="utf-8")
+        other = Lexicon()
+        other.load(str(edited))
+        assert other.word_count == lexicon.word_count
+        with pytest.raises(ValueError):
+            TurkmenFST.load(path, other)
+
+
+class TestFSTAnalyzer:
+    """FSTAnalyzer ↔ MorphologicalAnalyzer eşdeğerliği."""
+
+    WORDS = [
+        "kitap", "kitabym", "kitaplarymyzdan", "mekdepdäki", "burny", "oglumyz",
+        "atlarynyň", "otuň", "gözüm", "geldim", "gelmedik", "okaýarys",
+        "gitjek", "men geljek däl", "okamak", "kitapçy",
+    ]
+
+    def test_identical_parse(self, lexicon, fst):
+        reference = MorphologicalAnalyzer(lexicon)
+        analyzer = FSTAnalyzer(lexicon, fst=fst)
+        for word in self.WORDS:
+            expected = [(r.stem, r.breakdown, r.word_type, r.meaning)
+                        for r in reference.parse(word).results]
+            actual = [(r.stem, r.breakdown, r.word_type, r.meaning)
+                      for r in analyzer.parse(word).results]
+            assert actual == expected, word
+
+    def test_one_walk_per_word(self, lexicon, fst, monkeypatch):
+        """Bir parse() içinde her kelime, kök adayı sayısından bağımsız bir kez yürünür."""
+        analyzer = FSTAnalyzer(lexicon, fst=fst)
+        for word in self.WORDS:  # eksik kökler derlensin
+            analyzer.parse(word)
+        walked = []
+        paths = fst._paths
+        monkeypatch.setattr(fst, "_paths", lambda word: walked.append(word) or paths(word))
+        for word in self.WORDS:
+            walked.clear()
+            analyzer.parse(word)
+            assert len(walked) == len(set(walked)), word
+            walked.clear()
+            analyzer.is_known(word)
+            assert len(walked) == len(set(walked)), word
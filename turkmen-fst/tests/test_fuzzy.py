@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Bulanık Kök Arama Testleri
+
+SymSpell dizininin tüm sözlüğü taramakla aynı sonucu vermesi, sınırlı
+Levenshtein uzaklığı ve paylaşılan dizinin yeniden yüklemede yenilenmesi.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from turkmen_fst.fuzzy import SymSpellIndex, edit_distance
+from turkmen_fst.lexicon import Lexicon
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+DICT_PATH = os.path.join(DATA_DIR, "turkmence_sozluk.txt")
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    lexicon = Lexicon()
+    lexicon.load(DICT_PATH)
+    return lexicon
+
+
+def _scan(lexicon, word, max_distance):
+    """Referans: tüm sözlük anahtarlarını tek tek karşılaştırır."""
+    found = []
+    for key in lexicon.all_words():
+        dist = edit_distance(word, key, max_distance)
+        if 0 < dist <= max_distance:
+            found.append((dist, key))
+    return sorted(found)
+
+
+class TestEditDistance:
+
+    @pytest.mark.parametrize("a,b,expected", [
+        ("kitap", "kitap", 0),
+        ("kitap", "kitab", 1),
+        ("kitap", "kitaplar", 3),
+        ("", "at", 2),
+        ("ab", "ba", 2),
+        ("göz", "goz", 1),
+    ])
+    def test_distance(self, a, b, expected):
+        assert edit_distance(a, b) == expected
+        assert edit_distance(b, a) == expected
+
+    def test_limit(self):
+        assert edit_distance("kitap", "kitaplar", limit=1) == 2
+        assert edit_distance("mekdep", "depder", limit=2) == 3
+        assert edit_distance("kitap", "kitab", limit=1) == 1
+
+
+class TestSymSpellIndex:
+
+    WORDS = ["kitab", "kitp", "mekdepp", "okuwçy", "goz", "dereje",
+             "ýagşy", "yagsy", "kompýuter", "a", "zzzz", "mugallymlar"]
+
+    @pytest.mark.parametrize("max_distance", [1, 2])
+    def test_matches_full_scan(self, lexicon, max_distance):
+        index = SymSpellIndex.for_lexicon(lexicon)
+        for word in self.WORDS:
+            assert index.lookup(word, max_distance) == _scan(lexicon, word, max_distance), word
+
+    def test_max_results(self, lexicon):
+        index = SymSpellIndex.for_lexicon(lexicon)
+        assert index.lookup("kitab", max_results=3) == index.lookup("kitab")[:3]
+
+    def test_case_insensitive(self, lexicon):
+        index = SymSpellIndex.for_lexicon(lexicon)
+        assert index.lookup("KITAB") == index.lookup("kitab")
+
+    def test_distance_limit(self, lexicon):
+        with pytest.raises(ValueError):
+            SymSpellIndex.for_lexicon(lexicon).lookup("kitab", max_distance=3)
+
+    def test_shared_and_rebuilt(self):
+        lexicon = Lexicon()
+        lexicon.load(DICT_PATH)
+        index = SymSpellIndex.for_lexicon(lexicon)
+        assert SymSpellIndex.for_lexicon(lexicon) is index
+        lexicon.load(DICT_PATH)
+        assert SymSpellIndex.for_lexicon(lexicon) is not index
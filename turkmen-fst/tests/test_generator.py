@@ -24,7 +24,7 @@ import json
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import pytest
-from turkmen_fst.generator import NounGenerator
+from turkmen_fst.generator import NounGenerator, VerbGenerator
 from turkmen_fst.lexicon import Lexicon
 
 
@@ -52,6 +52,12 @@ def generator():
     return NounGenerator(lexicon)
 
 
+@pytest.fixture(scope="module")
+def verb_gen():
+    """Sözlüksüz VerbGenerator (generate_all testleri)."""
+    return VerbGenerator()
+
+
 # ==============================================================================
 #  Toplu doğrulama (tek büyük test — hata raporu detaylı)
 # ==============================================================================
@@ -220,3 +226,54 @@ class TestBreakdown:
     def test_case_breakdown(self, generator):
         r = generator.generate("kitap", case="A2")
         assert "yň" in r.breakdown or "iň" in r.breakdown
+
+
+# ==============================================================================
+#  Paradigma tablosu — hücre hücre generate() ile aynı
+# ==============================================================================
+
+class TestParadigmTable:
+    """generate_paradigm() ortak önekleri paylaşır ama sonuç değişmez."""
+
+    STEMS = ["kitap", "guzy", "süri", "burun", "ogul", "asyl", "alma", "hepde",
+             "göz", "okuwçy", "agyz", "at", "gelin", "ýüzük"]
+
+    @pytest.mark.parametrize("stem", STEMS)
+    @pytest.mark.parametrize("yumusama_izni", [True, False])
+    def test_matches_generate(self, generator, stem, yumusama_izni):
+        table = generator.generate_paradigm(stem, yumusama_izni)
+        assert len(table) == 2 * 6 * 6
+        for (plural, poss, case), word in table.items():
+            poss_type = "cog" if poss in ("B1", "B2") else "tek"
+            code = {"B1": "A1", "B2": "A2"}.get(poss, poss)
+            r = generator.generate(stem, plural, code, poss_type, case,
+                                   yumusama_izni=yumusama_izni)
+            assert word == r.word, (stem, plural, poss, case)
+
+
+
+class TestVerbGenerateAll:
+    """generate_all() kök verilerini paylaşır ama her hücre generate() ile aynıdır."""
+
+    STEMS = ["gel", "oka", "al", "et", "git", "gör", "otur", "dur", "ýat",
+             "gülle", "döre", "ber", "sözle", "bol"]
+
+    @pytest.mark.parametrize("stem", STEMS)
+    def test_matches_generate(self, verb_gen, stem):
+        grid = verb_gen.generate_all(stem)
+        assert len(grid) == len(VerbGenerator.TENSES) * 6 * 2
+        for (tense, person, negative), r in grid.items():
+            expected = verb_gen.generate(stem, tense, person, negative)
+            assert (r.word, r.breakdown, r.morphemes, r.is_valid) == \
+                (expected.word, expected.breakdown, expected.morphemes, expected.is_valid), \
+                (stem, tense, person, negative)
+
+    def test_order_and_subset(self, verb_gen):
+        grid = verb_gen.generate_all("gel", ("4", "1"), ("A3",))
+        assert list(grid) == [("4", "A3", False), ("4", "A3", True),
+                              ("1", "A3", False), ("1", "A3", True)]
+        assert grid[("1", "A3", True)].word == "gelmedi"
+
+    def test_invalid_tense(self, verb_gen):
+        grid = verb_gen.generate_all("gel", ("99",), ("A1",))
+        assert not grid[("99", "A1", False)].is_valid
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Bilinen Form Kümesi Testleri
+
+Bloom filtresinin, küme kaydının ve is_known() kararının parse() ile
+aynı olduğunu küçük bir sözlük üzerinde doğrular (tam sözlükte küme
+oluşturmak ~2 dk sürer).
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.cache import AnalysisCache
+from turkmen_fst.known_forms import BloomFilter, KnownForms
+from turkmen_fst.lexicon import Lexicon
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+STEMS = {"kitap", "mekdep", "gel", "oka", "et", "üstünlik", "wajyp", "okuwçy",
+         "degişli", "bu", "ol", "şu", "gör", "ýaz", "alma", "at"}
+
+WORDS = [
+    "kitabym", "kitaplarymyzdan", "mekdepdäki", "okuwçylar", "okuwçular",
+    "geldim", "okaýarys", "gelmedik", "ýazypdyr", "etmek", "okamaga",
+    "görkezildi", "üstünlikli", "wajypdygy", "degişlidir", "kitapdyr",
+    "mundan", "şol", "ýedinji", "2024-nji", "hem-de", "BMG-niň",
+    "men geljek", "biz geldik däl", "at", "atlar", "alma", "almalar",
+    "kitapz", "gelxyz", "qqq", "okuwçylaryň", "ýazdyrylýan",
+]
+
+
+@pytest.fixture(scope="module")
+def lexicon(tmp_path_factory):
+    """Tam sözlüğün başlıkları + STEMS girişleri."""
+    path = tmp_path_factory.mktemp("lex") / "sozluk.txt"
+    with open(os.path.join(DATA_DIR, "turkmence_sozluk.txt"), encoding="utf-8") as src, \
+            open(path, "w", encoding="utf-8") as dst:
+        for line in src:
+            if line.startswith("%") or line.split("\t", 1)[0] in STEMS:
+                dst.write(line)
+    lex = Lexicon()
+    lex.load(str(path))
+    return lex
+
+
+@pytest.fixture(scope="module")
+def forms(lexicon):
+    return KnownForms.build(lexicon)
+
+
+def _known(multi):
+    return any(r.word_type != "unknown" for r in multi.results)
+
+
+class TestBloomFilter:
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        keys = [f"kelime{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+        false_positives = sum(f"başga{i}" in bloom for i in range(5000))
+        assert false_positives < 150  # hedef %1
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            BloomFilter(10, fp_rate=1.0)
+
+
+class TestKnownForms:
+
+    def test_paradigm_forms(self, forms):
+        assert forms.maybe_noun("kitabym") and forms.maybe_noun("kitap")
+        assert forms.maybe_noun("okuwçylar") and forms.maybe_noun("okuwçular")
+        assert forms.maybe_verb("geldim") and forms.maybe_verb("okaýarys")
+        assert not forms.maybe_noun("qqq") and not forms.maybe_verb("qqq")
+
+    def test_save_load(self, lexicon, forms, tmp_path):
+        path = str(tmp_path / "known_forms.pkl")
+        forms.save(path)
+        loaded = KnownForms.load(path, lexicon)
+        assert len(loaded) == len(forms)
+        assert loaded.nouns.bits == forms.nouns.bits
+        assert loaded.maybe_verb("geldim")
+
+    def test_load_rejects_other_lexicon(self, forms, tmp_path):
+        path = str(tmp_path / "known_forms.pkl")
+        forms.save(path)
+        other = Lexicon()
+        other.load(os.path.join(DATA_DIR, "turkmence_sozluk.txt"))
+        with pytest.raises(ValueError):
+            KnownForms.load(path, other)
+
+    def test_load_rejects_edited_lexicon(self, lexicon, forms, tmp_path):
+        """Kelime sayısı aynı kalsa da değişmiş sözlükle yüklenmez (SHA-256)."""
+        path = str(tmp_path / "known_forms.pkl")
+        forms.save(path)
+        edited = tmp_path / "sozluk.txt"
+        with open(lexicon.source_path, encoding="utf-8") as f:
+            edited.write_text(f.read().replace("\nalma\t", "\nalmy\t", 1), encoding="utf-8")
+        other = Lexicon()
+        other.load(str(edited))
+        assert other.word_count == lexicon.word_count
+        with pytest.raises(ValueError):
+            KnownForms.load(path, other)
+
+
+class TestIsKnown:
+    """is_known() kararı parse() ile aynı."""
+
+    @pytest.mark.parametrize("with_forms", [False, True])
+    def test_matches_parse(self, lexicon, forms, with_forms):
+        analyzer = MorphologicalAnalyzer(lexicon, known_forms=forms if with_forms else None)
+        for word in WORDS:
+            assert analyzer.is_known(word) == _known(analyzer.parse(word)), word
+
+    def test_skips_rejected_paradigms(self, lexicon, forms):
+        calls = []
+
+        class _Counting(MorphologicalAnalyzer):
+            def parse_noun(self, word, first=False):
+                calls.append(word)
+                return super().parse_noun(word, first)
+
+        analyzer = _Counting(lexicon, known_forms=forms)
+        assert not analyzer.is_known("qqq")
+        assert analyzer.is_known("kitabym")
+        assert calls == ["kitabym"]
+
+    def test_uses_cache(self, lexicon):
+        analyzer = MorphologicalAnalyzer(lexicon, cache=AnalysisCache(16))
+        analyzer.parse("kitabym")
+        analyzer.parse("qqq")
+        hits = analyzer.cache.hits
+        assert analyzer.is_known("Kitabym ") and not analyzer.is_known("qqq")
+        assert analyzer.cache.hits == hits + 2
+        assert not analyzer.is_known("   ")
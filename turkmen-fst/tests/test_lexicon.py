@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Sözlük Girişi ve Snapshot Testleri
+
+Paketlenmiş LexiconEntry'nin özellik sözlüğünü ve allows_* değerlerini
+koruduğunu; ikili snapshot'ın metin yüklemesiyle birebir aynı girişleri
+(ekleme sırası, POS, özellik sözlüğü ve anahtar sırası) verdiğini doğrular.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pickle
+import pytest
+from turkmen_fst.lexicon import Lexicon, LexiconEntry, SNAPSHOT_SUFFIX
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+DICT_PATH = os.path.join(DATA_DIR, "turkmence_sozluk.txt")
+
+
+def _dump(lexicon):
+    return [(key, [(e.word, e.pos, list(e.features.items())) for e in lexicon._entries[key]])
+            for key in lexicon._entries]
+
+
+@pytest.fixture(scope="module")
+def text_lexicon():
+    lexicon = Lexicon()
+    lexicon.load(DICT_PATH)
+    return lexicon
+
+
+@pytest.fixture(scope="module")
+def snapshot_path(text_lexicon, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("snap") / "sozluk.snap")
+    text_lexicon.save_snapshot(path, DICT_PATH)
+    return path
+
+
+class TestLexiconEntry:
+    """__slots__ + bit alanlı giriş."""
+
+    def test_features_roundtrip(self):
+        features = {"vowel_drop": True, "exception_drop": False,
+                    "dropped_form": "agz", "softening": False}
+        entry = LexiconEntry("agyz", "n", features)
+        assert entry.features == features
+        assert list(entry.features) == list(features)
+
+    def test_default_flags(self):
+        assert LexiconEntry("kitap", "n").allows_softening is True
+        assert LexiconEntry("adam", "n").allows_softening is False
+        assert LexiconEntry("kitap", "n", {"softening": False}).allows_softening is False
+
+    def test_compact(self, text_lexicon):
+        entry = text_lexicon.lookup("kitap")[0]
+        assert not hasattr(entry, "__dict__")
+        other = text_lexicon.lookup("mekdep")[0]
+        assert entry._layout is other._layout
+        assert entry.pos is other.pos
+
+    def test_equality(self):
+        assert LexiconEntry("at", "n", {"softening": False}) == \
+               LexiconEntry("at", "n", {"softening": False})
+        assert LexiconEntry("at", "n") != LexiconEntry("at", "v")
+
+    def test_rejects_other_values(self):
+        with pytest.raises(TypeError):
+            LexiconEntry("at", "n", {"count": 3})
+
+
+class TestSnapshot:
+    """save_snapshot / load_snapshot."""
+
+    def test_identical_entries(self, text_lexicon, snapshot_path):
+        lexicon = Lexicon()
+        count = lexicon.load_snapshot(snapshot_path, DICT_PATH)
+        assert count == text_lexicon.word_count
+        assert _dump(lexicon) == _dump(text_lexicon)
+
+    def test_lookup_api(self, snapshot_path):
+        lexicon = Lexicon()
+        lexicon.load_snapshot(snapshot_path)
+        assert lexicon.lookup("Kitap")[0].allows_softening is True
+        assert "burun" in lexicon
+        assert lexicon.lookup("yokdur-yok") == []
+        assert lexicon.get_homonyms("at") is not None
+
+    def test_source_sha256(self, text_lexicon, snapshot_path):
+        """Snapshot'tan yüklenen sözlük kaynak özetini taşır."""
+        lexicon = Lexicon()
+        lexicon.load_snapshot(snapshot_path)
+        assert len(text_lexicon.source_sha256) == 32
+        assert lexicon.source_sha256 == text_lexicon.source_sha256
+        assert Lexicon().source_sha256 == b""
+
+    def test_source_mismatch(self, snapshot_path, tmp_path):
+        other = tmp_path / "sozluk.txt"
+        other.write_text("kitap\t%<n%>\tsoftening\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            Lexicon().load_snapshot(snapshot_path, str(other))
+
+    def test_invalid_file(self, tmp_path):
+        bad = tmp_path / "bad.snap"
+        bad.write_bytes(b"not a snapshot at all" * 4)
+        with pytest.raises(ValueError):
+            Lexicon().load_snapshot(str(bad))
+
+    def test_load_prefers_fresh_snapshot(self, tmp_path):
+        source = tmp_path / "sozluk.txt"
+        source.write_text("kitap\t%<n%>\tsoftening\nburun\t%<n%>\tvowel_drop\n", encoding="utf-8")
+        lexicon = Lexicon()
+        lexicon.load(str(source))
+        lexicon.save_snapshot(str(source) + SNAPSHOT_SUFFIX)
+
+        fast = Lexicon()
+        assert fast.load(str(source), use_snapshot=True) == 2
+        assert not isinstance(fast._entries, dict)
+
+        # Kaynak değişti → snapshot yok sayılır
+        source.write_text("kitap\t%<n%>\tsoftening\n", encoding="utf-8")
+        fresh = Lexicon()
+        assert fresh.load(str(source), use_snapshot=True) == 1
+        assert isinstance(fresh._entries, dict)
+
+    def test_pickle(self, snapshot_path):
+        lexicon = Lexicon()
+        lexicon.load_snapshot(snapshot_path)
+        copy = pickle.loads(pickle.dumps(lexicon))
+        assert copy.lookup("kitap")[0].allows_softening is True
+        assert len(copy._entries) == len(lexicon._entries)
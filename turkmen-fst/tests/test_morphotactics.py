@@ -116,6 +116,12 @@ class TestNounParamValidation:
         assert valid is False
         assert "Geçersiz hal" in msg
 
+    def test_matrix_matches_full_check(self):
+        """Önceden hesaplanmış matris tam doğrulamayla aynı sonucu verir."""
+        for (plural, poss, case), result in NounMorphotactics._PARAM_MATRIX.items():
+            assert result == NounMorphotactics._check_noun_params(plural, poss, case)
+        assert len(NounMorphotactics._PARAM_MATRIX) == 2 * 6 * 6
+
 
 class TestVerbStates:
     """Fiil state'leri kontrol."""
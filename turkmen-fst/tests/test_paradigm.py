@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Paradigma Tablosu Testleri
+
+Tablo hücrelerinin generator çağrılarıyla aynı olması, LRU önbellek ve
+toplu dışa aktarmanın işçi sayısından bağımsız, belirlenimli çıktısı.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import gzip
+import json
+import pytest
+from turkmen_fst.generator import MorphologicalGenerator
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.paradigm import (
+    ParadigmCache, export_paradigms, paradigm_jobs,
+    NOUN_CASES, NOUN_POSSESSIVES, VERB_TENSES, VERB_PERSONS
+)
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+SUBSET = {"kitap", "at", "burun", "göz", "mekdep", "okuwçy", "alma", "gowy",
+          "gel", "git", "oka", "et", "nirä"}
+
+
+@pytest.fixture(scope="module")
+def small_lexicon(tmp_path_factory):
+    """Sözlükten seçilmiş köklerle küçük bir sözlük dosyası oluşturur."""
+    path = tmp_path_factory.mktemp("lex") / "sozluk.txt"
+    lines = []
+    with open(os.path.join(DATA_DIR, "turkmence_sozluk.txt"), encoding="utf-8") as f:
+        for line in f:
+            if line.split("\t", 1)[0].strip() in SUBSET:
+                lines.append(line)
+    path.write_text("".join(lines), encoding="utf-8")
+    lexicon = Lexicon()
+    lexicon.load(str(path))
+    return lexicon
+
+
+@pytest.fixture
+def paradigms(small_lexicon):
+    return ParadigmCache(MorphologicalGenerator(small_lexicon), maxsize=2)
+
+
+class TestParadigmCache:
+
+    def test_noun_cells(self, paradigms):
+        gen = paradigms.generator
+        table = paradigms.noun("kitap")
+        assert table.form(True, "A1", "A5") == "kitaplarymda"
+        for plural in (False, True):
+            for poss in NOUN_POSSESSIVES:
+                for case in NOUN_CASES:
+                    r = gen.generate_noun("kitap", plural=plural, possessive=poss, case=case)
+                    assert table.form(plural, poss, case) == (r.word if r.is_valid else None)
+
+    def test_verb_cells(self, paradigms):
+        gen = paradigms.generator
+        table = paradigms.verb("gel")
+        for tense in VERB_TENSES:
+            for person in VERB_PERSONS:
+                for negative in (False, True):
+                    r = gen.generate_verb("gel", tense, person, negative=negative)
+                    assert table.form(tense, person, negative) == (r.word if r.is_valid else None)
+
+    def test_lru(self, paradigms):
+        first = paradigms.noun("kitap")
+        assert paradigms.noun("kitap") is first
+        paradigms.verb("gel")
+        paradigms.noun("göz")
+        stats = paradigms.stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 1)
+        assert paradigms.noun("kitap") is not first
+
+    def test_invalidated_on_reload(self, paradigms, small_lexicon):
+        first = paradigms.noun("kitap")
+        small_lexicon.load(small_lexicon._source_path)
+        assert paradigms.noun("kitap") is not first
+
+    def test_invalid_kind(self, paradigms):
+        with pytest.raises(ValueError):
+            paradigms.get("adverb", "kitap")
+
+
+class TestExport:
+
+    def _read(self, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_jobs(self, small_lexicon):
+        jobs = paradigm_jobs(small_lexicon)
+        assert [stem for stem, _, _ in jobs] == sorted(stem for stem, _, _ in jobs)
+        assert all(kind == "verb" for _, pos, kind in jobs if pos == "v")
+        assert not any(stem == "nirä" for stem, _, _ in jobs)  # zarf: paradigma yok
+        assert {pos for _, pos, _ in paradigm_jobs(small_lexicon, pos=["v"])} == {"v"}
+
+    def test_deterministic(self, small_lexicon, tmp_path):
+        serial, parallel = str(tmp_path / "a.jsonl.gz"), str(tmp_path / "b.jsonl.gz")
+        count = export_paradigms(small_lexicon, serial, workers=1)
+        assert export_paradigms(small_lexicon, parallel, workers=2) == count
+        with open(serial, "rb") as a, open(parallel, "rb") as b:
+            assert a.read() == b.read()
+        records = self._read(serial)
+        assert len(records) == count
+        kitap = next(r for r in records if r["stem"] == "kitap")
+        assert kitap["type"] == "noun"
+        assert kitap["forms"]["pl|A1|A5"] == "kitaplarymda"
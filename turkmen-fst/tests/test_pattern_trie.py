@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Ters Ek Kalıbı Trie'si Testleri
+
+SuffixPatternTrie eşleşmelerinin tablo sırasıyla `endswith` taramasıyla
+aynı olduğunu ve kalıp tabanlı alt çözümleyicilerin bilinen sonuçlarını
+doğrular.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.pattern_trie import SuffixPatternTrie
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+WORDS = [
+    "ösdürmek", "edilen", "alnyp", "göñükdirilen", "okamaga", "goýýandygym",
+    "wajypdygy", "üstünlikli", "bermegiň", "gelýändigini", "okaýarlar",
+    "a", "", "niň", "laryň", "qqq",
+]
+
+TABLES = {
+    "infinitive": [p[0] for p in MorphologicalAnalyzer._INFINITIVE_PATTERNS],
+    "outer": [p[0] for p in MorphologicalAnalyzer._DERIVED_OUTER],
+    "voice": [p[0] for p in MorphologicalAnalyzer._VOICE],
+    "copula": MorphologicalAnalyzer._COPULA,
+    "derivation": [p[0] for p in MorphologicalAnalyzer._DERIVATION],
+    "abbreviation": [p[0] for p in MorphologicalAnalyzer._ABBR_SUFFIX_MAP],
+    "predicative": [p[0] for p in MorphologicalAnalyzer._DIGI_PATTERNS],
+}
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    lexicon = Lexicon()
+    lexicon.load(os.path.join(DATA_DIR, "turkmence_sozluk.txt"))
+    return MorphologicalAnalyzer(lexicon)
+
+
+def _reference(word, suffixes, end=None):
+    w = word[:end] if end is not None else word
+    return tuple((i, len(w) - len(s)) for i, s in enumerate(suffixes) if w.endswith(s))
+
+
+class TestSuffixPatternTrie:
+    """Trie ↔ endswith taraması eşdeğerliği."""
+
+    @pytest.mark.parametrize("word", WORDS)
+    def test_matches_equal_endswith(self, word):
+        trie = MorphologicalAnalyzer._PATTERN_TRIE
+        for table, suffixes in TABLES.items():
+            assert trie.table_matches(word, table) == _reference(word, suffixes), table
+
+    @pytest.mark.parametrize("end", [3, 5, 8])
+    def test_matches_at_split_point(self, end):
+        trie = MorphologicalAnalyzer._PATTERN_TRIE
+        word = "göñükdirilen"
+        assert trie.table_matches(word, "voice", end) == _reference(word, TABLES["voice"], end)
+
+    def test_list_order_not_length_order(self):
+        trie = SuffixPatternTrie({"t": ["ler", "r", "er"]})
+        assert trie.table_matches("geler", "t") == ((0, 2), (1, 4), (2, 3))
+
+    def test_duplicate_pattern_reported_twice(self):
+        trie = SuffixPatternTrie({"a": ["da"], "b": ["a", "da"]})
+        assert trie.matches("kitapda") == {"b": ((0, 6), (1, 5)), "a": ((0, 5),)}
+
+    def test_empty_pattern_rejected(self):
+        with pytest.raises(ValueError):
+            SuffixPatternTrie({"t": ["a", ""]})
+
+
+class TestPatternParsers:
+    """Trie üzerinden çalışan alt çözümleyicilerin bilinen çözümlemeleri."""
+
+    def test_derived_verb_double_voice(self, analyzer):
+        breakdowns = [r.breakdown for r in analyzer.parse_derived_verb("göñükdirilen")]
+        assert "Göñük (Kök) + dir (Ettirgen) + il (Edilgen) + en (Ortaç)" in breakdowns
+
+    def test_derived_verb_single_voice(self, analyzer):
+        assert any(r.stem == "Ös" for r in analyzer.parse_derived_verb("ösdürmek"))
+
+    def test_infinitive(self, analyzer):
+        assert any(r.stem == "Oka" for r in analyzer.parse_infinitive("okamaga"))
+
+    def test_predicative(self, analyzer):
+        assert analyzer.parse_predicative("wajypdygy")[0].stem == "Wajyp"
+
+    def test_abbreviation_requires_whole_suffix(self, analyzer):
+        assert analyzer.parse_abbreviation("BMG-niň")[0].stem == "BMG"
+        assert analyzer.parse_abbreviation("BMG-xniň") == []
@@ -9,6 +9,7 @@ Test kapsamı:
   - Ünsüz sertleşmesi (ters yön)
   - Ünlü düşmesi (burun→burn, asyl→asl)
   - Yuvarlaklaşma uyumu
+  - Kök profili (StemProfile)
 """
 
 import sys
@@ -17,6 +18,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import pytest
 from turkmen_fst.phonology import PhonologyRules, VowelSystem, VOWEL_DROP_CANDIDATES, VOWEL_DROP_EXCEPTIONS
+from turkmen_fst.phonology import StemProfile, stem_profile
 
 
 class TestVowelSystem:
@@ -214,3 +216,35 @@ class TestPreSuffixPipeline:
                                                         apply_drop=True,
                                                         apply_softening=True)
         assert result == "kitab"
+
+
+class TestStemProfile:
+    """Kök profili PhonologyRules fonksiyonlarıyla aynı sonucu vermeli."""
+
+    WORDS = ["kitap", "gelin", "ogul", "köwüş", "brn", "", "ata", "Kitap",
+             "gör", "aýt", "burun", "asyl", "süri", "mekdep", "okuwçy"]
+
+    @pytest.mark.parametrize("word", WORDS)
+    def test_matches_rules(self, word):
+        p = StemProfile(word)
+        assert p.word == word.lower()
+        assert p.quality == PhonologyRules.get_vowel_quality(word)
+        assert p.rounded == PhonologyRules.has_rounded_vowel(word)
+        assert p.ends_vowel == PhonologyRules.ends_with_vowel(word)
+        assert p.last_vowel == PhonologyRules.last_vowel(word)
+        assert p.vowel_count == sum(ch in VowelSystem.ALL for ch in word.lower())
+
+    def test_single_rounded(self):
+        assert StemProfile("gör").single_rounded is True
+        assert StemProfile("gel").single_rounded is False
+        assert StemProfile("okuw").single_rounded is False
+
+    def test_flags(self):
+        assert StemProfile("kitap").softenable is True
+        assert StemProfile("gelin").softenable is False
+        assert StemProfile("burun").drop_candidate is True
+        assert StemProfile("asyl").drop_candidate is True
+        assert StemProfile("kitap").drop_candidate is False
+
+    def test_cached(self):
+        assert stem_profile("kitap") is stem_profile("kitap")
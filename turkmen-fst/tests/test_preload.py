@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Önyükleme Testleri
+
+Süreçteki sözlüğün tek olduğunu, depodaki snapshot'ın güncel olduğunu,
+preload()'un snapshot'a bağlanıp paylaşılan yapıları kurduğunu ve fork
+edilen işçinin aynı nesneleri devraldığını doğrular.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import gc
+import runpy
+import pytest
+from turkmen_fst import preload as preload_module
+from turkmen_fst.lexicon import Lexicon, SNAPSHOT_SUFFIX
+from turkmen_fst.preload import preload, shared_lexicon, warm
+from turkmen_fst.stem_trie import StemTrie
+from turkmen_fst.fuzzy import SymSpellIndex
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+CONFIGS = [
+    os.path.join(os.path.dirname(__file__), "..", "gunicorn.conf.py"),
+    os.path.join(os.path.dirname(__file__), "..", "..", "gunicorn.conf.py"),
+]
+
+STEMS = {"kitap", "mekdep", "gel", "oka", "et", "alma", "at", "okuwçy"}
+
+
+@pytest.fixture
+def small_lexicon(tmp_path):
+    """Başlıklar + STEMS girişleri, geçici dizinde."""
+    path = tmp_path / "sozluk.txt"
+    with open(os.path.join(DATA_DIR, "turkmence_sozluk.txt"), encoding="utf-8") as src, \
+            open(path, "w", encoding="utf-8") as dst:
+        for line in src:
+            if line.startswith("%") or line.split("\t", 1)[0] in STEMS:
+                dst.write(line)
+    lex = Lexicon()
+    lex.load(str(path))
+    return lex
+
+
+def test_shipped_snapshot_is_current():
+    """Depodaki snapshot sözlükle güncel (değilse: python -m turkmen_fst snapshot)."""
+    path = os.path.join(DATA_DIR, "turkmence_sozluk.txt")
+    assert os.path.exists(path + SNAPSHOT_SUFFIX)
+    lexicon = Lexicon()
+    lexicon.load(path, use_snapshot=True)
+    assert lexicon.is_mapped
+
+
+def test_shared_lexicon_is_single():
+    lexicon = shared_lexicon()
+    assert lexicon is shared_lexicon()
+    assert lexicon is preload_module._lexicon
+    assert lexicon.is_loaded and lexicon.word_count > 30000
+
+
+def test_preload_maps_snapshot(small_lexicon):
+    assert not small_lexicon.is_mapped
+    stats = preload(small_lexicon, write_snapshot=True, freeze=False)
+    assert os.path.exists(small_lexicon.source_path + SNAPSHOT_SUFFIX)
+    assert small_lexicon.is_mapped and stats["mapped"]
+    assert stats["lexicon_words"] == small_lexicon.word_count
+    assert small_lexicon.lookup("kitap")
+
+
+def test_preload_without_snapshot(small_lexicon):
+    preload(small_lexicon, freeze=False)  # sunucu süreçleri snapshot yazmaz
+    assert not small_lexicon.is_mapped
+    assert not os.path.exists(small_lexicon.source_path + SNAPSHOT_SUFFIX)
+
+
+def test_warm_builds_shared_structures(small_lexicon):
+    warm(small_lexicon)
+    trie = StemTrie.for_lexicon(small_lexicon)
+    index = SymSpellIndex.for_lexicon(small_lexicon)
+    warm(small_lexicon)  # kuruluysa yeniden kurulmaz
+    assert StemTrie.for_lexicon(small_lexicon) is trie
+    assert SymSpellIndex.for_lexicon(small_lexicon) is index
+
+
+@pytest.mark.parametrize("path", CONFIGS, ids=["api", "app"])
+def test_config_keeps_gc_enabled(path):
+    config = runpy.run_path(path)
+    assert gc.isenabled()
+    assert config["preload_app"] and "post_fork" not in config
+
+
+def test_preload_freezes(small_lexicon):
+    try:
+        stats = preload(small_lexicon, write_snapshot=False)
+        assert stats["frozen"] > 0 and gc.get_freeze_count() == stats["frozen"]
+    finally:
+        gc.unfreeze()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork yok")
+def test_forked_worker_inherits_structures(small_lexicon):
+    preload(small_lexicon, write_snapshot=False, freeze=False)
+    expected = f"{id(StemTrie.for_lexicon(small_lexicon))} " \
+               f"{id(SymSpellIndex.for_lexicon(small_lexicon))}"
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # işçi: yapılar yeniden kurulmamalı
+        os.close(read_fd)
+        got = f"{id(StemTrie.for_lexicon(small_lexicon))} " \
+              f"{id(SymSpellIndex.for_lexicon(small_lexicon))}"
+        os.write(write_fd, got.encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        got = f.read()
+    os.waitpid(pid, 0)
+    assert got == expected
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Çözümleme Profili Testleri
+
+Profilin sonuçları değiştirmemesi, aşama sayaçları, önbellek isabeti,
+iç içe çözümleyicilerin dış aşamaya sayılması ve çıkış biçimleri.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import json
+import logging
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.cache import AnalysisCache
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.profiling import (
+    ParseProfiler, MemorySink, PrometheusSink, JsonLogSink, STAGES
+)
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+DICT_PATH = os.path.join(DATA_DIR, "turkmence_sozluk.txt")
+
+WORDS = ["kitabym", "geldim", "degişlidir", "BMG-niň", "goýýandygym", "okamaga"]
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    lexicon = Lexicon()
+    lexicon.load(DICT_PATH)
+    return lexicon
+
+
+class _ListSink:
+    def __init__(self):
+        self.records = []
+
+    def record(self, record):
+        self.records.append(record)
+
+
+def _signature(multi):
+    return [(r.stem, r.breakdown, r.word_type) for r in multi.results]
+
+
+class TestParseProfiler:
+
+    def test_results_unchanged(self, lexicon):
+        plain = MorphologicalAnalyzer(lexicon)
+        profiled = MorphologicalAnalyzer(lexicon, profiler=ParseProfiler(MemorySink()))
+        for word in WORDS:
+            assert _signature(profiled.parse(word)) == _signature(plain.parse(word)), word
+
+    def test_stage_counters(self, lexicon):
+        sink = _ListSink()
+        analyzer = MorphologicalAnalyzer(lexicon, profiler=ParseProfiler(sink))
+        multi = analyzer.parse("kitabym")
+        record, = sink.records
+        assert record.word == "kitabym"
+        assert record.results == multi.count
+        assert not record.cached
+        assert list(record.stages) == ["noun", "verb", "infinitive", "derived_verb",
+                                       "derivation", "pronoun", "predicative"]
+        noun = record.stages["noun"]
+        assert noun.calls == 1
+        assert noun.candidates > 0
+        assert noun.generator_calls > 0
+        assert noun.matches >= 1
+        assert record.seconds >= sum(s.seconds for s in record.stages.values())
+
+    def test_nested_parse_counted_once(self, lexicon):
+        sink = _ListSink()
+        analyzer = MorphologicalAnalyzer(lexicon, profiler=ParseProfiler(sink))
+        analyzer.parse("degişlidir")
+        # Kopula denemesi özyinelemeli parse() çağırır; tek kayıt oluşur
+        record, = sink.records
+        assert record.stages["copula"].calls == 1
+        assert record.stages["noun"].calls == 1
+
+    def test_cache_hit(self, lexicon):
+        sink = _ListSink()
+        analyzer = MorphologicalAnalyzer(lexicon, cache=AnalysisCache(),
+                                         profiler=ParseProfiler(sink))
+        analyzer.parse("kitabym")
+        analyzer.parse("Kitabym")
+        first, second = sink.records
+        assert not first.cached and first.stages
+        assert second.cached and not second.stages
+
+    def test_generator_calls_outside_parse_ignored(self, lexicon):
+        sink = _ListSink()
+        analyzer = MorphologicalAnalyzer(lexicon, profiler=ParseProfiler(sink))
+        analyzer.noun_gen.generate("kitap", True)
+        assert sink.records == []
+
+
+class TestSinks:
+
+    def test_memory_sink(self, lexicon):
+        sink = MemorySink(hot_words=3)
+        analyzer = MorphologicalAnalyzer(lexicon, profiler=ParseProfiler(sink))
+        for word in WORDS:
+            analyzer.parse(word)
+        snap = sink.snapshot()
+        assert snap["parses"] == len(WORDS)
+        assert snap["stages"]["noun"]["calls"] == len(WORDS) - 1  # BMG-niň kısaltmada biter
+        assert list(snap["stages"]) == [s for s in STAGES if s in snap["stages"]]
+        hot = sink.hot()
+        assert len(hot) == 3
+        assert [s for _, s in hot] == sorted((s for _, s in hot), reverse=True)
+        sink.reset()
+        assert sink.snapshot()["parses"] == 0
+
+    def test_prometheus_render(self, lexicon):
+        sink = PrometheusSink()
+        analyzer = MorphologicalAnalyzer(lexicon, profiler=ParseProfiler(sink))
+        analyzer.parse("kitabym")
+        text = sink.render()
+        assert "# TYPE turkmen_fst_parses_total counter" in text
+        assert "turkmen_fst_parses_total 1" in text
+        assert 'turkmen_fst_stage_calls_total{stage="noun"} 1' in text
+        for line in text.splitlines():
+            if not line.startswith("#"):
+                name_labels, value = line.rsplit(" ", 1)
+                float(value)
+
+    def test_json_log_sink(self, lexicon, caplog):
+        logger = logging.getLogger("turkmen_fst.profile.test")
+        analyzer = MorphologicalAnalyzer(
+            lexicon, profiler=ParseProfiler(JsonLogSink(logger, min_seconds=0.0)))
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            analyzer.parse("geldim")
+        record = json.loads(caplog.records[-1].getMessage())
+        assert record["word"] == "geldim"
+        assert record["stages"]["verb"]["matches"] >= 1
+
+    def test_json_log_threshold(self, lexicon, caplog):
+        logger = logging.getLogger("turkmen_fst.profile.test")
+        analyzer = MorphologicalAnalyzer(
+            lexicon, profiler=ParseProfiler(JsonLogSink(logger, min_seconds=3600.0)))
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            analyzer.parse("geldim")
+        assert not caplog.records
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Gölge Mod Testleri
+
+Hızlandırılmış analizörün referans çözümleyiciyle aynı çözümlemeleri
+verdiğini, farkların günlüğe yazıldığını ve gölge denetimin canlı
+önbelleğe dokunmadığını doğrular.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import json
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.cache import AnalysisCache
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.pattern_trie import SuffixPatternScan
+from turkmen_fst.profiling import MemorySink, ParseProfiler
+from turkmen_fst.shadow import ShadowChecker, ReferenceAnalyzer, breakdowns
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+WORDS = [
+    "kitabym", "kitaplarymyzdan", "geldim", "okaýarys", "mekdepdäki",
+    "göñükdirilen", "BMG-niň", "wajypdygy", "mundan", "qqq",
+]
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    lex = Lexicon()
+    lex.load(os.path.join(DATA_DIR, "turkmence_sozluk.txt"))
+    return lex
+
+
+@pytest.fixture(scope="module")
+def reference(lexicon):
+    return ReferenceAnalyzer(lexicon)
+
+
+class _DropsDerivations(MorphologicalAnalyzer):
+    """Hatalı hızlı yol: yapım eki çözümlemelerini kaybeder."""
+
+    def parse_derivation(self, word):
+        return []
+
+
+class TestReferenceAgreement:
+    """Mevcut hızlı yollar referansla aynı çözümleme kümesini verir."""
+
+    @pytest.mark.parametrize("word", WORDS)
+    def test_default_analyzer(self, lexicon, reference, word):
+        fast = MorphologicalAnalyzer(lexicon)
+        assert breakdowns(fast.parse(word)) == breakdowns(reference.parse(word))
+
+    def test_cached_analyzer(self, lexicon, reference):
+        """Çevrimdışı denetim hızlı yolu önbelleksiz ve profilsiz çalıştırır."""
+        sink = MemorySink()
+        fast = MorphologicalAnalyzer(lexicon, cache=AnalysisCache(64),
+                                     profiler=ParseProfiler(sink))
+        checker = ShadowChecker(fast, reference)
+        checker.check_many(WORDS + WORDS)
+        stats = checker.stats()
+        assert stats["checked"] == 2 * len(WORDS)
+        assert stats["mismatches"] == 0
+        assert stats["speedup"] is not None
+        assert len(fast.cache) == 0 and fast.cache.hits == 0
+        assert sink.snapshot()["parses"] == 0
+
+    @pytest.mark.parametrize("word", WORDS)
+    def test_known_agrees(self, lexicon, reference, word):
+        checker = ShadowChecker(MorphologicalAnalyzer(lexicon), reference)
+        assert checker.check_known(word).match
+
+
+class TestReferenceAnalyzer:
+    """Referans yol hızlandırmasızdır."""
+
+    def test_no_pattern_trie(self, reference):
+        assert isinstance(reference._PATTERN_TRIE, SuffixPatternScan)
+        assert not isinstance(MorphologicalAnalyzer._PATTERN_TRIE, SuffixPatternScan)
+
+    def test_ignores_attached_accelerators(self, lexicon):
+        class _Index:
+            def covers(self, stem):
+                raise AssertionError("referans dizine bakmamalı")
+            lookup = covers
+
+        ref = ReferenceAnalyzer(lexicon)
+        assert ref.cache is None and ref.profiler is None and ref.known_forms is None
+        ref.noun_index = ref.verb_index = _Index()
+        assert ref.tail_automaton is None
+        assert "Kitap (Kök) + ym (D₁b)" in breakdowns(ref.parse("kitabym"))
+
+
+class TestShadowChecker:
+
+    def test_mismatch_logged(self, lexicon, reference, tmp_path):
+        log = str(tmp_path / "shadow.jsonl")
+        checker = ShadowChecker(_DropsDerivations(lexicon), reference,
+                                log_path=log, log_matches=False)
+        record = checker.check("üstünlikli")
+        assert not record.match
+        assert record.only_reference == ["Üstünlik (Kök) + li (Sıfat yapım eki)"]
+        assert checker.check("geldim").match
+
+        lines = [json.loads(line) for line in open(log, encoding="utf-8")]
+        assert [line["word"] for line in lines] == ["üstünlikli"]
+        assert lines[0]["match"] is False and lines[0]["reference_ms"] >= 0
+        assert checker.stats()["recent_mismatches"] == ["üstünlikli"]
+
+    def test_served_result_compared(self, lexicon, reference):
+        """Canlı denetim isteğe hizmet eden yolun sonucunu ve süresini kullanır."""
+        checker = ShadowChecker(MorphologicalAnalyzer(lexicon), reference)
+        record = checker.check("kitabym", "analyze", frozenset(["Kitab (Kök)"]), 0.002)
+        assert not record.match and record.fast_seconds == 0.002
+        assert record.only_fast == ["Kitab (Kök)"]
+
+    def test_known_mismatch(self, lexicon, reference, tmp_path):
+        log = str(tmp_path / "shadow.jsonl")
+        checker = ShadowChecker(MorphologicalAnalyzer(lexicon), reference, log_path=log)
+        assert not checker.check_known("kitabym", "spellcheck", known=False,
+                                       fast_seconds=0.0001).match
+        assert checker.check_known("qqq", "spellcheck", known=False, fast_seconds=0.0001).match
+        line = json.loads(open(log, encoding="utf-8").readline())
+        assert line["check"] == "known" and line["only_reference"] == ["known"]
+        stats = checker.stats()
+        assert stats["checks"]["known"]["checked"] == 2
+        assert stats["checks"]["known"]["mismatches"] == 1
+        assert stats["checks"]["analysis"]["checked"] == 0
+
+    def test_enqueue(self, lexicon, reference):
+        checker = ShadowChecker(MorphologicalAnalyzer(lexicon), reference, sample_rate=0.0)
+        assert checker.enqueue("kitabym", "analyze",
+                               breakdowns(reference.parse("kitabym")), 0.001)
+        assert checker.enqueue_known("qqq", "spellcheck", False, 0.001)
+        checker.join()
+        stats = checker.stats()
+        assert stats["checked"] == 2 and stats["mismatches"] == 0
+        assert stats["checks"]["analysis"]["checked"] == 1
+
+    def test_submit_sampling(self, lexicon, reference):
+        off = ShadowChecker(MorphologicalAnalyzer(lexicon), reference, sample_rate=0.0)
+        assert off.submit("kitabym") is False
+        assert off.submit_many(["kitabym", "geldim"]) == 0
+
+        on = ShadowChecker(MorphologicalAnalyzer(lexicon), reference, sample_rate=1.0)
+        assert on.submit("kitabym", "analyze")
+        assert on.submit_many(["geldim", "okaýarys"], "spellcheck") == 2
+        on.join()
+        stats = on.stats()
+        assert stats["checked"] == 3 and stats["mismatches"] == 0 and stats["pending"] == 0
+
+    def test_full_queue_drops(self, lexicon, reference):
+        checker = ShadowChecker(MorphologicalAnalyzer(lexicon), reference,
+                                sample_rate=1.0, queue_size=1)
+        checker._ensure_worker = lambda: None  # işçi yok: kuyruk boşalmaz
+        assert checker.submit("kitabym")
+        assert not checker.submit("geldim")
+        assert checker.stats()["dropped"] == 1
+
+    def test_invalid_rate(self, lexicon, reference):
+        with pytest.raises(ValueError):
+            ShadowChecker(MorphologicalAnalyzer(lexicon), reference, sample_rate=1.5)
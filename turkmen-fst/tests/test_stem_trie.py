@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Kök Trie'si Testleri
+
+StemTrie.candidates() sonucunun eski yöntemle (tüm adayları üretip
+sözlükte arama) aynı kümeyi, uzundan kısaya sıralı verdiğini doğrular.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.stem_trie import StemTrie
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+WORDS = [
+    "kitabym", "kitaplarymyzdan", "burny", "asly", "ylmy", "nesli", "guzusy",
+    "sürüsi", "derejä", "sergä", "guza", "gülläp", "oglumyz", "geldim",
+    "okaýarys", "mekdepdäki", "a", "qqq", "Kitabym", "at",
+]
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    lexicon = Lexicon()
+    lexicon.load(os.path.join(DATA_DIR, "turkmence_sozluk.txt"))
+    return MorphologicalAnalyzer(lexicon)
+
+
+def _reference(analyzer, word):
+    return {c for c in analyzer._raw_stem_candidates(word) if analyzer.lexicon.exists(c)}
+
+
+class TestStemTrie:
+    """Trie ↔ üret-ve-ara eşdeğerliği."""
+
+    def test_same_candidates(self, analyzer):
+        for word in WORDS:
+            candidates = analyzer._generate_stem_candidates(word)
+            assert set(candidates) == _reference(analyzer, word), word
+            assert len(candidates) == len(set(candidates))
+            lengths = [len(c) for c in candidates]
+            assert lengths == sorted(lengths, reverse=True)
+
+    def test_lexicon_sample(self, analyzer):
+        """Sözlük anahtarları ve basit ekli halleri."""
+        for key in analyzer.lexicon.all_words()[::50]:
+            for word in (key, key + "ym", key + "lary", key + "a"):
+                assert set(analyzer.stem_trie.candidates(word)) == \
+                       _reference(analyzer, word), word
+
+    def test_reverse_phonology(self, analyzer):
+        trie = analyzer.stem_trie
+        assert "kitap" in trie.candidates("kitabym")
+        assert "burun" in trie.candidates("burny")
+        assert "asyl" in trie.candidates("asly")
+        assert "guzy" in trie.candidates("guzusy")
+
+    def test_rebuilt_on_reload(self, analyzer):
+        lexicon = Lexicon()
+        lexicon.load(os.path.join(DATA_DIR, "turkmence_sozluk.txt"))
+        fresh = MorphologicalAnalyzer(lexicon)
+        trie = fresh.stem_trie
+        assert fresh.stem_trie is trie
+        lexicon.load(os.path.join(DATA_DIR, "turkmence_sozluk.txt"))
+        assert fresh.stem_trie is not trie
+
+    def test_without_lexicon(self):
+        candidates = MorphologicalAnalyzer()._generate_stem_candidates("kitabym")
+        assert "kitap" in candidates and "kitabym" in candidates
+
+    def test_empty_lexicon(self):
+        assert StemTrie.build(Lexicon()).candidates("kitap") == []
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Yazım Önerisi Testleri
+
+Ağırlıklı uzaklık, ek kuyruğu tablosu ve kökü düzeltip ekleri yeniden
+ekleyen SuggestionEngine.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.fuzzy import weighted_edit_distance, CONFUSION_COST
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.suggest import SuggestionEngine, SuffixTailTable, tail_key
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+DICT_PATH = os.path.join(DATA_DIR, "turkmence_sozluk.txt")
+
+
+@pytest.fixture(scope="module")
+def engine():
+    lexicon = Lexicon()
+    lexicon.load(DICT_PATH)
+    # Testte süre bütçesi sonuçları etkilemesin
+    return SuggestionEngine(MorphologicalAnalyzer(lexicon), budget_ms=10_000)
+
+
+class TestWeightedDistance:
+
+    def test_confusions_are_cheap(self):
+        assert weighted_edit_distance("yagsy", "ýagşy") == pytest.approx(2 * CONFUSION_COST)
+        assert weighted_edit_distance("kitaplaryn", "kitaplaryň") == pytest.approx(CONFUSION_COST)
+
+    def test_plain_edits(self):
+        assert weighted_edit_distance("kitap", "kitap") == 0
+        assert weighted_edit_distance("kitap", "kitab") == 1
+        assert weighted_edit_distance("kitap", "kitaplar") == 3
+
+
+class TestSuffixTailTable:
+
+    def test_harmony_folded(self):
+        assert tail_key("larym") == tail_key("lerim") == tail_key("larim")
+
+    def test_known_tails(self, engine):
+        tails = SuffixTailTable.for_lexicon(engine.lexicon)
+        assert tails.get("lar")
+        assert tails.get("lerimiz")
+        assert not tails.get("qqq")
+
+
+class TestSuggestionEngine:
+
+    @pytest.mark.parametrize("wrong,expected", [
+        ("kitaplarim", "kitaplarym"),     # ek uyumu
+        ("mugalymlar", "mugallymlar"),    # kök hatası, ek korunur
+        ("kitapym", "kitabym"),           # yumuşama köke göre yeniden üretilir
+        ("kitaplaryn", "kitaplaryň"),     # klavye karışıklığı
+        ("yagsy", "ýagşy"),
+    ])
+    def test_top_suggestion(self, engine, wrong, expected):
+        assert engine.suggest(wrong)[0] == expected
+
+    def test_suggestions_are_valid_forms(self, engine):
+        for form in engine.suggest("mugalymlar"):
+            assert engine.analyzer.parse(form).success, form
+
+    def test_ranked_by_cost(self, engine):
+        costs = [cost for cost, _ in engine.rank("okuwcylar")]
+        assert costs == sorted(costs)
+        assert costs and costs[-1] <= engine.max_cost
+
+    def test_budget(self, engine):
+        fast = SuggestionEngine(engine.analyzer, budget_ms=0)
+        # Bütçe dolduğunda o ana kadarki (en az ilk kökün) adayları döner
+        assert len(fast.rank("mugalymlar")) <= len(engine.rank("mugalymlar"))
+
+    def test_empty(self, engine):
+        assert engine.suggest("") == []
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Ek Kuyruğu Otomatı Testleri
+
+Otomatın üretilebilen her formu kabul etmesi (sonuç kaybı yok), olanaksız
+kuyrukları elemesi ve analizör sonuçlarını değiştirmemesi.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.form_index import (
+    NOUN_COMBOS, VERB_TENSES, VERB_PERSONS, noun_softening_variants, rounding_key
+)
+from turkmen_fst.generator import NounGenerator, VerbGenerator
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.tail_automaton import SuffixTailAutomaton, tail_of
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+DICT_PATH = os.path.join(DATA_DIR, "turkmence_sozluk.txt")
+
+STEMS = ["kitap", "burun", "ogul", "asyl", "guzy", "süri", "at", "gelin", "hepde",
+         "göz", "gel", "oka", "et", "git", "gör", "otyr", "dur", "gülle", "ýaz", "al"]
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    lexicon = Lexicon()
+    lexicon.load(DICT_PATH)
+    return lexicon
+
+
+@pytest.fixture(scope="module")
+def automaton(lexicon):
+    return SuffixTailAutomaton.for_lexicon(lexicon)
+
+
+class PlainAnalyzer(MorphologicalAnalyzer):
+    """Referans: otomatsız generate-and-compare."""
+
+    @property
+    def tail_automaton(self):
+        return None
+
+
+def test_tail_of():
+    assert tail_of("kitap", "kitaby") == "by"
+    assert tail_of("byryn", "byrnym") == "nym"
+    assert tail_of("gel", "gel") == ""
+
+
+class TestAcceptsGenerated:
+
+    @pytest.mark.parametrize("stem", STEMS)
+    def test_noun_forms(self, lexicon, automaton, stem):
+        gen = NounGenerator(lexicon)
+        for yumusama_izni, _ in noun_softening_variants(lexicon, stem):
+            for plural, poss, poss_type, case, daky in NOUN_COMBOS:
+                r = gen.generate(stem, plural, poss, poss_type, case,
+                                 yumusama_izni=yumusama_izni, daky=daky)
+                if r.is_valid:
+                    assert automaton.noun_possible(stem, rounding_key(r.word)), r.word
+
+    @pytest.mark.parametrize("stem", STEMS)
+    def test_verb_forms(self, lexicon, automaton, stem):
+        grid = VerbGenerator(lexicon).generate_all(stem, VERB_TENSES, VERB_PERSONS)
+        for r in grid.values():
+            if r.is_valid:
+                last = r.word.lower().split()[-1]
+                assert automaton.verb_possible(stem, rounding_key(last)), r.word
+
+
+class TestRejects:
+
+    def test_impossible_tails(self, automaton):
+        assert not automaton.noun_possible("kitap", rounding_key("kitapzyk"))
+        assert not automaton.noun_possible("gel", rounding_key("gelinlerimizden"))
+        assert not automaton.verb_possible("gel", rounding_key("gelkitap"))
+
+    def test_unknown_stem_not_filtered(self, automaton):
+        assert automaton.noun_possible("qqqq", rounding_key("qqqqzzz"))
+        assert automaton.verb_possible("qqqq", rounding_key("qqqqzzz"))
+
+
+class TestAnalyzerUnchanged:
+
+    WORDS = ["kitabym", "burnumyz", "guzulary", "gelýärin", "okadyk", "edipdir",
+             "gelinlerimizden", "gülläp", "görmedik", "ýazjak", "otyrsyňyz",
+             "kitapçylyk", "hepdäniň", "alnyp", "geljekdigini", "bolsam", "agzymyz"]
+
+    def test_same_results(self, lexicon):
+        fast = MorphologicalAnalyzer(lexicon)
+        plain = PlainAnalyzer(lexicon)
+        for word in self.WORDS:
+            a = [(r.stem, r.breakdown, r.word_type, r.meaning) for r in fast.parse(word).results]
+            b = [(r.stem, r.breakdown, r.word_type, r.meaning) for r in plain.parse(word).results]
+            assert a == b, word
+
+
+def test_shared_and_rebuilt():
+    lexicon = Lexicon()
+    lexicon.load(DICT_PATH)
+    automaton = SuffixTailAutomaton.for_lexicon(lexicon)
+    assert SuffixTailAutomaton.for_lexicon(lexicon) is automaton
+    lexicon.load(DICT_PATH)
+    assert SuffixTailAutomaton.for_lexicon(lexicon) is not automaton
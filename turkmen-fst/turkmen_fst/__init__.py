@@ -10,6 +10,9 @@ Modüller:
     - morphotactics: Ek sırası kuralları (FST-inspired state machine)
     - generator: Sentez (üretim) motoru
     - analyzer: Tahlil (analiz) motoru
+    - cache: Analiz sonuçları için LRU önbellek
+    - suggest: Çekim duyarlı yazım önerileri
+    - fst: Harf düzeyinde sonlu durum dönüştürücü ve FSTAnalyzer
 """
 
 __version__ = "1.0.0"
@@ -20,3 +23,6 @@ from turkmen_fst.lexicon import Lexicon, LexiconEntry
 from turkmen_fst.morphotactics import NounMorphotactics, VerbMorphotactics
 from turkmen_fst.generator import MorphologicalGenerator, GenerationResult
 from turkmen_fst.analyzer import MorphologicalAnalyzer, AnalysisResult
+from turkmen_fst.cache import AnalysisCache
+from turkmen_fst.suggest import SuggestionEngine
+from turkmen_fst.fst import TurkmenFST, FSTAnalyzer
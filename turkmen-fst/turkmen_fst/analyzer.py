@@ -14,15 +14,27 @@ Otomatik:     parse()       — birden fazla sonuç döndürebilen ana giriş no
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Optional
+import multiprocessing
+import re
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Iterator, Optional
 
 from turkmen_fst.phonology import (
-    PhonologyRules, VowelSystem, SOFTENING_TABLE,
+    PhonologyRules, VowelSystem, SOFTENING_TABLE, stem_profile,
     VOWEL_DROP_CANDIDATES, VOWEL_DROP_EXCEPTIONS,
     YUVARLAKLASMA_LISTESI
 )
-from turkmen_fst.lexicon import Lexicon, HOMONYMS
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.cache import AnalysisCache
+from turkmen_fst.profiling import ParseProfiler
+from turkmen_fst.pattern_trie import SuffixPatternTrie
+from turkmen_fst.stem_trie import StemTrie
+from turkmen_fst.tail_automaton import SuffixTailAutomaton
+from turkmen_fst.form_index import (
+    NOUN_COMBOS, VERB_COMBOS, NounFormIndex, VerbFormIndex, noun_softening_variants,
+    rounding_key
+)
+from turkmen_fst.known_forms import KnownForms
 
 
 # ==============================================================================
@@ -74,6 +86,14 @@ class MultiAnalysisResult:
         return self.count > 0
 
 
+def _with_original(multi: MultiAnalysisResult, word: str) -> MultiAnalysisResult:
+    """Sonucun kopyasını `original` alanları verilen yazımla döndürür."""
+    return MultiAnalysisResult(
+        original=word,
+        results=[replace(r, original=word, suffixes=list(r.suffixes))
+                 for r in multi.results])
+
+
 # ==============================================================================
 #  DISPLAY KODLARI
 # ==============================================================================
@@ -151,8 +171,20 @@ class MorphologicalAnalyzer:
             print(r.breakdown)
     """
 
-    def __init__(self, lexicon: Optional[Lexicon] = None):
+    def __init__(self, lexicon: Optional[Lexicon] = None,
+                 noun_index: Optional[NounFormIndex] = None,
+                 verb_index: Optional[VerbFormIndex] = None,
+                 cache: Optional[AnalysisCache] = None,
+                 profiler: Optional[ParseProfiler] = None,
+                 known_forms: Optional[KnownForms] = None):
         self.lexicon = lexicon
+        self.noun_index = noun_index
+        self.verb_index = verb_index
+        self.cache = cache
+        self.profiler = profiler
+        self.known_forms = known_forms
+        self._stem_trie = None  # (sözlük nesli, StemTrie)
+        self._tail_automaton = None  # (sözlük nesli, SuffixTailAutomaton)
         self._noun_gen = None
         self._verb_gen = None
 
@@ -161,6 +193,8 @@ class MorphologicalAnalyzer:
         if self._noun_gen is None:
             from turkmen_fst.generator import NounGenerator
             self._noun_gen = NounGenerator(self.lexicon)
+        if self.profiler is not None:
+            return self.profiler.counting(self._noun_gen)
         return self._noun_gen
 
     @property
@@ -168,12 +202,80 @@ class MorphologicalAnalyzer:
         if self._verb_gen is None:
             from turkmen_fst.generator import VerbGenerator
             self._verb_gen = VerbGenerator(self.lexicon)
+        if self.profiler is not None:
+            return self.profiler.counting(self._verb_gen)
         return self._verb_gen
 
+    def build_noun_index(self) -> NounFormIndex:
+        """
+        Sözlükteki isimler için yüzey formu dizinini oluşturur ve bağlar.
+
+        Oluşturma bir kerelik maliyettir (tüm sözlükte ~40 sn); dizin
+        NounFormIndex.save() ile diske yazılıp sonraki açılışlarda yüklenebilir.
+        """
+        if self.lexicon is None:
+            raise ValueError("Dizin oluşturmak için sözlük gerekli")
+        self.noun_index = NounFormIndex.build(self.lexicon)
+        return self.noun_index
+
+    def build_verb_index(self) -> VerbFormIndex:
+        """
+        Sözlükteki fiiller için yüzey formu dizinini oluşturur ve bağlar.
+
+        Oluşturma bir kerelik maliyettir (tüm sözlükte ~20 sn).
+        """
+        if self.lexicon is None:
+            raise ValueError("Dizin oluşturmak için sözlük gerekli")
+        self.verb_index = VerbFormIndex.build(self.lexicon)
+        return self.verb_index
+
+    def build_known_forms(self) -> KnownForms:
+        """
+        is_known() için bilinen yüzey formu kümesini oluşturur ve bağlar.
+
+        Oluşturma bir kerelik maliyettir (tüm sözlükte ~2 dk); küme
+        KnownForms.save() ile diske yazılıp sonraki açılışlarda yüklenebilir.
+        """
+        if self.lexicon is None:
+            raise ValueError("Küme oluşturmak için sözlük gerekli")
+        self.known_forms = KnownForms.build(self.lexicon)
+        return self.known_forms
+
     # ------------------------------------------------------------------
     #  KÖK ADAY OLUŞTURUCU
     # ------------------------------------------------------------------
 
+    @property
+    def stem_trie(self) -> StemTrie:
+        """Sözlüğün ters fonoloji trie'si (sözlük başına bir kez, ~0.4 sn'de kurulur)."""
+        generation = self.lexicon.generation
+        cached = self._stem_trie
+        if cached is None or cached[0] != generation:
+            cached = (generation, StemTrie.for_lexicon(self.lexicon))
+            self._stem_trie = cached
+        return cached[1]
+
+    @property
+    def tail_automaton(self) -> Optional[SuffixTailAutomaton]:
+        """Sözlüğün ek kuyruğu otomatı (sözlük başına bir kez kurulur)."""
+        if self.lexicon is None:
+            return None
+        generation = self.lexicon.generation
+        cached = self._tail_automaton
+        if cached is None or cached[0] != generation:
+            cached = (generation, SuffixTailAutomaton.for_lexicon(self.lexicon))
+            self._tail_automaton = cached
+        return cached[1]
+
+    def prepare(self) -> None:
+        """
+        Sözlüğe bağlı paylaşılan yapıları (StemTrie, SuffixTailAutomaton)
+        önceden kurar; aksi halde ilk parse() çağrısında kurulurlar.
+        """
+        if self.lexicon is not None:
+            self.stem_trie
+            self.tail_automaton
+
     def _generate_stem_candidates(self, word: str) -> list[str]:
         """
         Verilen kelimeden olası kök adaylarını üretir.
@@ -181,6 +283,24 @@ class MorphologicalAnalyzer:
         Ek soyma, ünsüz yumuşaması / ünlü düşmesi / yuvarlaklaşma
         geri alma işlemleriyle tüm olası kökleri listeler,
         sonra sözlüke kontrol ederek filtreler.
+
+        Sözlük varsa adaylar StemTrie üzerinde tek yürüyüşle bulunur
+        (aynı küme, uzundan kısaya).
+        """
+        if self.lexicon:
+            candidates = self.stem_trie.candidates(word)
+        else:
+            candidates = sorted(self._raw_stem_candidates(word), key=len, reverse=True)
+        if self.profiler is not None:
+            self.profiler.count_candidates(len(candidates))
+        return candidates
+
+    def _raw_stem_candidates(self, word: str) -> set[str]:
+        """
+        Sözlükte doğrulanmamış tüm kök adayları.
+
+        StemTrie aynı dönüşümleri sözlük anahtarlarına ters yönde uygular;
+        iki tarafın kuralları birlikte değiştirilmelidir.
         """
         candidates = set()
         w = word.lower()
@@ -235,23 +355,44 @@ class MorphologicalAnalyzer:
                 # a→e varyantı (nadir ama tireli bileşiklerde olabilir)
                 pass
 
-        # Sözlükte olanları filtrele
-        if self.lexicon:
-            verified = [c for c in candidates if self.lexicon.exists(c)]
-            return sorted(verified, key=len, reverse=True)
+        return candidates
 
-        return sorted(candidates, key=len, reverse=True)
+    def _noun_hits(self, word: str, stem: str) -> Optional[list[tuple[int, int]]]:
+        """
+        Kelimeyi kökten üreten (varyant_no, kombinasyon_no) çiftleri.
+
+        None → bu kök için hızlı yol yok, tüm NOUN_COMBOS denenir.
+        """
+        if self.noun_index is not None and self.noun_index.covers(stem):
+            return self.noun_index.lookup(word, stem)
+        return None
+
+    def _verb_hits(self, word: str, stem: str) -> Optional[list[int]]:
+        """
+        Zamirsiz fiil formunu kökten üreten VERB_COMBOS numaraları.
+
+        None → bu kök için hızlı yol yok, tüm VERB_COMBOS denenir.
+        """
+        if self.verb_index is not None:
+            return self.verb_index.lookup(word, stem, self.verb_gen)
+        return None
 
     # ------------------------------------------------------------------
     #  İSİM TAHLİLİ
     # ------------------------------------------------------------------
 
-    def parse_noun(self, word: str) -> list[AnalysisResult]:
+    def parse_noun(self, word: str, first: bool = False) -> list[AnalysisResult]:
         """
         İsim kelimesini generator ile doğrulayarak çözümler.
 
         Her kök adayı × her (çoğul, iyelik, hal) kombinasyonu denenir.
         Üretim sonucu girişle eşleşirse geçerli çözümleme olarak eklenir.
+        first=True ise ilk çözümlemede durulur (is_known()).
+
+        Analizöre NounFormIndex bağlıysa dizindeki kökler için yalnızca
+        dizinin bulduğu kombinasyonlar üretilir (sonuç aynıdır). Kalan
+        kuyruğu hiçbir ek dizisi üretemeyen kökler SuffixTailAutomaton ile
+        generator çağrılmadan elenir.
         """
         w = word.lower().strip()
         if not w:
@@ -261,122 +402,106 @@ class MorphologicalAnalyzer:
         seen = set()
 
         candidates = self._generate_stem_candidates(w)
-
-        plural_opts = [False, True]
-        poss_opts = [None, "A1", "A2", "A3"]
-        poss_type_opts = ["tek", "cog"]
-        # case + daky pairs: normal cases OR daky (aitlik eki replaces case)
-        case_daky_opts = [
-            (None, False), ("A2", False), ("A3", False),
-            ("A4", False), ("A5", False), ("A6", False),
-            (None, True),  # daky: lokatif+kI → göreceli sıfat
-        ]
+        all_combos = list(enumerate(NOUN_COMBOS))
+        tails = self.tail_automaton
+        w_key = rounding_key(w)
 
         for stem in candidates:
-            # Eş sesli kelime kontrolü
-            homonym_data = HOMONYMS.get(stem)
-            yumusama_variants = []
+            yumusama_variants = noun_softening_variants(self.lexicon, stem)
+            profile = stem_profile(stem)
 
-            if homonym_data:
-                for key, (anlam, yumusama) in homonym_data.items():
-                    yumusama_variants.append((yumusama, anlam))
+            if tails is not None and not tails.noun_possible(stem, w_key):
+                indexed = []
             else:
-                # Sözlükteki softening bayrağına bak
-                entries = self.lexicon.lookup(stem)
-                noun_entries = [e for e in entries if e.pos in ("n", "np", "n?")]
-                if noun_entries:
-                    yumusama = noun_entries[0].allows_softening
-                    yumusama_variants.append((yumusama, ""))
+                indexed = self._noun_hits(w, stem)
+
+            for vi, (yumusama_izni, anlam) in enumerate(yumusama_variants):
+                # Yalın hal + ek yok = sadece kök
+                if stem == w:
+                    key = f"{stem}|bare|{anlam}"
+                    if key not in seen:
+                        seen.add(key)
+                        results.append(AnalysisResult(
+                            success=True,
+                            original=word,
+                            stem=stem.capitalize(),
+                            suffixes=[],
+                            breakdown=f"{stem.capitalize()} (Kök)",
+                            word_type="noun",
+                            meaning=anlam
+                        ))
+                        if first:
+                            return results
+
+                if indexed is None:
+                    combos = all_combos
                 else:
-                    # İsim olarak bulunamadıysa yumuşamasız dene
-                    yumusama_variants.append((False, ""))
-
-            for yumusama_izni, anlam in yumusama_variants:
-                for plural in plural_opts:
-                    for poss in poss_opts:
-                        for poss_type in poss_type_opts:
-                            # İyelik yoksa sadece tek dene (gereksiz çoğullama engelle)
-                            if poss is None and poss_type == "cog":
-                                continue
+                    combos = [(ci, NOUN_COMBOS[ci]) for v, ci in indexed if v == vi]
+
+                for _, (plural, poss, poss_type, case, daky_flag) in combos:
+                    try:
+                        gen = self.noun_gen.generate(
+                            stem, plural, poss, poss_type, case,
+                            yumusama_izni=yumusama_izni,
+                            daky=daky_flag,
+                            profile=profile
+                        )
+                    except Exception:
+                        continue
+
+                    if not gen.is_valid or not _rounding_equivalent(gen.word.lower(), w):
+                        continue
+
+                    # İyelik display kodu
+                    actual_poss_code = poss
+                    if poss and poss_type == "cog":
+                        actual_poss_code = {"A1": "B1", "A2": "B2"}.get(poss, poss)
+
+                    sig = f"{stem}|{plural}|{actual_poss_code}|{case}|{daky_flag}|{anlam}"
+                    if sig in seen:
+                        continue
+                    seen.add(sig)
+
+                    # Ek listesi oluştur
+                    suffixes = []
+                    mi = 0  # morpheme index
+
+                    if plural and mi < len(gen.morphemes):
+                        _, suf = gen.morphemes[mi]
+                        suffixes.append({"suffix": suf, "type": "San", "code": "S2"})
+                        mi += 1
+
+                    if poss and mi < len(gen.morphemes):
+                        _, suf = gen.morphemes[mi]
+                        disp = POSSESSIVE_DISPLAY.get(actual_poss_code, actual_poss_code)
+                        suffixes.append({"suffix": suf, "type": "Degişlilik", "code": disp})
+                        mi += 1
+
+                    if case and not daky_flag and mi < len(gen.morphemes):
+                        _, suf = gen.morphemes[mi]
+                        disp = CASE_DISPLAY.get(case, case)
+                        suffixes.append({"suffix": suf, "type": "Düşüm", "code": disp})
+                        mi += 1
 
-                            for case, daky_flag in case_daky_opts:
-                                # Yalın hal + ek yok = sadece kök
-                                if not plural and poss is None and case is None and not daky_flag:
-                                    if stem == w:
-                                        key = f"{stem}|bare|{anlam}"
-                                        if key not in seen:
-                                            seen.add(key)
-                                            results.append(AnalysisResult(
-                                                success=True,
-                                                original=word,
-                                                stem=stem.capitalize(),
-                                                suffixes=[],
-                                                breakdown=f"{stem.capitalize()} (Kök)",
-                                                word_type="noun",
-                                                meaning=anlam
-                                            ))
-                                    continue
-
-                                try:
-                                    gen = self.noun_gen.generate(
-                                        stem, plural, poss, poss_type, case,
-                                        yumusama_izni=yumusama_izni,
-                                        daky=daky_flag
-                                    )
-                                except Exception:
-                                    continue
-
-                                if not gen.is_valid or not _rounding_equivalent(gen.word.lower(), w):
-                                    continue
-
-                                # İyelik display kodu
-                                actual_poss_code = poss
-                                if poss and poss_type == "cog":
-                                    actual_poss_code = {"A1": "B1", "A2": "B2"}.get(poss, poss)
-
-                                sig = f"{stem}|{plural}|{actual_poss_code}|{case}|{daky_flag}|{anlam}"
-                                if sig in seen:
-                                    continue
-                                seen.add(sig)
-
-                                # Ek listesi oluştur
-                                suffixes = []
-                                mi = 0  # morpheme index
-
-                                if plural and mi < len(gen.morphemes):
-                                    _, suf = gen.morphemes[mi]
-                                    suffixes.append({"suffix": suf, "type": "San", "code": "S2"})
-                                    mi += 1
-
-                                if poss and mi < len(gen.morphemes):
-                                    _, suf = gen.morphemes[mi]
-                                    disp = POSSESSIVE_DISPLAY.get(actual_poss_code, actual_poss_code)
-                                    suffixes.append({"suffix": suf, "type": "Degişlilik", "code": disp})
-                                    mi += 1
-
-                                if case and not daky_flag and mi < len(gen.morphemes):
-                                    _, suf = gen.morphemes[mi]
-                                    disp = CASE_DISPLAY.get(case, case)
-                                    suffixes.append({"suffix": suf, "type": "Düşüm", "code": disp})
-                                    mi += 1
-
-                                if daky_flag and mi < len(gen.morphemes):
-                                    _, suf = gen.morphemes[mi]
-                                    suffixes.append({"suffix": suf, "type": "Aitlik", "code": "+kI"})
-
-                                parts = [f"{stem.capitalize()} (Kök)"]
-                                for s in suffixes:
-                                    parts.append(f"{s['suffix']} ({s['code']})")
-
-                                results.append(AnalysisResult(
-                                    success=True,
-                                    original=word,
-                                    stem=stem.capitalize(),
-                                    suffixes=suffixes,
-                                    breakdown=" + ".join(parts),
-                                    word_type="noun",
-                                    meaning=anlam
-                                ))
+                    if daky_flag and mi < len(gen.morphemes):
+                        _, suf = gen.morphemes[mi]
+                        suffixes.append({"suffix": suf, "type": "Aitlik", "code": "+kI"})
+
+                    parts = [f"{stem.capitalize()} (Kök)"]
+                    for s in suffixes:
+                        parts.append(f"{s['suffix']} ({s['code']})")
+
+                    results.append(AnalysisResult(
+                        success=True,
+                        original=word,
+                        stem=stem.capitalize(),
+                        suffixes=suffixes,
+                        breakdown=" + ".join(parts),
+                        word_type="noun",
+                        meaning=anlam
+                    ))
+                    if first:
+                        return results
 
         # Sıralama: tam kök eşleşmesi önce, hayalet ekler en sona
         w_lower = word.lower().strip()
@@ -402,13 +527,19 @@ class MorphologicalAnalyzer:
         "biz": "B1", "siz": "B2", "olar": "B3"
     }
 
-    def parse_verb(self, word: str) -> list[AnalysisResult]:
+    def parse_verb(self, word: str, first: bool = False) -> list[AnalysisResult]:
         """
         Fiil kelimesini generator ile doğrulayarak çözümler.
         Her kök adayı × her (zaman, şahıs, olumsuzluk) kombinasyonu denenir.
+        first=True ise ilk çözümlemede durulur (is_known()).
 
         Çok kelimeli girişi de destekler: "Men geljek", "Biz geldik däl" vb.
         Zamir + fiil formu → tek çözümleme olarak döner.
+
+        Analizöre VerbFormIndex bağlıysa tek kelimelik girişte yalnızca
+        dizinin bulduğu kombinasyonlar üretilir (sonuç aynıdır). Tek
+        kelimelik girişte kuyruğu üretilemeyen kökler SuffixTailAutomaton
+        ile elenir.
         """
         w = word.lower().strip()
         if not w:
@@ -420,9 +551,9 @@ class MorphologicalAnalyzer:
         verb_token = w  # tek kelimede aynen kullan
 
         if is_multi_word:
-            first = w_parts[0]
+            zamir = w_parts[0]
             # Zamir ile başlıyorsa, fiil kısmını çıkar
-            if first in self._ZAMIRLER:
+            if zamir in self._ZAMIRLER:
                 verb_token = w_parts[1]  # "geljek" kısmı
             else:
                 verb_token = w_parts[0]  # zamir yoksa ilk kelime
@@ -431,107 +562,113 @@ class MorphologicalAnalyzer:
         seen = set()
 
         candidates = self._generate_stem_candidates(verb_token)
-
-        # 1-7: temel zamanlar, 8-18: şert/buýruk/ortaç/ulaç/ettirgen vb.
-        # 22-35: goşma zamanlar (hekaýa/rowaýat/şert)
-        tense_opts = [str(i) for i in range(1, 19)] + [str(i) for i in range(22, 36)]
-        person_opts = ["A1", "A2", "A3", "B1", "B2", "B3"]
-
+        tails = None if is_multi_word else self.tail_automaton
+        w_key = rounding_key(w)
         for stem in candidates:
-            for tense in tense_opts:
-                for person in person_opts:
-                    for neg in [False, True]:
-                        try:
-                            gen = self.verb_gen.generate(stem, tense, person, neg)
-                        except Exception:
-                            continue
+            if tails is not None and not tails.verb_possible(stem, w_key):
+                continue
+            combos = VERB_COMBOS
+            # Dizin zamirsiz formla eşleşir; çok kelimeli giriş tam döngüyü kullanır
+            if not is_multi_word:
+                hits = self._verb_hits(w, stem)
+                if hits is not None:
+                    combos = [VERB_COMBOS[ci] for ci in hits]
+
+            profile = stem_profile(stem)
+            for tense, person, neg in combos:
+                try:
+                    gen = self.verb_gen.generate(stem, tense, person, neg, profile=profile)
+                except Exception:
+                    continue
 
-                        if not gen.is_valid:
-                            continue
+                if not gen.is_valid:
+                    continue
 
-                        # Fiil çekimi "Zamir kelime" veya "kelime" olabilir
-                        gen_word = gen.word.lower()
-                        gen_parts = gen_word.split()
-                        gen_word_only = gen_parts[-1] if len(gen_parts) >= 2 else gen_word
-
-                        # Eşleşme kontrolü: tam form veya sadece fiil kısmı
-                        matched = False
-                        if is_multi_word:
-                            # Çok kelimeli giriş: tam üretim ("men geljek" vs "men geljek")
-                            if _rounding_equivalent(gen_word, w):
-                                matched = True
-                            # Veya däl içeren olumsuz: "men geljek däl" vs gen+däl
-                            elif len(w_parts) >= 3 and w_parts[-1] in ("däl", "däldir"):
-                                w_without_dal = " ".join(w_parts[:-1])
-                                if _rounding_equivalent(gen_word, w_without_dal):
-                                    matched = True
-                        else:
-                            # Tek kelime: zamirsiz kısım
-                            if _rounding_equivalent(gen_word_only, w):
-                                matched = True
-
-                        if not matched:
-                            continue
+                # Fiil çekimi "Zamir kelime" veya "kelime" olabilir
+                gen_word = gen.word.lower()
+                gen_parts = gen_word.split()
+                gen_word_only = gen_parts[-1] if len(gen_parts) >= 2 else gen_word
+
+                # Eşleşme kontrolü: tam form veya sadece fiil kısmı
+                matched = False
+                if is_multi_word:
+                    # Çok kelimeli giriş: tam üretim ("men geljek" vs "men geljek")
+                    if _rounding_equivalent(gen_word, w):
+                        matched = True
+                    # Veya däl içeren olumsuz: "men geljek däl" vs gen+däl
+                    elif len(w_parts) >= 3 and w_parts[-1] in ("däl", "däldir"):
+                        w_without_dal = " ".join(w_parts[:-1])
+                        if _rounding_equivalent(gen_word, w_without_dal):
+                            matched = True
+                else:
+                    # Tek kelime: zamirsiz kısım
+                    if _rounding_equivalent(gen_word_only, w):
+                        matched = True
 
-                        tense_disp = TENSE_DISPLAY.get(tense, tense)
-                        sig = f"{stem}|{tense}|{person}|{neg}"
-                        if sig in seen:
-                            continue
-                        seen.add(sig)
+                if not matched:
+                    continue
 
-                        # Aynı breakdown'u tekrar ekleme (ör. G1'de A1-B2 aynı kelime)
-                        breakdown_key = f"{stem}|{tense}|{neg}|{gen_word_only}"
-                        if breakdown_key in seen:
-                            continue
-                        seen.add(breakdown_key)
-
-                        suffixes = []
-                        for cat, suf in gen.morphemes:
-                            if cat == "NEGATION":
-                                suffixes.append({"suffix": suf, "type": "Olumsuzluk", "code": "Olumsuz"})
-                            elif cat == "TENSE":
-                                suffixes.append({"suffix": suf, "type": "Zaman", "code": tense_disp})
-                            elif cat in ("PERSON", "PERSON1", "PERSON2"):
-                                suffixes.append({"suffix": suf, "type": "Şahıs", "code": person})
-                            elif cat == "HEKAYA":
-                                suffixes.append({"suffix": suf, "type": "Hekaýa", "code": "HK"})
-                            elif cat == "ROWAYAT":
-                                suffixes.append({"suffix": suf, "type": "Rowaýat", "code": "RW"})
-                            elif cat == "CONDITIONAL_BOL":
-                                suffixes.append({"suffix": suf, "type": "Şert (bol-)", "code": "ŞR"})
-                            elif cat == "NEGATION+TENSE":
-                                suffixes.append({"suffix": suf, "type": "Olumsuz+Zaman", "code": tense_disp})
-                            elif cat == "CONVERB":
-                                suffixes.append({"suffix": suf, "type": "Zarf-fiil", "code": tense_disp})
-                            elif cat == "PARTICIPLE":
-                                suffixes.append({"suffix": suf, "type": "Sıfat-fiil", "code": tense_disp})
-                            elif cat == "CONDITIONAL":
-                                suffixes.append({"suffix": suf, "type": "Şert", "code": tense_disp})
-                            elif cat in ("NEGATION+CONDITIONAL",):
-                                suffixes.append({"suffix": suf, "type": "Olumsuz+Şert", "code": tense_disp})
-                            elif cat == "NEG_COPULA":
-                                suffixes.append({"suffix": suf, "type": "Olumsuz", "code": "däl"})
-                            elif cat == "CAUSATIVE":
-                                suffixes.append({"suffix": suf, "type": "Ettirgen", "code": "Caus"})
-                            elif cat == "PASSIVE":
-                                suffixes.append({"suffix": suf, "type": "Edilgen", "code": "Pass"})
-                            elif cat == "RECIPROCAL":
-                                suffixes.append({"suffix": suf, "type": "İşteşlik", "code": "Rec"})
-                            elif cat == "REFLEXIVE":
-                                suffixes.append({"suffix": suf, "type": "Dönüşlü", "code": "Ref"})
-
-                        parts = [f"{stem.capitalize()} (Kök)"]
-                        for s in suffixes:
-                            parts.append(f"{s['suffix']} ({s['code']})")
+                tense_disp = TENSE_DISPLAY.get(tense, tense)
+                sig = f"{stem}|{tense}|{person}|{neg}"
+                if sig in seen:
+                    continue
+                seen.add(sig)
 
-                        results.append(AnalysisResult(
-                            success=True,
-                            original=word,
-                            stem=stem.capitalize(),
-                            suffixes=suffixes,
-                            breakdown=" + ".join(parts),
-                            word_type="verb"
-                        ))
+                # Aynı breakdown'u tekrar ekleme (ör. G1'de A1-B2 aynı kelime)
+                breakdown_key = f"{stem}|{tense}|{neg}|{gen_word_only}"
+                if breakdown_key in seen:
+                    continue
+                seen.add(breakdown_key)
+
+                suffixes = []
+                for cat, suf in gen.morphemes:
+                    if cat == "NEGATION":
+                        suffixes.append({"suffix": suf, "type": "Olumsuzluk", "code": "Olumsuz"})
+                    elif cat == "TENSE":
+                        suffixes.append({"suffix": suf, "type": "Zaman", "code": tense_disp})
+                    elif cat in ("PERSON", "PERSON1", "PERSON2"):
+                        suffixes.append({"suffix": suf, "type": "Şahıs", "code": person})
+                    elif cat == "HEKAYA":
+                        suffixes.append({"suffix": suf, "type": "Hekaýa", "code": "HK"})
+                    elif cat == "ROWAYAT":
+                        suffixes.append({"suffix": suf, "type": "Rowaýat", "code": "RW"})
+                    elif cat == "CONDITIONAL_BOL":
+                        suffixes.append({"suffix": suf, "type": "Şert (bol-)", "code": "ŞR"})
+                    elif cat == "NEGATION+TENSE":
+                        suffixes.append({"suffix": suf, "type": "Olumsuz+Zaman", "code": tense_disp})
+                    elif cat == "CONVERB":
+                        suffixes.append({"suffix": suf, "type": "Zarf-fiil", "code": tense_disp})
+                    elif cat == "PARTICIPLE":
+                        suffixes.append({"suffix": suf, "type": "Sıfat-fiil", "code": tense_disp})
+                    elif cat == "CONDITIONAL":
+                        suffixes.append({"suffix": suf, "type": "Şert", "code": tense_disp})
+                    elif cat in ("NEGATION+CONDITIONAL",):
+                        suffixes.append({"suffix": suf, "type": "Olumsuz+Şert", "code": tense_disp})
+                    elif cat == "NEG_COPULA":
+                        suffixes.append({"suffix": suf, "type": "Olumsuz", "code": "däl"})
+                    elif cat == "CAUSATIVE":
+                        suffixes.append({"suffix": suf, "type": "Ettirgen", "code": "Caus"})
+                    elif cat == "PASSIVE":
+                        suffixes.append({"suffix": suf, "type": "Edilgen", "code": "Pass"})
+                    elif cat == "RECIPROCAL":
+                        suffixes.append({"suffix": suf, "type": "İşteşlik", "code": "Rec"})
+                    elif cat == "REFLEXIVE":
+                        suffixes.append({"suffix": suf, "type": "Dönüşlü", "code": "Ref"})
+
+                parts = [f"{stem.capitalize()} (Kök)"]
+                for s in suffixes:
+                    parts.append(f"{s['suffix']} ({s['code']})")
+
+                results.append(AnalysisResult(
+                    success=True,
+                    original=word,
+                    stem=stem.capitalize(),
+                    suffixes=suffixes,
+                    breakdown=" + ".join(parts),
+                    word_type="verb"
+                ))
+                if first:
+                    return results
 
         return results
 
@@ -577,11 +714,10 @@ class MorphologicalAnalyzer:
         results = []
         seen = set()
 
-        for suffix, is_front, case_label, display in self._INFINITIVE_PATTERNS:
-            if not w.endswith(suffix):
-                continue
-
-            stem_part = w[:-len(suffix)]
+        patterns = self._INFINITIVE_PATTERNS
+        for index, split in self._PATTERN_TRIE.table_matches(w, "infinitive"):
+            suffix, is_front, case_label, display = patterns[index]
+            stem_part = w[:split]
             if len(stem_part) < 2:
                 continue
 
@@ -779,20 +915,26 @@ class MorphologicalAnalyzer:
         results: list[AnalysisResult] = []
         seen: set[str] = set()
 
+        trie = self._PATTERN_TRIE
+        outer_patterns = self._DERIVED_OUTER
+        voice_patterns = self._VOICE
+
         # Kopula katmanı: orijinal + opsiyonel -dIr sıyırma
-        bases_to_try: list[tuple[str, str | None]] = [(w, None)]
-        for cop in self._COPULA:
-            if w.endswith(cop) and len(w) > len(cop) + 5:
-                bases_to_try.append((w[:-len(cop)], cop))
+        bases_to_try: list[tuple[int, str | None]] = [(len(w), None)]
+        for index, split in trie.table_matches(w, "copula"):
+            cop = self._COPULA[index]
+            if len(w) > len(cop) + 5:
+                bases_to_try.append((split, cop))
                 break  # tek kopula yeterli
 
-        for base_w, copula in bases_to_try:
+        for end, copula in bases_to_try:
+            # Dış çekim eşleşmeleri (bölünme noktası → çatılı gövdenin sonu)
+            outer = [(outer_patterns[index], split)
+                     for index, split in trie.table_matches(w, "outer", end)]
 
             # ═══ 0) Çatısız (bare stem):  base + outer ═══
-            for o_suf, o_lbl, o_code, o_fr in self._DERIVED_OUTER:
-                if not base_w.endswith(o_suf):
-                    continue
-                raw = base_w[:-len(o_suf)]
+            for (o_suf, o_lbl, o_code, o_fr), split in outer:
+                raw = w[:split]
                 if len(raw) < 2:
                     continue
 
@@ -821,17 +963,13 @@ class MorphologicalAnalyzer:
                     ))
 
             # ═══ 1) Tek çatı:  base + voice + outer ═══
-            for o_suf, o_lbl, o_code, o_fr in self._DERIVED_OUTER:
-                if not base_w.endswith(o_suf):
-                    continue
-                derived = base_w[:-len(o_suf)]
-                if len(derived) < 3:
+            for (o_suf, o_lbl, o_code, o_fr), split in outer:
+                if split < 3:
                     continue
 
-                for v_suf, v_lbl, v_code, v_fr in self._VOICE:
-                    if not derived.endswith(v_suf):
-                        continue
-                    raw = derived[:-len(v_suf)]
+                for v_index, v_split in trie.table_matches(w, "voice", split):
+                    v_suf, v_lbl, v_code, v_fr = voice_patterns[v_index]
+                    raw = w[:v_split]
                     if len(raw) < 2:
                         continue
 
@@ -861,28 +999,22 @@ class MorphologicalAnalyzer:
                         ))
 
             # ═══ 2) Çift çatı:  base + voice₁ + voice₂ + outer ═══
-            for o_suf, o_lbl, o_code, o_fr in self._DERIVED_OUTER:
-                if not base_w.endswith(o_suf):
-                    continue
-                rest1 = base_w[:-len(o_suf)]
-                if len(rest1) < 5:
+            for (o_suf, o_lbl, o_code, o_fr), split in outer:
+                if split < 5:
                     continue
 
-                for v2s, v2l, v2c, _ in self._VOICE:
-                    if not rest1.endswith(v2s):
-                        continue
-                    rest2 = rest1[:-len(v2s)]
-                    if len(rest2) < 4:
+                for v2_index, v2_split in trie.table_matches(w, "voice", split):
+                    if v2_split < 4:
                         continue
+                    v2s, v2l, v2c, _ = voice_patterns[v2_index]
 
-                    for v1s, v1l, v1c, _ in self._VOICE:
+                    for v1_index, v1_split in trie.table_matches(w, "voice", v2_split):
+                        v1s, v1l, v1c, _ = voice_patterns[v1_index]
                         # Aynı çatı tipi: Edilgen+Edilgen izin ver (n+il gibi),
                         # diğerlerinde (ETT+ETT, İŞT+İŞT) atla
                         if v1l == v2l and v1l != "Edilgen":
                             continue
-                        if not rest2.endswith(v1s):
-                            continue
-                        raw = rest2[:-len(v1s)]
+                        raw = w[:v1_split]
                         if len(raw) < 2:
                             continue
 
@@ -968,10 +1100,10 @@ class MorphologicalAnalyzer:
         results: list[AnalysisResult] = []
         seen: set[str] = set()
 
-        for suf, target_pos, label, code, is_front, base_filter in self._DERIVATION:
-            if not w.endswith(suf):
-                continue
-            base = w[:-len(suf)]
+        patterns = self._DERIVATION
+        for index, split in self._PATTERN_TRIE.table_matches(w, "derivation"):
+            suf, target_pos, label, code, is_front, base_filter = patterns[index]
+            base = w[:split]
             if len(base) < 2:
                 continue
 
@@ -1213,8 +1345,9 @@ class MorphologicalAnalyzer:
 
         # lowercase'den gelebilir: bmg-niň → BMG-niň
         right_lower = right.lower()
-        for suf, label, code in self._ABBR_SUFFIX_MAP:
-            if right_lower == suf:
+        for index, split in self._PATTERN_TRIE.table_matches(right_lower, "abbreviation"):
+            if split == 0:
+                suf, label, code = self._ABBR_SUFFIX_MAP[index]
                 abbr = left.upper()
                 return [AnalysisResult(
                     success=True,
@@ -1250,6 +1383,20 @@ class MorphologicalAnalyzer:
         ("dygy", "-dIgI+D₃b"), ("digi", "-dIgI+D₃b"),
     ]
 
+    # Kalıp tabanlı alt çözümleyicilerin tüm ek tabloları tek ters trie'de:
+    # kelimenin sağdan sola tek yürüyüşü eşleşen kalıpları bölünme
+    # noktalarıyla verir (bkz. pattern_trie.py)
+    _PATTERN_TABLES = {
+        "infinitive": [p[0] for p in _INFINITIVE_PATTERNS],
+        "outer": [p[0] for p in _DERIVED_OUTER],
+        "voice": [p[0] for p in _VOICE],
+        "copula": _COPULA,
+        "derivation": [p[0] for p in _DERIVATION],
+        "abbreviation": [p[0] for p in _ABBR_SUFFIX_MAP],
+        "predicative": [p[0] for p in _DIGI_PATTERNS],
+    }
+    _PATTERN_TRIE = SuffixPatternTrie(_PATTERN_TABLES)
+
     def parse_predicative(self, word: str) -> list[AnalysisResult]:
         """
         Bildiriş (predicative) -dIgI formlarını çözümler.
@@ -1265,10 +1412,9 @@ class MorphologicalAnalyzer:
             return []
 
         results = []
-        for suf, code in self._DIGI_PATTERNS:
-            if not w.endswith(suf):
-                continue
-            base = w[:-len(suf)]
+        for index, split in self._PATTERN_TRIE.table_matches(w, "predicative"):
+            suf, code = self._DIGI_PATTERNS[index]
+            base = w[:split]
             if len(base) < 2:
                 continue
 
@@ -1315,17 +1461,229 @@ class MorphologicalAnalyzer:
     #  ANA GİRİŞ NOKTASI
     # ------------------------------------------------------------------
 
+    # ------------------------------------------------------------------
+    #  SABİT TABLOLAR (parse / is_known)
+    # ------------------------------------------------------------------
+
+    # Rakamla sıra sayı: "2024-nji", "25-njy"
+    _ORDINAL_RE = re.compile(r'^(\d+)-(nji|njy)$')
+
+    # Yazılı sıra sayılar: "ýedinji", "birinji", "ilkinji" vb.
+    _CARDINAL_ORDINAL_MAP = {
+        "bir": "birinji", "iki": "ikinji", "üç": "üçünji",
+        "dört": "dördünji", "bäş": "bäşinji", "alty": "altynjy",
+        "ýedi": "ýedinji", "sekiz": "sekizinji", "dokuz": "dokuzynjy",
+        "on": "onunjy", "ýigrimi": "ýigriminji", "otuz": "otuzynjy",
+        "kyrk": "kyrkynjy", "elli": "ellinji", "altmyş": "altmyşynjy",
+        "ýetmiş": "ýetmişinji", "segsen": "segseninji", "togsan": "togsanynjy",
+        "ýüz": "ýüzünji", "müň": "müňünji", "ilki": "ilkinji",
+    }
+    _ORDINAL_TO_CARDINAL = {v: k for k, v in _CARDINAL_ORDINAL_MAP.items()}
+
+    # Tireli bağlaç/zarflar
+    _TIRELI_BAGLACLAR = {
+        "hem-de": ("hem-de", "bağlaç", "ayrıca, ve"),
+        "has-da": ("has-da", "bağlaç", "daha da"),
+        "beýläk-de": ("beýläk-de", "bağlaç", "bundan böyle"),
+        "hususan-da": ("hususan-da", "zarf", "özellikle"),
+        "ýene-de": ("ýene-de", "bağlaç", "yine de"),
+        "başga-da": ("başga-da", "bağlaç", "başka da"),
+        "şeýle-de": ("şeýle-de", "bağlaç", "ayrıca, öyle de"),
+    }
+
+    def _split_copula(self, w_lower: str) -> tuple[Optional[str], Optional[str]]:
+        """
+        -dIr ile biten kelimeyi (taban, ek) olarak böler; yoksa (None, None).
+        degişlidir → degişli + dir,  baglanyşyklydyr → baglanyşykly + dyr
+        """
+        for cop in self._COPULA:
+            if w_lower.endswith(cop) and len(w_lower) > len(cop) + 2:
+                return w_lower[:-len(cop)], cop
+        return None, None
+
     def parse(self, word: str) -> MultiAnalysisResult:
         """
         Verilen kelimeyi hem isim hem fiil olarak analiz eder.
         Birden fazla geçerli çözümleme varsa hepsini döndürür.
 
+        Önbellek bağlıysa sonuç küçük harfli kelimeyle saklanır; isabette
+        yalnızca `original` alanları istenen yazımla yeniden kurulur.
+
+        Profiler bağlıysa alt çözümleyici süreleri ve sayaçları ölçülür
+        (bkz. profiling.py).
+
         Args:
             word: Çekimli kelime (ör. "kitabym", "geldim", "guzulary")
 
         Returns:
             MultiAnalysisResult — tüm geçerli çözümlemeler
         """
+        profiler = self.profiler
+        if profiler is not None and profiler.begin(word):
+            multi = None
+            try:
+                multi = self._parse_cached(word)
+            finally:
+                profiler.end(multi)
+            return multi
+        return self._parse_cached(word)
+
+    def _parse_cached(self, word: str) -> MultiAnalysisResult:
+        """parse() gövdesi: önbellek bağlıysa önce önbelleğe bakar."""
+        cache = self.cache
+        if cache is None:
+            return self._parse(word)
+
+        generation = self.lexicon.generation if self.lexicon is not None else 0
+        if cache.generation != generation:
+            cache.invalidate(generation)
+
+        word = word.strip()
+        key = word.lower()
+        multi = cache.get(key)
+        if multi is None:
+            multi = self._parse(word)
+            cache.put(key, multi)
+        elif self.profiler is not None:
+            self.profiler.cache_hit()
+        return _with_original(multi, word)
+
+    # ------------------------------------------------------------------
+    #  KABUL DENETİMİ (yazım denetimi)
+    # ------------------------------------------------------------------
+
+    def is_known(self, word: str) -> bool:
+        """
+        Kelimenin en az bir bilinen çözümlemesi var mı?
+
+        Sonuç `any(r.word_type != "unknown" for r in parse(word).results)`
+        ile aynıdır, ancak alt çözümleyiciler parse() sırasıyla denenir ve
+        ilk eşleşmede durulur; çözümlemeler sıralanmaz, tekilleştirilmez.
+
+        KnownForms bağlıysa filtrenin reddettiği paradigma için
+        parse_noun() / parse_verb() çağrılmaz; filtrenin kabulü ilgili alt
+        çözümleyiciyle doğrulanır. Önbellekte çözümlemesi olan kelime için
+        önbellek kullanılır.
+
+        Args:
+            word: Çekimli kelime
+        """
+        word = word.strip()
+        if not word:
+            return False
+        cache = self.cache
+        if cache is not None:
+            generation = self.lexicon.generation if self.lexicon is not None else 0
+            key = word.lower()
+            if cache.generation == generation and key in cache:
+                multi = cache.get(key)
+                if multi is not None:
+                    return any(r.word_type != "unknown" for r in multi.results)
+        return self._is_known(word)
+
+    def _is_known(self, word: str) -> bool:
+        """is_known() gövdesi (önbelleksiz); _parse() ile aynı dallar."""
+        w_lower = word.lower()
+        if (self._ORDINAL_RE.match(w_lower) or w_lower in self._ORDINAL_TO_CARDINAL
+                or w_lower in self._TIRELI_BAGLACLAR):
+            return True
+        if "-" in word and self.parse_abbreviation(word):
+            return True
+
+        forms = self.known_forms
+        if forms is None or len(w_lower.split()) > 1:
+            # Filtre yok veya çok kelimeli giriş (filtre tek kelimelik formları tutar)
+            if self.parse_noun(word, first=True) or self.parse_verb(word, first=True):
+                return True
+        else:
+            if forms.maybe_noun(w_lower) and self.parse_noun(word, first=True):
+                return True
+            if forms.maybe_verb(w_lower) and self.parse_verb(word, first=True):
+                return True
+
+        for parser in (self.parse_infinitive, self.parse_derived_verb, self.parse_derivation,
+                       self.parse_pronoun, self.parse_predicative):
+            if parser(word):
+                return True
+
+        copula_base, _ = self._split_copula(w_lower)
+        return copula_base is not None and self.is_known(copula_base)
+
+    # ------------------------------------------------------------------
+    #  TOPLU ANALİZ
+    # ------------------------------------------------------------------
+
+    def parse_many(self, words: Iterable[str],
+                   workers: Optional[int] = None) -> list[MultiAnalysisResult]:
+        """
+        Kelime listesini çözümler; sonuçlar giriş sırasıyla döner.
+
+        Tekrarlanan kelimeler (büyük/küçük harf ve boşluk farkı dahil) bir kez
+        çözümlenir. workers > 1 ise benzersiz kelimeler süreç havuzuna dağıtılır.
+        Çok büyük girişler için iter_parse() kullanın.
+        """
+        return list(self.iter_parse(words, workers=workers))
+
+    def iter_parse(self, words: Iterable[str], workers: Optional[int] = None,
+                   chunk_size: int = 1024) -> Iterator[MultiAnalysisResult]:
+        """
+        parse_many() akış sürümü: girişi `chunk_size` kelimelik pencerelerle
+        okur, her pencereyi tekilleştirip çözümler ve sonuçları giriş
+        sırasıyla üretir. Bellekte en fazla bir pencere tutulur.
+        """
+        pool = None
+        if workers is not None and workers > 1:
+            pool = self._make_pool(workers)
+        try:
+            window = []
+            for word in words:
+                window.append(word)
+                if len(window) >= chunk_size:
+                    yield from self._parse_window(window, pool, workers)
+                    window = []
+            if window:
+                yield from self._parse_window(window, pool, workers)
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+    def _parse_window(self, window: list[str], pool, workers) -> Iterator[MultiAnalysisResult]:
+        stripped = [word.strip() for word in window]
+        unique = list(dict.fromkeys(word.lower() for word in stripped))
+        if pool is None:
+            parsed = [self.parse(key) for key in unique]
+        else:
+            size = max(1, -(-len(unique) // (workers * 4)))
+            chunks = [unique[i:i + size] for i in range(0, len(unique), size)]
+            parsed = [multi for part in pool.map(_pool_parse, chunks) for multi in part]
+        by_key = dict(zip(unique, parsed))
+        for word in stripped:
+            yield _with_original(by_key[word.lower()], word)
+
+    def _make_pool(self, workers: int):
+        """
+        İşçi havuzu: fork varsa işçiler bu analizörü (dizinler, trie dahil)
+        miras alır; yoksa her işçi aynı sınıftan bir analizörü sözlükle kurar
+        (hızlı yollar sonucu değiştirmediği için çıktı aynıdır).
+        """
+        if "fork" in multiprocessing.get_all_start_methods():
+            if self.lexicon:
+                self.stem_trie  # fork öncesi bir kez kurulur
+            ctx = multiprocessing.get_context("fork")
+            initargs = (self, None, None)
+        else:
+            ctx = multiprocessing.get_context()
+            initargs = (None, type(self), self.lexicon)
+        return ctx.Pool(workers, initializer=_pool_init, initargs=initargs)
+
+    def _stage(self, name: str, parser, word: str):
+        """Alt çözümleyiciyi çalıştırır; profiler bağlıysa `name` aşaması olarak ölçer."""
+        if self.profiler is None:
+            return parser(word)
+        return self.profiler.run_stage(name, parser, word)
+
+    def _parse(self, word: str) -> MultiAnalysisResult:
+        """parse() gövdesi (önbelleksiz)."""
         word = word.strip()
         if not word:
             return MultiAnalysisResult(original=word)
@@ -1333,8 +1691,7 @@ class MorphologicalAnalyzer:
         w_lower = word.lower()
 
         # ── Sıra sayı tanıma: "2024-nji", "25-njy" ──
-        import re as _re
-        _ordinal_m = _re.match(r'^(\d+)-(nji|njy)$', w_lower)
+        _ordinal_m = self._ORDINAL_RE.match(w_lower)
         if _ordinal_m:
             num = _ordinal_m.group(1)
             suf = _ordinal_m.group(2)
@@ -1346,18 +1703,8 @@ class MorphologicalAnalyzer:
             )])
 
         # ── Yazılı sıra sayı tanıma: "ýedinji", "birinji", "ilkinji" vb. ──
-        _CARDINAL_ORDINAL_MAP = {
-            "bir": "birinji", "iki": "ikinji", "üç": "üçünji",
-            "dört": "dördünji", "bäş": "bäşinji", "alty": "altynjy",
-            "ýedi": "ýedinji", "sekiz": "sekizinji", "dokuz": "dokuzynjy",
-            "on": "onunjy", "ýigrimi": "ýigriminji", "otuz": "otuzynjy",
-            "kyrk": "kyrkynjy", "elli": "ellinji", "altmyş": "altmyşynjy",
-            "ýetmiş": "ýetmişinji", "segsen": "segseninji", "togsan": "togsanynjy",
-            "ýüz": "ýüzünji", "müň": "müňünji", "ilki": "ilkinji",
-        }
-        _ORDINAL_TO_CARDINAL = {v: k for k, v in _CARDINAL_ORDINAL_MAP.items()}
-        if w_lower in _ORDINAL_TO_CARDINAL:
-            cardinal = _ORDINAL_TO_CARDINAL[w_lower]
+        if w_lower in self._ORDINAL_TO_CARDINAL:
+            cardinal = self._ORDINAL_TO_CARDINAL[w_lower]
             suffix = w_lower[len(cardinal):]  # nji, njy, ünji etc.
             return MultiAnalysisResult(original=word, results=[AnalysisResult(
                 success=True, original=word,
@@ -1367,17 +1714,8 @@ class MorphologicalAnalyzer:
             )])
 
         # ── Tireli bağlaç/zarf tanıma ──
-        _TIRELI_BAGLACLAR = {
-            "hem-de": ("hem-de", "bağlaç", "ayrıca, ve"),
-            "has-da": ("has-da", "bağlaç", "daha da"),
-            "beýläk-de": ("beýläk-de", "bağlaç", "bundan böyle"),
-            "hususan-da": ("hususan-da", "zarf", "özellikle"),
-            "ýene-de": ("ýene-de", "bağlaç", "yine de"),
-            "başga-da": ("başga-da", "bağlaç", "başka da"),
-            "şeýle-de": ("şeýle-de", "bağlaç", "ayrıca, öyle de"),
-        }
-        if w_lower in _TIRELI_BAGLACLAR:
-            stem, wtype, meaning = _TIRELI_BAGLACLAR[w_lower]
+        if w_lower in self._TIRELI_BAGLACLAR:
+            stem, wtype, meaning = self._TIRELI_BAGLACLAR[w_lower]
             return MultiAnalysisResult(original=word, results=[AnalysisResult(
                 success=True, original=word,
                 stem=stem.capitalize(), suffixes=[],
@@ -1388,46 +1726,38 @@ class MorphologicalAnalyzer:
         all_results = []
 
         # ── Kopula (bildiriş) -dIr soyma ──
-        # degişlidir → degişli + dir,  baglanyşyklydyr → baglanyşykly + dyr
-        _COPULA_SUFFIXES = ["dyr", "dir", "dur", "dür"]
-        copula_base = None
-        copula_suf = None
-        for _cop in _COPULA_SUFFIXES:
-            if w_lower.endswith(_cop) and len(w_lower) > len(_cop) + 2:
-                copula_base = w_lower[:-len(_cop)]
-                copula_suf = _cop
-                break
+        copula_base, copula_suf = self._split_copula(w_lower)
 
         # Kısaltma+ek (BMG-niň, ÝUNESKO-nyň vb.)
         if "-" in word:
-            abbr_results = self.parse_abbreviation(word)
+            abbr_results = self._stage("abbreviation", self.parse_abbreviation, word)
             if abbr_results:
                 return MultiAnalysisResult(original=word, results=abbr_results)
 
         # İsim olarak çözümle
-        all_results.extend(self.parse_noun(word))
+        all_results.extend(self._stage("noun", self.parse_noun, word))
 
         # Fiil olarak çözümle
-        all_results.extend(self.parse_verb(word))
+        all_results.extend(self._stage("verb", self.parse_verb, word))
 
         # Mastar (infinitive) olarak çözümle
-        all_results.extend(self.parse_infinitive(word))
+        all_results.extend(self._stage("infinitive", self.parse_infinitive, word))
 
         # Türetilmiş fiil (ettirgen/edilgen + dış çekim)
-        all_results.extend(self.parse_derived_verb(word))
+        all_results.extend(self._stage("derived_verb", self.parse_derived_verb, word))
 
         # Yapım ekleri (-lI, -lIk, -sIz, -çI, -dAş)
-        all_results.extend(self.parse_derivation(word))
+        all_results.extend(self._stage("derivation", self.parse_derivation, word))
 
         # İşaret zamirleri (bu/şu/ol/şol paradigması)
-        all_results.extend(self.parse_pronoun(word))
+        all_results.extend(self._stage("pronoun", self.parse_pronoun, word))
 
         # Bildiriş (predicative) -dIgI: sıfat/isim + dIgI + iyelik + hal
-        all_results.extend(self.parse_predicative(word))
+        all_results.extend(self._stage("predicative", self.parse_predicative, word))
 
         # ── Kopula denemesi: kelime -dIr ile bitiyorsa, soyup altını analiz et ──
         if copula_base and not all_results:
-            sub = self.parse(copula_base)
+            sub = self._stage("copula", self.parse, copula_base)
             if sub.results and sub.results[0].word_type != "unknown":
                 for sr in sub.results:
                     if sr.word_type == "unknown":
@@ -1489,3 +1819,19 @@ class MorphologicalAnalyzer:
             ))
 
         return MultiAnalysisResult(original=word, results=all_results)
+
+
+# ==============================================================================
+#  SÜREÇ HAVUZU YARDIMCILARI (parse_many)
+# ==============================================================================
+
+_POOL_ANALYZER: Optional[MorphologicalAnalyzer] = None
+
+
+def _pool_init(analyzer, cls, lexicon):
+    global _POOL_ANALYZER
+    _POOL_ANALYZER = analyzer if analyzer is not None else cls(lexicon)
+
+
+def _pool_parse(words: list[str]) -> list[MultiAnalysisResult]:
+    return [_POOL_ANALYZER.parse(word) for word in words]
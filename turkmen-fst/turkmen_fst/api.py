@@ -8,22 +8,51 @@ Endpoints:
     POST /generate/verb — Fiil çekimi
     POST /generate      — Birleşik üretim (isim veya fiil)
     POST /analyze       — Morfolojik analiz
+    POST /analyze/stream — Akış halinde toplu analiz (NDJSON)
     GET  /lexicon/{word} — Sözlük sorgusu
     GET  /health        — Sağlık kontrolü
+    GET  /metrics       — Alt çözümleyici profili (Prometheus, profil açıksa)
+    GET  /shadow        — Gölge mod karşılaştırma özeti (gölge mod açıksa)
+
+CPU işleri (analiz, üretim, yazım denetimi) olay döngüsünü bloklamaması
+için sınırlı bir iş havuzunda çalışır; havuz doluysa 503, istek süresi
+aşılırsa 504 döner. Sözlüğe bağlı yapılar uygulama açılışında kurulur;
+ilk istek bunları beklemez (TURKMEN_FST_WARM). Ayarlar ortam değişkenleriyle yapılır:
+    TURKMEN_FST_EXECUTOR     — "thread" (varsayılan) veya "process"
+    TURKMEN_FST_WORKERS      — işçi sayısı (varsayılan: CPU sayısı)
+    TURKMEN_FST_MAX_PENDING  — kabul edilen en fazla eşzamanlı iş (64)
+    TURKMEN_FST_TIMEOUT      — istek zaman aşımı, sn (10)
+    TURKMEN_FST_WARM         — "1" (varsayılan): paylaşılan yapılar açılışta
+                               kurulur; "0": ilk kullanımda (bkz. preload.warm)
+    TURKMEN_FST_PROFILE      — "1": parse() profili açık, /metrics sunulur
+    TURKMEN_FST_PROFILE_LOG_MS — bundan yavaş kelimeler JSON olarak loglanır
+                                 (profil açıkken; boş → log yok)
+    TURKMEN_FST_SHADOW_RATE  — /analyze ve /spellcheck isteklerinin referans
+                               çözümleyiciyle karşılaştırılan oranı (0–1; boş → kapalı)
+    TURKMEN_FST_SHADOW_LOG   — gölge mod günlüğü (shadow.jsonl)
+
+Süreç havuzunda (TURKMEN_FST_EXECUTOR=process) profil işçi süreçlerde
+tutulur; /metrics yalnızca ana süreçte çalışan analizleri gösterir.
 
 Swagger UI: http://localhost:8000/docs
 """
 
 from __future__ import annotations
+import asyncio
+import codecs
+import json
 import os
 import re
+import time
+from contextlib import asynccontextmanager
 from functools import lru_cache
 from typing import Optional, Literal
 
 try:
-    from fastapi import FastAPI, HTTPException
+    from fastapi import FastAPI, HTTPException, Request
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import HTMLResponse
+    from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
+    from starlette.requests import ClientDisconnect
     from pydantic import BaseModel, Field
     HAS_FASTAPI = True
 except ImportError:
@@ -34,6 +63,15 @@ from turkmen_fst.lexicon import Lexicon, POS_DISPLAY
 from turkmen_fst.morphotactics import VerbMorphotactics
 from turkmen_fst.generator import MorphologicalGenerator
 from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.cache import AnalysisCache
+from turkmen_fst.known_forms import KnownForms
+from turkmen_fst.paradigm import ParadigmCache
+from turkmen_fst.executor import BoundedExecutor, ExecutorSaturated
+from turkmen_fst.fuzzy import SymSpellIndex, MAX_DISTANCE
+from turkmen_fst.suggest import SuggestionEngine
+from turkmen_fst.profiling import ParseProfiler, PrometheusSink, JsonLogSink
+from turkmen_fst.shadow import ShadowChecker, breakdowns
+from turkmen_fst.preload import shared_lexicon, warm
 
 
 # ==============================================================================
@@ -56,6 +94,86 @@ def tokenize(text: str) -> list[dict]:
     return tokens
 
 
+class IncrementalTokenizer:
+    """
+    Parça parça gelen metni tokenize() ile aynı sonuçla kelimelere ayırır.
+
+    Parçanın sonundaki kelime bir sonraki parçada devam edebileceği için
+    bekletilir; konumlar metnin başından itibaren sayılır.
+
+        tokenizer = IncrementalTokenizer()
+        for chunk in chunks:
+            tokens = tokenizer.feed(chunk)
+        tokens = tokenizer.close()
+    """
+
+    _TRAILING_WORD_RE = re.compile(_WORD_RE.pattern + r"\Z", re.UNICODE)
+
+    def __init__(self):
+        self._buf = ""
+        self._offset = 0  # _buf'un metindeki başlangıç konumu
+
+    def feed(self, text: str) -> list[dict]:
+        """Parçayı ekler, kesinleşen kelimeleri döndürür."""
+        buf = self._buf + text
+        m = self._TRAILING_WORD_RE.search(buf)
+        cut = m.start() if m else len(buf)
+        tokens = self._emit(buf[:cut])
+        self._buf = buf[cut:]
+        return tokens
+
+    def close(self) -> list[dict]:
+        """Metin bitti: bekleyen son kelimeyi döndürür."""
+        tokens = self._emit(self._buf)
+        self._buf = ""
+        return tokens
+
+    def _emit(self, text: str) -> list[dict]:
+        offset = self._offset
+        self._offset += len(text)
+        tokens = tokenize(text)
+        for tok in tokens:
+            tok["start"] += offset
+            tok["end"] += offset
+        return tokens
+
+
+class NDJSONTokenizer:
+    """
+    NDJSON girişini satır satır tokenize eder.
+
+    Her satır {"text": "..."} nesnesi veya JSON dizgesidir; kelimeler
+    satır numarasıyla ("line") ve satır içi konumlarıyla döner. Okunamayan
+    satırlar {"line": n, "error": "..."} kaydı olarak döner.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._line = 0
+
+    def feed(self, text: str) -> list[dict]:
+        *lines, self._buf = (self._buf + text).split("\n")
+        return [tok for line in lines for tok in self._tokens(line)]
+
+    def close(self) -> list[dict]:
+        line, self._buf = self._buf, ""
+        return self._tokens(line) if line.strip() else []
+
+    def _tokens(self, line: str) -> list[dict]:
+        n = self._line
+        self._line += 1
+        if not line.strip():
+            return []
+        try:
+            record = json.loads(line)
+            text = record["text"] if isinstance(record, dict) else record
+            if not isinstance(text, str):
+                raise TypeError("metin dizge değil")
+        except (ValueError, KeyError, TypeError) as exc:
+            return [{"line": n, "error": f"Geçersiz satır: {exc}"}]
+        return [dict(tok, line=n) for tok in tokenize(text)]
+
+
 def _edit_distance(a: str, b: str) -> int:
     """İki string arasındaki Levenshtein edit distance."""
     if len(a) < len(b):
@@ -76,8 +194,13 @@ def _find_similar_roots(word: str, lexicon: Lexicon,
                         max_distance: int = 2, max_results: int = 10) -> list[str]:
     """
     Sözlükte edit distance ≤ max_distance olan kelimeleri bulur.
-    Performans için kelime uzunluğuna göre filtreleme yapar.
+    max_distance ≤ 2 için SymSpell dizini kullanılır; daha büyük uzaklıklarda
+    kelime uzunluğuna göre filtrelenmiş tam tarama yapılır.
     """
+    if max_distance <= MAX_DISTANCE:
+        index = SymSpellIndex.for_lexicon(lexicon)
+        return [key for _, key in index.lookup(word, max_distance, max_results)]
+
     w = word.lower()
     wlen = len(w)
     candidates = []
@@ -99,51 +222,171 @@ def generate_suggestions(wrong_word: str, analyzer: MorphologicalAnalyzer,
     """
     Yanlış yazılmış kelime için öneri üretir.
 
-    Strateji:
-    1. Edit distance ≤ 2 olan sözlük köklerini bul
-    2. Her köke orijinal kelimeye en yakın çekim formlarını üret
-    3. En yakın formları sırala ve döndür
+    Strateji (SuggestionEngine):
+    1. Kelimeyi kök kısmı + tanınan ek kuyruğu olarak böl
+    2. Kök kısmına edit distance ≤ 2 olan sözlük köklerini bul
+    3. Ekleri düzeltilmiş köke generator ile yeniden ekle
+    4. Klavye karışıklığı ağırlıklı uzaklığa göre sırala
+
+    Arama kelime başına SUGGEST_BUDGET_MS ile sınırlıdır.
     """
-    similar_roots = _find_similar_roots(wrong_word, lexicon, max_distance=2, max_results=15)
+    return SuggestionEngine(analyzer).suggest(wrong_word, max_suggestions)
 
-    suggestions = set()
-    for root in similar_roots:
-        # Kökün kendisi bir öneri olabilir
-        suggestions.add(root)
 
-        # Kökün çekim formlarını üretip orijinal kelimeye yakınlığa göre sırala
-        # Ama tüm paradigmayı üretmek pahalı, sadece kökü öneriyoruz
-        # İleride buraya tam paradigma eklenebilir
+# ==============================================================================
+#  SÖZLÜK YÜKLEME
+# ==============================================================================
+
+# Analiz önbelleği sınırları (kayıt sayısı, yaklaşık bayt)
+ANALYSIS_CACHE_SIZE = 16384
+ANALYSIS_CACHE_BYTES = 64 * 1024 * 1024
+PARADIGM_CACHE_SIZE = 2048
+
+# Global instances (sözlük süreç başına tektir; gunicorn önyüklemesi için
+# bkz. preload.py)
+_lexicon = shared_lexicon()
 
-    # Orijinal kelimeye en yakın olanları sırala
-    ranked = sorted(suggestions, key=lambda s: _edit_distance(s.lower(), wrong_word.lower()))
-    return ranked[:max_suggestions]
+# parse() profili (isteğe bağlı)
+PROFILE_ENABLED = os.environ.get("TURKMEN_FST_PROFILE", "") == "1"
+PROFILE_LOG_MS = os.environ.get("TURKMEN_FST_PROFILE_LOG_MS", "")
+
+_metrics: Optional[PrometheusSink] = None
+_profiler: Optional[ParseProfiler] = None
+if PROFILE_ENABLED:
+    _metrics = PrometheusSink()
+    _profiler = ParseProfiler(_metrics)
+    if PROFILE_LOG_MS:
+        _profiler.add_sink(JsonLogSink(min_seconds=float(PROFILE_LOG_MS) / 1000.0))
+
+_generator = MorphologicalGenerator(_lexicon)
+_analysis_cache = AnalysisCache(ANALYSIS_CACHE_SIZE, ANALYSIS_CACHE_BYTES)
+_analyzer = MorphologicalAnalyzer(_lexicon, cache=_analysis_cache, profiler=_profiler)
+
+# Yazım denetiminin bilinen form kümesi (index --pos known ile oluşturulur);
+# yoksa is_known() alt çözümleyicileri filtresiz dener
+KNOWN_FORMS_PATH = os.environ.get("TURKMEN_FST_KNOWN_FORMS", "")
+if KNOWN_FORMS_PATH:
+    _analyzer.known_forms = KnownForms.load(KNOWN_FORMS_PATH, _lexicon)
+
+_paradigms = ParadigmCache(_generator, PARADIGM_CACHE_SIZE)
+
+# Gölge mod: isteklerin bir kısmı arka planda referans çözümleyiciyle
+# karşılaştırılır (bkz. shadow.py)
+SHADOW_RATE = float(os.environ.get("TURKMEN_FST_SHADOW_RATE", "") or 0)
+SHADOW_LOG = os.environ.get("TURKMEN_FST_SHADOW_LOG", "shadow.jsonl")
+
+_shadow: Optional[ShadowChecker] = None
+if SHADOW_RATE > 0:
+    _shadow = ShadowChecker(_analyzer, sample_rate=SHADOW_RATE, log_path=SHADOW_LOG)
 
 
 # ==============================================================================
-#  SÖZLÜK YÜKLEME
+#  İŞ HAVUZU
 # ==============================================================================
 
-def _find_lexicon_path() -> str:
-    candidates = [
-        os.path.join(os.path.dirname(__file__), "..", "data", "turkmence_sozluk.txt"),
-        os.path.join(os.path.dirname(__file__), "..", "..", "turkmence_sozluk.txt"),
-    ]
-    for path in candidates:
-        real = os.path.realpath(path)
-        if os.path.exists(real):
-            return real
-    return ""
+EXECUTOR_KIND = os.environ.get("TURKMEN_FST_EXECUTOR", "thread")
+EXECUTOR_WORKERS = int(os.environ.get("TURKMEN_FST_WORKERS", "0")) or None
+EXECUTOR_MAX_PENDING = int(os.environ.get("TURKMEN_FST_MAX_PENDING", "64"))
+REQUEST_TIMEOUT = float(os.environ.get("TURKMEN_FST_TIMEOUT", "10"))
+WARM_ON_STARTUP = os.environ.get("TURKMEN_FST_WARM", "1") == "1"
 
 
-# Global instances
-_lexicon = Lexicon()
-_path = _find_lexicon_path()
-if _path:
-    _lexicon.load(_path)
+# Havuzda çalışan işler. Süreç havuzunda pickle edilebilmeleri için modül
+# düzeyindedir ve global analizör/generator'ı kullanır.
 
-_generator = MorphologicalGenerator(_lexicon)
-_analyzer = MorphologicalAnalyzer(_lexicon)
+def _parse_word(word: str):
+    return _analyzer.parse(word)
+
+
+def _parse_word_timed(word: str):
+    """_parse_word() + süresi (gölge mod, isteğe hizmet eden yolun süresi)."""
+    started = time.perf_counter()
+    multi = _analyzer.parse(word)
+    return multi, time.perf_counter() - started
+
+
+def _parse_words(words: list[str]):
+    return _analyzer.parse_many(words)
+
+
+def _generate_noun(stem: str, plural: bool, possessive: Optional[str],
+                   poss_type: str, case: Optional[str]):
+    return _generator.generate_noun(stem, plural, possessive, poss_type, case)
+
+
+def _generate_verb(stem: str, tense: str, person: str, negative: bool):
+    return _generator.generate_verb(stem, tense, person, negative)
+
+
+def _warm() -> None:
+    """Sözlüğe bağlı yapıları ve analizörün başvurularını önceden kurar."""
+    warm(_lexicon)
+    _analyzer.prepare()
+
+
+def _verdict(word: str, with_analysis: bool) -> tuple[bool, Optional[str]]:
+    """Kelime doğru mu; with_analysis ise ilk bilinen çözümlemenin metni."""
+    if not with_analysis:
+        return _analyzer.is_known(word), None
+    multi = _analyzer.parse(word)
+    for r in multi.results if multi.success else ():
+        if r.word_type != "unknown":
+            return True, r.breakdown
+    return False, None
+
+
+def _check_words(words: list[str], with_analysis: bool = False, timed: bool = False):
+    """
+    Yazım denetimi: her kelime için (doğru mu, analiz, öneriler).
+
+    Kelime en az bir bilinen kökle çözümlenebiliyorsa doğrudur;
+    değilse öneri üretilir. Doğruluk is_known() ile denetlenir; tam
+    çözümleme yalnızca with_analysis ile analiz metni istenirse yapılır.
+    Tekrarlanan kelimeler (büyük/küçük harf ve boşluk farkı dahil) bir kez
+    denetlenir.
+
+    timed=True ise (sonuçlar, [(kelime, doğru mu, sn), ...]) döner: her
+    benzersiz kelimenin kararı ve süresi (gölge mod).
+    """
+    checked = []
+    timings = []
+    verdicts: dict[str, tuple[bool, Optional[str]]] = {}
+    for w in words:
+        key = w.strip().lower()
+        verdict = verdicts.get(key)
+        if verdict is None:
+            started = time.perf_counter()
+            verdict = verdicts[key] = _verdict(w, with_analysis)
+            if timed:
+                timings.append((w, verdict[0], time.perf_counter() - started))
+        is_correct, analysis = verdict
+        if is_correct:
+            checked.append((True, analysis, []))
+        else:
+            checked.append((False, None, generate_suggestions(
+                w, _analyzer, _lexicon, max_suggestions=5)))
+    return (checked, timings) if timed else checked
+
+
+# Akış analizinde havuza tek seferde verilen kelime sayısı
+STREAM_WINDOW = 64
+
+
+def _stream_record(token: dict, multi) -> str:
+    """Kelimenin çözümlemesini tek NDJSON satırı olarak biçimlendirir."""
+    record = dict(token)
+    record.update(
+        success=multi.success,
+        count=multi.count,
+        results=[{
+            "stem": r.stem,
+            "word_type": r.word_type,
+            "breakdown": r.breakdown,
+            "suffixes": r.suffixes,
+            "meaning": r.meaning,
+        } for r in multi.results],
+    )
+    return json.dumps(record, ensure_ascii=False) + "\n"
 
 
 # ==============================================================================
@@ -238,12 +481,24 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
 | `B3` | Olar | 3. çoğul |
 """
 
+    @asynccontextmanager
+    async def _lifespan(app):
+        """
+        İstek almadan önce paylaşılan yapıları kurar (bkz. preload.warm);
+        aksi halde soğuk başlangıçtaki ilk yazım denetimi ~7 sn sürer.
+        gunicorn önyüklemesinde yapılar ana süreçten hazır gelir.
+        """
+        if WARM_ON_STARTUP:
+            await asyncio.to_thread(_warm)
+        yield
+
     app = FastAPI(
         title="TurkmenFST API",
         description=API_DESCRIPTION,
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        lifespan=_lifespan,
     )
 
     # CORS
@@ -255,6 +510,20 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
         allow_headers=["*"],
     )
 
+    _executor = BoundedExecutor(EXECUTOR_WORKERS, EXECUTOR_MAX_PENDING,
+                                REQUEST_TIMEOUT, EXECUTOR_KIND)
+
+    async def _offload(fn, *args):
+        """fn(*args)'ı iş havuzunda çalıştırır; doluysa 503, süre aşımında 504."""
+        try:
+            return await _executor.run(fn, *args)
+        except ExecutorSaturated:
+            raise HTTPException(status_code=503, headers={"Retry-After": "1"},
+                                detail="Sunucu meşgul, lütfen biraz sonra tekrar deneyin.")
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504,
+                                detail=f"İstek {_executor.timeout:g} sn içinde tamamlanamadı.")
+
     # ---- Request / Response modelleri ----
 
     class NounGenerateRequest(BaseModel):
@@ -441,6 +710,9 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
         version: str
         lexicon_loaded: bool
         lexicon_words: int
+        analysis_cache: Optional[dict] = None
+        executor: Optional[dict] = None
+        paradigm_cache: Optional[dict] = None
 
     # ---- Spellcheck Modelleri ----
 
@@ -451,6 +723,9 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
             description="Kontrol edilecek metin (bir veya birden fazla kelime)",
             json_schema_extra={"example": "men kitabym okadym"}
         )
+        include_analysis: bool = Field(
+            False, description="Doğru kelimeler için morfolojik analiz de döndürülsün mü?"
+        )
 
         model_config = {
             "json_schema_extra": {
@@ -476,7 +751,8 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
         suggestions: list[str] = Field(default_factory=list,
                                        description="Yanlışsa öneri listesi")
         analysis: Optional[str] = Field(None,
-                                         description="Doğruysa morfolojik analiz")
+                                         description="Doğruysa morfolojik analiz "
+                                                     "(include_analysis ile)")
 
     class SpellcheckResponse(BaseModel):
         """Yazım denetimi sonucu."""
@@ -493,6 +769,9 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
             description="Kontrol edilecek kelimeler listesi",
             json_schema_extra={"example": ["kitabym", "okadym", "mugalym"]}
         )
+        include_analysis: bool = Field(
+            False, description="Doğru kelimeler için morfolojik analiz de döndürülsün mü?"
+        )
 
     # ---- Endpoints ----
 
@@ -633,14 +912,47 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
     @app.get("/health", response_model=HealthResponse, tags=["System"],
              summary="Sistem sağlık kontrolü")
     async def health():
-        """Sistemin çalışıp çalışmadığını ve sözlük durumunu kontrol eder."""
+        """Sistemin çalışıp çalışmadığını, sözlük, analiz önbelleği ve iş havuzu durumunu kontrol eder."""
         return HealthResponse(
             status="ok",
             version="1.0.0",
             lexicon_loaded=_lexicon.is_loaded,
-            lexicon_words=_lexicon.word_count
+            lexicon_words=_lexicon.word_count,
+            analysis_cache=_analysis_cache.stats(),
+            executor=_executor.stats(),
+            paradigm_cache=_paradigms.stats()
         )
 
+    @app.get("/metrics", response_class=PlainTextResponse, tags=["System"],
+             summary="Alt çözümleyici profili (Prometheus)")
+    async def metrics():
+        """
+        parse() alt çözümleyicilerinin süre, generator çağrısı, kök adayı ve
+        eşleşme sayaçları (Prometheus metin biçimi).
+
+        Yalnızca TURKMEN_FST_PROFILE=1 ile açılır; kapalıysa 404 döner.
+        """
+        if _metrics is None:
+            raise HTTPException(status_code=404,
+                                detail="Profil kapalı (TURKMEN_FST_PROFILE=1)")
+        return PlainTextResponse(_metrics.render(), media_type=PrometheusSink.CONTENT_TYPE)
+
+    @app.get("/shadow", tags=["System"], summary="Gölge mod karşılaştırma özeti")
+    async def shadow():
+        """
+        Referans çözümleyiciyle karşılaştırılan kelime sayısı, farklı sonuç
+        sayısı ve hız oranı (referans süresi / isteğe hizmet eden yolun
+        süresi). `checks.analysis` /analyze çözümlemelerini, `checks.known`
+        /spellcheck kabul kararlarını özetler. Ayrıntılar
+        TURKMEN_FST_SHADOW_LOG günlüğündedir.
+
+        Yalnızca TURKMEN_FST_SHADOW_RATE > 0 ile açılır; kapalıysa 404 döner.
+        """
+        if _shadow is None:
+            raise HTTPException(status_code=404,
+                                detail="Gölge mod kapalı (TURKMEN_FST_SHADOW_RATE)")
+        return _shadow.stats()
+
     @app.post("/generate/noun", response_model=GenerateResponse, tags=["Generation"],
               summary="İsim çekimi (üretim)")
     async def generate_noun(req: NounGenerateRequest):
@@ -664,8 +976,8 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
         ```
         Sonuç: `kitaplarda` (kitap + lar + da)
         """
-        result = _generator.generate_noun(
-            req.stem, req.plural, req.possessive, req.poss_type, req.case
+        result = await _offload(
+            _generate_noun, req.stem, req.plural, req.possessive, req.poss_type, req.case
         )
         if not result.is_valid:
             raise HTTPException(status_code=400, detail=result.error)
@@ -696,8 +1008,8 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
         ```
         Sonuç: `gelmedim`
         """
-        result = _generator.generate_verb(
-            req.stem, req.tense, req.person, req.negative
+        result = await _offload(
+            _generate_verb, req.stem, req.tense, req.person, req.negative
         )
         if not result.is_valid:
             raise HTTPException(status_code=400, detail=result.error)
@@ -726,7 +1038,8 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
         ```
         """
         if req.type == "noun":
-            result = _generator.generate_noun(req.stem, req.plural, req.possessive, req.poss_type, req.case)
+            result = await _offload(_generate_noun, req.stem, req.plural, req.possessive,
+                                    req.poss_type, req.case)
             morphemes = _format_morphemes(result.morphemes, req.possessive)
         elif req.type == "verb":
             if not req.tense or not req.person:
@@ -735,7 +1048,7 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
                     detail="Fiil çekimi için 'tense' (zaman: 1-7) ve 'person' (şahıs: A1-B3) alanları zorunludur. "
                            "Örnek: {\"type\": \"verb\", \"stem\": \"gel\", \"tense\": \"1\", \"person\": \"A1\"}"
                 )
-            result = _generator.generate_verb(req.stem, req.tense, req.person, req.negative)
+            result = await _offload(_generate_verb, req.stem, req.tense, req.person, req.negative)
             morphemes = _format_morphemes(result.morphemes)
         else:
             raise HTTPException(
@@ -767,7 +1080,11 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
 
         Hem isim hem fiil çekimlerini otomatik algılar.
         """
-        multi = _analyzer.parse(req.word)
+        if _shadow is not None and _shadow.sampled():
+            multi, seconds = await _offload(_parse_word_timed, req.word)
+            _shadow.enqueue(req.word, "analyze", breakdowns(multi), seconds)
+        else:
+            multi = await _offload(_parse_word, req.word)
         results_list = []
         for r in multi.results:
             results_list.append(AnalyzeSingleResult(
@@ -784,6 +1101,94 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
             results=results_list
         )
 
+    class UploadStreamingResponse(StreamingResponse):
+        """
+        İstek gövdesi okunurken akan StreamingResponse.
+
+        StreamingResponse ASGI < 2.4 sunucularda yanıt boyunca receive()'i
+        dinleyerek bağlantı kopmasını yakalar; bu dinleyici henüz okunmamış
+        gövde mesajlarını da tüketir. Burada dinleme `body_read` kurulunca
+        (gövde bitince) başlar; gövde okunurken gelen kopma
+        request.stream()'den ClientDisconnect olarak yakalanır.
+        """
+
+        def __init__(self, content, body_read: asyncio.Event, **kwargs):
+            super().__init__(content, **kwargs)
+            self.body_read = body_read
+
+        async def __call__(self, scope, receive, send) -> None:
+            async def listen():
+                await self.body_read.wait()
+                await self.listen_for_disconnect(receive)
+
+            streaming = asyncio.ensure_future(self.stream_response(send))
+            listening = asyncio.ensure_future(listen())
+            await asyncio.wait({streaming, listening},
+                               return_when=asyncio.FIRST_COMPLETED)
+            for task in (streaming, listening):
+                task.cancel()
+            if not streaming.cancelled():
+                try:
+                    streaming.result()
+                except OSError:  # ASGI 2.4: istemci koptu
+                    raise ClientDisconnect()
+            if self.background is not None:
+                await self.background()
+
+    @app.post("/analyze/stream", tags=["Analysis"],
+              summary="Akış halinde toplu analiz (NDJSON)")
+    async def analyze_stream(request: Request):
+        """
+        Büyük metinleri akış halinde çözümler; her kelime için bir JSON satırı döner.
+
+        Gövde düz metin (`text/plain`) veya NDJSON (`application/x-ndjson`,
+        her satır `{"text": "..."}`) olabilir. Gövde geldikçe kelimelere
+        ayrılır ve çözümlenir: ilk satırlar yükleme bitmeden yazılır, bellek
+        belge boyutuyla büyümez.
+
+        ```
+        {"word": "kitabym", "start": 0, "end": 7, "success": true, "count": 1, "results": [...]}
+        ```
+
+        Havuz dolarsa veya süre aşılırsa akış `{"error": ..., "status": 503|504}`
+        satırıyla sona erer.
+        """
+        ndjson = "json" in request.headers.get("content-type", "")
+        tokenizer = NDJSONTokenizer() if ndjson else IncrementalTokenizer()
+        body_read = asyncio.Event()
+        return UploadStreamingResponse(_stream_analysis(request, tokenizer, body_read),
+                                       body_read, media_type="application/x-ndjson")
+
+    async def _stream_analysis(request: Request, tokenizer, body_read: asyncio.Event):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            try:
+                async for chunk in request.stream():
+                    async for line in _analyze_tokens(tokenizer.feed(decoder.decode(chunk))):
+                        yield line
+            finally:
+                body_read.set()
+            tail = tokenizer.feed(decoder.decode(b"", final=True)) + tokenizer.close()
+            async for line in _analyze_tokens(tail):
+                yield line
+        except ClientDisconnect:
+            return
+        except HTTPException as exc:
+            yield json.dumps({"error": exc.detail, "status": exc.status_code},
+                             ensure_ascii=False) + "\n"
+
+    async def _analyze_tokens(tokens: list[dict]):
+        """Kelimeleri STREAM_WINDOW'luk gruplarla havuzda çözümler, satır satır verir."""
+        for i in range(0, len(tokens), STREAM_WINDOW):
+            window = tokens[i:i + STREAM_WINDOW]
+            words = [tok["word"] for tok in window if "word" in tok]
+            multis = iter(await _offload(_parse_words, words) if words else ())
+            for tok in window:
+                if "word" in tok:
+                    yield _stream_record(tok, next(multis))
+                else:
+                    yield json.dumps(tok, ensure_ascii=False) + "\n"
+
     @app.get("/lexicon/{word}", response_model=LexiconResponse, tags=["Lexicon"],
              summary="Sözlük sorgusu")
     async def lexicon_lookup(word: str):
@@ -815,16 +1220,31 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
 
     # ---- Spellcheck Endpoints ----
 
+    async def _spellcheck_words(words: list[str], with_analysis: bool):
+        """
+        _check_words() havuzda; istek gölge mod için örneklenirse her kelimenin
+        kararı ve süresi referans kabulüyle karşılaştırılmak üzere kuyruğa eklenir.
+        """
+        if _shadow is None or not _shadow.sampled():
+            return await _offload(_check_words, words, with_analysis)
+        checked, timings = await _offload(_check_words, words, with_analysis, True)
+        for word, known, seconds in timings:
+            _shadow.enqueue_known(word, "spellcheck", known, seconds)
+        return checked
+
     @app.post("/spellcheck", response_model=SpellcheckResponse,
               tags=["Spellcheck"], summary="Yazım denetimi")
     async def spellcheck(req: SpellcheckRequest):
         """
         Metin içindeki kelimelerin yazımını kontrol eder.
 
-        Her kelime analyzer ile çözümlenir:
-        - Çözümleme başarılıysa → **doğru**
+        Her kelime analyzer ile denetlenir:
+        - Bilinen bir çözümlemesi varsa → **doğru**
         - Çözümleme bulunamazsa → **yanlış** + öneri listesi
 
+        Doğru kelimelerin çözümlemesi yalnızca `include_analysis: true`
+        ile döndürülür (tam çözümleme daha yavaştır).
+
         ```json
         {"text": "men kitabym okadym"}
         ```
@@ -835,28 +1255,14 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
         results = []
         error_count = 0
 
-        for tok in tokens:
-            w = tok["word"]
-            multi = _analyzer.parse(w)
-
-            # Kelime doğru mu? (en az 1 bilinen kökle çözümlenebiliyorsa)
-            is_correct = False
-            analysis_str = None
-
-            if multi.success and multi.results:
-                for r in multi.results:
-                    if r.word_type != "unknown":
-                        is_correct = True
-                        analysis_str = r.breakdown
-                        break
-
-            suggestions = []
+        words = [tok["word"] for tok in tokens]
+        checked = await _spellcheck_words(words, req.include_analysis)
+        for tok, (is_correct, analysis_str, suggestions) in zip(tokens, checked):
             if not is_correct:
                 error_count += 1
-                suggestions = generate_suggestions(w, _analyzer, _lexicon, max_suggestions=5)
 
             results.append(SpellcheckWordResult(
-                word=w,
+                word=tok["word"],
                 correct=is_correct,
                 start=tok["start"],
                 end=tok["end"],
@@ -885,23 +1291,10 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
         error_count = 0
         offset = 0
 
-        for w in req.words:
-            multi = _analyzer.parse(w)
-
-            is_correct = False
-            analysis_str = None
-
-            if multi.success and multi.results:
-                for r in multi.results:
-                    if r.word_type != "unknown":
-                        is_correct = True
-                        analysis_str = r.breakdown
-                        break
-
-            suggestions = []
+        checked = await _spellcheck_words(list(req.words), req.include_analysis)
+        for w, (is_correct, analysis_str, suggestions) in zip(req.words, checked):
             if not is_correct:
                 error_count += 1
-                suggestions = generate_suggestions(w, _analyzer, _lexicon, max_suggestions=5)
 
             results.append(SpellcheckWordResult(
                 word=w,
@@ -1016,17 +1409,18 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
         ```
         """
         if req.type == "noun":
-            return _generate_noun_paradigm(req.stem)
+            return await _offload(_generate_noun_paradigm, req.stem)
         elif req.type == "verb":
-            return _generate_verb_paradigm(req.stem)
+            return await _offload(_generate_verb_paradigm, req.stem)
         else:
             raise HTTPException(status_code=400,
                                 detail=f"Geçersiz tür: '{req.type}'")
 
     def _generate_noun_paradigm(stem: str) -> ParadigmaNounResponse:
-        """İsim paradigma tablosu oluşturur."""
+        """İsim paradigma tablosu oluşturur (tablo ParadigmCache'ten okunur)."""
         cases = [None, "A2", "A3", "A4", "A5", "A6"]
         poss_codes = [None, "A1", "A2", "A3"]
+        table = _paradigms.noun(stem)
 
         singular_rows = []
         plural_rows = []
@@ -1037,19 +1431,15 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
             # Tekil
             s_row = {"case_code": code, "case_name": name}
             for poss in poss_codes:
-                r = _generator.generate_noun(stem, plural=False,
-                                              possessive=poss, case=case)
                 key = "base" if poss is None else f"poss{poss}"
-                s_row[key] = r.word if r.is_valid else "—"
+                s_row[key] = table.form(False, poss, case) or "—"
             singular_rows.append(ParadigmaNounRow(**s_row))
 
             # Çoğul
             p_row = {"case_code": code, "case_name": name}
             for poss in poss_codes:
-                r = _generator.generate_noun(stem, plural=True,
-                                              possessive=poss, case=case)
                 key = "base" if poss is None else f"poss{poss}"
-                p_row[key] = r.word if r.is_valid else "—"
+                p_row[key] = table.form(True, poss, case) or "—"
             plural_rows.append(ParadigmaNounRow(**p_row))
 
         return ParadigmaNounResponse(stem=stem,
@@ -1057,20 +1447,19 @@ Sonuç: `kitap` (yalın hal). Ek parametreler ekleyerek çekim yapabilirsiniz.
                                       plural=plural_rows)
 
     def _generate_verb_paradigm(stem: str) -> ParadigmaVerbResponse:
-        """Fiil paradigma tablosu oluşturur."""
+        """Fiil paradigma tablosu oluşturur (tablo ParadigmCache'ten okunur)."""
         tenses = []
         persons = ["A1", "A2", "A3", "B1", "B2", "B3"]
+        table = _paradigms.verb(stem)
 
         for t_code in ["1", "2", "3", "4", "5", "6", "7"]:
             rows = []
             for p_code in persons:
-                pos_r = _generator.generate_verb(stem, t_code, p_code, negative=False)
-                neg_r = _generator.generate_verb(stem, t_code, p_code, negative=True)
                 rows.append(ParadigmaVerbRow(
                     person_code=p_code,
                     person_name=PERSON_NAMES[p_code],
-                    positive=pos_r.word if pos_r.is_valid else "—",
-                    negative=neg_r.word if neg_r.is_valid else "—",
+                    positive=table.form(t_code, p_code, False) or "—",
+                    negative=table.form(t_code, p_code, True) or "—",
                 ))
             tenses.append(ParadigmaVerbTense(
                 tense_code=t_code,
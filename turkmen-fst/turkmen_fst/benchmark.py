@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Tekrarlanabilir Hız Ölçümleri (benchmark.py)
+
+Ağ bağlantısı gerektirmeyen sabit bir iş yükü üzerinde sözlük yükleme,
+çözümleme, üretim, paradigma ve yazım önerisi sürelerini ölçer.
+
+İş yükü depodaki dosyalardan belirlenimli olarak çıkarılır:
+    - çözümleme kümeleri: corpus_lab/reports/corpus_coverage_local.json
+      hata kategorilerinin en sık örnekleri (isim / fiil / yapım ağırlıklı)
+      ve en sık tanınmayan kelimeler
+    - üretim / paradigma kökleri: sözlüğün sıralı isim ve fiil köklerinden
+      eşit aralıklı örnek
+İş yükünün SHA-256 özeti her kayda yazılır; farklı iş yükleriyle alınmış
+kayıtlar karşılaştırılırken uyarı verilir.
+
+Her ölçüm bir ısınma geçişinden sonra ROUNDS tur çalışır; kısa listeler
+bir tur MIN_ROUND_SECONDS sürene kadar tekrarlanır. Öğe başına en iyi
+süreden p50/p95 gecikme, en hızlı turdan işlem/sn çıkarılır (ölçüm
+gürültüsü tek yönlüdür: yavaşlatır). Sonuçlar JSON geçmiş dosyasına eklenir; compare_runs() iki
+kaydı karşılaştırıp eşiği aşan gerilemeleri döndürür.
+
+Kullanım:
+    python -m turkmen_fst bench run --label "trie"
+    python -m turkmen_fst bench compare --threshold 0.10   # gerilemede çıkış kodu 1
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.form_index import NOUN_COMBOS, VERB_COMBOS, NOUN_POS
+from turkmen_fst.generator import MorphologicalGenerator, NounGenerator, VerbGenerator
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.paradigm import build_noun_paradigm, build_verb_paradigm
+from turkmen_fst.suggest import SuggestionEngine
+
+
+REPORT_PATH = os.path.realpath(os.path.join(
+    os.path.dirname(__file__), "..", "..", "corpus_lab", "reports", "corpus_coverage_local.json"))
+HISTORY_PATH = "bench_history.json"
+
+# Ölçüm turu sayısı, bir turun en kısa süresi (sn) ve varsayılan gerileme
+# eşiği (0.10 → %10)
+ROUNDS = 5
+MIN_ROUND_SECONDS = 0.25
+THRESHOLD = 0.10
+
+# Çözümleme kümesi başına kelime, üretim kökü ve öneri kelimesi sayısı
+PARSE_SET_SIZE = 60
+STEM_COUNT = 40
+SUGGEST_SET_SIZE = 30
+
+# Üretim ölçümlerinde kök başına denenen kombinasyon aralığı
+NOUN_COMBO_STEP = 8
+VERB_COMBO_STEP = 16
+
+# Çözümleme kümeleri: küme → rapordaki hata kategorileri
+PARSE_SETS = {
+    "noun": ("cok_ekli_isim", "ozel_isim", "tireli_bilesik", "yabanci"),
+    "verb": ("fiil_cekimi", "fiilimsi_zarf"),
+    "derivation": ("yapim_ekli", "ettirgen_edilgen"),
+}
+
+# Karşılaştırılan metrikler ve iyi yön
+COMPARED_METRICS = (("p50_us", "lower"), ("ops_per_sec", "higher"))
+
+
+# ==============================================================================
+#  İŞ YÜKÜ
+# ==============================================================================
+
+def _unique(words: Iterable[str], limit: int) -> list[str]:
+    out: dict[str, None] = {}
+    for word in words:
+        word = word.strip()
+        if word and word not in out:
+            out[word] = None
+            if len(out) == limit:
+                break
+    return list(out)
+
+
+def load_word_sets(report_path: str = REPORT_PATH,
+                   size: int = PARSE_SET_SIZE) -> dict[str, list[str]]:
+    """
+    Rapordan çözümleme kümeleri: PARSE_SETS kümeleri + "top" (en sık
+    tanınmayan kelimeler). Kategoriler sıklık sırasıyla birleştirilir.
+    """
+    with open(report_path, encoding="utf-8") as f:
+        report = json.load(f)
+    categories = report.get("error_categories", {})
+    sets = {}
+    for name, wanted in PARSE_SETS.items():
+        words = (word for cat in wanted
+                 for word, _ in categories.get(cat, {}).get("top_examples", ()))
+        sets[name] = _unique(words, size)
+    sets["top"] = _unique((word for word, _ in report.get("top_unrecognized_100", ())), size)
+    return sets
+
+
+def sample_stems(lexicon: Lexicon, pos: tuple, count: int = STEM_COUNT) -> list[str]:
+    """Sözlüğün sıralı, tek kelimelik kökleri arasından eşit aralıklı örnek."""
+    stems = [w for w in sorted(lexicon.all_words())
+             if " " not in w and any(e.pos in pos for e in lexicon.lookup(w))]
+    if len(stems) <= count:
+        return stems
+    step = len(stems) / count
+    return [stems[int(i * step)] for i in range(count)]
+
+
+def workload_digest(workload: dict) -> str:
+    data = json.dumps(workload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+# ==============================================================================
+#  ÖLÇÜM
+# ==============================================================================
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def time_ops(fn: Callable, items: list, rounds: int = ROUNDS,
+             min_round_seconds: float = MIN_ROUND_SECONDS) -> dict:
+    """
+    fn(item)'ı tüm öğeler için çağırır: önce bir ısınma geçişi (tembel
+    kurulumlar ölçüme girmesin), sonra `rounds` tur. Bir tur, en az
+    `min_round_seconds` sürene kadar öğe listesini tekrarlar.
+
+    Returns:
+        {"ops", "rounds", "mean_us", "p50_us", "p95_us", "ops_per_sec"}
+        ops listedeki öğe sayısıdır; p50/p95 öğe başına en iyi süreden,
+        mean_us / ops_per_sec en hızlı turdan hesaplanır.
+    """
+    perf = time.perf_counter
+    for item in items:
+        fn(item)
+    best = [float("inf")] * len(items)
+    best_rate = 0.0
+    rounds = max(1, rounds)
+    for _ in range(rounds):
+        total = 0.0
+        done = 0
+        while True:
+            for i, item in enumerate(items):
+                started = perf()
+                fn(item)
+                elapsed = perf() - started
+                total += elapsed
+                if elapsed < best[i]:
+                    best[i] = elapsed
+            done += len(items)
+            if total >= min_round_seconds or not items:
+                break
+        if total > 0:
+            best_rate = max(best_rate, done / total)
+    per_op = sorted(best)
+    return {
+        "ops": len(items),
+        "rounds": rounds,
+        "mean_us": round(1e6 / best_rate, 3) if best_rate else 0.0,
+        "p50_us": round(_percentile(per_op, 0.50) * 1e6, 3),
+        "p95_us": round(_percentile(per_op, 0.95) * 1e6, 3),
+        "ops_per_sec": round(best_rate, 3),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                             cwd=os.path.dirname(os.path.abspath(__file__)),
+                             capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if out.returncode != 0:
+        return None
+    return out.stdout.strip() or None
+
+
+def run_benchmarks(lexicon_path: str, report_path: Optional[str] = REPORT_PATH,
+                   rounds: int = ROUNDS, only: Optional[Iterable[str]] = None,
+                   label: Optional[str] = None,
+                   log: Optional[Callable[[str], None]] = None) -> dict:
+    """
+    Tüm ölçümleri çalıştırır ve geçmişe yazılacak kaydı döndürür.
+
+    Args:
+        lexicon_path: turkmence_sozluk.txt
+        report_path: Kelime kümelerinin alındığı kapsam raporu (None → REPORT_PATH)
+        rounds: Tur sayısı
+        only: Yalnızca bu öneklerle başlayan ölçümler (ör. ["parse", "lexicon"])
+        label: Kayda yazılan serbest etiket
+        log: İlerleme satırları için (ör. print)
+    """
+    prefixes = tuple(only) if only else None
+    lexicon = Lexicon()
+    lexicon.load(lexicon_path)
+    word_sets = load_word_sets(report_path or REPORT_PATH)
+    noun_stems = sample_stems(lexicon, NOUN_POS + ("adj",))
+    verb_stems = sample_stems(lexicon, ("v",))
+    suggest_words = word_sets["top"][:SUGGEST_SET_SIZE]
+    workload = {"parse": word_sets, "noun_stems": noun_stems,
+                "verb_stems": verb_stems, "suggest": suggest_words}
+
+    analyzer = MorphologicalAnalyzer(lexicon)
+    generator = MorphologicalGenerator(lexicon)
+    noun_gen = NounGenerator(lexicon)
+    verb_gen = VerbGenerator(lexicon)
+    engine = SuggestionEngine(analyzer)
+
+    def load(path):
+        Lexicon().load(path)
+
+    def noun(item):
+        stem, (plural, poss, poss_type, case, daky) = item
+        noun_gen.generate(stem, plural, poss, poss_type, case, daky=daky)
+
+    def verb(item):
+        stem, (tense, person, neg) = item
+        verb_gen.generate(stem, tense, person, neg)
+
+    # (ad, fn, öğeler, hazırlık)
+    benches = [("lexicon.load", load, [lexicon_path], None)]
+    for name, words in word_sets.items():
+        benches.append((f"parse.{name}", analyzer.parse, words, analyzer.prepare))
+    benches += [
+        ("generate.noun", noun,
+         [(s, c) for s in noun_stems for c in NOUN_COMBOS[::NOUN_COMBO_STEP]], None),
+        ("generate.verb", verb,
+         [(s, c) for s in verb_stems for c in VERB_COMBOS[::VERB_COMBO_STEP]], None),
+        ("paradigm.noun", lambda s: build_noun_paradigm(generator, s), noun_stems, None),
+        ("paradigm.verb", lambda s: build_verb_paradigm(generator, s), verb_stems, None),
+        # İlk öneri paylaşılan SymSpell dizinini ve kuyruk tablosunu kurar
+        ("suggest", engine.suggest, suggest_words, lambda: engine.suggest("kitab")),
+    ]
+
+    results = {}
+    for name, fn, items, prepare in benches:
+        if prefixes and not name.startswith(prefixes):
+            continue
+        if prepare is not None:
+            prepare()
+        results[name] = time_ops(fn, items, rounds)
+        if log:
+            log(_format_row(name, results[name]))
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "label": label,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "workload": workload_digest(workload),
+        "rounds": rounds,
+        "benchmarks": results,
+    }
+
+
+def _format_row(name: str, stats: dict) -> str:
+    return (f"{name:<18} {stats['ops']:>6} işlem  ort {stats['mean_us']:>11.1f} µs  "
+            f"p50 {stats['p50_us']:>11.1f} µs  p95 {stats['p95_us']:>11.1f} µs  "
+            f"{stats['ops_per_sec']:>11.1f} işlem/sn")
+
+
+# ==============================================================================
+#  GEÇMİŞ VE KARŞILAŞTIRMA
+# ==============================================================================
+
+def load_history(path: str = HISTORY_PATH) -> list[dict]:
+    """Geçmiş dosyasındaki kayıtlar (dosya yoksa boş liste)."""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError(f"Geçersiz ölçüm geçmişi: {path}")
+    return data
+
+
+def append_history(record: dict, path: str = HISTORY_PATH) -> int:
+    """Kaydı geçmişe ekler; kaydın sırasını döndürür."""
+    history = load_history(path)
+    history.append(record)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(history, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+    os.replace(tmp, path)
+    return len(history) - 1
+
+
+def select_run(history: list[dict], ref: str) -> dict:
+    """
+    Kayıt seçici: tam sayı sıra (negatif: sondan, ör. "-1") veya etiket
+    (aynı etiketli son kayıt).
+    """
+    try:
+        index = int(ref)
+    except ValueError:
+        for record in reversed(history):
+            if record.get("label") == ref:
+                return record
+        raise KeyError(f"Etiketli kayıt yok: {ref!r}")
+    try:
+        return history[index]
+    except IndexError:
+        raise KeyError(f"Kayıt yok: {ref} (geçmişte {len(history)} kayıt)") from None
+
+
+def compare_runs(baseline: dict, current: dict,
+                 threshold: float = THRESHOLD) -> list[dict]:
+    """
+    Ortak ölçümleri karşılaştırır.
+
+    Returns:
+        Her (ölçüm, metrik) için {"benchmark", "metric", "baseline",
+        "current", "change", "regressed"}; change göreli değişimdir
+        (pozitif = kötüleşme).
+    """
+    rows = []
+    base_benches = baseline.get("benchmarks", {})
+    for name, stats in current.get("benchmarks", {}).items():
+        base = base_benches.get(name)
+        if base is None:
+            continue
+        for metric, better in COMPARED_METRICS:
+            old, new = base.get(metric), stats.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old if better == "lower" else (old - new) / old
+            rows.append({
+                "benchmark": name,
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change": round(change, 4),
+                "regressed": change > threshold,
+            })
+    return rows
+
+
+def format_comparison(baseline: dict, current: dict, rows: list[dict]) -> str:
+    def describe(record):
+        parts = [record.get("timestamp", "?")]
+        if record.get("label"):
+            parts.append(record["label"])
+        if record.get("commit"):
+            parts.append(record["commit"])
+        return " / ".join(parts)
+
+    lines = [f"Taban:  {describe(baseline)}", f"Güncel: {describe(current)}"]
+    if baseline.get("workload") != current.get("workload"):
+        lines.append("UYARI: kayıtlar farklı iş yükleriyle alınmış")
+    for row in rows:
+        mark = "GERİLEME" if row["regressed"] else ""
+        lines.append(f"{row['benchmark']:<18} {row['metric']:<12} "
+                     f"{row['baseline']:>12.1f} → {row['current']:>12.1f}  "
+                     f"{row['change'] * 100:+7.1f}%  {mark}".rstrip())
+    return "\n".join(lines)
+
+
+def main_run(lexicon_path: str, history_path: str = HISTORY_PATH, **kwargs) -> dict:
+    """Ölçümleri çalıştırıp geçmişe ekler (CLI)."""
+    record = run_benchmarks(lexicon_path, log=lambda line: print(line, flush=True), **kwargs)
+    index = append_history(record, history_path)
+    print(f"Kayıt #{index} yazıldı: {history_path}")
+    return record
+
+
+def main_compare(history_path: str = HISTORY_PATH, baseline: str = "-2",
+                 current: str = "-1", threshold: float = THRESHOLD) -> int:
+    """İki kaydı karşılaştırır; gerileme varsa 1 döndürür (CLI çıkış kodu)."""
+    history = load_history(history_path)
+    try:
+        base_run = select_run(history, baseline)
+        cur_run = select_run(history, current)
+    except KeyError as exc:
+        print(f"HATA: {exc.args[0]}", file=sys.stderr)
+        return 2
+    rows = compare_runs(base_run, cur_run, threshold)
+    print(format_comparison(base_run, cur_run, rows))
+    regressions = [r for r in rows if r["regressed"]]
+    if regressions:
+        print(f"{len(regressions)} gerileme (eşik %{threshold * 100:g})")
+        return 1
+    print(f"Gerileme yok (eşik %{threshold * 100:g})")
+    return 0
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Analiz Önbelleği (cache.py)
+
+MorphologicalAnalyzer.parse() sonuçları için iş parçacığı güvenli LRU
+önbelleği. Anahtar, kırpılmış ve küçük harfe çevrilmiş kelimedir; analiz
+büyük/küçük harften bağımsız olduğu için yalnızca `original` alanı isabette
+istenen yazımla yeniden kurulur.
+
+Metindeki kelime sıklıkları Zipf dağılımına uyduğundan birkaç bin kelime
+türü token'ların büyük kısmını karşılar.
+
+Kullanım:
+    cache = AnalysisCache(maxsize=8192, max_bytes=64 * 2**20)
+    analyzer = MorphologicalAnalyzer(lexicon, cache=cache)
+    analyzer.parse("kitabym")
+    cache.stats()   # {"hits": ..., "misses": ..., "evictions": ...}
+"""
+
+from __future__ import annotations
+import sys
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+def estimate_size(multi) -> int:
+    """MultiAnalysisResult'ın yaklaşık bellek boyutu (bayt)."""
+    size = sys.getsizeof(multi) + sys.getsizeof(multi.original) + sys.getsizeof(multi.results)
+    for r in multi.results:
+        size += sys.getsizeof(r) + sys.getsizeof(r.stem) + sys.getsizeof(r.breakdown)
+        size += sys.getsizeof(r.meaning) + sys.getsizeof(r.suffixes)
+        for suffix in r.suffixes:
+            size += sys.getsizeof(suffix)
+            size += sum(sys.getsizeof(value) for value in suffix.values())
+    return size
+
+
+class AnalysisCache:
+    """
+    Boyut ve bellek sınırlı LRU analiz önbelleği.
+
+    Args:
+        maxsize: En fazla kayıt sayısı
+        max_bytes: Yaklaşık bellek bütçesi (None → yalnızca kayıt sınırı)
+
+    Sözlük yeniden yüklendiğinde (Lexicon.generation değişince)
+    MorphologicalAnalyzer önbelleği invalidate() ile boşaltır.
+    """
+
+    def __init__(self, maxsize: int = 8192, max_bytes: Optional[int] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize pozitif olmalı")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._data: OrderedDict = OrderedDict()  # anahtar → (sonuç, boyut)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.generation = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: str):
+        """Kayıt varsa döndürür ve en yeni yapar; yoksa None."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: str, multi) -> None:
+        """Kaydı ekler; sınırlar aşılırsa en eski kayıtları çıkarır."""
+        size = estimate_size(multi)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (multi, size)
+            self._bytes += size
+            while len(self._data) > self.maxsize or \
+                    (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, (_, evicted) = self._data.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def invalidate(self, generation=None) -> None:
+        """Tüm kayıtları siler (sayaçlar korunur)."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            if self.generation is not None:
+                self.invalidations += 1
+            self.generation = generation
+
+    def clear(self) -> None:
+        """Kayıtları ve sayaçları sıfırlar."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> dict:
+        """İsabet / ıskalama / çıkarma sayaçları ve doluluk."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"AnalysisCache(size={len(self._data)}, maxsize={self.maxsize})"
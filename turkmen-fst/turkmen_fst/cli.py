@@ -5,6 +5,15 @@ TurkmenFST — Komut Satırı Arayüzü (cli.py)
 Kullanım:
     python -m turkmen_fst generate --stem kitap --plural --poss 1sg --case abl
     python -m turkmen_fst analyze kitabym
+    python -m turkmen_fst analyze --profile kitabym geldim
+    python -m turkmen_fst index --pos noun --output noun_index.pkl
+    python -m turkmen_fst index --pos known --output known_forms.pkl
+    python -m turkmen_fst fst --complete --output turkmen.fst
+    python -m turkmen_fst snapshot
+    python -m turkmen_fst paradigms --pos n,v --workers 4 --output paradigms.jsonl.gz
+    python -m turkmen_fst shadow --index noun_index.pkl --file corpus.txt
+    python -m turkmen_fst bench run --label baseline
+    python -m turkmen_fst bench compare --threshold 0.10
     python -m turkmen_fst serve --port 8000
     python -m turkmen_fst interactive
 """
@@ -13,13 +22,19 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
 import sys
 
 from turkmen_fst.phonology import PhonologyRules
-from turkmen_fst.lexicon import Lexicon, HOMONYMS
+from turkmen_fst.lexicon import Lexicon, HOMONYMS, SNAPSHOT_SUFFIX
 from turkmen_fst.morphotactics import VerbMorphotactics
 from turkmen_fst.generator import MorphologicalGenerator
 from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.form_index import NounFormIndex, VerbFormIndex
+from turkmen_fst.fst import TurkmenFST, FSTAnalyzer
+from turkmen_fst.paradigm import export_paradigms
+from turkmen_fst.profiling import ParseProfiler, MemorySink
+from turkmen_fst.shadow import ShadowChecker
 
 
 # ==============================================================================
@@ -45,7 +60,7 @@ def _load_lexicon() -> Lexicon:
     lexicon = Lexicon()
     path = _find_lexicon_path()
     if path:
-        count = lexicon.load(path)
+        count = lexicon.load(path, use_snapshot=True)
         return lexicon
     return lexicon
 
@@ -103,25 +118,199 @@ def cmd_generate(args):
 def cmd_analyze(args):
     """Kelimeyi morfolojik olarak analiz eder."""
     lexicon = _load_lexicon()
+    analyzer = _build_analyzer(args, lexicon)
+    metrics = None
+    if args.profile:
+        # Paylaşılan yapıların kurulumu ilk kelimenin süresine eklenmesin
+        analyzer.prepare()
+        metrics = MemorySink()
+        analyzer.profiler = ParseProfiler(metrics)
+
+    for multi in analyzer.iter_parse(args.words, workers=args.workers):
+        for result in multi.results:
+            print(f"\n{'='*40}")
+            print(f"Kelime:  {result.original}")
+            print(f"Kök:     {result.stem}")
+            print(f"Tür:     {result.word_type}")
+            print(f"Analiz:  {result.breakdown}")
+            if result.suffixes:
+                print("Ekler:")
+                for s in result.suffixes:
+                    print(f"  - {s.get('suffix', '')} ({s.get('type', '')}, {s.get('code', '')})")
+            if args.json:
+                print(json.dumps({
+                    "original": result.original, "stem": result.stem,
+                    "type": result.word_type, "breakdown": result.breakdown,
+                    "suffixes": result.suffixes
+                }, ensure_ascii=False, indent=2))
+
+    if metrics is not None:
+        _print_profile(metrics)
+
+
+def _build_analyzer(args, lexicon: Lexicon) -> MorphologicalAnalyzer:
+    """--fst / --index / --verb-index seçenekleriyle hızlandırılmış analizör."""
+    if args.fst:
+        analyzer = FSTAnalyzer(lexicon, fst=TurkmenFST.load(args.fst, lexicon))
+    else:
+        analyzer = MorphologicalAnalyzer(lexicon)
+    if args.index:
+        analyzer.noun_index = NounFormIndex.load(args.index, lexicon)
+    if args.verb_index:
+        analyzer.verb_index = VerbFormIndex.load(args.verb_index, lexicon)
+    return analyzer
+
+
+def _print_profile(metrics: MemorySink):
+    """Alt çözümleyici profilini stderr'e tablo olarak yazar."""
+    snap = metrics.snapshot()
+    out = sys.stderr
+    print(f"\n{'='*72}", file=out)
+    print(f"Profil: {snap['parses']} kelime, {snap['seconds'] * 1000:.1f} ms", file=out)
+    print(f"{'Aşama':<14}{'Çağrı':>8}{'ms':>12}{'Generator':>12}{'Aday':>10}{'Eşleşme':>10}", file=out)
+    for name, st in snap["stages"].items():
+        print(f"{name:<14}{st['calls']:>8}{st['seconds'] * 1000:>12.2f}"
+              f"{st['generator_calls']:>12}{st['candidates']:>10}{st['matches']:>10}", file=out)
+    if snap["parses"] and not snap["stages"]:
+        print("(işçi süreçlerindeki çözümlemeler ölçülmez; --workers 1 kullanın)", file=out)
+    hot = metrics.hot()
+    if hot:
+        print("En yavaş kelimeler: " + ", ".join(f"{w} ({sec * 1000:.1f} ms)" for w, sec in hot[:5]),
+              file=out)
+
+
+# ==============================================================================
+#  SHADOW KOMUTU
+# ==============================================================================
+
+# Corpus dosyasından kelime ayıklama (tireli bileşikler tek kelime)
+_SHADOW_WORD_RE = re.compile(r"[^\W\d_]+(?:-[^\W\d_]+)*")
+
+
+def cmd_shadow(args):
+    """
+    Kelimeleri hızlandırılmış analizör ve referans çözümleyiciyle
+    çözümleyip karşılaştırır; fark varsa çıkış kodu 1.
+    """
+    words = list(args.words)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            for line in f:
+                words.extend(_SHADOW_WORD_RE.findall(line))
+    types: dict[str, str] = {}
+    for w in words:
+        types.setdefault(w.lower(), w)  # her tür bir kez, ilk yazımıyla
+    words = list(types.values())
+    if args.limit:
+        words = words[:args.limit]
+    if not words:
+        print("HATA: Kelime yok (kelime listesi veya --file verin).")
+        sys.exit(1)
+
+    lexicon = _load_lexicon()
+    analyzer = _build_analyzer(args, lexicon)
+    analyzer.prepare()
+    checker = ShadowChecker(analyzer, log_path=args.log, log_matches=not args.mismatches_only)
+    checker.reference.prepare()
+    for record in checker.check_many(words):
+        if not record.match:
+            print(f"FARK {record.word}: yalnız hızlı {record.only_fast}, "
+                  f"yalnız referans {record.only_reference}")
+
+    stats = checker.stats()
+    print(f"{stats['checked']} kelime, {stats['mismatches']} fark, "
+          f"hızlı {stats['fast_seconds'] * 1000:.1f} ms, "
+          f"referans {stats['reference_seconds'] * 1000:.1f} ms, "
+          f"hız oranı {stats['speedup']}x")
+    if args.log:
+        print(f"Günlük: {args.log}")
+    if stats["mismatches"]:
+        sys.exit(1)
+
+
+# ==============================================================================
+#  INDEX KOMUTU
+# ==============================================================================
+
+def cmd_index(args):
+    """
+    İsim / fiil yüzey formu dizinini veya yazım denetiminin bilinen form
+    kümesini (--pos known) oluşturup diske yazar.
+    """
+    lexicon = _load_lexicon()
     analyzer = MorphologicalAnalyzer(lexicon)
+    if args.pos == "noun":
+        index = analyzer.build_noun_index()
+    elif args.pos == "verb":
+        index = analyzer.build_verb_index()
+    else:
+        index = analyzer.build_known_forms()
+    output = args.output or ("known_forms.pkl" if args.pos == "known" else f"{args.pos}_index.pkl")
+    index.save(output)
+    print(f"Dizin yazıldı: {output} ({len(index)} form)")
 
-    for word in args.words:
-        result = analyzer.parse(word)
-        print(f"\n{'='*40}")
-        print(f"Kelime:  {result.original}")
-        print(f"Kök:     {result.stem}")
-        print(f"Tür:     {result.word_type}")
-        print(f"Analiz:  {result.breakdown}")
-        if result.suffixes:
-            print("Ekler:")
-            for s in result.suffixes:
-                print(f"  - {s.get('suffix', '')} ({s.get('type', '')}, {s.get('code', '')})")
-        if args.json:
-            print(json.dumps({
-                "original": result.original, "stem": result.stem,
-                "type": result.word_type, "breakdown": result.breakdown,
-                "suffixes": result.suffixes
-            }, ensure_ascii=False, indent=2))
+
+# ==============================================================================
+#  FST KOMUTU
+# ==============================================================================
+
+def cmd_fst(args):
+    """Sözlüğü harf düzeyinde dönüştürücüye derleyip diske yazar."""
+    lexicon = _load_lexicon()
+    fst = TurkmenFST.compile(lexicon, complete=args.complete)
+    fst.save(args.output)
+    print(f"FST yazıldı: {args.output} ({fst})")
+
+
+# ==============================================================================
+#  SNAPSHOT KOMUTU
+# ==============================================================================
+
+def cmd_snapshot(args):
+    """Sözlüğün ikili snapshot'ını yazar (hızlı açılış için)."""
+    path = _find_lexicon_path()
+    if not path:
+        print("HATA: Sözlük dosyası bulunamadı.")
+        sys.exit(1)
+    lexicon = Lexicon()
+    lexicon.load(path)
+    output = args.output or path + SNAPSHOT_SUFFIX
+    lexicon.save_snapshot(output, path)
+    print(f"Snapshot yazıldı: {output} ({lexicon.word_count} kelime)")
+
+
+# ==============================================================================
+#  PARADIGMS KOMUTU
+# ==============================================================================
+
+def cmd_paradigms(args):
+    """Sözlüğün paradigma tablolarını gzip'li JSON Lines olarak dışa aktarır."""
+    lexicon = _load_lexicon()
+    pos = [p.strip() for p in args.pos.split(",") if p.strip()] if args.pos else None
+    workers = args.workers if args.workers is not None else (os.cpu_count() or 1)
+    count = export_paradigms(lexicon, args.output, pos=pos, workers=workers)
+    print(f"Paradigmalar yazıldı: {args.output} ({count} tablo)")
+
+
+# ==============================================================================
+#  BENCH KOMUTU
+# ==============================================================================
+
+def cmd_bench(args):
+    """Hız ölçümlerini çalıştırır veya geçmişteki iki kaydı karşılaştırır."""
+    from turkmen_fst import benchmark
+
+    if args.action == "compare":
+        sys.exit(benchmark.main_compare(args.history, args.baseline, args.current,
+                                        args.threshold))
+
+    path = _find_lexicon_path()
+    if not path:
+        print("HATA: Sözlük dosyası bulunamadı.")
+        sys.exit(1)
+    only = [p.strip() for p in args.only.split(",") if p.strip()] if args.only else None
+    benchmark.main_run(path, args.history, report_path=args.report, rounds=args.rounds,
+                       only=only, label=args.label)
 
 
 # ==============================================================================
@@ -234,8 +423,78 @@ def main():
     analyze_parser = subparsers.add_parser("analyze", help="Morfolojik analiz")
     analyze_parser.add_argument("words", nargs="+", help="Analiz edilecek kelimeler")
     analyze_parser.add_argument("--json", action="store_true", help="JSON çıktı")
+    analyze_parser.add_argument("--index", help="İsim formu dizini (index komutuyla oluşturulur)")
+    analyze_parser.add_argument("--verb-index", help="Fiil formu dizini (index --pos verb)")
+    analyze_parser.add_argument("--fst", help="Derlenmiş FST (fst komutuyla oluşturulur)")
+    analyze_parser.add_argument("--profile", action="store_true",
+                                help="Alt çözümleyici sürelerini ve sayaçlarını stderr'e yaz")
+    analyze_parser.add_argument("--workers", type=int, default=None,
+                                help="Süreç sayısı (çok sayıda kelime için)")
     analyze_parser.set_defaults(func=cmd_analyze)
 
+    # shadow komutu
+    shadow_parser = subparsers.add_parser(
+        "shadow", help="Hızlı analizörü referans çözümleyiciyle karşılaştır")
+    shadow_parser.add_argument("words", nargs="*", help="Denetlenecek kelimeler")
+    shadow_parser.add_argument("--file", help="Corpus metin dosyası (her kelime türü bir kez)")
+    shadow_parser.add_argument("--limit", type=int, default=None, help="En fazla kelime türü")
+    shadow_parser.add_argument("--index", help="İsim formu dizini")
+    shadow_parser.add_argument("--verb-index", help="Fiil formu dizini")
+    shadow_parser.add_argument("--fst", help="Derlenmiş FST")
+    shadow_parser.add_argument("--log", default="shadow.jsonl", help="JSON Lines günlüğü")
+    shadow_parser.add_argument("--mismatches-only", action="store_true",
+                               help="Günlüğe yalnızca farklı sonuçları yaz")
+    shadow_parser.set_defaults(func=cmd_shadow)
+
+    # index komutu
+    index_parser = subparsers.add_parser("index", help="Yüzey formu dizini oluştur")
+    index_parser.add_argument("--pos", choices=["noun", "verb", "known"], default="noun",
+                              help="Dizin türü (known: yazım denetimi form kümesi)")
+    index_parser.add_argument("--output", help="Çıktı dosyası (varsayılan: <pos>_index.pkl, "
+                                               "known_forms.pkl)")
+    index_parser.set_defaults(func=cmd_index)
+
+    # fst komutu
+    fst_parser = subparsers.add_parser("fst", help="Sözlüğü FST'ye derle")
+    fst_parser.add_argument("--output", default="turkmen.fst", help="Çıktı dosyası")
+    fst_parser.add_argument("--complete", action="store_true",
+                            help="Her kökü hem isim hem fiil olarak derle")
+    fst_parser.set_defaults(func=cmd_fst)
+
+    # snapshot komutu
+    snapshot_parser = subparsers.add_parser("snapshot", help="Sözlük snapshot'ı oluştur")
+    snapshot_parser.add_argument("--output", help="Çıktı dosyası (varsayılan: <sözlük>.snap)")
+    snapshot_parser.set_defaults(func=cmd_snapshot)
+
+    # paradigms komutu
+    paradigms_parser = subparsers.add_parser("paradigms", help="Paradigma tablolarını dışa aktar")
+    paradigms_parser.add_argument("--output", default="paradigms.jsonl.gz",
+                                  help="Çıktı dosyası (gzip JSON Lines)")
+    paradigms_parser.add_argument("--pos", help="POS alt kümesi, virgülle (ör. n,adj,v)")
+    paradigms_parser.add_argument("--workers", type=int, default=None,
+                                  help="Süreç sayısı (varsayılan: CPU sayısı)")
+    paradigms_parser.set_defaults(func=cmd_paradigms)
+
+    # bench komutu
+    bench_parser = subparsers.add_parser("bench", help="Hız ölçümleri (çalıştır / karşılaştır)")
+    bench_actions = bench_parser.add_subparsers(dest="action", required=True)
+    bench_run = bench_actions.add_parser("run", help="Ölçümleri çalıştır ve geçmişe ekle")
+    bench_run.add_argument("--history", default="bench_history.json", help="Geçmiş dosyası")
+    bench_run.add_argument("--report", default=None,
+                           help="Kelime kümeleri için kapsam raporu "
+                                "(varsayılan: corpus_lab/reports/corpus_coverage_local.json)")
+    bench_run.add_argument("--rounds", type=int, default=5, help="Tur sayısı")
+    bench_run.add_argument("--only", help="Ölçüm önekleri, virgülle (ör. parse,generate)")
+    bench_run.add_argument("--label", help="Kayıt etiketi")
+    bench_compare = bench_actions.add_parser("compare", help="İki kaydı karşılaştır")
+    bench_compare.add_argument("--history", default="bench_history.json", help="Geçmiş dosyası")
+    bench_compare.add_argument("--baseline", default="-2",
+                               help="Taban kayıt: sıra (ör. -2, 0) veya etiket")
+    bench_compare.add_argument("--current", default="-1", help="Güncel kayıt: sıra veya etiket")
+    bench_compare.add_argument("--threshold", type=float, default=0.10,
+                               help="Gerileme eşiği (0.10 → %%10)")
+    bench_parser.set_defaults(func=cmd_bench)
+
     # serve komutu
     serve_parser = subparsers.add_parser("serve", help="API sunucusu başlat")
     serve_parser.add_argument("--port", type=int, default=8000, help="Port (varsayılan: 8000)")
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Sınırlı İş Havuzu (executor.py)
+
+Async sunucularda (api.py) analiz ve üretim gibi CPU işlerini olay
+döngüsünün dışında, iş parçacığı veya süreç havuzunda çalıştırır.
+
+    - Kuyruk derinliği sınırlıdır: bekleyen + çalışan iş sayısı
+      max_pending'e ulaştığında yeni iş hemen ExecutorSaturated ile
+      reddedilir (sunucu 503 döndürür, istek kuyrukta yaşlanmaz).
+    - Her istek bir zaman aşımıyla beklenir; süresi dolan iş henüz
+      başlamadıysa iptal edilir ve yeri boşalır.
+
+Süreç havuzunda çalıştırılan fonksiyon ve argümanları pickle
+edilebilir olmalıdır (modül düzeyinde fonksiyonlar).
+
+Kullanım:
+    executor = BoundedExecutor(workers=4, max_pending=64, timeout=10.0)
+    multi = await executor.run(parse_word, "kitabym")
+"""
+
+from __future__ import annotations
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Callable, Optional
+
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+class ExecutorSaturated(RuntimeError):
+    """Havuz dolu; iş kabul edilmedi."""
+
+
+class BoundedExecutor:
+    """
+    Kuyruk derinliği ve istek süresi sınırlı iş havuzu.
+
+    Args:
+        workers: İşçi sayısı (None → CPU sayısı)
+        max_pending: Aynı anda kabul edilen en fazla iş (bekleyen + çalışan)
+        timeout: Varsayılan istek zaman aşımı (sn, None → sınırsız)
+        kind: "thread" veya "process"
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: int = 64,
+                 timeout: Optional[float] = 10.0, kind: str = "thread"):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Geçersiz havuz türü: {kind!r} ({', '.join(EXECUTOR_KINDS)})")
+        if max_pending < 1:
+            raise ValueError("max_pending en az 1 olmalı")
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.kind = kind
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._completed = 0
+        if kind == "process":
+            ctx = multiprocessing.get_context(
+                "fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=ctx)
+        else:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="turkmen-fst")
+
+    def submit(self, fn: Callable, *args):
+        """
+        İşi havuza verir ve concurrent.futures.Future döndürür.
+
+        Raises:
+            ExecutorSaturated: max_pending iş zaten kabul edilmişse
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise ExecutorSaturated(f"İş havuzu dolu ({self.max_pending} iş)")
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending += 1
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self._completed += 1
+        self._slots.release()
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None):
+        """
+        fn(*args)'ı havuzda çalıştırır ve sonucunu bekler.
+
+        Raises:
+            ExecutorSaturated: Havuz doluysa (hemen)
+            asyncio.TimeoutError: İş süresinde bitmezse
+        """
+        future = asyncio.wrap_future(self.submit(fn, *args))
+        try:
+            return await asyncio.wait_for(future, timeout if timeout is not None else self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            raise
+
+    def stats(self) -> dict:
+        """Havuz sayaçları (/health için)."""
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def __repr__(self) -> str:
+        return (f"BoundedExecutor(kind={self.kind!r}, workers={self.workers}, "
+                f"max_pending={self.max_pending})")
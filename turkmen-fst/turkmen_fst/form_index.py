@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Yüzey Formu Dizini (form_index.py)
+
+Generator'ı sözlükteki her isim ve fiil kökü için bir kez çalıştırır ve
+yüzey formu → (kök, çekim parametreleri) ters dizinini oluşturur.
+
+Analizör dizin bağlandığında parse_noun() / parse_verb() eşleşmelerini
+sözlük aramasıyla bulur; generate-and-compare döngüsü yalnızca dizin
+dışındaki kökler için çalışır. Sonuçlar dizinsiz çalışmayla birebir aynıdır.
+
+Kullanım:
+    noun_index = NounFormIndex.build(lexicon)
+    noun_index.save("noun_index.pkl")
+    verb_index = VerbFormIndex.build(lexicon)
+    analyzer = MorphologicalAnalyzer(lexicon, noun_index=noun_index,
+                                     verb_index=verb_index)
+"""
+
+from __future__ import annotations
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from turkmen_fst.lexicon import Lexicon, HOMONYMS
+from turkmen_fst.generator import NounGenerator, VerbGenerator
+from turkmen_fst.phonology import stem_profile
+
+
+# ==============================================================================
+#  İSİM ÇEKİM KOMBİNASYONLARI
+# ==============================================================================
+
+# parse_noun() ile aynı deneme sırası: çoğul × iyelik × iyelik tipi × (hal, daky)
+# Yalın kök (hiç ek yok) kombinasyonu üretim gerektirmediği için listede yoktur.
+_CASE_DAKY_OPTS = [
+    (None, False), ("A2", False), ("A3", False),
+    ("A4", False), ("A5", False), ("A6", False),
+    (None, True),  # daky: lokatif+kI → göreceli sıfat
+]
+
+NOUN_COMBOS: list[tuple] = [
+    (plural, poss, poss_type, case, daky)
+    for plural in (False, True)
+    for poss in (None, "A1", "A2", "A3")
+    for poss_type in ("tek", "cog")
+    if not (poss is None and poss_type == "cog")
+    for case, daky in _CASE_DAKY_OPTS
+    if plural or poss is not None or case is not None or daky
+]
+
+# İsim çekimi alan POS etiketleri
+NOUN_POS = ("n", "np", "n?")
+
+# parse_verb() ile aynı deneme sırası: zaman × şahıs × olumsuzluk
+# 1-7: temel zamanlar, 8-18: şert/buýruk/ortaç/ulaç/ettirgen vb.
+# 22-35: goşma zamanlar (hekaýa/rowaýat/şert)
+VERB_TENSES = [str(i) for i in range(1, 19)] + [str(i) for i in range(22, 36)]
+VERB_PERSONS = ["A1", "A2", "A3", "B1", "B2", "B3"]
+
+VERB_COMBOS: list[tuple] = [
+    (tense, person, neg)
+    for tense in VERB_TENSES
+    for person in VERB_PERSONS
+    for neg in (False, True)
+]
+
+# Yuvarlaklaşma normalizasyonu: u→y, ü→i
+# İki kelime _rounding_equivalent() ise normalize halleri birebir aynıdır.
+_ROUNDING_FOLD = str.maketrans({"u": "y", "ü": "i"})
+
+
+def rounding_key(word: str) -> str:
+    """Yuvarlaklaşma farklarını yok sayan dizin anahtarı."""
+    return word.lower().translate(_ROUNDING_FOLD)
+
+
+def verb_form_key(gen_word: str) -> str:
+    """Üretilen fiil formunun zamirsiz (son kelime) kısmının dizin anahtarı."""
+    parts = gen_word.lower().split()
+    return rounding_key(parts[-1] if len(parts) >= 2 else gen_word)
+
+
+def noun_softening_variants(lexicon: Optional[Lexicon], stem: str) -> list[tuple[bool, str]]:
+    """
+    Bir kök için denenecek (yumuşama_izni, anlam) varyantlarını döndürür.
+
+    Eş sesli kelimelerde her anlam ayrı varyanttır; diğerlerinde
+    sözlükteki softening bayrağı kullanılır.
+    """
+    homonym_data = HOMONYMS.get(stem)
+    if homonym_data:
+        return [(yumusama, anlam) for _, (anlam, yumusama) in homonym_data.items()]
+
+    entries = lexicon.lookup(stem) if lexicon else []
+    noun_entries = [e for e in entries if e.pos in NOUN_POS]
+    if noun_entries:
+        return [(noun_entries[0].allows_softening, "")]
+    # İsim olarak bulunamadıysa yumuşamasız dene
+    return [(False, "")]
+
+
+# ==============================================================================
+#  ORTAK DİZİN YAPISI
+# ==============================================================================
+
+class _FormIndex:
+    """
+    Yüzey formu → paketlenmiş kayıt dizini.
+
+    Her kayıt kök numarası ile alt sınıfın tanımladığı düşük bitlerin
+    (varyant, kombinasyon) tek bir tamsayıya paketlenmiş halidir.
+    Kayıtlar kök başına üretim sırasıyla tutulur, böylece analizör
+    dizinsiz döngüyle aynı sonuç sırasını verir.
+
+    Bellek için tek kayıtlı formlar liste yerine doğrudan tamsayı saklar.
+    """
+
+    VERSION = 2
+    _STEM_SHIFT = 12
+
+    def __init__(self):
+        self._forms: dict[str, int | list[int]] = {}
+        self._stem_ids: dict[str, int] = {}
+        self._lexicon_words = 0
+        self._lexicon_sha256 = b""
+
+    def _add_stem(self, stem: str) -> int:
+        stem_id = len(self._stem_ids)
+        self._stem_ids[stem] = stem_id
+        return stem_id << self._STEM_SHIFT
+
+    def _add(self, key: str, code: int) -> None:
+        bucket = self._forms.get(key)
+        if bucket is None:
+            self._forms[key] = code
+        elif isinstance(bucket, int):
+            self._forms[key] = [bucket, code]
+        else:
+            bucket.append(code)
+
+    def _codes(self, key: str, stem: str) -> list[int]:
+        """Anahtarı verilen kökten üreten kayıtların düşük bitleri."""
+        bucket = self._forms.get(key)
+        stem_id = self._stem_ids.get(stem)
+        if bucket is None or stem_id is None:
+            return []
+        codes = (bucket,) if isinstance(bucket, int) else bucket
+        mask = (1 << self._STEM_SHIFT) - 1
+        return [code & mask for code in codes if code >> self._STEM_SHIFT == stem_id]
+
+    def covers(self, stem: str) -> bool:
+        """Kök dizine dahil mi?"""
+        return stem in self._stem_ids
+
+    def save(self, path: str) -> None:
+        """Dizini diske yazar."""
+        with open(path, "wb") as f:
+            pickle.dump({
+                "kind": type(self).__name__,
+                "version": self.VERSION,
+                "lexicon_words": self._lexicon_words,
+                "lexicon_sha256": self._lexicon_sha256,
+                "stem_ids": self._stem_ids,
+                "forms": self._forms,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str, lexicon: Optional[Lexicon] = None):
+        """
+        Diskteki dizini yükler.
+
+        Sözlük verilirse kaynak sözlüğün SHA-256 özeti ve kelime sayısı
+        karşılaştırılır; uyuşmazlıkta ValueError fırlatılır (dizin yeniden
+        oluşturulmalıdır).
+        """
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("kind", cls.__name__) != cls.__name__:
+            raise ValueError(f"Dosya {cls.__name__} değil: {data.get('kind')}")
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Desteklenmeyen dizin sürümü: {data.get('version')}")
+        if lexicon is not None and (data["lexicon_sha256"], data["lexicon_words"]) != (
+                lexicon.source_sha256, lexicon.word_count):
+            raise ValueError("Dizin bu sözlükle oluşturulmamış, yeniden oluşturun")
+        index = cls()
+        index._stem_ids = data["stem_ids"]
+        index._forms = data["forms"]
+        index._lexicon_words = data["lexicon_words"]
+        index._lexicon_sha256 = data["lexicon_sha256"]
+        return index
+
+    def __len__(self) -> int:
+        return len(self._forms)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(forms={len(self._forms)}, stems={len(self._stem_ids)})"
+
+
+# ==============================================================================
+#  İSİM YÜZEY FORMU DİZİNİ
+# ==============================================================================
+
+class NounFormIndex(_FormIndex):
+    """
+    İsim çekimlerinin ters dizini.
+
+    Kayıt: kök_no << 12 | varyant_no << 8 | kombinasyon_no
+    (kombinasyon_no NOUN_COMBOS listesindeki sıradır).
+    """
+
+    _VARIANT_SHIFT = 8
+
+    @classmethod
+    def build(cls, lexicon: Lexicon) -> "NounFormIndex":
+        """
+        Sözlükteki tüm isim kökleri (ve eş sesliler) için dizini oluşturur.
+
+        Args:
+            lexicon: Yüklü sözlük
+        Returns:
+            Oluşturulan dizin
+        """
+        index = cls()
+        gen = NounGenerator(lexicon)
+
+        for stem, entries in lexicon._entries.items():
+            if stem not in HOMONYMS and not any(e.pos in NOUN_POS for e in entries):
+                continue
+            stem_code = index._add_stem(stem)
+
+            variants = noun_softening_variants(lexicon, stem)
+            profile = stem_profile(stem)
+            for vi, (yumusama_izni, _) in enumerate(variants):
+                base = stem_code | (vi << cls._VARIANT_SHIFT)
+                for ci, (plural, poss, poss_type, case, daky) in enumerate(NOUN_COMBOS):
+                    try:
+                        result = gen.generate(stem, plural, poss, poss_type, case,
+                                              yumusama_izni=yumusama_izni, daky=daky,
+                                              profile=profile)
+                    except Exception:
+                        continue
+                    if result.is_valid:
+                        index._add(rounding_key(result.word), base | ci)
+
+        index._lexicon_words = lexicon.word_count
+        index._lexicon_sha256 = lexicon.source_sha256
+        return index
+
+    def lookup(self, word: str, stem: str) -> list[tuple[int, int]]:
+        """
+        Kelimeyi verilen kökten üreten (varyant_no, kombinasyon_no) listesi.
+
+        Args:
+            word: Çekimli kelime
+            stem: Aday kök (küçük harf)
+        """
+        return [(code >> self._VARIANT_SHIFT, code & 0xFF)
+                for code in self._codes(rounding_key(word), stem)]
+
+
+# ==============================================================================
+#  FİİL YÜZEY FORMU DİZİNİ
+# ==============================================================================
+
+class VerbFormIndex(_FormIndex):
+    """
+    Fiil çekimlerinin ters dizini.
+
+    Kayıt: kök_no << 9 | kombinasyon_no (VERB_COMBOS sırası).
+    Anahtar, üretilen formun zamirsiz kısmıdır ("men geljek" → "geljek").
+
+    Dizin sözlükteki "v" köklerini kapsar. parse_verb() sözlükteki her
+    kelimeyi kök adayı olarak denediği için, dizin dışı kökler ilk
+    kullanımda üretilip sınırlı bir LRU tablosunda tutulur.
+    """
+
+    _STEM_SHIFT = 9
+    EXTRA_STEMS = 2048
+
+    def __init__(self):
+        super().__init__()
+        self._extra: OrderedDict[str, dict[str, list[int]]] = OrderedDict()
+        self._extra_lock = threading.Lock()
+
+    @staticmethod
+    def _stem_forms(gen: VerbGenerator, stem: str):
+        """Bir kökün tüm (anahtar, kombinasyon_no) çiftleri, üretim sırasıyla."""
+        grid = gen.generate_all(stem, VERB_TENSES, VERB_PERSONS, profile=stem_profile(stem))
+        # generate_all sırası VERB_COMBOS sırasıyla aynıdır (zaman → şahıs → olumsuz)
+        for ci, result in enumerate(grid.values()):
+            if result.is_valid:
+                yield verb_form_key(result.word), ci
+
+    @classmethod
+    def build(cls, lexicon: Lexicon) -> "VerbFormIndex":
+        """
+        Sözlükteki tüm fiil kökleri için dizini oluşturur.
+
+        Args:
+            lexicon: Yüklü sözlük
+        Returns:
+            Oluşturulan dizin
+        """
+        index = cls()
+        gen = VerbGenerator(lexicon)
+
+        for stem, entries in lexicon._entries.items():
+            if not any(e.pos == "v" for e in entries):
+                continue
+            stem_code = index._add_stem(stem)
+            for key, ci in cls._stem_forms(gen, stem):
+                index._add(key, stem_code | ci)
+
+        index._lexicon_words = lexicon.word_count
+        index._lexicon_sha256 = lexicon.source_sha256
+        return index
+
+    def lookup(self, word: str, stem: str,
+               generator: Optional[VerbGenerator] = None) -> Optional[list[int]]:
+        """
+        Kelimeyi (zamirsiz) verilen kökten üreten kombinasyon numaraları.
+
+        Kök dizinde yoksa ve generator verilmişse kökün formları üretilip
+        önbelleğe alınır; generator yoksa None döner (tam döngüye düşülür).
+
+        Args:
+            word: Zamirsiz fiil formu
+            stem: Aday kök (küçük harf)
+            generator: Dizin dışı kökler için VerbGenerator
+        """
+        key = rounding_key(word)
+        if stem in self._stem_ids:
+            return self._codes(key, stem)
+
+        with self._extra_lock:
+            table = self._extra.get(stem)
+            if table is not None:
+                self._extra.move_to_end(stem)
+        if table is None:
+            if generator is None:
+                return None
+            table = {}
+            for form, ci in self._stem_forms(generator, stem):
+                table.setdefault(form, []).append(ci)
+            with self._extra_lock:
+                self._extra[stem] = table
+                if len(self._extra) > self.EXTRA_STEMS:
+                    self._extra.popitem(last=False)
+        return list(table.get(key, ()))
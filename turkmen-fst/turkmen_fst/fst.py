@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Harf Düzeyinde Sonlu Durum Dönüştürücü (fst.py)
+
+Sözlük, morfotaktik geçiş tabloları ve generator'daki ses kuralları
+(PhonologyRules) tek bir harf düzeyinde dönüştürücüye derlenir:
+
+    KÖK TRIE'Sİ ──ε──▶ DEVAM SINIFI ──▶ EK KUYRUĞU TRIE'Sİ ──▶ çıktı
+
+  - Kök trie'si: her kökün yüzeyde görünen biçimleri (kitap, kita+b…,
+    bur+n… gibi ses olaylı allomorflar)
+  - Devam sınıfı: allomorftan sonra gelebilecek ek kuyrukları ve
+    her kuyruğun çıktısı (NOUN_COMBOS / VERB_COMBOS numaraları).
+    Aynı ses özelliklerine sahip kökler aynı sınıfı paylaşır.
+  - Ek kuyruğu trie'si: tüm sınıfların ortak kullandığı kuyruk durumları;
+    aynı kuyruklar ters yönde de tutulur (sorgu kelime uzunluğunda doğrusal)
+
+Etiket kümesi morfotaktik modelden gelir: isim kombinasyonlarının tamamı
+NounMorphotactics.TRANSITIONS ile doğrulanır; fiilde TRANSITIONS yalnızca
+1-7 zamanlarını kapsadığından 8-35 zamanlar generator tablosundan alınır.
+
+Derleme tüm sözlükte birkaç dakika sürer; TurkmenFST.save() ile
+diske yazılıp load() ile yüklenebilir. Derlenmemiş kökler ilk sorguda
+derlenir (tembel genişletme), böylece FSTAnalyzer boş bir dönüştürücüyle
+de MorphologicalAnalyzer ile birebir aynı sonuçları verir.
+
+Kullanım:
+    fst = TurkmenFST.compile(lexicon, complete=True)
+    fst.save("turkmen.fst")
+    analyzer = FSTAnalyzer(lexicon, fst=TurkmenFST.load("turkmen.fst", lexicon))
+    analyzer.parse("kitaplarymyzdan")
+"""
+
+from __future__ import annotations
+import pickle
+import threading
+from typing import Optional, Iterable
+
+from turkmen_fst.lexicon import Lexicon, HOMONYMS
+from turkmen_fst.morphotactics import NounMorphotactics, VerbMorphotactics
+from turkmen_fst.generator import NounGenerator, VerbGenerator
+from turkmen_fst.analyzer import MorphologicalAnalyzer, MultiAnalysisResult
+from turkmen_fst.form_index import (
+    NOUN_COMBOS, VERB_COMBOS, NOUN_POS,
+    rounding_key, verb_form_key, noun_softening_variants
+)
+
+
+# ==============================================================================
+#  ETİKET KÜMESİ (morfotaktik modelden)
+# ==============================================================================
+
+def _noun_label_ok(plural, poss, poss_type, case, daky) -> bool:
+    """İsim kombinasyonu NounMorphotactics geçişleriyle kabul ediliyor mu?"""
+    if poss and poss_type == "cog":
+        poss = {"A1": "B1", "A2": "B2"}.get(poss, poss)
+    # daky: bulunma hali + -kI
+    valid, _ = NounMorphotactics.validate_noun_params(plural, poss, "A5" if daky else case)
+    return valid
+
+
+def _verb_label_ok(tense, person, neg) -> bool:
+    """Fiil kombinasyonu kabul ediliyor mu? (TRANSITIONS dışı zamanlar generator'dan)"""
+    if tense not in {"1", "2", "3", "4", "5", "6", "7"}:
+        return True
+    valid, _ = VerbMorphotactics.validate_verb_params(tense, person, neg)
+    return valid
+
+
+NOUN_LABELS = [ci for ci, combo in enumerate(NOUN_COMBOS) if _noun_label_ok(*combo)]
+VERB_LABELS = [ci for ci, combo in enumerate(VERB_COMBOS) if _verb_label_ok(*combo)]
+
+
+# ==============================================================================
+#  DÖNÜŞTÜRÜCÜ
+# ==============================================================================
+
+class TurkmenFST:
+    """
+    Harf düzeyinde dönüştürücü.
+
+    Geçişler tek bir sözlükte tutulur: (durum << 16 | harf kodu) → durum.
+    0 kök trie'sinin, 1 ek kuyruğu trie'sinin, 2 ters kuyruk trie'sinin
+    başlangıç durumudur.
+
+    Attributes:
+        lexicon: Tembel genişletme için sözlük (derleme ve sorgu aynı sözlükle)
+    """
+
+    VERSION = 2
+    STEM_ROOT = 0
+    TAIL_ROOT = 1
+    RTAIL_ROOT = 2
+
+    def __init__(self, lexicon: Optional[Lexicon] = None):
+        self.lexicon = lexicon
+        self._delta: dict[int, int] = {}
+        self._num_states = 3
+        # kök allomorfu sonu → [(yay_no, sınıf_no)]
+        self._stem_finals: dict[int, list[tuple[int, int]]] = {}
+        # yay: (kök, tür "n"/"v", varyant_no)
+        self._arcs: list[tuple[str, str, int]] = []
+        # sınıf: kuyruk sonu durumu → kombinasyon numaraları
+        self._classes: list[dict[int, tuple[int, ...]]] = []
+        self._class_ids: dict[tuple, int] = {}
+        # ters kuyruk sonu → aynı kuyruğun ileri yöndeki sonu
+        self._tail_states: dict[int, int] = {}
+        self._compiled: set[tuple[str, str]] = set()
+        self._lexicon_words = lexicon.word_count if lexicon else 0
+        self._lexicon_sha256 = lexicon.source_sha256 if lexicon else b""
+        self._lock = threading.Lock()
+        self._noun_gen = None
+        self._verb_gen = None
+
+    # ------------------------------------------------------------------
+    #  Derleme
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def compile(cls, lexicon: Lexicon, stems: Optional[Iterable[str]] = None,
+                complete: bool = False) -> "TurkmenFST":
+        """
+        Sözlüğü dönüştürücüye derler.
+
+        Varsayılan olarak isim yolları isim/eş sesli kökler, fiil yolları
+        "v" kökleri için derlenir; diğer kökler sorgu sırasında eklenir.
+        Analizör sözlükteki her kelimeyi hem isim hem fiil kökü olarak
+        denediğinden, complete=True her kökü iki türde de derler (daha
+        uzun derleme, sorguda hiç tembel derleme yok).
+
+        Args:
+            lexicon: Yüklü sözlük
+            stems: Yalnızca bu kökleri derle (None → tüm sözlük)
+            complete: Her kökü hem isim hem fiil olarak derle
+        """
+        fst = cls(lexicon)
+        keys = lexicon._entries.keys() if stems is None else stems
+        for stem in keys:
+            entries = lexicon.lookup(stem)
+            if complete or stem in HOMONYMS or any(e.pos in NOUN_POS for e in entries):
+                fst.add_stem(stem, "n")
+            if complete or any(e.pos == "v" for e in entries):
+                fst.add_stem(stem, "v")
+        return fst
+
+    @property
+    def noun_gen(self) -> NounGenerator:
+        if self._noun_gen is None:
+            self._noun_gen = NounGenerator(self.lexicon)
+        return self._noun_gen
+
+    @property
+    def verb_gen(self) -> VerbGenerator:
+        if self._verb_gen is None:
+            self._verb_gen = VerbGenerator(self.lexicon)
+        return self._verb_gen
+
+    def _surface_forms(self, stem: str, kind: str):
+        """Kökün (varyant_no, anahtar, kombinasyon_no) üçlüleri, üretim sırasıyla."""
+        if kind == "n":
+            variants = noun_softening_variants(self.lexicon, stem)
+            for vi, (yumusama_izni, _) in enumerate(variants):
+                for ci in NOUN_LABELS:
+                    plural, poss, poss_type, case, daky = NOUN_COMBOS[ci]
+                    try:
+                        result = self.noun_gen.generate(stem, plural, poss, poss_type, case,
+                                                        yumusama_izni=yumusama_izni, daky=daky)
+                    except Exception:
+                        continue
+                    if result.is_valid:
+                        yield vi, rounding_key(result.word), ci
+        else:
+            for ci in VERB_LABELS:
+                try:
+                    result = self.verb_gen.generate(stem, *VERB_COMBOS[ci])
+                except Exception:
+                    continue
+                if result.is_valid:
+                    yield 0, verb_form_key(result.word), ci
+
+    def _walk_or_add(self, state: int, s: str) -> int:
+        delta = self._delta
+        for ch in s:
+            key = (state << 16) | ord(ch)
+            nxt = delta.get(key)
+            if nxt is None:
+                nxt = self._num_states
+                self._num_states += 1
+                delta[key] = nxt
+            state = nxt
+        return state
+
+    def add_stem(self, stem: str, kind: str) -> None:
+        """
+        Bir kökün isim ("n") veya fiil ("v") yollarını ekler.
+
+        Her yüzey formu kökle ortak önekinden bölünür: önek kök trie'sine,
+        kalan kuyruk ortak kuyruk trie'sine (ve ters kuyruk trie'sine)
+        yazılır. Aynı önekten çıkan kuyruk kümesi bir devam sınıfıdır ve
+        kökler arasında paylaşılır.
+        """
+        with self._lock:
+            if (stem, kind) in self._compiled:
+                return
+            fstem = rounding_key(stem)
+
+            # (varyant, önek uzunluğu) → [(kuyruk, kombinasyon)]
+            groups: dict[tuple[int, int], list[tuple[str, int]]] = {}
+            for vi, key, ci in self._surface_forms(stem, kind):
+                b = 0
+                limit = min(len(key), len(fstem))
+                while b < limit and key[b] == fstem[b]:
+                    b += 1
+                groups.setdefault((vi, b), []).append((key[b:], ci))
+
+            arc_ids: dict[int, int] = {}
+            for (vi, b), tails in groups.items():
+                table: dict[int, list[int]] = {}
+                for tail, ci in tails:
+                    t = self._walk_or_add(self.TAIL_ROOT, tail)
+                    self._tail_states[self._walk_or_add(self.RTAIL_ROOT, tail[::-1])] = t
+                    table.setdefault(t, []).append(ci)
+                signature = tuple(sorted((q, tuple(cis)) for q, cis in table.items()))
+                cid = self._class_ids.get(signature)
+                if cid is None:
+                    cid = len(self._classes)
+                    self._classes.append(dict(signature))
+                    self._class_ids[signature] = cid
+
+                arc = arc_ids.get(vi)
+                if arc is None:
+                    arc = arc_ids[vi] = len(self._arcs)
+                    self._arcs.append((stem, kind, vi))
+                q = self._walk_or_add(self.STEM_ROOT, fstem[:b])
+                self._stem_finals.setdefault(q, []).append((arc, cid))
+
+            self._compiled.add((stem, kind))
+
+    def covers(self, stem: str, kind: str) -> bool:
+        """Kökün bu türdeki yolları derlenmiş mi?"""
+        return (stem, kind) in self._compiled
+
+    # ------------------------------------------------------------------
+    #  Sorgu
+    # ------------------------------------------------------------------
+
+    def _paths(self, word: str):
+        """
+        Kelimenin tüm (kök allomorfu, kuyruk) bölünmeleri, O(len(word)).
+
+        Önce ters kuyruk trie'si sağdan sola bir kez yürünür: key[i:] bir
+        kuyruksa i konumu kuyruğun ileri yöndeki sonuyla işaretlenir. Sonra
+        kök trie'si soldan sağa bir kez yürünür; her kök allomorfu sonunda
+        işaretli kuyruk devam sınıfında aranır.
+        Yields: (yay_no, kombinasyon numaraları)
+        """
+        delta = self._delta
+        tail_states = self._tail_states
+        key = rounding_key(word)
+        n = len(key)
+
+        tails: dict[int, int] = {}
+        r = self.RTAIL_ROOT
+        i = n
+        while True:
+            t = tail_states.get(r)
+            if t is not None:
+                tails[i] = t
+            if i == 0:
+                break
+            i -= 1
+            r = delta.get((r << 16) | ord(key[i]))
+            if r is None:
+                break
+
+        q = self.STEM_ROOT
+        i = 0
+        while True:
+            finals = self._stem_finals.get(q)
+            if finals:
+                t = tails.get(i)
+                if t is not None:
+                    for arc, cid in finals:
+                        cis = self._classes[cid].get(t)
+                        if cis:
+                            yield arc, cis
+            if i == n:
+                return
+            q = delta.get((q << 16) | ord(key[i]))
+            if q is None:
+                return
+            i += 1
+
+    def transduce(self, word: str) -> list[tuple[str, str, int, int]]:
+        """
+        Kelimenin tüm (kök, tür, varyant_no, kombinasyon_no) çözümlemeleri.
+
+        Yalnızca derlenmiş kökler döner; tür "n" ise kombinasyon NOUN_COMBOS,
+        "v" ise VERB_COMBOS numarasıdır.
+        """
+        out = []
+        for arc, cis in self._paths(word):
+            stem, kind, vi = self._arcs[arc]
+            out.extend((stem, kind, vi, ci) for ci in cis)
+        return out
+
+    def transduce_grouped(self, word: str) -> dict[tuple[str, str], list[tuple[int, int]]]:
+        """
+        Kelimenin çözümlemeleri, (kök, tür) → (varyant_no, kombinasyon_no)
+        listesi olarak gruplanmış (listeler üretim sırasıyla).
+
+        Tek yürüyüştür: analizör bir kelimenin bütün kök adaylarını bu
+        sözlükten okur.
+        """
+        arcs = self._arcs
+        groups: dict[tuple[str, str], list[tuple[int, int]]] = {}
+        for arc, cis in self._paths(word):
+            stem, kind, vi = arcs[arc]
+            groups.setdefault((stem, kind), []).extend((vi, ci) for ci in cis)
+        for hits in groups.values():
+            hits.sort()
+        return groups
+
+    def lookup(self, word: str, stem: str, kind: str) -> list[tuple[int, int]]:
+        """
+        Kelimeyi verilen kökten üreten (varyant_no, kombinasyon_no) listesi.
+
+        Kök henüz derlenmemişse önce derlenir. Sonuç üretim sırasıyladır.
+        Aynı kelimenin birden çok kökü için transduce_grouped() kullanın.
+        """
+        if (stem, kind) not in self._compiled:
+            self.add_stem(stem, kind)
+        return self.transduce_grouped(word).get((stem, kind), [])
+
+    # ------------------------------------------------------------------
+    #  Kalıcılık
+    # ------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """Dönüştürücüyü diske yazar."""
+        with open(path, "wb") as f:
+            pickle.dump({
+                "version": self.VERSION,
+                "lexicon_words": self._lexicon_words,
+                "lexicon_sha256": self._lexicon_sha256,
+                "delta": self._delta,
+                "num_states": self._num_states,
+                "stem_finals": self._stem_finals,
+                "arcs": self._arcs,
+                "classes": self._classes,
+                "tail_states": self._tail_states,
+                "compiled": self._compiled,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str, lexicon: Optional[Lexicon] = None) -> "TurkmenFST":
+        """
+        Diskteki dönüştürücüyü yükler.
+
+        Sözlük verilirse kaynak sözlüğün SHA-256 özeti ve kelime sayısı
+        karşılaştırılır; uyuşmazlıkta ValueError fırlatılır (yeniden
+        derlenmelidir).
+        """
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Desteklenmeyen FST sürümü: {data.get('version')}")
+        if lexicon is not None and (data["lexicon_sha256"], data["lexicon_words"]) != (
+                lexicon.source_sha256, lexicon.word_count):
+            raise ValueError("FST bu sözlükle derlenmemiş, yeniden derleyin")
+        fst = cls(lexicon)
+        fst._lexicon_words = data["lexicon_words"]
+        fst._lexicon_sha256 = data["lexicon_sha256"]
+        fst._delta = data["delta"]
+        fst._num_states = data["num_states"]
+        fst._stem_finals = data["stem_finals"]
+        fst._arcs = data["arcs"]
+        fst._classes = data["classes"]
+        fst._tail_states = data["tail_states"]
+        fst._class_ids = {tuple(sorted(c.items())): cid for cid, c in enumerate(fst._classes)}
+        fst._compiled = data["compiled"]
+        return fst
+
+    @property
+    def num_states(self) -> int:
+        return self._num_states
+
+    def __repr__(self) -> str:
+        return (f"TurkmenFST(states={self._num_states}, arcs={len(self._arcs)}, "
+                f"classes={len(self._classes)})")
+
+
+# ==============================================================================
+#  FST TABANLI ANALİZÖR
+# ==============================================================================
+
+class FSTAnalyzer(MorphologicalAnalyzer):
+    """
+    İsim ve fiil çekimlerini dönüştürücüyle bulan analizör.
+
+    parse_noun() / parse_verb() kök adaylarını aynı sırayla dolaşır, ancak
+    her aday için 97 / 384 kombinasyonu üretmek yerine dönüştürücünün
+    bulduğu kombinasyonları üretir. Dönüştürücü bir parse() / is_known()
+    çağrısında kelime başına bir kez yürünür; kök adaylarının hitleri bu
+    yürüyüşün (kök, tür) gruplarından okunur. Diğer alt çözümleyiciler
+    (mastar, yapım ekleri, zamirler…) MorphologicalAnalyzer'dan aynen
+    gelir ve içlerinde çağrılan parse_noun/parse_verb üzerinden hızlanır.
+    """
+
+    def __init__(self, lexicon: Optional[Lexicon] = None, fst: Optional[TurkmenFST] = None):
+        super().__init__(lexicon)
+        self.fst = fst if fst is not None else TurkmenFST(lexicon)
+        # parse() / is_known() süresince kelime → transduce_grouped() sonucu
+        self._local = threading.local()
+
+    def parse(self, word: str) -> MultiAnalysisResult:
+        return self._with_walks(super().parse, word)
+
+    def is_known(self, word: str) -> bool:
+        return self._with_walks(super().is_known, word)
+
+    def _with_walks(self, fn, word: str):
+        """fn(word)'ü, kelime başına tek yürüyüş tutan bir kapsamda çalıştırır."""
+        local = self._local
+        if getattr(local, "walks", None) is not None:  # iç içe çağrı
+            return fn(word)
+        local.walks = {}
+        try:
+            return fn(word)
+        finally:
+            local.walks = None
+
+    def _hits(self, word: str, stem: str, kind: str) -> list[tuple[int, int]]:
+        """
+        Kökün hitleri, kelimenin kapsamdaki tek yürüyüşünden okunur.
+
+        Kök henüz derlenmemişse derlenir; dönüştürücü değiştiği için
+        kapsamdaki yürüyüşler atılır.
+        """
+        fst = self.fst
+        walks = getattr(self._local, "walks", None)
+        if not fst.covers(stem, kind):
+            fst.add_stem(stem, kind)
+            if walks:
+                walks.clear()
+        if walks is None:  # parse() dışından doğrudan çağrı
+            return fst.transduce_grouped(word).get((stem, kind), [])
+        groups = walks.get(word)
+        if groups is None:
+            groups = walks[word] = fst.transduce_grouped(word)
+        return groups.get((stem, kind), [])
+
+    def _noun_hits(self, word: str, stem: str) -> Optional[list[tuple[int, int]]]:
+        return self._hits(word, stem, "n")
+
+    def _verb_hits(self, word: str, stem: str) -> Optional[list[int]]:
+        return [ci for _, ci in self._hits(word, stem, "v")]
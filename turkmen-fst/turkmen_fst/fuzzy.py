@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Bulanık Kök Arama (fuzzy.py)
+
+Yazım denetimi önerileri için sözlük anahtarları üzerinde SymSpell tarzı
+silme komşuluğu dizini. Her anahtarın ilk PREFIX_LEN harfinden en fazla
+MAX_DISTANCE harf silinerek elde edilen dizgeler anahtar kimliklerine
+eşlenir; sorguda aynı silmeler üretilir, ortak dizgelerden gelen az
+sayıdaki aday gerçek Levenshtein uzaklığıyla doğrulanır.
+
+İki dizgenin uzaklığı ≤ d ise önekleri de en fazla d silmeyle ortak bir
+dizgeye iner; bu yüzden önek sınırı sonuç kaybına yol açmaz — dizin tüm
+sözlüğü taramakla aynı sonucu verir.
+
+weighted_edit_distance() öneri sıralamasında kullanılır: Türkmen
+klavyesinde sık karıştırılan harf çiftleri (ý/y, ň/n, ä/a, ž/z …) tam bir
+yazım hatasından ucuz sayılır.
+
+Kullanım:
+    index = SymSpellIndex.for_lexicon(lexicon)
+    index.lookup("kitab")            # [(1, "kitap"), ...]
+    weighted_edit_distance("yagsy", "ýagşy")  # 0.6
+"""
+
+from __future__ import annotations
+import threading
+import weakref
+from typing import Optional
+
+
+# Dizinin desteklediği en büyük uzaklık ve silme uygulanan önek uzunluğu
+MAX_DISTANCE = 2
+PREFIX_LEN = 7
+
+# Klavye karışıklığı çiftleri: özel harf yerine Latin karşılığı yazılır
+KEYBOARD_CONFUSIONS = {
+    ("ý", "y"), ("ň", "n"), ("ä", "a"), ("ž", "z"),
+    ("ö", "o"), ("ü", "u"), ("ş", "s"), ("ç", "c"),
+}
+CONFUSION_COST = 0.3
+_CONFUSABLE = frozenset(KEYBOARD_CONFUSIONS | {(b, a) for a, b in KEYBOARD_CONFUSIONS})
+
+# Sözlük → (nesil, SymSpellIndex)
+_SHARED: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_SHARED_LOCK = threading.Lock()
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """
+    Levenshtein uzaklığı.
+
+    limit verilirse uzaklık limit'i aştığı anda limit + 1 döndürülür.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a)
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        curr = [i]
+        for j, cb in enumerate(b, 1):
+            cost = prev[j - 1] + (ca != cb)
+            if prev[j] + 1 < cost:
+                cost = prev[j] + 1
+            if curr[j - 1] + 1 < cost:
+                cost = curr[j - 1] + 1
+            curr.append(cost)
+        if limit is not None and min(curr) > limit:
+            return limit + 1
+        prev = curr
+    return prev[-1]
+
+
+def weighted_edit_distance(a: str, b: str) -> float:
+    """
+    Klavye karışıklıklarını CONFUSION_COST ile sayan Levenshtein uzaklığı.
+
+    Diğer ekleme, silme ve değiştirmeler 1 maliyetlidir.
+    """
+    prev = [float(j) for j in range(len(b) + 1)]
+    for i, ca in enumerate(a, 1):
+        curr = [float(i)]
+        for j, cb in enumerate(b, 1):
+            if ca == cb:
+                sub = 0.0
+            elif (ca, cb) in _CONFUSABLE:
+                sub = CONFUSION_COST
+            else:
+                sub = 1.0
+            curr.append(min(prev[j - 1] + sub, prev[j] + 1, curr[j - 1] + 1))
+        prev = curr
+    return prev[-1]
+
+
+def _deletes(s: str, depth: int) -> set[str]:
+    """s'den en fazla `depth` harf silinerek elde edilen dizgeler (s dahil)."""
+    out = {s}
+    frontier = {s}
+    for _ in range(depth):
+        frontier = {x[:i] + x[i + 1:] for x in frontier for i in range(len(x))}
+        out |= frontier
+    return out
+
+
+class SymSpellIndex:
+    """
+    Silme komşuluğu dizini (uzaklık ≤ MAX_DISTANCE).
+
+    `_postings` silme dizgesi → anahtar numarası (tek) veya tuple'ıdır.
+    """
+
+    def __init__(self, keys: list[str]):
+        self._keys = keys
+        postings: dict[str, object] = {}
+        for i, key in enumerate(keys):
+            for d in _deletes(key[:PREFIX_LEN], MAX_DISTANCE):
+                ids = postings.get(d)
+                if ids is None:
+                    postings[d] = i
+                elif type(ids) is int:
+                    postings[d] = [ids, i]
+                else:
+                    ids.append(i)
+        for d, ids in postings.items():
+            if type(ids) is list:
+                postings[d] = tuple(ids)
+        self._postings = postings
+
+    @classmethod
+    def build(cls, lexicon) -> "SymSpellIndex":
+        """Sözlük anahtarları için dizini oluşturur (~1 sn)."""
+        return cls(lexicon.all_words())
+
+    @classmethod
+    def for_lexicon(cls, lexicon) -> "SymSpellIndex":
+        """Sözlüğün paylaşılan dizini; sözlük yeniden yüklendiyse yeniden kurulur."""
+        with _SHARED_LOCK:
+            cached = _SHARED.get(lexicon)
+            if cached is None or cached[0] != lexicon.generation:
+                cached = (lexicon.generation, cls.build(lexicon))
+                _SHARED[lexicon] = cached
+            return cached[1]
+
+    def lookup(self, word: str, max_distance: int = MAX_DISTANCE,
+               max_results: Optional[int] = None) -> list[tuple[int, str]]:
+        """
+        Uzaklığı 1..max_distance olan anahtarlar, (uzaklık, anahtar) sırasıyla.
+
+        Raises:
+            ValueError: max_distance dizinin desteklediğinden büyükse
+        """
+        if max_distance > MAX_DISTANCE:
+            raise ValueError(f"max_distance en fazla {MAX_DISTANCE} olabilir")
+        w = word.lower()
+        ids = set()
+        postings = self._postings
+        for d in _deletes(w[:PREFIX_LEN], max_distance):
+            found = postings.get(d)
+            if found is None:
+                continue
+            if type(found) is int:
+                ids.add(found)
+            else:
+                ids.update(found)
+
+        results = []
+        keys = self._keys
+        for i in ids:
+            key = keys[i]
+            dist = edit_distance(w, key, max_distance)
+            if 0 < dist <= max_distance:
+                results.append((dist, key))
+        results.sort()
+        return results[:max_results] if max_results is not None else results
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"SymSpellIndex(keys={len(self._keys)}, deletes={len(self._postings)})"
@@ -14,9 +14,13 @@ v26.0 referans sonuçlarıyla %100 uyumlu olması zorunludur.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
-from turkmen_fst.phonology import PhonologyRules, VowelSystem, YUVARLAKLASMA_LISTESI, SOFTENING_TABLE
+from turkmen_fst.phonology import (
+    PhonologyRules, VowelSystem, StemProfile, stem_profile,
+    YUVARLAKLASMA_LISTESI, VOWEL_DROP_CANDIDATES, SOFTENING_TABLE
+)
 from turkmen_fst.morphotactics import (
     NounMorphotactics, VerbMorphotactics, MorphCategory
 )
@@ -66,15 +70,143 @@ class NounResult(GenerationResult):
 #  İSİM ÇEKİM MOTORU
 # ==============================================================================
 
+# Derlenmiş ek tabloları. Anahtar, ek yuvası ve gövde sonunun ses sınıfıdır
+# (nitelik, ünlüyle bitiş, yuvarlaklık); seçim tek sözlük erişimidir.
+
+_YUVARLAK_UNLU = {"yogyn": "u", "ince": "ü"}          # y→u / i→ü
+_PLURAL_SUFFIXES = {"yogyn": "lar", "ince": "ler"}
+
+
+def _compile_possessive_suffixes() -> dict:
+    """(iyelik, tekil_mi, nitelik, ünlüyle_biter, yuvarlak) → ek (A1, A2)."""
+    table = {}
+    for nit in ("yogyn", "ince"):
+        for is_unlu in (False, True):
+            for kok_yuvarlak in (False, True):
+                for tek in (True, False):
+                    # A1: -m / -ym, -im, -um, -üm (+ -yz/-iz çoğul)
+                    if is_unlu:
+                        ek = "m" if tek else ("myz" if nit == "yogyn" else "miz")
+                    else:
+                        taban = ("um" if nit == "yogyn" else "üm") if kok_yuvarlak else ("ym" if nit == "yogyn" else "im")
+                        ek = taban if tek else (taban + ("yz" if nit == "yogyn" else "iz"))
+                    table[("A1", tek, nit, is_unlu, kok_yuvarlak)] = ek
+
+                    # A2: -ň / -yň, -iň, -uň, -üň (+ -yz/-iz çoğul)
+                    if is_unlu:
+                        ek = "ň" if tek else ("ňyz" if nit == "yogyn" else "ňiz")
+                    else:
+                        taban = ("uň" if nit == "yogyn" else "üň") if kok_yuvarlak else ("yň" if nit == "yogyn" else "iň")
+                        ek = taban if tek else (taban + ("yz" if nit == "yogyn" else "iz"))
+                    table[("A2", tek, nit, is_unlu, kok_yuvarlak)] = ek
+    return table
+
+
+def _compile_a3_suffixes() -> dict:
+    """(nitelik, ünlüyle_biter, yuvarlak_ek) → 3. tekil iyelik eki."""
+    table = {}
+    for nit in ("yogyn", "ince"):
+        for yuvarlak in (False, True):
+            if yuvarlak:
+                table[(nit, True, yuvarlak)] = "su" if nit == "yogyn" else "sü"
+                table[(nit, False, yuvarlak)] = "u" if nit == "yogyn" else "ü"
+            else:
+                table[(nit, True, yuvarlak)] = "sy" if nit == "yogyn" else "si"
+                table[(nit, False, yuvarlak)] = "y" if nit == "yogyn" else "i"
+    return table
+
+
+# Hal eki öncesi gövde işlemi
+_CASE_PLAIN = 0     # Ek doğrudan eklenir
+_CASE_DROP = 1      # Ünlü düşmesi + ünsüz yumuşaması
+_CASE_E_TO_A = 2    # Ünlüyle biten gövdede e → ä (hepde → hepdäniň)
+_CASE_DATIVE = 3    # Son ünlü a/ä'ya dönüşür, ek yüzeyde yok (alma → alma)
+
+
+def _compile_case_suffixes() -> dict:
+    """
+    (hal, nitelik, gövde sınıfı) → (ek, işlem).
+
+    Gövde sınıfı: "n" (3. iyelikten sonra n-kaynaştırma), "v" (ünlüyle
+    biter), "c" (ünsüzle biter), "cr" (ünsüzle biter, kısa ve yuvarlak kök).
+    """
+    table = {}
+    for nit in ("yogyn", "ince"):
+        y = nit == "yogyn"
+        rows = {
+            # İlgi hali
+            "A2": {"n": ("nyň" if y else "niň", _CASE_PLAIN),
+                   "v": ("nyň" if y else "niň", _CASE_E_TO_A),
+                   "c": ("yň" if y else "iň", _CASE_DROP),
+                   "cr": ("uň" if y else "üň", _CASE_DROP)},
+            # Yönelme hali
+            "A3": {"n": ("na" if y else "ne", _CASE_PLAIN),
+                   "v": ("", _CASE_DATIVE),
+                   "c": ("a" if y else "e", _CASE_DROP)},
+            # Belirtme hali
+            "A4": {"n": ("ny" if y else "ni", _CASE_PLAIN),
+                   "v": ("ny" if y else "ni", _CASE_E_TO_A),
+                   "c": ("y" if y else "i", _CASE_DROP)},
+            # Bulunma hali
+            "A5": {"n": ("nda" if y else "nde", _CASE_PLAIN),
+                   "v": ("da" if y else "de", _CASE_PLAIN)},
+            # Çıkma hali
+            "A6": {"n": ("ndan" if y else "nden", _CASE_PLAIN),
+                   "v": ("dan" if y else "den", _CASE_PLAIN)},
+        }
+        for case, row in rows.items():
+            row.setdefault("c", row["v"])
+            row.setdefault("cr", row["c"])
+            for sinif, value in row.items():
+                table[(case, nit, sinif)] = value
+    return table
+
+
+_POSSESSIVE_SUFFIXES = _compile_possessive_suffixes()
+_A3_SUFFIXES = _compile_a3_suffixes()
+
+# İyelik eki → (ekin niteliği ya da None, ünlüyle biter, yuvarlak ünlü içerir).
+# Ek sonrası gövde özellikleri bundan türetilir; gövde yeniden taranmaz.
+_POSSESSIVE_FEATURES = {
+    ek: (stem_profile(ek).quality if stem_profile(ek).vowel_count else None,
+         stem_profile(ek).ends_vowel, stem_profile(ek).rounded)
+    for ek in (*_POSSESSIVE_SUFFIXES.values(), *_A3_SUFFIXES.values())
+}
+_CASE_SUFFIXES = _compile_case_suffixes()
+_DAKY_SUFFIXES = {
+    (False, "yogyn"): "daky", (False, "ince"): "däki",
+    (True, "yogyn"): "ndaky", (True, "ince"): "ndäki",
+}
+
+# Paradigma iyelik kodu → (iyelik, iyelik tipi)
+_PARADIGM_POSSESSIVES = {"B1": ("A1", "cog"), "B2": ("A2", "cog")}
+
+
+@lru_cache(maxsize=32)
+def _paradigm_rows(possessives: tuple, cases: tuple) -> tuple:
+    """Paradigma satırları: (çoğul, iyelik, geçerli haller) — geçiş matrisinden."""
+    return tuple(
+        (plural, poss, frozenset(case for case in cases
+                                 if NounMorphotactics.validate_noun_params(plural, poss, case)[0]))
+        for plural in (False, True)
+        for poss in possessives
+    )
+
+
 class NounGenerator:
     """
     Türkmen Türkçesi isim çekim motoru.
     
     State machine (NounMorphotactics) üzerinden çalışır.
-    Her adımda fonoloji kurallarını (PhonologyRules) uygular.
+    Her adımda fonoloji kurallarını (PhonologyRules) uygular; ek
+    allomorfları derlenmiş tablolardan seçilir.
     
     Ek sırası: KÖK + [çokluk] + [iyelik] + [hal]
     """
+
+    # generate_paradigm() varsayılan eksenleri
+    PARADIGM_POSSESSIVES = (None, "A1", "A2", "A3", "B1", "B2")
+    PARADIGM_CASES = (None, "A2", "A3", "A4", "A5", "A6")
     
     def __init__(self, lexicon: Optional[Lexicon] = None):
         self.lexicon = lexicon
@@ -83,7 +215,8 @@ class NounGenerator:
                  possessive: Optional[str] = None, poss_type: str = "tek",
                  case: Optional[str] = None,
                  yumusama_izni: bool = True,
-                 daky: bool = False) -> GenerationResult:
+                 daky: bool = False,
+                 profile: Optional[StemProfile] = None) -> GenerationResult:
         """
         İsim çekimi yapar.
         
@@ -95,6 +228,7 @@ class NounGenerator:
             case: Hal kodu: "A2"-"A6" veya None
             yumusama_izni: Ünsüz yumuşaması uygulanacak mı (eş sesliler için)
             daky: Aitlik eki -daky/-däki eklensin mi (lokatif+kI → göreceli sıfat)
+            profile: Kökün StemProfile'ı (None → stem_profile(stem) önbelleğinden)
             
         Returns:
             GenerationResult
@@ -109,6 +243,12 @@ class NounGenerator:
         # --- Çekim mantığı (v26 uyumlu) ---
         govde = stem.lower()
         yol = [stem]
+        morphemes = []
+        if profile is None:
+            profile = stem_profile(govde)
+
+        # Orta hece yuvarlaklaşma adayı (3. iyelikten sonraki hal/aitlik ekleri)
+        yuv_adayi = govde in VOWEL_DROP_CANDIDATES or govde in YUVARLAKLASMA_LISTESI
 
         # Berdi Hoca kuralı: Guzy/Süri/Guýy yuvarlaklaşması
         # Sadece Çokluk ve A3 kategorilerinde kök değişir.
@@ -116,183 +256,39 @@ class NounGenerator:
         if govde in YUVARLAKLASMA_LISTESI and (plural or possessive == "A3"):
             govde = YUVARLAKLASMA_LISTESI[govde]
             yuvarlaklasma_yapildi = True
+            profile = stem_profile(govde)
 
-        nit_ilk = PhonologyRules.get_vowel_quality(govde)
-        kok_yuvarlak = PhonologyRules.has_rounded_vowel(govde)
-        morphemes = []
+        # Gövdenin güncel ses özellikleri; her ekten sonra güncellenir
+        nit = profile.quality
+        kok_yuvarlak = profile.rounded
+        is_unlu = profile.ends_vowel
 
-        # ================================================================
         # 1) ÇOKLUK EKİ (-lar / -ler)
-        # ================================================================
         if plural:
-            # Yuvarlaklaşma: son harf y/i ve kök yuvarlak ise u/ü'ye
-            if not yuvarlaklasma_yapildi and kok_yuvarlak and govde[-1] in "yi":
-                govde = govde[:-1] + ("u" if nit_ilk == "yogyn" else "ü")
-
-            ek = "lar" if PhonologyRules.get_vowel_quality(govde) == "yogyn" else "ler"
-            govde += ek
+            govde, ek = self._add_plural(govde, nit, kok_yuvarlak, yuvarlaklasma_yapildi)
+            is_unlu = False
             yol.append(ek)
             morphemes.append(("PLURAL", ek))
 
-        # ================================================================
         # 2) İYELİK EKLERİ
-        # ================================================================
         if possessive:
-            nit = PhonologyRules.get_vowel_quality(govde)
-            is_unlu = PhonologyRules.ends_with_vowel(govde)
-            kok_yuvarlak = PhonologyRules.has_rounded_vowel(govde)
-
-            if possessive == "A1":
-                if is_unlu:
-                    ek = "m" if poss_type == "tek" else ("myz" if nit == "yogyn" else "miz")
-                else:
-                    taban = ("um" if nit == "yogyn" else "üm") if kok_yuvarlak else ("ym" if nit == "yogyn" else "im")
-                    ek = taban if poss_type == "tek" else (taban + ("yz" if nit == "yogyn" else "iz"))
-
-            elif possessive == "A2":
-                if is_unlu:
-                    ek = "ň" if poss_type == "tek" else ("ňyz" if nit == "yogyn" else "ňiz")
-                else:
-                    taban = ("uň" if nit == "yogyn" else "üň") if kok_yuvarlak else ("yň" if nit == "yogyn" else "iň")
-                    ek = taban if poss_type == "tek" else (taban + ("yz" if nit == "yogyn" else "iz"))
-
-            elif possessive == "A3":
-                # 3. tekil iyelik — yuvarlaklaşma + su/sü veya sy/si
-                yuvarlaklasti = False
-                if not yuvarlaklasma_yapildi and kok_yuvarlak and govde[-1] in "yi":
-                    govde = govde[:-1] + ("u" if nit == "yogyn" else "ü")
-                    yuvarlaklasti = True
-                if is_unlu:
-                    if yuvarlaklasti or yuvarlaklasma_yapildi:
-                        ek = "su" if nit == "yogyn" else "sü"
-                    else:
-                        ek = "sy" if nit == "yogyn" else "si"
-                else:
-                    if yuvarlaklasma_yapildi and kok_yuvarlak:
-                        ek = "u" if nit == "yogyn" else "ü"
-                    else:
-                        ek = "y" if nit == "yogyn" else "i"
-
-            # Düşme ve yumuşama
-            govde = PhonologyRules.apply_vowel_drop(govde, ek)
-            if yumusama_izni:
-                govde = PhonologyRules.apply_consonant_softening(govde)
-            govde += ek
+            govde, ek, nit, is_unlu, kok_yuvarlak = self._add_possessive(
+                govde, nit, is_unlu, kok_yuvarlak, possessive, poss_type,
+                yuvarlaklasma_yapildi, yumusama_izni)
             yol.append(ek)
             morphemes.append(("POSSESSIVE", ek))
 
-        # ================================================================
         # 3) HAL EKLERİ
-        # ================================================================
         if case and not daky:
-            nit = PhonologyRules.get_vowel_quality(govde)
-            is_unlu = PhonologyRules.ends_with_vowel(govde)
-            kok_yuvarlak = PhonologyRules.has_rounded_vowel(govde)
-            yol_eki = None
-
-            # 3. iyelikten sonra n-kaynaştırma
-            n_kay = possessive == "A3"
-
-            # Orta Hece Yuvarlaklaşma — sadece ünlü düşme/yuvarlaklaşma adayları
-            from turkmen_fst.phonology import VOWEL_DROP_CANDIDATES, YUVARLAKLASMA_LISTESI as _YL
-            _yuv_adayi = (stem.lower() in VOWEL_DROP_CANDIDATES or stem.lower() in _YL)
-            if n_kay and kok_yuvarlak and govde[-1] in "yi" and _yuv_adayi:
-                govde = govde[:-1] + ("u" if nit == "yogyn" else "ü")
-
-            # Yuvarlaklaşma sonrası niteligi güncelle
-            nit = PhonologyRules.get_vowel_quality(govde)
-
-            if case == "A2":  # İlgi hali
-                if n_kay:
-                    ek = "nyň" if nit == "yogyn" else "niň"
-                elif is_unlu:
-                    # Ünlüyle biten köklerde son ünlü değişimi:
-                    # e → ä  (hepde → hepdäniň, çäre → çäräniň)
-                    # a, y, i vb. değişmez
-                    son = govde[-1]
-                    if son == "e":
-                        govde = govde[:-1] + "ä"
-                    ek = "nyň" if nit == "yogyn" else "niň"
-                else:
-                    if len(stem) <= 4 and kok_yuvarlak:
-                        ek = "uň" if nit == "yogyn" else "üň"
-                    else:
-                        ek = "yň" if nit == "yogyn" else "iň"
-                    govde = PhonologyRules.apply_vowel_drop(govde, ek)
-                    if yumusama_izni:
-                        govde = PhonologyRules.apply_consonant_softening(govde)
-
-            elif case == "A3":  # Yönelme hali
-                if n_kay:
-                    ek = "na" if nit == "yogyn" else "ne"
-                elif is_unlu:
-                    son = govde[-1]
-                    govde = govde[:-1]
-                    degisen = "a" if son in "ay" else "ä"
-                    govde += degisen
-                    ek = ""
-                    yol_eki = degisen
-                else:
-                    ek = "a" if nit == "yogyn" else "e"
-                    govde = PhonologyRules.apply_vowel_drop(govde, ek)
-                    if yumusama_izni:
-                        govde = PhonologyRules.apply_consonant_softening(govde)
-
-            elif case == "A4":  # Belirtme hali
-                if n_kay:
-                    ek = "ny" if nit == "yogyn" else "ni"
-                elif is_unlu:
-                    # Ünlüyle biten köklerde son ünlü değişimi:
-                    # e → ä  (wezipe → wezipäni, tejribe → tejribäni)
-                    son = govde[-1]
-                    if son == "e":
-                        govde = govde[:-1] + "ä"
-                    ek = "ny" if nit == "yogyn" else "ni"
-                else:
-                    ek = "y" if nit == "yogyn" else "i"
-                    govde = PhonologyRules.apply_vowel_drop(govde, ek)
-                    if yumusama_izni:
-                        govde = PhonologyRules.apply_consonant_softening(govde)
-
-            elif case == "A5":  # Bulunma hali
-                if n_kay:
-                    ek = "nda" if nit == "yogyn" else "nde"
-                else:
-                    ek = "da" if nit == "yogyn" else "de"
-
-            elif case == "A6":  # Çıkma hali
-                if n_kay:
-                    ek = "ndan" if nit == "yogyn" else "nden"
-                else:
-                    ek = "dan" if nit == "yogyn" else "den"
-
-            govde += ek
-            yol.append(yol_eki if yol_eki is not None else ek)
-            morphemes.append(("CASE", yol_eki if yol_eki is not None else ek))
+            govde, ek = self._add_case(stem, govde, nit, is_unlu, kok_yuvarlak, case,
+                                       possessive == "A3", yuv_adayi, yumusama_izni)
+            yol.append(ek)
+            morphemes.append(("CASE", ek))
 
-        # ================================================================
         # 4) AİTLİK EKİ  -daky / -däki  (Lokatif + kI → göreceli sıfat)
         #    Tabaklar §2121: öýdäki, adyndaky, arasyndaky ...
-        # ================================================================
         if daky:
-            nit = PhonologyRules.get_vowel_quality(govde)
-            kok_yuvarlak = PhonologyRules.has_rounded_vowel(govde)
-            n_kay = possessive == "A3"
-
-            # Orta Hece Yuvarlaklaşma (ogly→ogluny dizisiyle tutarlı)
-            from turkmen_fst.phonology import VOWEL_DROP_CANDIDATES, YUVARLAKLASMA_LISTESI as _YL
-            _yuv_adayi = (stem.lower() in VOWEL_DROP_CANDIDATES or stem.lower() in _YL)
-            if n_kay and kok_yuvarlak and govde[-1] in "yi" and _yuv_adayi:
-                govde = govde[:-1] + ("u" if nit == "yogyn" else "ü")
-                nit = PhonologyRules.get_vowel_quality(govde)
-
-            # Aitlik eki: kalın→daky, ince→däki; A3 sonrası n-kaynaştırma
-            if n_kay:
-                ek = "ndaky" if nit == "yogyn" else "ndäki"
-            else:
-                ek = "daky" if nit == "yogyn" else "däki"
-
-            govde += ek
+            govde, ek = self._add_daky(govde, nit, kok_yuvarlak, possessive == "A3", yuv_adayi)
             yol.append(ek)
             morphemes.append(("DAKY", ek))
 
@@ -304,47 +300,241 @@ class NounGenerator:
             is_valid=True
         )
 
+    def generate_paradigm(self, stem: str, yumusama_izni: bool = True,
+                          possessives: tuple = PARADIGM_POSSESSIVES,
+                          cases: tuple = PARADIGM_CASES,
+                          profile: Optional[StemProfile] = None) -> dict:
+        """
+        Kökün paradigma tablosu: (çoğul, iyelik, hal) → kelime.
+
+        generate() ile aynı adımları kullanır, ancak çoğul ve iyelik
+        gövdeleri her hal için yeniden üretilmez. İyelik kodları "B1"/"B2"
+        çoğul iyeliktir; geçersiz hücrelerin değeri None'dır.
+
+        Args:
+            stem: Kök kelime
+            yumusama_izni: Ünsüz yumuşaması uygulanacak mı
+            possessives: İyelik ekseni (None = iyeliksiz)
+            cases: Hal ekseni (None = yalın)
+            profile: Kökün StemProfile'ı
+        """
+        kok = stem.lower()
+        if profile is None:
+            profile = stem_profile(kok)
+        yuv_adayi = kok in VOWEL_DROP_CANDIDATES or kok in YUVARLAKLASMA_LISTESI
+        if kok in YUVARLAKLASMA_LISTESI:
+            yuvarlak_kok = YUVARLAKLASMA_LISTESI[kok]
+            yuvarlak_profil = stem_profile(yuvarlak_kok)
+        else:
+            yuvarlak_kok, yuvarlak_profil = kok, profile
+
+        table = {}
+        for plural, poss_code, valid in _paradigm_rows(tuple(possessives), tuple(cases)):
+            possessive, poss_type = _PARADIGM_POSSESSIVES.get(poss_code, (poss_code, "tek"))
+            if not valid:
+                for case in cases:
+                    table[(plural, poss_code, case)] = None
+                continue
+
+            # Ortak önek: kök + [çokluk] + [iyelik]
+            yuvarlaklasma_yapildi = kok != yuvarlak_kok and (plural or possessive == "A3")
+            if yuvarlaklasma_yapildi:
+                govde, p = yuvarlak_kok, yuvarlak_profil
+            else:
+                govde, p = kok, profile
+            nit, is_unlu, kok_yuvarlak = p.quality, p.ends_vowel, p.rounded
+            if plural:
+                govde, _ = self._add_plural(govde, nit, kok_yuvarlak, yuvarlaklasma_yapildi)
+                is_unlu = False
+            if possessive:
+                govde, _, nit, is_unlu, kok_yuvarlak = self._add_possessive(
+                    govde, nit, is_unlu, kok_yuvarlak, possessive, poss_type,
+                    yuvarlaklasma_yapildi, yumusama_izni)
+
+            for case in cases:
+                if case not in valid:
+                    table[(plural, poss_code, case)] = None
+                elif case:
+                    table[(plural, poss_code, case)] = self._add_case(
+                        stem, govde, nit, is_unlu, kok_yuvarlak, case,
+                        possessive == "A3", yuv_adayi, yumusama_izni)[0]
+                else:
+                    table[(plural, poss_code, case)] = govde
+        return table
+
+    # -- Ek adımları (generate ve generate_paradigm ortak) -----------------
+
+    @staticmethod
+    def _add_plural(govde: str, nit: str, kok_yuvarlak: bool,
+                    yuvarlaklasma_yapildi: bool) -> tuple[str, str]:
+        """Çokluk eki; (yeni gövde, ek). y→u / i→ü kalınlığı korur."""
+        # Yuvarlaklaşma: son harf y/i ve kök yuvarlak ise u/ü'ye
+        if not yuvarlaklasma_yapildi and kok_yuvarlak and govde[-1] in "yi":
+            govde = govde[:-1] + _YUVARLAK_UNLU[nit]
+        ek = _PLURAL_SUFFIXES[nit]
+        return govde + ek, ek
+
+    @staticmethod
+    def _add_possessive(govde: str, nit: str, is_unlu: bool, kok_yuvarlak: bool,
+                        possessive: str, poss_type: str,
+                        yuvarlaklasma_yapildi: bool,
+                        yumusama_izni: bool) -> tuple:
+        """
+        İyelik eki; (yeni gövde, ek, nitelik, ünlüyle biter, yuvarlak).
+
+        Ses özellikleri ekten türetilir; yalnızca ünlü düşmesi gövdeyi
+        kısalttığında yeni gövdenin profili okunur.
+        """
+        if possessive == "A3":
+            # 3. tekil iyelik — yuvarlaklaşma + su/sü veya sy/si
+            yuvarlaklasti = False
+            if not yuvarlaklasma_yapildi and kok_yuvarlak and govde[-1] in "yi":
+                govde = govde[:-1] + _YUVARLAK_UNLU[nit]
+                yuvarlaklasti = True
+            if is_unlu:
+                yuvarlak_ek = yuvarlaklasti or yuvarlaklasma_yapildi
+            else:
+                yuvarlak_ek = yuvarlaklasma_yapildi and kok_yuvarlak
+            ek = _A3_SUFFIXES[(nit, is_unlu, yuvarlak_ek)]
+        else:
+            ek = _POSSESSIVE_SUFFIXES[(possessive, poss_type == "tek", nit, is_unlu, kok_yuvarlak)]
+
+        # Düşme ve yumuşama
+        dusmus = PhonologyRules.apply_vowel_drop(govde, ek)
+        if yumusama_izni:
+            dusmus = PhonologyRules.apply_consonant_softening(dusmus)
+        govde_son = dusmus + ek
+        if len(dusmus) != len(govde):
+            p = stem_profile(govde_son)
+            return govde_son, ek, p.quality, p.ends_vowel, p.rounded
+        ek_nit, ek_unlu, ek_yuvarlak = _POSSESSIVE_FEATURES[ek]
+        return govde_son, ek, ek_nit or nit, ek_unlu, kok_yuvarlak or ek_yuvarlak
+
+    @staticmethod
+    def _add_case(stem: str, govde: str, nit: str, is_unlu: bool, kok_yuvarlak: bool,
+                  case: str, n_kay: bool, yuv_adayi: bool,
+                  yumusama_izni: bool) -> tuple[str, str]:
+        """Hal eki; (yeni gövde, şecerede görünen ek)."""
+        # Orta Hece Yuvarlaklaşma — sadece ünlü düşme/yuvarlaklaşma adayları
+        # (y→u / i→ü kalınlığı korur, nitelik değişmez)
+        if n_kay and kok_yuvarlak and govde[-1] in "yi" and yuv_adayi:
+            govde = govde[:-1] + _YUVARLAK_UNLU[nit]
+
+        # 3. iyelikten sonra n-kaynaştırma
+        if n_kay:
+            sinif = "n"
+        elif is_unlu:
+            sinif = "v"
+        elif len(stem) <= 4 and kok_yuvarlak:
+            sinif = "cr"
+        else:
+            sinif = "c"
+        ek, islem = _CASE_SUFFIXES[(case, nit, sinif)]
+
+        if islem == _CASE_DROP:
+            govde = PhonologyRules.apply_vowel_drop(govde, ek)
+            if yumusama_izni:
+                govde = PhonologyRules.apply_consonant_softening(govde)
+        elif islem == _CASE_E_TO_A:
+            # Ünlüyle biten köklerde son ünlü değişimi:
+            # e → ä  (hepde → hepdäniň, wezipe → wezipäni); a, y, i vb. değişmez
+            if govde[-1] == "e":
+                govde = govde[:-1] + "ä"
+        elif islem == _CASE_DATIVE:
+            degisen = "a" if govde[-1] in "ay" else "ä"
+            return govde[:-1] + degisen, degisen
+        return govde + ek, ek
+
+    @staticmethod
+    def _add_daky(govde: str, nit: str, kok_yuvarlak: bool, n_kay: bool,
+                  yuv_adayi: bool) -> tuple[str, str]:
+        """Aitlik eki -daky/-däki; (yeni gövde, ek)."""
+        # Orta Hece Yuvarlaklaşma (ogly→ogluny dizisiyle tutarlı)
+        if n_kay and kok_yuvarlak and govde[-1] in "yi" and yuv_adayi:
+            govde = govde[:-1] + _YUVARLAK_UNLU[nit]
+        # Aitlik eki: kalın→daky, ince→däki; A3 sonrası n-kaynaştırma
+        ek = _DAKY_SUFFIXES[(n_kay, nit)]
+        return govde + ek, ek
+
 
 # ==============================================================================
 #  FİİL ÇEKİM MOTORU
 # ==============================================================================
 
+# Şahıs ekleri — standart tablo (Ö1, Ö2, Ö3 zamanları) ve genişletilmiş
+# tablo (H1, G2 zamanları), niteliğe göre
+_PERSON_STANDARD = {
+    "yogyn": {"A1": "m", "A2": "ň", "A3": "", "B1": "k", "B2": "ňyz", "B3": "lar"},
+    "ince":  {"A1": "m", "A2": "ň", "A3": "", "B1": "k", "B2": "ňiz", "B3": "ler"},
+}
+_PERSON_EXTENDED = {
+    "yogyn": {"A1": "yn", "A2": "syň", "A3": "", "B1": "ys", "B2": "syňyz", "B3": "lar"},
+    "ince":  {"A1": "in", "A2": "siň", "A3": "", "B1": "is", "B2": "siňiz", "B3": "ler"},
+}
+
+# Anyk Häzirki (5) — yalnızca bu yardımcı fiiller çekimlenir
+_ANYK_HAZIRKI = {
+    "otyr":  {"A1": "yn",  "A2": "syň",  "A3": "", "B1": "ys",  "B2": "syňyz",  "B3": "lar"},
+    "dur":   {"A1": "un",  "A2": "suň",  "A3": "", "B1": "us",  "B2": "suňyz",  "B3": "lar"},
+    "ýatyr": {"A1": "yn",  "A2": "syň",  "A3": "", "B1": "ys",  "B2": "syňyz",  "B3": "lar"},
+    "ýör":   {"A1": "ün",  "A2": "siň",  "A3": "", "B1": "üs",  "B2": "siňiz",  "B3": "ler"}
+}
+
+
+class _VerbStem:
+    """
+    Köke bağlı, tüm zaman × şahıs × olumsuzluk hücrelerinde ortak veriler.
+
+    generate() her çağrıda bir kez, generate_all() kök başına bir kez kurar.
+    """
+
+    __slots__ = ("stem", "govde", "profile", "quality", "yogyn", "ends_vowel",
+                 "single_rounded", "softened", "neg")
+
+    def __init__(self, stem: str, profile: Optional[StemProfile] = None):
+        govde = stem.lower()
+        if profile is None:
+            profile = stem_profile(govde)
+        self.stem = stem
+        self.govde = govde
+        self.profile = profile
+        self.quality = profile.quality
+        self.yogyn = profile.quality == "yogyn"
+        self.ends_vowel = profile.ends_vowel
+        # k/t yumuşaması ve e→ä ünlü sayısını/yuvarlaklığı değiştirmez
+        self.single_rounded = profile.single_rounded
+        self.softened = VerbGenerator._fiil_yumusama(govde, profile)
+        self.neg = "ma" if self.yogyn else "me"
+
+
 class VerbGenerator:
     """
     Türkmen Türkçesi fiil çekim motoru.
     
     7 zaman × 6 şahıs × 2 (olumlu/olumsuz) çekim.
     State machine (VerbMorphotactics) üzerinden çalışır.
+
+    Her zaman kodunun kendi çekim fonksiyonu vardır; generate() bunları
+    _TENSE_HANDLERS tablosundan seçer.
     """
 
+    PERSONS = ("A1", "A2", "A3", "B1", "B2", "B3")
+
+    # Anyk Häzirki zamanda çekimlenen yardımcı fiiller
+    AUXILIARY_STEMS = frozenset(_ANYK_HAZIRKI)
+
     def __init__(self, lexicon: Optional[Lexicon] = None):
         self.lexicon = lexicon
 
     @staticmethod
     def _person_suffix_standard(quality: str, person: str) -> str:
         """Standart şahıs eki tablosu (Ö1, Ö2, Ö3 zamanları)."""
-        table = {
-            "A1": "m",
-            "A2": "ň",
-            "A3": "",
-            "B1": "k",
-            "B2": "ňyz" if quality == "yogyn" else "ňiz",
-            "B3": "lar" if quality == "yogyn" else "ler"
-        }
-        return table[person]
+        return _PERSON_STANDARD["yogyn" if quality == "yogyn" else "ince"][person]
 
     @staticmethod
     def _person_suffix_extended(quality: str, person: str) -> str:
         """Genişletilmiş şahıs eki tablosu (H1, G2 zamanları)."""
-        table = {
-            "A1": "yn" if quality == "yogyn" else "in",
-            "A2": "syň" if quality == "yogyn" else "siň",
-            "A3": "",
-            "B1": "ys" if quality == "yogyn" else "is",
-            "B2": "syňyz" if quality == "yogyn" else "siňiz",
-            "B3": "lar" if quality == "yogyn" else "ler"
-        }
-        return table[person]
+        return _PERSON_EXTENDED["yogyn" if quality == "yogyn" else "ince"][person]
 
     @staticmethod
     def _tek_heceli_dodak(govde: str) -> bool:
@@ -353,11 +543,14 @@ class VerbGenerator:
         return len(unluler) == 1 and unluler[0] in VowelSystem.DODAK
 
     @staticmethod
-    def _fiil_yumusama(govde: str) -> str:
+    def _fiil_yumusama(govde: str, profile: Optional[StemProfile] = None) -> str:
         """Çok heceli veya özel tek heceli fiillerde k/t→g/d yumuşaması uygular."""
         if not govde or govde[-1] not in ('k', 't'):
             return govde
-        unlu_sayisi = sum(1 for c in govde if c in VowelSystem.ALL)
+        if profile is not None:
+            unlu_sayisi = profile.vowel_count
+        else:
+            unlu_sayisi = sum(1 for c in govde if c in VowelSystem.ALL)
         if unlu_sayisi > 1 or govde in TEK_HECELI_YUMUSAMA_FIIL:
             return govde[:-1] + SOFTENING_TABLE[govde[-1]]
         return govde
@@ -376,7 +569,7 @@ class VerbGenerator:
         "33": "sert", "34": "sert", "35": "sert",
     }
 
-    def _compound_base(self, govde, quality, ends_vowel, sub, negative):
+    def _compound_base(self, govde, quality, ends_vowel, sub, negative, profile=None):
         """Birleşik zamanın temel gövdesini üretir (şahıssız)."""
         dal_sonra = False
 
@@ -385,7 +578,7 @@ class VerbGenerator:
                 ek = "maz" if quality == "yogyn" else "mez"
                 return govde + ek, [("NEGATION+TENSE", ek)], False
             else:
-                g = self._fiil_yumusama(govde)
+                g = self._fiil_yumusama(govde, profile)
                 # NOT: e→ä dönüşümü geniş zaman gövdesinde uygulanmaz
                 ev = g[-1] in VowelSystem.ALL if g else False
                 ek = "r" if ev else ("ar" if quality == "yogyn" else "er")
@@ -396,7 +589,7 @@ class VerbGenerator:
                 ek = "maýar" if quality == "yogyn" else "meýär"
                 return govde + ek, [("NEGATION+TENSE", ek)], False
             else:
-                g = self._fiil_yumusama(govde)
+                g = self._fiil_yumusama(govde, profile)
                 ek = "ýar" if quality == "yogyn" else "ýär"
                 return g + ek, [("TENSE", ek)], False
 
@@ -405,10 +598,11 @@ class VerbGenerator:
                 ek = "man" if quality == "yogyn" else "män"
                 return govde + ek, [("NEGATION+TENSE", ek)], False
             else:
-                g = self._fiil_yumusama(govde)
+                g = self._fiil_yumusama(govde, profile)
                 if ends_vowel:
                     ek = "p"
-                elif self._tek_heceli_dodak(g):
+                elif (profile.single_rounded if profile is not None
+                      else self._tek_heceli_dodak(g)):
                     ek = "up" if quality == "yogyn" else "üp"
                 else:
                     ek = "yp" if quality == "yogyn" else "ip"
@@ -437,13 +631,13 @@ class VerbGenerator:
         return govde, [], False
 
     def _generate_compound(self, stem, govde, quality, ends_vowel, tense, person,
-                           negative, pronoun, morphemes):
+                           negative, pronoun, morphemes, profile=None):
         """Goşma zaman çekimi."""
         sub = self._COMPOUND_SUB[tense]
         ctype = self._COMPOUND_TYPE[tense]
 
         base_form, ek_list, dal_sonra = self._compound_base(
-            govde, quality, ends_vowel, sub, negative)
+            govde, quality, ends_vowel, sub, negative, profile)
 
         for morph_type, morph_val in ek_list:
             morphemes.append((morph_type, morph_val))
@@ -533,550 +727,488 @@ class VerbGenerator:
         )
 
     def generate(self, stem: str, tense: str, person: str,
-                 negative: bool = False) -> GenerationResult:
+                 negative: bool = False,
+                 profile: Optional[StemProfile] = None) -> GenerationResult:
         """
         Fiil çekimi yapar.
         
         Args:
             stem: Fiil kökü (ör. "gel", "oka")
-            tense: Zaman kodu ("1"-"7")
+            tense: Zaman kodu ("1"-"35")
             person: Şahıs kodu ("A1"-"B3")
             negative: Olumsuz mu
+            profile: Kökün StemProfile'ı (None → stem_profile(stem) önbelleğinden)
             
         Returns:
             GenerationResult
         """
-        govde = stem.lower()
-        quality = PhonologyRules.get_vowel_quality(govde)
-        ends_vowel = PhonologyRules.ends_with_vowel(govde)
-        pronoun = VerbMorphotactics.PRONOUNS.get(person, "")
-        morphemes = []
-
-        # ================================================================
-        # Mälim Geljek (6) — özel format
-        # ================================================================
-        if tense == "6":
-            tense_suffix = "jak" if quality == "yogyn" else "jek"
-            if negative:
-                # Olumsuz: kök + jak/jek + däl
-                result = govde + tense_suffix + " däl"
-                breakdown = f"{pronoun} + {stem} + {tense_suffix} + däl"
-                morphemes.append(("TENSE", tense_suffix))
-                morphemes.append(("NEGATION", "däl"))
-            else:
-                # Olumlu: kök + jak/jek (kopulasız)
-                result = govde + tense_suffix
-                breakdown = f"{pronoun} + {stem} + {tense_suffix}"
-                morphemes.append(("TENSE", tense_suffix))
+        handler = self._TENSE_HANDLERS.get(tense)
+        if handler is None:
             return GenerationResult(
-                word=f"{pronoun} {result}",
-                breakdown=breakdown,
+                word=f"HATA: Geçersiz zaman kodu '{tense}'",
+                breakdown="",
                 stem=stem,
-                morphemes=morphemes,
-                is_valid=True
+                is_valid=False,
+                error=f"Geçersiz zaman kodu: {tense}"
             )
+        return handler(self, _VerbStem(stem, profile), tense, person, negative)
 
-        # ================================================================
-        # Anyk Häzirki (5) — özel yardımcı fiiller
-        # ================================================================
-        if tense == "5":
-            table = {
-                "otyr":  {"A1": "yn",  "A2": "syň",  "A3": "", "B1": "ys",  "B2": "syňyz",  "B3": "lar"},
-                "dur":   {"A1": "un",  "A2": "suň",  "A3": "", "B1": "us",  "B2": "suňyz",  "B3": "lar"},
-                "ýatyr": {"A1": "yn",  "A2": "syň",  "A3": "", "B1": "ys",  "B2": "syňyz",  "B3": "lar"},
-                "ýör":   {"A1": "ün",  "A2": "siň",  "A3": "", "B1": "üs",  "B2": "siňiz",  "B3": "ler"}
-            }
-            if govde not in table:
-                return GenerationResult(
-                    word=f"HATA: '{stem}' fiili Anyk Häzirki zamanda çekimlenemez",
-                    breakdown="",
-                    stem=stem,
-                    is_valid=False,
-                    error=f"'{stem}' fiili Anyk Häzirki zamanda çekimlenemez"
-                )
-            person_suffix = table[govde][person]
-            morphemes.append(("PERSON", person_suffix))
-            base_form = govde + person_suffix
-            if negative:
-                # H2 olumsuzluk: analitik yapı — fiil + "yok"
-                # otyrynym yok, durunym yok
-                morphemes.append(("NEGATION", "yok"))
-                return GenerationResult(
-                    word=base_form + " yok",
-                    breakdown=f"{stem} + {person_suffix if person_suffix else '(0)'} + yok",
-                    stem=stem,
-                    morphemes=morphemes,
-                    is_valid=True
-                )
-            return GenerationResult(
-                word=base_form,
-                breakdown=f"{stem} + {person_suffix if person_suffix else '(0)'}",
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
+    def generate_all(self, stem: str, tenses: Optional[tuple] = None,
+                     persons: tuple = PERSONS,
+                     profile: Optional[StemProfile] = None) -> dict:
+        """
+        Kökün tüm zaman × şahıs × olumsuzluk çekimleri tek geçişte.
 
-        # ================================================================
-        # Diğer zamanlar
-        # ================================================================
-        neg_suffix = ("ma" if quality == "yogyn" else "me") if negative else ""
-        if neg_suffix:
-            morphemes.append(("NEGATION", neg_suffix))
+        Kök verileri (profil, yumuşamış gövde, olumsuzluk eki) bir kez
+        hesaplanır. Sonuç (zaman, şahıs, olumsuz) → GenerationResult
+        sözlüğüdür; her hücre generate() ile aynıdır. Çekim sırasında hata
+        veren hücre geçersiz sonuç olarak döner.
 
-        if tense == "1":
-            # Anyk Öten: kök + [ma] + dy/di + şahıs
-            # Tek heceli dodak fiillerde: -dy/-di → -du/-dü (şahıs eki varken)
-            if not negative and self._tek_heceli_dodak(govde) and person != "A3":
-                tense_suffix = "du" if quality == "yogyn" else "dü"
-            else:
-                tense_suffix = "dy" if quality == "yogyn" else "di"
-            person_suffix = self._person_suffix_standard(quality, person)
+        Args:
+            stem: Fiil kökü
+            tenses: Zaman kodları (None → tüm zamanlar, "1"-"35")
+            persons: Şahıs kodları
+            profile: Kökün StemProfile'ı
+        """
+        vs = _VerbStem(stem, profile)
+        results = {}
+        for tense in (self.TENSES if tenses is None else tenses):
+            handler = self._TENSE_HANDLERS.get(tense)
+            for person in persons:
+                for negative in (False, True):
+                    if handler is None:
+                        results[(tense, person, negative)] = self.generate(stem, tense, person, negative)
+                        continue
+                    try:
+                        results[(tense, person, negative)] = handler(self, vs, tense, person, negative)
+                    except Exception as e:
+                        results[(tense, person, negative)] = GenerationResult(
+                            stem=stem, is_valid=False, error=str(e))
+        return results
+
+    # ==================================================================
+    #  ZAMAN ÇEKİM FONKSİYONLARI
+    #  İmza: (self, vs: _VerbStem, tense, person, negative) → GenerationResult
+    # ==================================================================
 
-        elif tense == "2":
-            # Daş Öten
-            if negative:
-                # enedilim kuralı: kök + män/man + di/dy + kişi
-                neg_suffix = ""  # genel olumsuz eki kullanılmaz
-                if morphemes and morphemes[-1][0] == "NEGATION":
-                    morphemes.pop()
-                tense_suffix = "mändi" if quality == "ince" else "mandy"
-                person_suffix = self._person_suffix_standard(quality, person)
-            else:
-                # Olumlu: kök + ypdy/pdy + şahıs
-                if ends_vowel:
-                    tense_suffix = "pdy" if quality == "yogyn" else "pdi"
-                else:
-                    tense_suffix = "ypdy" if quality == "yogyn" else "ipdi"
-                person_suffix = self._person_suffix_standard(quality, person)
+    @staticmethod
+    def _finish(vs: _VerbStem, govde: str, neg_suffix: str, tense_suffix: str,
+                person_suffix: str) -> GenerationResult:
+        """Kök + [olumsuz] + zaman + [şahıs] dizilimli zamanların sonucu."""
+        morphemes = []
+        if neg_suffix:
+            morphemes.append(("NEGATION", neg_suffix))
+        morphemes.append(("TENSE", tense_suffix))
+        if person_suffix:
+            morphemes.append(("PERSON", person_suffix))
 
-        elif tense == "3":
-            # Dowamly Öten
-            if negative:
-                # enedilim kuralı: kök + ýan/ýän + däldi + kişi (analitik yapı)
-                neg_suffix = ""  # genel olumsuz eki kullanılmaz
-                if morphemes and morphemes[-1][0] == "NEGATION":
-                    morphemes.pop()
-                sifat_fiil = "ýan" if quality == "yogyn" else "ýän"
-                # däldi her zaman ince, kişi ekleri ince
-                person_suffix_str = self._person_suffix_standard("ince", person)
-                result = govde + sifat_fiil + " däldi" + person_suffix_str
-                morphemes.append(("PARTICIPLE", sifat_fiil))
-                morphemes.append(("NEG_COPULA", "däldi"))
-                if person_suffix_str:
-                    morphemes.append(("PERSON", person_suffix_str))
-                breakdown = f"{stem} + {sifat_fiil} + däldi + {person_suffix_str if person_suffix_str else '(0)'}"
-                return GenerationResult(
-                    word=result,
-                    breakdown=breakdown,
-                    stem=stem,
-                    morphemes=morphemes,
-                    is_valid=True
-                )
-            else:
-                # Olumlu: kök + ýardy/ýärdi + şahıs
-                tense_suffix = "ýardy" if quality == "yogyn" else "ýärdi"
-                person_suffix = self._person_suffix_standard(quality, person)
-
-        elif tense == "4":
-            # Umumy Häzirki: kök + [ma] + ýar/ýär + şahıs
-            # k/t yumuşaması (sadece olumlu formda)
-            if not negative:
-                govde = self._fiil_yumusama(govde)
-            tense_suffix = "ýar" if quality == "yogyn" else "ýär"
-            person_suffix = self._person_suffix_extended(quality, person)
-
-        elif tense == "7":
-            # Nämälim Geljek
-            if negative:
-                # Olumsuzluk zaman ekine dahil: -mar/-mer (1./2. şahıs), -maz/-mez (3. şahıs)
-                neg_suffix = ""  # Genel olumsuz eki kullanılmaz
-                if morphemes and morphemes[-1][0] == "NEGATION":
-                    morphemes.pop()
-                if person in ("A3", "B3"):
-                    tense_suffix = "maz" if quality == "yogyn" else "mez"
-                else:
-                    tense_suffix = "mar" if quality == "yogyn" else "mer"
-            else:
-                # k/t yumuşaması
-                govde = self._fiil_yumusama(govde)
-                # NOT: e→ä dönüşümü G2'de uygulanmaz (gel+er=geler, ÇEK+er=çeker)
-                tense_suffix = "r" if ends_vowel else ("ar" if quality == "yogyn" else "er")
-            person_suffix = self._person_suffix_extended(quality, person)
-
-        elif tense == "8":
-            # Şert formasy (Şart kipi): kök + [ma/me] + sa/se + kişi
-            tense_suffix = "sa" if quality == "yogyn" else "se"
-            person_suffix = self._person_suffix_standard(quality, person)
-
-        elif tense == "9":
-            # Buýruk formasy (Emir kipi) — her şahıs için farklı yapı
-            if negative:
-                neg_suf = "ma" if quality == "yogyn" else "me"
-                if morphemes and morphemes[-1][0] == "NEGATION":
-                    morphemes.pop()
-                morphemes.append(("NEGATION", neg_suf))
-                # -ma/-me sonrası dodak uyumu iptal
-                if person == "A1":
-                    p_suf = "ýyn" if quality == "yogyn" else "ýin"
-                elif person == "A2":
-                    p_suf = ""
-                elif person == "A3":
-                    p_suf = "syn" if quality == "yogyn" else "sin"
-                elif person == "B1":
-                    p_suf = "ly" if quality == "yogyn" else "li"
-                elif person == "B2":
-                    p_suf = "ň"
-                else:  # B3
-                    p_suf = "synlar" if quality == "yogyn" else "sinler"
-                result = govde + neg_suf + p_suf
-                if p_suf:
-                    morphemes.append(("PERSON", p_suf))
-                breakdown = f"{stem} + {neg_suf} + {p_suf if p_suf else '(0)'}"
-            else:
-                # Olumlu emir
-                neg_suffix = ""
-                if morphemes and morphemes[-1][0] == "NEGATION":
-                    morphemes.pop()
-                if person == "A1":
-                    if ends_vowel:
-                        p_suf = "ýyn" if quality == "yogyn" else "ýin"
-                    else:
-                        p_suf = "aýyn" if quality == "yogyn" else "eýin"
-                elif person == "A2":
-                    p_suf = ""
-                elif person == "A3":
-                    if self._tek_heceli_dodak(govde):
-                        p_suf = "sun" if quality == "yogyn" else "sün"
-                    else:
-                        p_suf = "syn" if quality == "yogyn" else "sin"
-                elif person == "B1":
-                    if ends_vowel:
-                        p_suf = "ly" if quality == "yogyn" else "li"
-                    else:
-                        p_suf = "aly" if quality == "yogyn" else "eli"
-                elif person == "B2":
-                    if ends_vowel:
-                        p_suf = "ň"
-                    else:
-                        if self._tek_heceli_dodak(govde):
-                            p_suf = "uň" if quality == "yogyn" else "üň"
-                        else:
-                            p_suf = "yň" if quality == "yogyn" else "iň"
-                else:  # B3
-                    if self._tek_heceli_dodak(govde):
-                        p_suf = "sunlar" if quality == "yogyn" else "sünler"
-                    else:
-                        p_suf = "synlar" if quality == "yogyn" else "sinler"
-                result = govde + p_suf
-                if p_suf:
-                    morphemes.append(("PERSON", p_suf))
-                breakdown = f"{stem} + {p_suf if p_suf else '(0)'}"
-            return GenerationResult(
-                word=result,
-                breakdown=breakdown,
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
+        breakdown_parts = [vs.stem]
+        if neg_suffix:
+            breakdown_parts.append(neg_suffix)
+        breakdown_parts.append(tense_suffix)
+        breakdown_parts.append(person_suffix if person_suffix else "(0)")
 
-        elif tense == "10":
-            # Hökmanlyk formasy (Gereklilik): kök + maly/meli [+ däl]
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            tense_suf = "maly" if quality == "yogyn" else "meli"
-            morphemes.append(("TENSE", tense_suf))
-            if negative:
-                result = govde + tense_suf + " däl"
-                morphemes.append(("NEGATION", "däl"))
-                breakdown = f"{stem} + {tense_suf} + däl"
-            else:
-                result = govde + tense_suf
-                breakdown = f"{stem} + {tense_suf}"
-            return GenerationResult(
-                word=result,
-                breakdown=breakdown,
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
+        return GenerationResult(
+            word=govde + neg_suffix + tense_suffix + person_suffix,
+            breakdown=" + ".join(breakdown_parts),
+            stem=vs.stem,
+            morphemes=morphemes,
+            is_valid=True
+        )
 
-        elif tense == "11":
-            # Nätanyş Öten (Kanıtsal / Evidential)
-            if negative:
-                # kök + mandyr/mändir + kişi
-                neg_suffix = ""
-                if morphemes and morphemes[-1][0] == "NEGATION":
-                    morphemes.pop()
-                tense_suffix = "mandyr" if quality == "yogyn" else "mändir"
-                person_suffix = self._person_suffix_extended(quality, person)
-            else:
-                # kök + ypdyr/ipdir + kişi
-                if ends_vowel:
-                    tense_suffix = "pdyr" if quality == "yogyn" else "pdir"
-                else:
-                    if self._tek_heceli_dodak(govde):
-                        tense_suffix = "updyr" if quality == "yogyn" else "üpdir"
-                    else:
-                        tense_suffix = "ypdyr" if quality == "yogyn" else "ipdir"
-                person_suffix = self._person_suffix_extended(quality, person)
+    @staticmethod
+    def _single_suffix(vs: _VerbStem, govde: str, morph_type: str, suffix: str) -> GenerationResult:
+        """Kök + tek ek dizilimli biçimlerin (işlik, dereje) sonucu."""
+        return GenerationResult(
+            word=govde + suffix,
+            breakdown=f"{vs.stem} + {suffix}",
+            stem=vs.stem,
+            morphemes=[(morph_type, suffix)],
+            is_valid=True
+        )
 
-        elif tense == "12":
-            # Arzuw-Ökünç (Optative): kök + [ma/me] + sa/se + dy/di + kişi
-            sart_eki = "sa" if quality == "yogyn" else "se"
-            gecmis_eki = "dy" if quality == "yogyn" else "di"
-            person_suffix = self._person_suffix_standard(quality, person)
-            result = govde + neg_suffix + sart_eki + gecmis_eki + person_suffix
-            morphemes.append(("CONDITIONAL", sart_eki))
-            morphemes.append(("TENSE", gecmis_eki))
-            if person_suffix:
-                morphemes.append(("PERSON", person_suffix))
-            bp = [stem]
-            if neg_suffix:
-                bp.append(neg_suffix)
-            bp.extend([sart_eki, gecmis_eki, person_suffix if person_suffix else "(0)"])
-            breakdown = " + ".join(bp)
-            return GenerationResult(
-                word=result,
-                breakdown=breakdown,
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
+    def _anyk_oten(self, vs, tense, person, negative):
+        # Anyk Öten (1): kök + [ma] + dy/di + şahıs
+        # Tek heceli dodak fiillerde: -dy/-di → -du/-dü (şahıs eki varken)
+        if not negative and vs.single_rounded and person != "A3":
+            tense_suffix = "du" if vs.yogyn else "dü"
+        else:
+            tense_suffix = "dy" if vs.yogyn else "di"
+        return self._finish(vs, vs.govde, vs.neg if negative else "", tense_suffix,
+                            _PERSON_STANDARD[vs.quality][person])
+
+    def _das_oten(self, vs, tense, person, negative):
+        # Daş Öten (2)
+        if negative:
+            # enedilim kuralı: kök + män/man + di/dy + kişi (genel olumsuz eki yok)
+            tense_suffix = "mändi" if vs.quality == "ince" else "mandy"
+        elif vs.ends_vowel:
+            # Olumlu: kök + ypdy/pdy + şahıs
+            tense_suffix = "pdy" if vs.yogyn else "pdi"
+        else:
+            tense_suffix = "ypdy" if vs.yogyn else "ipdi"
+        return self._finish(vs, vs.govde, "", tense_suffix, _PERSON_STANDARD[vs.quality][person])
+
+    def _dowamly_oten(self, vs, tense, person, negative):
+        # Dowamly Öten (3)
+        if not negative:
+            # Olumlu: kök + ýardy/ýärdi + şahıs
+            tense_suffix = "ýardy" if vs.yogyn else "ýärdi"
+            return self._finish(vs, vs.govde, "", tense_suffix, _PERSON_STANDARD[vs.quality][person])
+
+        # enedilim kuralı: kök + ýan/ýän + däldi + kişi (analitik yapı)
+        sifat_fiil = "ýan" if vs.yogyn else "ýän"
+        # däldi her zaman ince, kişi ekleri ince
+        person_suffix_str = _PERSON_STANDARD["ince"][person]
+        morphemes = [("PARTICIPLE", sifat_fiil), ("NEG_COPULA", "däldi")]
+        if person_suffix_str:
+            morphemes.append(("PERSON", person_suffix_str))
+        return GenerationResult(
+            word=vs.govde + sifat_fiil + " däldi" + person_suffix_str,
+            breakdown=f"{vs.stem} + {sifat_fiil} + däldi + {person_suffix_str if person_suffix_str else '(0)'}",
+            stem=vs.stem,
+            morphemes=morphemes,
+            is_valid=True
+        )
 
-        elif tense == "13":
-            # Hal işlik (converb): kök + yp/ip/up/üp/p (neg: man/män)
-            # Fiil yumuşaması: et→ed, git→gid (ünlü başlayan ek öncesi)
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            if negative:
-                suffix = "man" if quality == "yogyn" else "män"
-            else:
-                govde = self._fiil_yumusama(govde)
-                if ends_vowel:
-                    # e→ä dönüşümü: gülle+p → gülläp, beze+p → bezäp
-                    if govde.endswith("e"):
-                        govde = govde[:-1] + "ä"
-                    suffix = "p"
-                elif self._tek_heceli_dodak(govde):
-                    suffix = "up" if quality == "yogyn" else "üp"
-                else:
-                    suffix = "yp" if quality == "yogyn" else "ip"
-            morphemes.append(("CONVERB", suffix))
-            return GenerationResult(
-                word=govde + suffix,
-                breakdown=f"{stem} + {suffix}",
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
+    def _umumy_hazirki(self, vs, tense, person, negative):
+        # Umumy Häzirki (4): kök + [ma] + ýar/ýär + şahıs
+        # k/t yumuşaması (sadece olumlu formda)
+        govde = vs.govde if negative else vs.softened
+        tense_suffix = "ýar" if vs.yogyn else "ýär"
+        return self._finish(vs, govde, vs.neg if negative else "", tense_suffix,
+                            _PERSON_EXTENDED[vs.quality][person])
 
-        elif tense == "14":
-            # Öten ortak işlik (past participle): kök + an/en (neg: madyk/medik)
-            # Fiil yumuşaması: et→ed+en=eden, git→gid+en=giden
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            if negative:
-                suffix = "madyk" if quality == "yogyn" else "medik"
-            else:
-                govde = self._fiil_yumusama(govde)
-                if ends_vowel:
-                    # e→ä dönüşümü: döre+n → dörän, güle+n → gülän
-                    if govde.endswith("e"):
-                        govde = govde[:-1] + "ä"
-                    suffix = "n"
-                else:
-                    suffix = "an" if quality == "yogyn" else "en"
-            morphemes.append(("PARTICIPLE", suffix))
+    def _anyk_hazirki(self, vs, tense, person, negative):
+        # Anyk Häzirki (5) — özel yardımcı fiiller
+        table = _ANYK_HAZIRKI.get(vs.govde)
+        if table is None:
             return GenerationResult(
-                word=govde + suffix,
-                breakdown=f"{stem} + {suffix}",
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
+                word=f"HATA: '{vs.stem}' fiili Anyk Häzirki zamanda çekimlenemez",
+                breakdown="",
+                stem=vs.stem,
+                is_valid=False,
+                error=f"'{vs.stem}' fiili Anyk Häzirki zamanda çekimlenemez"
             )
-
-        elif tense == "15":
-            # Häzirki ortak işlik (present participle): kök + ýan/ýän (neg: maýan/meýän)
-            # Fiil yumuşaması: et→ed+ýän=edýän
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            if negative:
-                suffix = "maýan" if quality == "yogyn" else "meýän"
-            else:
-                govde = self._fiil_yumusama(govde)
-                suffix = "ýan" if quality == "yogyn" else "ýän"
-            morphemes.append(("PARTICIPLE", suffix))
+        person_suffix = table[person]
+        morphemes = [("PERSON", person_suffix)]
+        base_form = vs.govde + person_suffix
+        breakdown = f"{vs.stem} + {person_suffix if person_suffix else '(0)'}"
+        if negative:
+            # H2 olumsuzluk: analitik yapı — fiil + "yok"
+            # otyrynym yok, durunym yok
+            morphemes.append(("NEGATION", "yok"))
             return GenerationResult(
-                word=govde + suffix,
-                breakdown=f"{stem} + {suffix}",
-                stem=stem,
+                word=base_form + " yok",
+                breakdown=breakdown + " + yok",
+                stem=vs.stem,
                 morphemes=morphemes,
                 is_valid=True
             )
+        return GenerationResult(
+            word=base_form,
+            breakdown=breakdown,
+            stem=vs.stem,
+            morphemes=morphemes,
+            is_valid=True
+        )
 
-        elif tense == "16":
-            # Geljek ortak işlik (future participle): kök + jak/jek (neg: majak/mejek)
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            if negative:
-                suffix = "majak" if quality == "yogyn" else "mejek"
-            else:
-                suffix = "jak" if quality == "yogyn" else "jek"
-            morphemes.append(("PARTICIPLE", suffix))
-            return GenerationResult(
-                word=govde + suffix,
-                breakdown=f"{stem} + {suffix}",
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
+    def _malim_geljek(self, vs, tense, person, negative):
+        # Mälim Geljek (6) — özel format (zamirli)
+        pronoun = VerbMorphotactics.PRONOUNS.get(person, "")
+        tense_suffix = "jak" if vs.yogyn else "jek"
+        morphemes = [("TENSE", tense_suffix)]
+        if negative:
+            # Olumsuz: kök + jak/jek + däl
+            result = vs.govde + tense_suffix + " däl"
+            breakdown = f"{pronoun} + {vs.stem} + {tense_suffix} + däl"
+            morphemes.append(("NEGATION", "däl"))
+        else:
+            # Olumlu: kök + jak/jek (kopulasız)
+            result = vs.govde + tense_suffix
+            breakdown = f"{pronoun} + {vs.stem} + {tense_suffix}"
+        return GenerationResult(
+            word=f"{pronoun} {result}",
+            breakdown=breakdown,
+            stem=vs.stem,
+            morphemes=morphemes,
+            is_valid=True
+        )
 
-        elif tense == "17":
-            # Ettirgen (causative): kök + dyr/dir/dur/dür veya +t
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            if ends_vowel:
-                suffix = "t"
-            elif self._tek_heceli_dodak(govde):
-                suffix = "dur" if quality == "yogyn" else "dür"
+    def _namalim_geljek(self, vs, tense, person, negative):
+        # Nämälim Geljek (7)
+        if negative:
+            # Olumsuzluk zaman ekine dahil: -mar/-mer (1./2. şahıs), -maz/-mez (3. şahıs)
+            govde = vs.govde
+            if person in ("A3", "B3"):
+                tense_suffix = "maz" if vs.yogyn else "mez"
             else:
-                suffix = "dyr" if quality == "yogyn" else "dir"
-            morphemes.append(("CAUSATIVE", suffix))
-            return GenerationResult(
-                word=govde + suffix,
-                breakdown=f"{stem} + {suffix}",
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
-
-        elif tense == "18":
-            # Edilgen (passive): kök + yl/il/ul/ül veya +yn/in/un/ün
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            if ends_vowel:
-                suffix = "n" if (govde and len(govde) >= 2 and govde[-2] == 'l') else "l"
-            elif govde and govde[-1] == 'l':
-                if self._tek_heceli_dodak(govde):
-                    suffix = "un" if quality == "yogyn" else "ün"
+                tense_suffix = "mar" if vs.yogyn else "mer"
+        else:
+            # k/t yumuşaması
+            govde = vs.softened
+            # NOT: e→ä dönüşümü G2'de uygulanmaz (gel+er=geler, ÇEK+er=çeker)
+            tense_suffix = "r" if vs.ends_vowel else ("ar" if vs.yogyn else "er")
+        return self._finish(vs, govde, "", tense_suffix, _PERSON_EXTENDED[vs.quality][person])
+
+    def _sert(self, vs, tense, person, negative):
+        # Şert formasy (8, Şart kipi): kök + [ma/me] + sa/se + kişi
+        tense_suffix = "sa" if vs.yogyn else "se"
+        return self._finish(vs, vs.govde, vs.neg if negative else "", tense_suffix,
+                            _PERSON_STANDARD[vs.quality][person])
+
+    def _buyruk(self, vs, tense, person, negative):
+        # Buýruk formasy (9, Emir kipi) — her şahıs için farklı yapı
+        yogyn = vs.yogyn
+        morphemes = []
+        if negative:
+            neg_suf = vs.neg
+            morphemes.append(("NEGATION", neg_suf))
+            # -ma/-me sonrası dodak uyumu iptal
+            if person == "A1":
+                p_suf = "ýyn" if yogyn else "ýin"
+            elif person == "A2":
+                p_suf = ""
+            elif person == "A3":
+                p_suf = "syn" if yogyn else "sin"
+            elif person == "B1":
+                p_suf = "ly" if yogyn else "li"
+            elif person == "B2":
+                p_suf = "ň"
+            else:  # B3
+                p_suf = "synlar" if yogyn else "sinler"
+            result = vs.govde + neg_suf + p_suf
+            breakdown = f"{vs.stem} + {neg_suf} + {p_suf if p_suf else '(0)'}"
+        else:
+            # Olumlu emir
+            if person == "A1":
+                if vs.ends_vowel:
+                    p_suf = "ýyn" if yogyn else "ýin"
                 else:
-                    suffix = "yn" if quality == "yogyn" else "in"
-            else:
-                if self._tek_heceli_dodak(govde):
-                    suffix = "ul" if quality == "yogyn" else "ül"
+                    p_suf = "aýyn" if yogyn else "eýin"
+            elif person == "A2":
+                p_suf = ""
+            elif person == "A3":
+                if vs.single_rounded:
+                    p_suf = "sun" if yogyn else "sün"
                 else:
-                    suffix = "yl" if quality == "yogyn" else "il"
-            morphemes.append(("PASSIVE", suffix))
-            return GenerationResult(
-                word=govde + suffix,
-                breakdown=f"{stem} + {suffix}",
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
-
-        elif tense == "19":
-            # Düýp Dereje (Temel/kök derece): fiil kökü
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            return GenerationResult(
-                word=govde,
-                breakdown=f"{stem}",
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
-
-        elif tense == "20":
-            # Şäriklik Dereje (İşteşlik / Reciprocal): -ş, -yş, -iş, -uş, -üş
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            if ends_vowel:
-                suffix = "ş"
-            elif self._tek_heceli_dodak(govde):
-                suffix = "uş" if quality == "yogyn" else "üş"
-            else:
-                suffix = "yş" if quality == "yogyn" else "iş"
-            morphemes.append(("RECIPROCAL", suffix))
-            return GenerationResult(
-                word=govde + suffix,
-                breakdown=f"{stem} + {suffix}",
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
-
-        elif tense == "21":
-            # Özlük Dereje (Dönüşlü / Reflexive): -n, -yn, -in, -un, -ün
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            if ends_vowel:
-                suffix = "n"
-            elif self._tek_heceli_dodak(govde):
-                suffix = "un" if quality == "yogyn" else "ün"
-            else:
-                suffix = "yn" if quality == "yogyn" else "in"
-            morphemes.append(("REFLEXIVE", suffix))
-            return GenerationResult(
-                word=govde + suffix,
-                breakdown=f"{stem} + {suffix}",
-                stem=stem,
-                morphemes=morphemes,
-                is_valid=True
-            )
-
-        # ================================================================
-        # GOŞMA ZAMANLAR (Birleşik Zamanlar / Compound Tenses)
-        # ================================================================
-        elif tense in ("22", "23", "24", "25", "26", "27", "28",
-                       "29", "30", "31", "32",
-                       "33", "34", "35"):
-            if morphemes and morphemes[-1][0] == "NEGATION":
-                morphemes.pop()
-            neg_suffix = ""
-            return self._generate_compound(
-                stem, govde, quality, ends_vowel, tense, person, negative, pronoun, morphemes
-            )
+                    p_suf = "syn" if yogyn else "sin"
+            elif person == "B1":
+                if vs.ends_vowel:
+                    p_suf = "ly" if yogyn else "li"
+                else:
+                    p_suf = "aly" if yogyn else "eli"
+            elif person == "B2":
+                if vs.ends_vowel:
+                    p_suf = "ň"
+                elif vs.single_rounded:
+                    p_suf = "uň" if yogyn else "üň"
+                else:
+                    p_suf = "yň" if yogyn else "iň"
+            else:  # B3
+                if vs.single_rounded:
+                    p_suf = "sunlar" if yogyn else "sünler"
+                else:
+                    p_suf = "synlar" if yogyn else "sinler"
+            result = vs.govde + p_suf
+            breakdown = f"{vs.stem} + {p_suf if p_suf else '(0)'}"
+        if p_suf:
+            morphemes.append(("PERSON", p_suf))
+        return GenerationResult(
+            word=result,
+            breakdown=breakdown,
+            stem=vs.stem,
+            morphemes=morphemes,
+            is_valid=True
+        )
 
+    def _hokmanlyk(self, vs, tense, person, negative):
+        # Hökmanlyk formasy (10, Gereklilik): kök + maly/meli [+ däl]
+        tense_suf = "maly" if vs.yogyn else "meli"
+        morphemes = [("TENSE", tense_suf)]
+        if negative:
+            result = vs.govde + tense_suf + " däl"
+            morphemes.append(("NEGATION", "däl"))
+            breakdown = f"{vs.stem} + {tense_suf} + däl"
         else:
-            return GenerationResult(
-                word=f"HATA: Geçersiz zaman kodu '{tense}'",
-                breakdown="",
-                stem=stem,
-                is_valid=False,
-                error=f"Geçersiz zaman kodu: {tense}"
-            )
+            result = vs.govde + tense_suf
+            breakdown = f"{vs.stem} + {tense_suf}"
+        return GenerationResult(
+            word=result,
+            breakdown=breakdown,
+            stem=vs.stem,
+            morphemes=morphemes,
+            is_valid=True
+        )
 
-        morphemes.append(("TENSE", tense_suffix))
+    def _natanys_oten(self, vs, tense, person, negative):
+        # Nätanyş Öten (11, Kanıtsal / Evidential)
+        if negative:
+            # kök + mandyr/mändir + kişi
+            tense_suffix = "mandyr" if vs.yogyn else "mändir"
+        elif vs.ends_vowel:
+            # kök + ypdyr/ipdir + kişi
+            tense_suffix = "pdyr" if vs.yogyn else "pdir"
+        elif vs.single_rounded:
+            tense_suffix = "updyr" if vs.yogyn else "üpdir"
+        else:
+            tense_suffix = "ypdyr" if vs.yogyn else "ipdir"
+        return self._finish(vs, vs.govde, "", tense_suffix, _PERSON_EXTENDED[vs.quality][person])
+
+    def _arzuw_okunc(self, vs, tense, person, negative):
+        # Arzuw-Ökünç (12, Optative): kök + [ma/me] + sa/se + dy/di + kişi
+        neg_suffix = vs.neg if negative else ""
+        sart_eki = "sa" if vs.yogyn else "se"
+        gecmis_eki = "dy" if vs.yogyn else "di"
+        person_suffix = _PERSON_STANDARD[vs.quality][person]
+        morphemes = []
+        if neg_suffix:
+            morphemes.append(("NEGATION", neg_suffix))
+        morphemes.append(("CONDITIONAL", sart_eki))
+        morphemes.append(("TENSE", gecmis_eki))
         if person_suffix:
             morphemes.append(("PERSON", person_suffix))
-
-        # Sonuç birleştirme
-        result = govde + neg_suffix + tense_suffix + person_suffix
-        breakdown_parts = [stem]
+        bp = [vs.stem]
         if neg_suffix:
-            breakdown_parts.append(neg_suffix)
-        breakdown_parts.append(tense_suffix)
-        breakdown_parts.append(person_suffix if person_suffix else "(0)")
-        breakdown = " + ".join(breakdown_parts)
-
+            bp.append(neg_suffix)
+        bp.extend([sart_eki, gecmis_eki, person_suffix if person_suffix else "(0)"])
         return GenerationResult(
-            word=result,
-            breakdown=breakdown,
-            stem=stem,
+            word=vs.govde + neg_suffix + sart_eki + gecmis_eki + person_suffix,
+            breakdown=" + ".join(bp),
+            stem=vs.stem,
             morphemes=morphemes,
             is_valid=True
         )
 
+    def _hal_islik(self, vs, tense, person, negative):
+        # Hal işlik (13, converb): kök + yp/ip/up/üp/p (neg: man/män)
+        # Fiil yumuşaması: et→ed, git→gid (ünlü başlayan ek öncesi)
+        govde = vs.govde
+        if negative:
+            suffix = "man" if vs.yogyn else "män"
+        else:
+            govde = vs.softened
+            if vs.ends_vowel:
+                # e→ä dönüşümü: gülle+p → gülläp, beze+p → bezäp
+                if govde.endswith("e"):
+                    govde = govde[:-1] + "ä"
+                suffix = "p"
+            elif vs.single_rounded:
+                suffix = "up" if vs.yogyn else "üp"
+            else:
+                suffix = "yp" if vs.yogyn else "ip"
+        return self._single_suffix(vs, govde, "CONVERB", suffix)
+
+    def _oten_ortak(self, vs, tense, person, negative):
+        # Öten ortak işlik (14, past participle): kök + an/en (neg: madyk/medik)
+        # Fiil yumuşaması: et→ed+en=eden, git→gid+en=giden
+        govde = vs.govde
+        if negative:
+            suffix = "madyk" if vs.yogyn else "medik"
+        else:
+            govde = vs.softened
+            if vs.ends_vowel:
+                # e→ä dönüşümü: döre+n → dörän, güle+n → gülän
+                if govde.endswith("e"):
+                    govde = govde[:-1] + "ä"
+                suffix = "n"
+            else:
+                suffix = "an" if vs.yogyn else "en"
+        return self._single_suffix(vs, govde, "PARTICIPLE", suffix)
+
+    def _hazirki_ortak(self, vs, tense, person, negative):
+        # Häzirki ortak işlik (15, present participle): kök + ýan/ýän (neg: maýan/meýän)
+        # Fiil yumuşaması: et→ed+ýän=edýän
+        if negative:
+            return self._single_suffix(vs, vs.govde, "PARTICIPLE", "maýan" if vs.yogyn else "meýän")
+        return self._single_suffix(vs, vs.softened, "PARTICIPLE", "ýan" if vs.yogyn else "ýän")
+
+    def _geljek_ortak(self, vs, tense, person, negative):
+        # Geljek ortak işlik (16, future participle): kök + jak/jek (neg: majak/mejek)
+        if negative:
+            suffix = "majak" if vs.yogyn else "mejek"
+        else:
+            suffix = "jak" if vs.yogyn else "jek"
+        return self._single_suffix(vs, vs.govde, "PARTICIPLE", suffix)
+
+    def _ettirgen(self, vs, tense, person, negative):
+        # Ettirgen (17, causative): kök + dyr/dir/dur/dür veya +t
+        if vs.ends_vowel:
+            suffix = "t"
+        elif vs.single_rounded:
+            suffix = "dur" if vs.yogyn else "dür"
+        else:
+            suffix = "dyr" if vs.yogyn else "dir"
+        return self._single_suffix(vs, vs.govde, "CAUSATIVE", suffix)
+
+    def _edilgen(self, vs, tense, person, negative):
+        # Edilgen (18, passive): kök + yl/il/ul/ül veya +yn/in/un/ün
+        govde = vs.govde
+        if vs.ends_vowel:
+            suffix = "n" if (govde and len(govde) >= 2 and govde[-2] == 'l') else "l"
+        elif govde and govde[-1] == 'l':
+            if vs.single_rounded:
+                suffix = "un" if vs.yogyn else "ün"
+            else:
+                suffix = "yn" if vs.yogyn else "in"
+        elif vs.single_rounded:
+            suffix = "ul" if vs.yogyn else "ül"
+        else:
+            suffix = "yl" if vs.yogyn else "il"
+        return self._single_suffix(vs, govde, "PASSIVE", suffix)
+
+    def _duyp_dereje(self, vs, tense, person, negative):
+        # Düýp Dereje (19, Temel/kök derece): fiil kökü
+        return GenerationResult(
+            word=vs.govde,
+            breakdown=f"{vs.stem}",
+            stem=vs.stem,
+            morphemes=[],
+            is_valid=True
+        )
+
+    def _sariklik_dereje(self, vs, tense, person, negative):
+        # Şäriklik Dereje (20, İşteşlik / Reciprocal): -ş, -yş, -iş, -uş, -üş
+        if vs.ends_vowel:
+            suffix = "ş"
+        elif vs.single_rounded:
+            suffix = "uş" if vs.yogyn else "üş"
+        else:
+            suffix = "yş" if vs.yogyn else "iş"
+        return self._single_suffix(vs, vs.govde, "RECIPROCAL", suffix)
+
+    def _ozluk_dereje(self, vs, tense, person, negative):
+        # Özlük Dereje (21, Dönüşlü / Reflexive): -n, -yn, -in, -un, -ün
+        if vs.ends_vowel:
+            suffix = "n"
+        elif vs.single_rounded:
+            suffix = "un" if vs.yogyn else "ün"
+        else:
+            suffix = "yn" if vs.yogyn else "in"
+        return self._single_suffix(vs, vs.govde, "REFLEXIVE", suffix)
+
+    def _gosma(self, vs, tense, person, negative):
+        # GOŞMA ZAMANLAR (22-35, Birleşik Zamanlar / Compound Tenses)
+        pronoun = VerbMorphotactics.PRONOUNS.get(person, "")
+        return self._generate_compound(
+            vs.stem, vs.govde, vs.quality, vs.ends_vowel, tense, person, negative, pronoun, [],
+            vs.profile
+        )
+
+    # Zaman kodu → çekim fonksiyonu
+    _TENSE_HANDLERS = {
+        "1": _anyk_oten, "2": _das_oten, "3": _dowamly_oten,
+        "4": _umumy_hazirki, "5": _anyk_hazirki,
+        "6": _malim_geljek, "7": _namalim_geljek,
+        "8": _sert, "9": _buyruk, "10": _hokmanlyk,
+        "11": _natanys_oten, "12": _arzuw_okunc,
+        "13": _hal_islik, "14": _oten_ortak, "15": _hazirki_ortak, "16": _geljek_ortak,
+        "17": _ettirgen, "18": _edilgen,
+        "19": _duyp_dereje, "20": _sariklik_dereje, "21": _ozluk_dereje,
+        **dict.fromkeys(_COMPOUND_SUB, _gosma),
+    }
+    TENSES = tuple(_TENSE_HANDLERS)
+
 
 # ==============================================================================
 #  BİRLEŞİK SENTEZ MOTORU
@@ -1113,23 +1245,47 @@ class MorphologicalGenerator:
         
         # yumusama_izni belirtilmemişse sözlükten oku
         if yumusama_izni is None:
-            if self.lexicon:
-                entries = self.lexicon.lookup(stem)
-                noun_entries = [e for e in entries if e.pos in ("n", "np", "n?")]
-                if noun_entries:
-                    yumusama_izni = noun_entries[0].allows_softening
-                else:
-                    yumusama_izni = True  # Sözlükte bulunamayan kelime — varsayılan
-            else:
-                yumusama_izni = True  # Sözlük yok — varsayılan
+            yumusama_izni = self._lexicon_softening(stem)
         
         return self.noun_gen.generate(stem, plural, possessive, poss_type, case, yumusama_izni)
 
+    def noun_paradigm(self, stem: str, possessives: tuple = NounGenerator.PARADIGM_POSSESSIVES,
+                      cases: tuple = NounGenerator.PARADIGM_CASES,
+                      yumusama_izni: Optional[bool] = None) -> dict:
+        """
+        İsim paradigma tablosu: (çoğul, iyelik, hal) → kelime (geçersiz: None).
+
+        Her hücre generate_noun() ile aynıdır; yumuşama bayrağı sözlükten
+        bir kez okunur.
+        """
+        if yumusama_izni is None:
+            yumusama_izni = self._lexicon_softening(stem)
+        return self.noun_gen.generate_paradigm(stem, yumusama_izni, possessives, cases)
+
+    def _lexicon_softening(self, stem: str) -> bool:
+        """Sözlükteki ilk isim kaydının softening bayrağı (yoksa True)."""
+        if self.lexicon:
+            entries = self.lexicon.lookup(stem)
+            noun_entries = [e for e in entries if e.pos in ("n", "np", "n?")]
+            if noun_entries:
+                return noun_entries[0].allows_softening
+            return True  # Sözlükte bulunamayan kelime — varsayılan
+        return True  # Sözlük yok — varsayılan
+
     def generate_verb(self, stem: str, tense: str, person: str,
                       negative: bool = False) -> GenerationResult:
         """Fiil çekimi yapar."""
         return self.verb_gen.generate(stem, tense, person, negative)
 
+    def verb_paradigm(self, stem: str, tenses: Optional[tuple] = None,
+                      persons: tuple = VerbGenerator.PERSONS) -> dict:
+        """
+        Fiil paradigma tablosu: (zaman, şahıs, olumsuz) → GenerationResult.
+
+        Her hücre generate_verb() ile aynıdır (bkz. VerbGenerator.generate_all).
+        """
+        return self.verb_gen.generate_all(stem, tenses, persons)
+
     def analyze_noun(self, root: str, s_code: str, i_code: str, h_code: str):
         """
         Flask uyumlu isim çekimi API'si (mevcut analyze fonksiyonuyla uyumlu).
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Bilinen Yüzey Formu Kümesi (known_forms.py)
+
+Yazım denetimi yalnızca kelimenin en az bir bilinen çözümlemesi olup
+olmadığını sorar; tam parse() ise her AnalysisResult'u, breakdown
+metnini ve ek sözlüklerini kurar. Bu modül sözlükteki her kökün isim ve
+fiil paradigmalarından üretilebilen tüm yüzey formlarını (yuvarlaklaşma
+anahtarıyla) iki Bloom filtresinde tutar:
+
+    - isim filtresi: her kök × NOUN_COMBOS × yumuşama varyantı, ve kökün
+      kendisi (parse_noun() ile aynı deneme kümesi)
+    - fiil filtresi: her kök × VERB_COMBOS, zamirsiz form
+      (parse_verb() tek kelimelik giriş ile aynı deneme kümesi)
+
+parse_noun() / parse_verb() sözlükteki her anahtarı kök adayı olarak
+denediği için filtreler yalnız isim/fiil etiketli kökleri değil, tüm
+anahtarları kapsar. Filtrenin olumsuz yanıtı kesindir: kelime o
+paradigmada üretilemez ve alt çözümleyici çağrılmaz. Olumlu yanıt yanlış
+olabilir; MorphologicalAnalyzer.is_known() onu ilgili alt çözümleyiciyle
+doğrular (kesin geri dönüş).
+
+Oluşturma bir kerelik maliyettir (tüm sözlükte ~2 dk); küme save() ile
+diske yazılıp sonraki açılışlarda yüklenir.
+
+Kullanım:
+    forms = KnownForms.build(lexicon)
+    forms.save("known_forms.pkl")
+    analyzer = MorphologicalAnalyzer(lexicon, known_forms=forms)
+    analyzer.is_known("kitabym")  # True
+"""
+
+from __future__ import annotations
+import hashlib
+import math
+import pickle
+from typing import Optional
+
+from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.generator import NounGenerator, VerbGenerator
+from turkmen_fst.phonology import stem_profile
+from turkmen_fst.form_index import (
+    NOUN_COMBOS, VERB_COMBOS, VerbFormIndex, noun_softening_variants, rounding_key
+)
+
+
+# Hedef yanlış pozitif oranı. Filtre kapasitenin üst sınırına (kök ×
+# kombinasyon) göre boyutlanır; tekrarlanan formlar yüzünden gerçek oran
+# bunun altında kalır.
+KNOWN_FORMS_FP_RATE = 0.01
+
+
+# ==============================================================================
+#  BLOOM FİLTRESİ
+# ==============================================================================
+
+class BloomFilter:
+    """
+    Sabit boyutlu Bloom filtresi.
+
+    Konumlar anahtarın 128 bit blake2b özetinin iki yarısından çift
+    özetleme ile (h1 + i·h2) hesaplanır; özet süreçten bağımsızdır, bu
+    yüzden filtre diske yazılıp başka süreçte yüklenebilir.
+
+    Args:
+        capacity: Beklenen en fazla anahtar sayısı
+        fp_rate: Kapasite doluyken hedef yanlış pozitif oranı
+    """
+
+    __slots__ = ("size", "hashes", "bits", "count")
+
+    def __init__(self, capacity: int, fp_rate: float = KNOWN_FORMS_FP_RATE):
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError("fp_rate 0 ile 1 arasında olmalı")
+        capacity = max(1, capacity)
+        size = math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))
+        self.size = max(8, size)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    @staticmethod
+    def _digest(key: str) -> tuple[int, int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add(self, key: str) -> None:
+        h1, h2 = self._digest(key)
+        size = self.size
+        bits = self.bits
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % size
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        h1, h2 = self._digest(key)
+        size = self.size
+        bits = self.bits
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __getstate__(self):
+        return {"size": self.size, "hashes": self.hashes,
+                "bits": bytes(self.bits), "count": self.count}
+
+    def __setstate__(self, state):
+        self.size = state["size"]
+        self.hashes = state["hashes"]
+        self.bits = bytearray(state["bits"])
+        self.count = state["count"]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+    def __repr__(self) -> str:
+        return f"BloomFilter(count={self.count}, bytes={self.nbytes}, hashes={self.hashes})"
+
+
+# ==============================================================================
+#  BİLİNEN FORM KÜMESİ
+# ==============================================================================
+
+class KnownForms:
+    """
+    Sözlükten üretilebilen isim ve fiil yüzey formlarının kümesi.
+
+    maybe_noun() / maybe_verb() False ise kelime o paradigmada kesinlikle
+    üretilemez; True ise üretilebilir olması muhtemeldir (doğrulanmalıdır).
+    """
+
+    VERSION = 2
+
+    def __init__(self, nouns: BloomFilter, verbs: BloomFilter, lexicon_words: int = 0,
+                 lexicon_sha256: bytes = b""):
+        self.nouns = nouns
+        self.verbs = verbs
+        self._lexicon_words = lexicon_words
+        self._lexicon_sha256 = lexicon_sha256
+
+    @classmethod
+    def build(cls, lexicon: Lexicon, fp_rate: float = KNOWN_FORMS_FP_RATE) -> "KnownForms":
+        """
+        Sözlükteki tüm anahtarlar için isim ve fiil formlarını üretir.
+
+        Args:
+            lexicon: Yüklü sözlük
+            fp_rate: Her filtre için hedef yanlış pozitif oranı
+        Returns:
+            Oluşturulan küme
+        """
+        stems = lexicon.all_words()
+        noun_capacity = sum(1 + len(noun_softening_variants(lexicon, stem)) * len(NOUN_COMBOS)
+                            for stem in stems)
+        nouns = BloomFilter(noun_capacity, fp_rate)
+        verbs = BloomFilter(len(stems) * len(VERB_COMBOS), fp_rate)
+        noun_gen = NounGenerator(lexicon)
+        verb_gen = VerbGenerator(lexicon)
+
+        for stem in stems:
+            profile = stem_profile(stem)
+            forms = {rounding_key(stem)}  # yalın kök
+            for yumusama_izni, _ in noun_softening_variants(lexicon, stem):
+                for plural, poss, poss_type, case, daky in NOUN_COMBOS:
+                    try:
+                        result = noun_gen.generate(stem, plural, poss, poss_type, case,
+                                                   yumusama_izni=yumusama_izni, daky=daky,
+                                                   profile=profile)
+                    except Exception:
+                        continue
+                    if result.is_valid:
+                        forms.add(rounding_key(result.word))
+            for form in forms:
+                nouns.add(form)
+
+            for form in {key for key, _ in VerbFormIndex._stem_forms(verb_gen, stem)}:
+                verbs.add(form)
+
+        return cls(nouns, verbs, lexicon.word_count, lexicon.source_sha256)
+
+    def maybe_noun(self, word: str) -> bool:
+        """Kelime bir kökün isim çekimi (veya kökün kendisi) olabilir mi?"""
+        return rounding_key(word) in self.nouns
+
+    def maybe_verb(self, word: str) -> bool:
+        """Kelime bir kökün zamirsiz fiil çekimi olabilir mi?"""
+        return rounding_key(word) in self.verbs
+
+    def save(self, path: str) -> None:
+        """Kümeyi diske yazar."""
+        with open(path, "wb") as f:
+            pickle.dump({
+                "kind": type(self).__name__,
+                "version": self.VERSION,
+                "lexicon_words": self._lexicon_words,
+                "lexicon_sha256": self._lexicon_sha256,
+                "nouns": self.nouns,
+                "verbs": self.verbs,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str, lexicon: Optional[Lexicon] = None) -> "KnownForms":
+        """
+        Diskteki kümeyi yükler.
+
+        Sözlük verilirse kaynak sözlüğün SHA-256 özeti ve kelime sayısı
+        karşılaştırılır; uyuşmazlıkta ValueError fırlatılır (küme yeniden
+        oluşturulmalıdır).
+        """
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("kind") != cls.__name__:
+            raise ValueError(f"Dosya {cls.__name__} değil: {data.get('kind')}")
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Desteklenmeyen küme sürümü: {data.get('version')}")
+        if lexicon is not None and (data["lexicon_sha256"], data["lexicon_words"]) != (
+                lexicon.source_sha256, lexicon.word_count):
+            raise ValueError("Küme bu sözlükle oluşturulmamış, yeniden oluşturun")
+        return cls(data["nouns"], data["verbs"], data["lexicon_words"], data["lexicon_sha256"])
+
+    def __len__(self) -> int:
+        return self.nouns.count + self.verbs.count
+
+    def __repr__(self) -> str:
+        return (f"KnownForms(nouns={self.nouns.count}, verbs={self.verbs.count}, "
+                f"bytes={self.nouns.nbytes + self.verbs.nbytes})")
@@ -9,11 +9,20 @@ Sözlük formatı (turkmence_sozluk.txt):
 
 Morfolojik özellikler (ünlü düşmesi, yumuşama izni) doğrudan
 sözlük girişine entegre edilmiştir — bu modern ve modüler yaklaşımı sağlar.
+
+Hızlı açılış için sözlük ikili bir snapshot'a derlenebilir
+(save_snapshot / load_snapshot). Snapshot kaynak dosyanın SHA-256
+özetini taşır; kaynak değiştiyse yüklenmez.
 """
 
 from __future__ import annotations
+import hashlib
+import mmap
 import os
-from dataclasses import dataclass, field
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
 from typing import Optional
 from turkmen_fst.phonology import (
     VOWEL_DROP_CANDIDATES, VOWEL_DROP_EXCEPTIONS,
@@ -25,34 +34,102 @@ from turkmen_fst.phonology import (
 #  SÖZLÜK GİRİŞİ
 # ==============================================================================
 
-@dataclass
+# Özellik düzenleri: features sözlüğünün (anahtar, dizge_mi) sırası.
+# Farklı düzen sayısı azdır; her giriş paylaşılan bir tuple'a işaret eder.
+_LAYOUTS: dict[tuple, tuple] = {(): ()}
+
+
+def _intern_layout(layout: tuple) -> tuple:
+    return _LAYOUTS.setdefault(layout, layout)
+
+
 class LexiconEntry:
     """
     Bir sözlük girişi.
-    
+
+    Bellek için __slots__ kullanır: özellikler sözlük yerine paylaşılan
+    bir düzen tuple'ı, bool değer bitleri ve dizge ekstraları olarak
+    saklanır. allows_* değerleri oluşturulurken bir kez çözülüp bayrak
+    bitlerine yazılır.
+
     Attributes:
         word: Kelime kökü (ör. "kitap")
         pos: Kelime türü (ör. "n", "v", "adj")
-        features: Morfolojik özellikler sözlüğü
+        features: Morfolojik özellikler sözlüğü (her erişimde yeniden kurulur)
     """
-    word: str
-    pos: str  # "n", "v", "adj", "adv", "conj", "det", "interj", "num", "phr", "postp", "prep", "pro", "np", "suf", "unk", "n?" (muhtemel isim)
-    features: dict = field(default_factory=dict)
+
+    __slots__ = ("word", "pos", "_layout", "_bits", "_extra", "_flags")
+
+    # Çözümlenmiş özellik bayrakları
+    SOFTENING = 1
+    VOWEL_DROP = 2
+    EXCEPTION_DROP = 4
+
+    def __init__(self, word: str, pos: str, features: Optional[dict] = None):
+        layout = []
+        bits = 0
+        extra = []
+        for j, (name, value) in enumerate((features or {}).items()):
+            if isinstance(value, str):
+                layout.append((name, True))
+                extra.append(value)
+            elif not isinstance(value, bool):
+                raise TypeError(f"Desteklenmeyen özellik değeri: {word} {name}={value!r}")
+            else:
+                layout.append((name, False))
+                if value:
+                    bits |= 1 << j
+        self._init(word, pos, _intern_layout(tuple(layout)), bits, tuple(extra))
+
+    @classmethod
+    def _packed(cls, word: str, pos: str, layout: tuple, bits: int,
+                extra: tuple) -> "LexiconEntry":
+        """Paketlenmiş özelliklerden giriş oluşturur (snapshot yükleme)."""
+        entry = cls.__new__(cls)
+        entry._init(word, pos, _intern_layout(layout), bits, extra)
+        return entry
+
+    def _init(self, word: str, pos: str, layout: tuple, bits: int, extra: tuple) -> None:
+        self.word = word
+        self.pos = sys.intern(pos)
+        self._layout = layout
+        self._bits = bits
+        self._extra = extra or None
+
+        values = {name: bool(bits >> j & 1)
+                  for j, (name, is_str) in enumerate(layout) if not is_str}
+        flags = 0
+        if values.get("softening", self._default_softening()):
+            flags |= self.SOFTENING
+        if values.get("vowel_drop", self._default_vowel_drop()):
+            flags |= self.VOWEL_DROP
+        if values.get("exception_drop", word.lower() in VOWEL_DROP_EXCEPTIONS):
+            flags |= self.EXCEPTION_DROP
+        self._flags = flags
+
+    @property
+    def features(self) -> dict:
+        """Özellik sözlüğü (dosyadaki anahtar sırasıyla)."""
+        features = {}
+        extra = iter(self._extra or ())
+        for j, (name, is_str) in enumerate(self._layout):
+            features[name] = next(extra) if is_str else bool(self._bits >> j & 1)
+        return features
 
     @property
     def allows_softening(self) -> bool:
         """Bu kelime ünsüz yumuşamasına izin veriyor mu?"""
-        return self.features.get("softening", self._default_softening())
+        return bool(self._flags & self.SOFTENING)
 
     @property
     def allows_vowel_drop(self) -> bool:
         """Bu kelime ünlü düşmesine aday mı?"""
-        return self.features.get("vowel_drop", self._default_vowel_drop())
+        return bool(self._flags & self.VOWEL_DROP)
 
     @property
     def is_exception_drop(self) -> bool:
         """Bu kelime istisna ünlü düşmesi mi?"""
-        return self.features.get("exception_drop", self.word.lower() in VOWEL_DROP_EXCEPTIONS)
+        return bool(self._flags & self.EXCEPTION_DROP)
 
     def _default_softening(self) -> bool:
         """Kelimenin son harfine göre varsayılan yumuşama davranışı.
@@ -73,6 +150,23 @@ class LexiconEntry:
         """Kelime genel düşme adayları listesinde mi?"""
         return self.word.lower() in VOWEL_DROP_CANDIDATES
 
+    def __getstate__(self):
+        return (self.word, self.pos, self._layout, self._bits, self._extra)
+
+    def __setstate__(self, state):
+        word, pos, layout, bits, extra = state
+        self._init(word, pos, _intern_layout(layout), bits, extra or ())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LexiconEntry):
+            return NotImplemented
+        return (self.word, self.pos, self.features) == (other.word, other.pos, other.features)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LexiconEntry(word={self.word!r}, pos={self.pos!r}, features={self.features!r})"
+
 
 # ==============================================================================
 #  EŞ SESLİ KELİMELER
@@ -134,6 +228,90 @@ POS_DISPLAY = {
 }
 
 
+# ==============================================================================
+#  İKİLİ SNAPSHOT FORMATI
+# ==============================================================================
+#
+#  Başlık | anahtarlar | anahtar aralıkları | giriş kayıtları | dizgeler
+#
+#  - anahtarlar: küçük harf kelimeler, "\n" ile birleşik UTF-8 (ekleme sırası)
+#  - anahtar aralıkları: n_keys + 1 adet uint32; i. anahtarın girişleri
+#    [spans[i], spans[i+1])
+#  - giriş kaydı: kelime ofseti/uzunluğu, POS kodu, özellik düzeni, bool
+#    değer bitleri ve ilk dizge özelliğinin ekstra numarası
+#  - özellik düzeni: features sözlüğündeki anahtar sırası (az sayıda farklı
+#    düzen vardır); bool değerler bit olarak, dizgeler ekstra tablosunda
+#  - dizgeler: kelimeler, ekstralar ve düzen tablosu
+
+SNAPSHOT_MAGIC = b"TKLX"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+
+_HEADER = struct.Struct("<4sHH32sIIIIII")
+_RECORD = struct.Struct("<IHBBHI")
+
+# POS kodları: POS_TAG_MAP değer sırası
+POS_CODES = tuple(dict.fromkeys(POS_TAG_MAP.values()))
+_POS_INDEX = {pos: i for i, pos in enumerate(POS_CODES)}
+
+
+def file_sha256(path: str) -> bytes:
+    """Dosyanın SHA-256 özeti."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+class _SnapshotEntries(Mapping):
+    """
+    Snapshot'tan tembel çözülen kelime → [LexiconEntry] eşlemesi.
+
+    Açılışta yalnızca anahtarlar çözülür; girişler ilk erişimde
+    bellek eşlemeli dosyadan okunup önbelleğe alınır.
+    """
+
+    def __init__(self, buf, keys: list[str], spans: array, records_at: int,
+                 words_at: int, extras: list[str], layouts: list[tuple]):
+        self._buf = buf
+        self._index = dict(zip(keys, range(len(keys))))
+        self._spans = spans
+        self._records_at = records_at
+        self._words_at = words_at
+        self._extras = extras
+        self._layouts = layouts
+        self._cache: dict[str, list[LexiconEntry]] = {}
+
+    def _decode(self, i: int) -> LexiconEntry:
+        word_off, word_len, pos, layout, bits, extra = _RECORD.unpack_from(
+            self._buf, self._records_at + i * _RECORD.size)
+        start = self._words_at + word_off
+        word = self._buf[start:start + word_len].decode("utf-8")
+        fields = self._layouts[layout]
+        n_str = sum(1 for _, is_str in fields if is_str)
+        return LexiconEntry._packed(word, POS_CODES[pos], fields, bits,
+                                    tuple(self._extras[extra:extra + n_str]))
+
+    def __getitem__(self, key: str) -> list[LexiconEntry]:
+        entries = self._cache.get(key)
+        if entries is None:
+            k = self._index[key]
+            entries = [self._decode(i) for i in range(self._spans[k], self._spans[k + 1])]
+            self._cache[key] = entries
+        return entries
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __reduce__(self):
+        # mmap taşınamaz; başka sürece düz sözlük olarak aktarılır
+        return (dict, (dict(self.items()),))
+
+
 # ==============================================================================
 #  ANA SÖZLÜK SINIFI
 # ==============================================================================
@@ -154,26 +332,65 @@ class Lexicon:
         self._entries: dict[str, list[LexiconEntry]] = {}  # kelime → [LexiconEntry, ...]
         self._loaded = False
         self._word_count = 0
+        self._source_path = ""
+        self._source_sha256 = b""
+        self._generation = 0
 
     @property
     def is_loaded(self) -> bool:
         return self._loaded
 
+    @property
+    def generation(self) -> int:
+        """Her yüklemede artan sayaç (önbellekleri geçersiz kılmak için)."""
+        return self._generation
+
     @property
     def word_count(self) -> int:
         return self._word_count
 
-    def load(self, path: str) -> int:
+    @property
+    def source_path(self) -> str:
+        """Yüklenen metin sözlüğün yolu (bilinmiyorsa boş)."""
+        return self._source_path
+
+    @property
+    def source_sha256(self) -> bytes:
+        """
+        Yüklenen kaynak sözlüğün SHA-256 özeti (bilinmiyorsa boş).
+
+        Sözlükten türetilip diske yazılan yapılar (FST, form dizinleri,
+        bilinen form kümesi) bayatlık denetimi için bunu saklar.
+        """
+        return self._source_sha256
+
+    @property
+    def is_mapped(self) -> bool:
+        """Girişler bellek eşlemeli snapshot'tan mı okunuyor?"""
+        return isinstance(self._entries, _SnapshotEntries)
+
+    def load(self, path: str, use_snapshot: bool = False) -> int:
         """
         Sözlük dosyasını yükler.
         
         Args:
             path: turkmence_sozluk.txt dosya yolu
+            use_snapshot: Yanında güncel bir <path>.snap varsa onu yükle
         
         Returns:
             Yüklenen kelime sayısı
         """
-        self._entries.clear()
+        if use_snapshot:
+            snapshot = path + SNAPSHOT_SUFFIX
+            if os.path.exists(snapshot):
+                try:
+                    return self.load_snapshot(snapshot, path)
+                except ValueError:
+                    pass  # eski snapshot — metinden yükle
+
+        self._entries = {}
+        self._source_path = path
+        self._source_sha256 = file_sha256(path)
         count = 0
 
         with open(path, "r", encoding="utf-8") as f:
@@ -213,8 +430,108 @@ class Lexicon:
 
         self._word_count = count
         self._loaded = True
+        self._generation += 1
         return count
 
+    def save_snapshot(self, path: str, source_path: Optional[str] = None) -> None:
+        """
+        Yüklü sözlüğü ikili snapshot olarak yazar.
+
+        Args:
+            path: Çıktı dosyası (genellikle <kaynak>.snap)
+            source_path: Özeti alınacak kaynak dosya (varsayılan: yüklenen dosya)
+        """
+        source_path = source_path or self._source_path
+        if not source_path:
+            raise ValueError("Snapshot için kaynak sözlük dosyası gerekli")
+
+        keys = list(self._entries.keys())
+        spans = array("I", [0])
+        records = bytearray()
+        words = bytearray()
+        extras: list[str] = []
+        layouts: dict[tuple, int] = {}
+
+        for key in keys:
+            for entry in self._entries[key]:
+                layout_id = layouts.setdefault(entry._layout, len(layouts))
+                if len(layouts) > 255 or len(entry._layout) > 16:
+                    raise ValueError("Snapshot: çok fazla özellik düzeni")
+                extra = len(extras)
+                extras.extend(entry._extra or ())
+                encoded = entry.word.encode("utf-8")
+                records += _RECORD.pack(len(words), len(encoded), _POS_INDEX[entry.pos],
+                                        layout_id, entry._bits, extra)
+                words += encoded
+            spans.append(len(records) // _RECORD.size)
+
+        keys_blob = "\n".join(keys).encode("utf-8")
+        extras_blob = "\x1f".join(extras).encode("utf-8")
+        layouts_blob = "\n".join(
+            ",".join(f"{name}:{'s' if is_str else 'b'}" for name, is_str in layout)
+            for layout in layouts
+        ).encode("utf-8")
+
+        header = _HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, file_sha256(source_path),
+            len(keys), len(records) // _RECORD.size, self._word_count,
+            len(keys_blob), len(extras_blob), len(layouts_blob),
+        )
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            for part in (header, keys_blob, spans.tobytes(), records,
+                         extras_blob, layouts_blob, words):
+                f.write(part)
+        os.replace(tmp, path)
+
+    def load_snapshot(self, path: str, source_path: Optional[str] = None) -> int:
+        """
+        İkili snapshot'ı yükler (bellek eşlemeli, girişler tembel çözülür).
+
+        Args:
+            path: save_snapshot ile yazılmış dosya
+            source_path: Verilirse SHA-256 özeti snapshot'takiyle karşılaştırılır
+        Returns:
+            Yüklenen kelime sayısı
+        Raises:
+            ValueError: Dosya geçersiz veya kaynak sözlük değişmiş
+        """
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(buf) < _HEADER.size:
+            raise ValueError(f"Geçersiz snapshot: {path}")
+        (magic, version, _, digest, n_keys, n_records, word_count,
+         keys_len, extras_len, layouts_len) = _HEADER.unpack_from(buf, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"Geçersiz snapshot: {path}")
+        if source_path is not None and file_sha256(source_path) != digest:
+            raise ValueError("Snapshot kaynak sözlükle uyuşmuyor, yeniden oluşturun")
+
+        pos = _HEADER.size
+        keys = buf[pos:pos + keys_len].decode("utf-8").split("\n") if n_keys else []
+        pos += keys_len
+        spans = array("I")
+        spans.frombytes(buf[pos:pos + (n_keys + 1) * 4])
+        pos += (n_keys + 1) * 4
+        records_at = pos
+        pos += n_records * _RECORD.size
+        extras = buf[pos:pos + extras_len].decode("utf-8").split("\x1f")
+        pos += extras_len
+        layouts = []
+        for line in buf[pos:pos + layouts_len].decode("utf-8").split("\n"):
+            fields = [item.rsplit(":", 1) for item in line.split(",") if item]
+            layouts.append(tuple((name, kind == "s") for name, kind in fields))
+        pos += layouts_len
+
+        self._entries = _SnapshotEntries(buf, keys, spans, records_at, pos, extras, layouts)
+        self._word_count = word_count
+        self._source_path = source_path or ""
+        self._source_sha256 = digest
+        self._loaded = True
+        self._generation += 1
+        return word_count
+
     def _compute_features(self, word: str, pos: str) -> dict:
         """
         Kelime için morfolojik özellikleri otomatik hesaplar (eski format uyumluluk).
@@ -174,6 +174,28 @@ class NounMorphotactics:
         Transition("POSSESSIVE", "CASE", MorphCategory.CASE_ABL.value, "İyelik → Çıkma hali"),
     ]
 
+    # Geçiş matrisi: (kaynak, kategori) → Transition
+    TRANSITION_MATRIX = {(t.source, t.category): t for t in TRANSITIONS}
+
+    # Parametre kodu → kategori
+    POSSESSIVE_CATEGORIES = {
+        "A1": MorphCategory.POSS_1SG.value,
+        "A2": MorphCategory.POSS_2SG.value,
+        "A3": MorphCategory.POSS_3SG.value,
+        "B1": MorphCategory.POSS_1PL.value,  # → A1 çoğul
+        "B2": MorphCategory.POSS_2PL.value,  # → A2 çoğul
+    }
+    CASE_CATEGORIES = {
+        "A2": MorphCategory.CASE_GEN.value,
+        "A3": MorphCategory.CASE_DAT.value,
+        "A4": MorphCategory.CASE_ACC.value,
+        "A5": MorphCategory.CASE_LOC.value,
+        "A6": MorphCategory.CASE_ABL.value,
+    }
+
+    # (çoğul, iyelik, hal) → (is_valid, error_message); sınıf tanımından sonra doldurulur
+    _PARAM_MATRIX: dict = {}
+
     @classmethod
     def get_transitions_from(cls, state_name: str) -> list[Transition]:
         """Belirli bir durumdan çıkan tüm geçişleri döndürür."""
@@ -182,10 +204,7 @@ class NounMorphotactics:
     @classmethod
     def get_transition(cls, source: str, category: str) -> Optional[Transition]:
         """Belirli bir kaynak ve kategori için geçişi döndürür."""
-        for t in cls.TRANSITIONS:
-            if t.source == source and t.category == category:
-                return t
-        return None
+        return cls.TRANSITION_MATRIX.get((source, category))
 
     @classmethod
     def is_valid_sequence(cls, categories: list[str]) -> bool:
@@ -214,37 +233,35 @@ class NounMorphotactics:
                               case: Optional[str]) -> tuple[bool, str]:
         """
         İsim çekim parametrelerinin geçerliliğini doğrular.
+
+        Geçerli kod kombinasyonlarının sonucu önceden hesaplanmıştır
+        (_PARAM_MATRIX); bilinmeyen kodlar tam doğrulamaya düşer.
         
         Returns:
             (is_valid, error_message)
         """
+        result = cls._PARAM_MATRIX.get((bool(plural), possessive or None, case or None))
+        if result is not None:
+            return result
+        return cls._check_noun_params(plural, possessive, case)
+
+    @classmethod
+    def _check_noun_params(cls, plural: bool, possessive: Optional[str],
+                           case: Optional[str]) -> tuple[bool, str]:
+        """Parametreleri geçiş matrisi üzerinden doğrular (önbelleksiz)."""
         categories = []
         
         if plural:
             categories.append(MorphCategory.PLURAL.value)
         
         if possessive:
-            poss_map = {
-                "A1": MorphCategory.POSS_1SG.value,
-                "A2": MorphCategory.POSS_2SG.value,
-                "A3": MorphCategory.POSS_3SG.value,
-                "B1": MorphCategory.POSS_1PL.value,  # → A1 çoğul
-                "B2": MorphCategory.POSS_2PL.value,  # → A2 çoğul
-            }
-            cat = poss_map.get(possessive)
+            cat = cls.POSSESSIVE_CATEGORIES.get(possessive)
             if cat is None:
                 return False, f"Geçersiz iyelik kodu: {possessive}"
             categories.append(cat)
         
         if case:
-            case_map = {
-                "A2": MorphCategory.CASE_GEN.value,
-                "A3": MorphCategory.CASE_DAT.value,
-                "A4": MorphCategory.CASE_ACC.value,
-                "A5": MorphCategory.CASE_LOC.value,
-                "A6": MorphCategory.CASE_ABL.value,
-            }
-            cat = case_map.get(case)
+            cat = cls.CASE_CATEGORIES.get(case)
             if cat is None:
                 return False, f"Geçersiz hal kodu: {case}"
             categories.append(cat)
@@ -255,6 +272,14 @@ class NounMorphotactics:
         return True, ""
 
 
+NounMorphotactics._PARAM_MATRIX = {
+    (plural, possessive, case): NounMorphotactics._check_noun_params(plural, possessive, case)
+    for plural in (False, True)
+    for possessive in (None, *NounMorphotactics.POSSESSIVE_CATEGORIES)
+    for case in (None, *NounMorphotactics.CASE_CATEGORIES)
+}
+
+
 # ==============================================================================
 #  FİİL MORFOTAKTİK MODELİ
 # ==============================================================================
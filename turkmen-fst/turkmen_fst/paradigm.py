@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Paradigma Tabloları (paradigm.py)
+
+Bir kökün tüm paradigma hücrelerini (isim: sayı × iyelik × hal, fiil:
+zaman × şahıs × olumsuzluk) bir kez üretir. Web arayüzleri ve API tabloları
+ParadigmCache üzerinden okur; aynı kök için generator tekrar çalışmaz.
+
+export_paradigms() sözlüğün tamamı (veya bir POS alt kümesi) için
+paradigmaları gzip'li JSON Lines dosyasına yazar. Kökler sıralı işlenir ve
+gzip başlığına zaman damgası yazılmaz; aynı sözlük ve ayarlarla çıktı
+işçi sayısından bağımsız olarak bayt bayt aynıdır.
+
+Kullanım:
+    paradigms = ParadigmCache(MorphologicalGenerator(lexicon))
+    paradigms.noun("kitap").form(True, "A1", "A5")   # "kitaplarymda"
+    export_paradigms(lexicon, "paradigms.jsonl.gz", pos=["n", "v"], workers=4)
+"""
+
+from __future__ import annotations
+import gzip
+import io
+import json
+import multiprocessing
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from turkmen_fst.generator import MorphologicalGenerator
+from turkmen_fst.form_index import NOUN_POS
+
+
+# Tablo eksenleri (ön yüzlerin gösterdiği hücrelerin birleşimi)
+NOUN_CASES = (None, "A2", "A3", "A4", "A5", "A6")
+NOUN_POSSESSIVES = (None, "A1", "A2", "A3", "B1", "B2")
+VERB_TENSES = ("1", "2", "3", "4", "5", "6", "7")
+VERB_PERSONS = ("A1", "A2", "A3", "B1", "B2", "B3")
+
+# İsim paradigması alan POS etiketleri (sıfatlar isim gibi çekimlenir)
+NOUN_PARADIGM_POS = NOUN_POS + ("adj",)
+VERB_PARADIGM_POS = ("v",)
+
+
+class Paradigm:
+    """
+    Bir kökün paradigma tablosu.
+
+    `forms` hücre anahtarı → yüzey formu eşlemesidir (geçersiz hücre: None):
+        isim: (çoğul, iyelik, hal)      fiil: (zaman, şahıs, olumsuz)
+    Önbellekte paylaşıldığı için değiştirilmemelidir.
+    """
+
+    __slots__ = ("stem", "type", "forms")
+
+    def __init__(self, stem: str, type: str, forms: dict):
+        self.stem = stem
+        self.type = type
+        self.forms = forms
+
+    def form(self, *cell) -> Optional[str]:
+        """Hücrenin formu; geçersizse None."""
+        return self.forms.get(cell)
+
+    def to_record(self) -> dict:
+        """Dışa aktarma kaydı: hücre anahtarları "sg|A1|A5" biçiminde."""
+        return {
+            "stem": self.stem,
+            "type": self.type,
+            "forms": {_cell_key(self.type, cell): word for cell, word in self.forms.items()},
+        }
+
+    def __repr__(self) -> str:
+        return f"Paradigm({self.stem!r}, {self.type!r}, forms={len(self.forms)})"
+
+
+def _cell_key(kind: str, cell: tuple) -> str:
+    if kind == "noun":
+        plural, poss, case = cell
+        return f"{'pl' if plural else 'sg'}|{poss or '0'}|{case or '0'}"
+    tense, person, negative = cell
+    return f"{tense}|{person}|{'neg' if negative else 'pos'}"
+
+
+def build_noun_paradigm(generator: MorphologicalGenerator, stem: str) -> Paradigm:
+    """İsim paradigması: 2 sayı × 6 iyelik × 6 hal."""
+    forms = generator.noun_paradigm(stem, NOUN_POSSESSIVES, NOUN_CASES)
+    return Paradigm(stem, "noun", forms)
+
+
+def build_verb_paradigm(generator: MorphologicalGenerator, stem: str) -> Paradigm:
+    """Fiil paradigması: 7 zaman × 6 şahıs × olumlu/olumsuz."""
+    grid = generator.verb_paradigm(stem, VERB_TENSES, VERB_PERSONS)
+    forms = {cell: r.word if r.is_valid else None for cell, r in grid.items()}
+    return Paradigm(stem, "verb", forms)
+
+
+_BUILDERS = {"noun": build_noun_paradigm, "verb": build_verb_paradigm}
+
+
+# ==============================================================================
+#  PARADİGMA ÖNBELLEĞİ
+# ==============================================================================
+
+class ParadigmCache:
+    """
+    İş parçacığı güvenli LRU paradigma önbelleği.
+
+    Anahtar (tür, kök) çiftidir. Generator'ın sözlüğü yeniden yüklenirse
+    (Lexicon.generation değişince) önbellek boşaltılır.
+
+    Args:
+        generator: Tabloları üreten MorphologicalGenerator
+        maxsize: En fazla tablo sayısı
+    """
+
+    def __init__(self, generator: MorphologicalGenerator, maxsize: int = 2048):
+        if maxsize <= 0:
+            raise ValueError("maxsize pozitif olmalı")
+        self.generator = generator
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = self._lexicon_generation()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lexicon_generation(self):
+        lexicon = self.generator.lexicon
+        return lexicon.generation if lexicon is not None else None
+
+    def noun(self, stem: str) -> Paradigm:
+        """Kökün isim paradigması."""
+        return self.get("noun", stem)
+
+    def verb(self, stem: str) -> Paradigm:
+        """Kökün fiil paradigması."""
+        return self.get("verb", stem)
+
+    def get(self, kind: str, stem: str) -> Paradigm:
+        """Tablo önbellekte yoksa üretilir ve eklenir."""
+        if kind not in _BUILDERS:
+            raise ValueError(f"Geçersiz paradigma türü: {kind!r}")
+        key = (kind, stem)
+        generation = self._lexicon_generation()
+        with self._lock:
+            if generation != self._generation:
+                self._data.clear()
+                self._generation = generation
+            paradigm = self._data.get(key)
+            if paradigm is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return paradigm
+            self.misses += 1
+
+        paradigm = _BUILDERS[kind](self.generator, stem)
+        with self._lock:
+            self._data[key] = paradigm
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return paradigm
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"ParadigmCache(size={len(self._data)}, maxsize={self.maxsize})"
+
+
+# ==============================================================================
+#  TOPLU DIŞA AKTARMA
+# ==============================================================================
+
+# İşçiye bir seferde verilen kök sayısı
+EXPORT_CHUNK = 256
+
+_POOL_GENERATOR: Optional[MorphologicalGenerator] = None
+
+
+def paradigm_jobs(lexicon, pos: Optional[Iterable[str]] = None) -> list[tuple[str, str, str]]:
+    """
+    Dışa aktarılacak (kök, POS, tür) üçlüleri, köke göre sıralı.
+
+    Args:
+        pos: Yalnızca bu POS etiketleri (None → paradigması olan tüm türler)
+    """
+    wanted = set(pos) if pos is not None else None
+    jobs = []
+    for stem in sorted(lexicon.all_words()):
+        seen = set()
+        for entry in lexicon.lookup(stem):
+            if wanted is not None and entry.pos not in wanted:
+                continue
+            if entry.pos in NOUN_PARADIGM_POS:
+                kind = "noun"
+            elif entry.pos in VERB_PARADIGM_POS:
+                kind = "verb"
+            else:
+                continue
+            if kind not in seen:
+                seen.add(kind)
+                jobs.append((stem, entry.pos, kind))
+    return jobs
+
+
+def _export_lines(generator: MorphologicalGenerator, jobs: list[tuple]) -> list[str]:
+    lines = []
+    for stem, pos, kind in jobs:
+        record = _BUILDERS[kind](generator, stem).to_record()
+        record = {"stem": stem, "pos": pos, "type": kind, "forms": record["forms"]}
+        lines.append(json.dumps(record, ensure_ascii=False))
+    return lines
+
+
+def _pool_init(generator, lexicon):
+    global _POOL_GENERATOR
+    _POOL_GENERATOR = generator if generator is not None else MorphologicalGenerator(lexicon)
+
+
+def _pool_export(jobs: list[tuple]) -> list[str]:
+    return _export_lines(_POOL_GENERATOR, jobs)
+
+
+def export_paradigms(lexicon, path: str, pos: Optional[Iterable[str]] = None,
+                     workers: Optional[int] = None) -> int:
+    """
+    Paradigmaları gzip'li JSON Lines olarak yazar; yazılan kayıt sayısını döndürür.
+
+    Her satır {"stem", "pos", "type", "forms": {"sg|A1|A5": "...", ...}}
+    nesnesidir (geçersiz hücre: null). Çıktı işçi sayısından bağımsızdır.
+
+    Args:
+        lexicon: Yüklü sözlük
+        path: Çıktı dosyası (ör. paradigms.jsonl.gz)
+        pos: POS alt kümesi (ör. ["n", "v"])
+        workers: Süreç sayısı (None/1 → tek süreç)
+    """
+    jobs = paradigm_jobs(lexicon, pos)
+    chunks = [jobs[i:i + EXPORT_CHUNK] for i in range(0, len(jobs), EXPORT_CHUNK)]
+    generator = MorphologicalGenerator(lexicon)
+
+    with open(path, "wb") as raw:
+        # mtime=0 ve boş dosya adı: gzip başlığı da belirlenimli olsun
+        with gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as gz:
+            out = io.TextIOWrapper(gz, encoding="utf-8", newline="\n")
+            if workers and workers > 1:
+                if "fork" in multiprocessing.get_all_start_methods():
+                    ctx = multiprocessing.get_context("fork")
+                    initargs = (generator, None)
+                else:
+                    ctx = multiprocessing.get_context()
+                    initargs = (None, lexicon)
+                with ctx.Pool(workers, initializer=_pool_init, initargs=initargs) as pool:
+                    for lines in pool.imap(_pool_export, chunks):
+                        out.writelines(line + "\n" for line in lines)
+            else:
+                for chunk in chunks:
+                    out.writelines(line + "\n" for line in _export_lines(generator, chunk))
+            out.flush()
+            out.detach()
+    return len(jobs)
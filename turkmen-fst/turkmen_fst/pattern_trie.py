@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Ters Ek Kalıbı Trie'si (pattern_trie.py)
+
+Kalıp tabanlı alt çözümleyiciler (parse_infinitive, parse_derivation,
+parse_derived_verb, parse_predicative, parse_abbreviation) kelimenin
+sonunu kendi ek listeleriyle `endswith` ile tek tek karşılaştırır. Bu modül
+tüm listeleri tek bir ters harf trie'sinde birleştirir: kelimenin sağdan
+sola tek yürüyüşü her (tablo, kalıp) eşleşmesini bölünme noktasıyla verir
+ve alt çözümleyiciler yalnızca gerçekten eşleşen kalıpları işler.
+
+Eşleşmeler tablo içinde kalıbın liste sırasıyla döner; alt çözümleyicilerin
+sonuç sırası ve erken çıkışları değişmez.
+
+SuffixPatternScan aynı arayüzü trie'siz, her kalıbı `endswith` ile
+tarayarak sağlar; gölge modun referans çözümleyicisi onu kullanır.
+
+Kullanım:
+    trie = SuffixPatternTrie({"inf": ["mak", "mek"], "drv": ["ly", "li"]})
+    trie.matches("okamak")["inf"]    # ((0, 3),)  → kalıp 0, kök "oka"
+"""
+
+from __future__ import annotations
+from typing import Optional
+
+
+_EMPTY: tuple = ()
+
+
+class SuffixPatternTrie:
+    """
+    Adlandırılmış ek tablolarının ters (sağdan sola) trie'si.
+
+    Geçişler `_delta[(durum << 21) | ord(harf)]` sözlüğündedir; durum 0
+    köktür. `_out` durum → ((tablo, kalıp sırası), ...) eşlemesidir.
+
+    Args:
+        tables: Tablo adı → ek listesi (liste sırası = kalıp sırası)
+    """
+
+    def __init__(self, tables: dict[str, list[str]]):
+        self._delta: dict[int, int] = {}
+        self._out: dict[int, tuple] = {}
+        self._num_states = 1
+        self.tables = tuple(tables)
+        out: dict[int, list] = {}
+        for table, suffixes in tables.items():
+            for index, suffix in enumerate(suffixes):
+                if not suffix:
+                    raise ValueError(f"Boş ek kalıbı: {table}[{index}]")
+                out.setdefault(self._insert(suffix), []).append((table, index))
+        self._out = {state: tuple(items) for state, items in out.items()}
+        self._last: tuple = (None, None)
+
+    def _insert(self, suffix: str) -> int:
+        state = 0
+        delta = self._delta
+        for ch in reversed(suffix):
+            key = (state << 21) | ord(ch)
+            nxt = delta.get(key)
+            if nxt is None:
+                nxt = self._num_states
+                self._num_states += 1
+                delta[key] = nxt
+            state = nxt
+        return state
+
+    def walk(self, word: str, end: Optional[int] = None) -> list[tuple[str, int, int]]:
+        """
+        word[:end]'in sonuyla eşleşen tüm kalıplar: (tablo, kalıp sırası,
+        bölünme noktası), kısa ekten uzuna. Kök word[:bölünme]'dir.
+        """
+        if end is None:
+            end = len(word)
+        delta = self._delta
+        out = self._out
+        found = []
+        state = 0
+        for i in range(end - 1, -1, -1):
+            state = delta.get((state << 21) | ord(word[i]))
+            if state is None:
+                break
+            items = out.get(state)
+            if items is not None:
+                for table, index in items:
+                    found.append((table, index, i))
+        return found
+
+    def matches(self, word: str) -> dict[str, tuple[tuple[int, int], ...]]:
+        """
+        Tablo → ((kalıp sırası, bölünme noktası), ...) eşlemesi; her tabloda
+        liste sırasıyla. Sonuç salt okunurdur.
+
+        Aynı kelimenin ardışık alt çözümleyicileri tek yürüyüşü paylaşır
+        (son kelimenin sonucu saklanır).
+        """
+        last_word, last = self._last
+        if last_word == word:
+            return last
+        delta = self._delta
+        out = self._out
+        grouped: dict[str, list] = {}
+        state = 0
+        for i in range(len(word) - 1, -1, -1):
+            state = delta.get((state << 21) | ord(word[i]))
+            if state is None:
+                break
+            items = out.get(state)
+            if items is not None:
+                for table, index in items:
+                    found = grouped.get(table)
+                    if found is None:
+                        grouped[table] = [(index, i)]
+                    else:
+                        found.append((index, i))
+        for table, found in grouped.items():
+            if len(found) > 1:
+                found.sort()
+            grouped[table] = tuple(found)
+        self._last = (word, grouped)
+        return grouped
+
+    def table_matches(self, word: str, table: str,
+                      end: Optional[int] = None) -> tuple[tuple[int, int], ...]:
+        """Tek tablonun word[:end] sonundaki eşleşmeleri, liste sırasıyla."""
+        if end is None or end == len(word):
+            return self.matches(word).get(table, _EMPTY)
+        return tuple(sorted((index, split) for name, index, split in self.walk(word, end)
+                            if name == table))
+
+    @property
+    def num_states(self) -> int:
+        return self._num_states
+
+    def __repr__(self) -> str:
+        return f"SuffixPatternTrie(tables={len(self.tables)}, states={self._num_states})"
+
+
+class SuffixPatternScan:
+    """
+    SuffixPatternTrie.table_matches() ile aynı sonucu her kalıbı `endswith`
+    ile tek tek deneyerek veren doğrusal tarama (referans yol).
+
+    Args:
+        tables: Tablo adı → ek listesi (liste sırası = kalıp sırası)
+    """
+
+    def __init__(self, tables: dict[str, list[str]]):
+        self._tables = {table: tuple(suffixes) for table, suffixes in tables.items()}
+        self.tables = tuple(tables)
+
+    def table_matches(self, word: str, table: str,
+                      end: Optional[int] = None) -> tuple[tuple[int, int], ...]:
+        """Tek tablonun word[:end] sonundaki eşleşmeleri, liste sırasıyla."""
+        w = word if end is None else word[:end]
+        return tuple((index, len(w) - len(suffix))
+                     for index, suffix in enumerate(self._tables[table]) if w.endswith(suffix))
+
+    def __repr__(self) -> str:
+        return f"SuffixPatternScan(tables={len(self.tables)})"
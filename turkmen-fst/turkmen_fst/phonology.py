@@ -14,6 +14,7 @@ Mevcut morphology.py'den ayıklanmış ve modülerleştirilmiş versiyon.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 
@@ -126,6 +127,63 @@ YUVARLAKLASMA_LISTESI = {
 }
 
 
+# Önbellekte tutulan en fazla kök/gövde profili
+PROFILE_CACHE_SIZE = 65536
+
+
+# ==============================================================================
+#  KÖK PROFİLİ
+# ==============================================================================
+
+class StemProfile:
+    """
+    Bir kökün (veya ara gövdenin) ek seçimini belirleyen ses özellikleri.
+
+    Üreticiler aynı kök için get_vowel_quality, has_rounded_vowel vb.
+    fonksiyonları her çekimde yeniden çağırmak yerine bu profili kullanır.
+    Değerler PhonologyRules fonksiyonlarıyla birebir aynıdır.
+
+    Attributes:
+        word: Küçük harfli kök
+        quality: Son ünlüye göre "yogyn" / "ince"
+        rounded: Kökte yuvarlak ünlü var mı
+        ends_vowel: Son harf ünlü mü
+        last_vowel: Son ünlü (yoksa None)
+        final: Son harf ("" boş kökte)
+        vowel_count: Ünlü (hece) sayısı
+        single_rounded: Tek heceli ve ünlüsü yuvarlak mı
+        softenable: Son harf p/ç/t/k mı (yumuşamaya aday)
+        drop_candidate: Ünlüyle başlayan ek öncesi ünlü düşmesine aday mı
+    """
+
+    __slots__ = ("word", "quality", "rounded", "ends_vowel", "last_vowel", "final",
+                 "vowel_count", "single_rounded", "softenable", "drop_candidate")
+
+    def __init__(self, word: str):
+        word = word.lower()
+        vowels = [ch for ch in word if ch in VowelSystem.ALL]
+        self.word = word
+        self.last_vowel = vowels[-1] if vowels else None
+        self.quality = "ince" if self.last_vowel in VowelSystem.INCE else "yogyn"
+        self.rounded = any(ch in VowelSystem.DODAK for ch in vowels)
+        self.final = word[-1:]
+        self.ends_vowel = self.final in VowelSystem.ALL
+        self.vowel_count = len(vowels)
+        self.single_rounded = len(vowels) == 1 and vowels[0] in VowelSystem.DODAK
+        self.softenable = self.final in SOFTENING_TABLE
+        self.drop_candidate = word in VOWEL_DROP_EXCEPTIONS or word in VOWEL_DROP_CANDIDATES
+
+    def __repr__(self) -> str:
+        return (f"StemProfile({self.word!r}, quality={self.quality!r}, "
+                f"rounded={self.rounded}, ends_vowel={self.ends_vowel})")
+
+
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def stem_profile(word: str) -> StemProfile:
+    """Kelimenin (önbellekli) ses profili; profil nesneleri değiştirilmemelidir."""
+    return StemProfile(word)
+
+
 # ==============================================================================
 #  FONOLOJİ KURALLARI
 # ==============================================================================
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — İşçiler Arası Paylaşılan Sözlük (preload.py)
+
+Her gunicorn / uvicorn işçisi sözlüğü kendisi yükleyip türetilmiş
+yapıları (StemTrie, ek kuyruğu otomatı, SymSpell dizini, öneri kuyruğu
+tablosu) kendisi kurarsa bellek işçi sayısıyla çoğalır ve işçi açılışı
+saniyeler sürer. Bu modül iki şey sağlar:
+
+    - shared_lexicon(): süreçteki tek Lexicon. api.py, app.py ve
+      parser.py aynı nesneyi kullanır (aynı süreçte ikinci kopya olmaz).
+    - warm(): paylaşılan yapıları kurar. Soğuk başlangıçta bunlar ilk
+      istekte kurulur ve ~7 sn sürer (istek zaman aşımı 10 sn); uzun
+      ömürlü sunucular istek almadan önce çağırır (api.py varsayılan
+      olarak, app.py TURKMEN_FST_WARM=1 ile). Yapılar zaten kuruluysa
+      maliyeti yoktur. Sunucusuz dağıtımda (app.py, vercel) çağrılmaz:
+      her soğuk başlangıç yalnızca hazır snapshot'ı eşler, yapılar
+      gerektikçe kurulur.
+    - preload(): tembel snapshot girişlerini çözer, warm()'ı çağırır ve
+      nesneleri gc.freeze() ile kalıcı nesle taşır. Yalnızca gunicorn
+      `preload_app` ile ana süreçte, işçiler fork edilmeden önce
+      (when_ready) çağrılır; işçiler hepsini hazır devralır ve sayfaları
+      kopyalamadan paylaşır.
+
+gunicorn.conf.py:
+    preload_app = True
+    from turkmen_fst.preload import when_ready, pre_fork
+
+Snapshot dosyası (data/turkmence_sozluk.txt.snap) depoyla gelir ve
+`python -m turkmen_fst snapshot` ile yeniden oluşturulur; sunucu
+süreçleri snapshot yazmaz. Fork kullanmayan işçiler (uvicorn --workers)
+sözlüğü aynı dosyadan eşler; türetilmiş yapıları ise her işçi açılışta
+warm() ile kendisi kurar.
+"""
+
+from __future__ import annotations
+import gc
+import os
+import threading
+import time
+from typing import Optional
+
+from turkmen_fst.lexicon import Lexicon, SNAPSHOT_SUFFIX
+from turkmen_fst.stem_trie import StemTrie
+from turkmen_fst.tail_automaton import SuffixTailAutomaton
+from turkmen_fst.fuzzy import SymSpellIndex
+from turkmen_fst.suggest import SuffixTailTable
+
+
+# ==============================================================================
+#  PAYLAŞILAN SÖZLÜK
+# ==============================================================================
+
+_lexicon: Optional[Lexicon] = None
+_lexicon_lock = threading.Lock()
+
+
+def find_lexicon_path() -> str:
+    """Sözlük dosyasını bul (paket verisi, depo kökü)."""
+    candidates = [
+        os.path.join(os.path.dirname(__file__), "..", "data", "turkmence_sozluk.txt"),
+        os.path.join(os.path.dirname(__file__), "..", "..", "turkmence_sozluk.txt"),
+    ]
+    for path in candidates:
+        real = os.path.realpath(path)
+        if os.path.exists(real):
+            return real
+    return ""
+
+
+def shared_lexicon(path: Optional[str] = None) -> Lexicon:
+    """
+    Süreçteki paylaşılan sözlük.
+
+    İlk çağrıda yüklenir (yanında güncel snapshot varsa bellek eşlemeli);
+    sonraki çağrılar aynı nesneyi döndürür ve `path`'i yok sayar.
+
+    Args:
+        path: Sözlük dosyası (None → find_lexicon_path())
+    """
+    global _lexicon
+    with _lexicon_lock:
+        if _lexicon is None:
+            lexicon = Lexicon()
+            path = path or find_lexicon_path()
+            if path:
+                lexicon.load(path, use_snapshot=True)
+            _lexicon = lexicon
+        return _lexicon
+
+
+# ==============================================================================
+#  ÖNYÜKLEME
+# ==============================================================================
+
+def warm(lexicon: Optional[Lexicon] = None) -> float:
+    """
+    StemTrie, SuffixTailAutomaton, SymSpellIndex ve SuffixTailTable'ı
+    kurar (for_lexicon önbelleklerine).
+
+    Args:
+        lexicon: Isıtılacak sözlük (None → shared_lexicon())
+    Returns:
+        Geçen süre (sn)
+    """
+    started = time.perf_counter()
+    if lexicon is None:
+        lexicon = shared_lexicon()
+    StemTrie.for_lexicon(lexicon)
+    SuffixTailAutomaton.for_lexicon(lexicon)
+    SymSpellIndex.for_lexicon(lexicon)
+    SuffixTailTable.for_lexicon(lexicon)
+    return time.perf_counter() - started
+
+
+def preload(lexicon: Optional[Lexicon] = None, write_snapshot: bool = False,
+            freeze: bool = True) -> dict:
+    """
+    Sözlüğe bağlı her şeyi fork öncesinde kurar.
+
+    1. write_snapshot=True ve sözlük metinden yüklendiyse snapshot
+       yazılır ve sözlük ondan yeniden yüklenir (dizin yazılamıyorsa düz
+       sözlükle devam edilir).
+    2. Tembel snapshot girişleri çözülür (işçiler çözülmüş girişleri
+       devralır).
+    3. warm(): paylaşılan yapılar kurulur.
+    4. freeze=True ise gc.collect() + gc.freeze(): işçilerdeki çöp
+       toplama paylaşılan nesnelere dokunmaz, sayfalar kopyalanmaz.
+
+    Args:
+        lexicon: Önyüklenecek sözlük (None → shared_lexicon())
+        write_snapshot: Snapshot yoksa yazılsın mı? (derleme adımı)
+        freeze: Nesneler kalıcı nesle taşınsın mı?
+    Returns:
+        {"seconds", "lexicon_words", "mapped", "frozen"}
+    """
+    started = time.perf_counter()
+    if lexicon is None:
+        lexicon = shared_lexicon()
+
+    source = lexicon.source_path
+    if write_snapshot and source and not lexicon.is_mapped:
+        snapshot = source + SNAPSHOT_SUFFIX
+        try:
+            lexicon.save_snapshot(snapshot, source)
+            lexicon.load_snapshot(snapshot, source)
+        except OSError:
+            pass  # salt okunur dizin — düz sözlükle devam
+
+    for word in lexicon.all_words():
+        lexicon.lookup(word)
+    warm(lexicon)
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return {
+        "seconds": round(time.perf_counter() - started, 3),
+        "lexicon_words": lexicon.word_count,
+        "mapped": lexicon.is_mapped,
+        "frozen": gc.get_freeze_count(),
+    }
+
+
+# ==============================================================================
+#  GUNICORN KANCALARI
+# ==============================================================================
+#
+#  Çöp toplama ana süreçte açık kalır; fork'tan hemen önce gc.freeze() o ana
+#  kadarki nesneleri kalıcı nesle taşır. İşçilerdeki toplama bunlara
+#  dokunmaz (sayfalar kopyalanmaz), işçide yeni oluşan nesneler ise normal
+#  toplanır.
+
+def when_ready(server) -> None:
+    """Uygulama ana süreçte yüklendi, işçiler henüz fork edilmedi."""
+    stats = preload()
+    server.log.info("TurkmenFST önyüklendi: %d kelime, %.2f sn, snapshot=%s",
+                    stats["lexicon_words"], stats["seconds"], stats["mapped"])
+
+
+def pre_fork(server, worker) -> None:
+    """Ana süreçte sonradan oluşan nesneleri de dondurur."""
+    gc.freeze()
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Çözümleme Profili (profiling.py)
+
+MorphologicalAnalyzer.parse() alt çözümleyicilerinin (parse_noun,
+parse_verb, …, kopula denemesi) her biri için duvar saati süresini,
+generator çağrı sayısını, denenen kök adayı sayısını ve eşleşme sayısını
+ölçer. Ölçüm isteğe bağlıdır: analizöre profiler bağlanmadıkça maliyeti
+aşama başına tek bir `None` kontrolüdür.
+
+Her parse() sonunda bir ParseRecord oluşturulur ve bağlı çıkışlara
+(sink) verilir:
+    - MemorySink: toplam sayaçlar ve en yavaş kelimeler
+    - PrometheusSink: MemorySink + Prometheus metin biçimi (/metrics)
+    - JsonLogSink: kayıt başına bir JSON satırı (logging)
+
+Aşama içinden çağrılan çözümleyiciler (parse_predicative → parse_verb,
+kopula denemesindeki özyinelemeli parse) dıştaki aşamaya sayılır.
+
+Kullanım:
+    metrics = PrometheusSink()
+    analyzer = MorphologicalAnalyzer(lexicon, profiler=ParseProfiler(metrics))
+    analyzer.parse("kitabym")
+    print(metrics.render())
+"""
+
+from __future__ import annotations
+import heapq
+import json
+import logging
+import threading
+import time
+from typing import Optional
+
+
+# Alt çözümleyici aşamaları (parse() çalıştırma sırasıyla)
+STAGES = ("abbreviation", "noun", "verb", "infinitive", "derived_verb",
+          "derivation", "pronoun", "predicative", "copula")
+
+# MemorySink'in tuttuğu en yavaş kelime sayısı
+HOT_WORDS = 20
+
+
+class StageStats:
+    """Bir aşamanın sayaçları (tek çözümlemede veya toplamda)."""
+
+    __slots__ = ("calls", "seconds", "generator_calls", "candidates", "matches")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.generator_calls = 0
+        self.candidates = 0
+        self.matches = 0
+
+    def add(self, other: "StageStats") -> None:
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.generator_calls += other.generator_calls
+        self.candidates += other.candidates
+        self.matches += other.matches
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "seconds": round(self.seconds, 6),
+            "generator_calls": self.generator_calls,
+            "candidates": self.candidates,
+            "matches": self.matches,
+        }
+
+
+class ParseRecord:
+    """Tek parse() çağrısının profili."""
+
+    __slots__ = ("word", "seconds", "cached", "results", "stages")
+
+    def __init__(self, word: str):
+        self.word = word
+        self.seconds = 0.0
+        self.cached = False
+        self.results = 0
+        self.stages: dict[str, StageStats] = {}
+
+    @property
+    def generator_calls(self) -> int:
+        return sum(s.generator_calls for s in self.stages.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "word": self.word,
+            "seconds": round(self.seconds, 6),
+            "cached": self.cached,
+            "results": self.results,
+            "stages": {name: s.to_dict() for name, s in self.stages.items()},
+        }
+
+
+class CountingGenerator:
+    """Generator sarmalayıcı: generate() çağrılarını profiler'a sayar."""
+
+    def __init__(self, generator, profiler: "ParseProfiler"):
+        self._generator = generator
+        self._profiler = profiler
+
+    def generate(self, *args, **kwargs):
+        self._profiler.count_generation()
+        return self._generator.generate(*args, **kwargs)
+
+    def generate_all(self, *args, **kwargs):
+        grid = self._generator.generate_all(*args, **kwargs)
+        self._profiler.count_generation(len(grid))
+        return grid
+
+    def __getattr__(self, name):
+        return getattr(self._generator, name)
+
+
+class ParseProfiler:
+    """
+    parse() ölçüm noktaları; kayıtları çıkışlara dağıtır.
+
+    Ölçüm durumu iş parçacığına özeldir; aynı profiler birden çok iş
+    parçacığında kullanılabilir (çıkışlar kendi kilitlerini tutar).
+
+    Args:
+        *sinks: record(ParseRecord) metodu olan çıkışlar
+    """
+
+    def __init__(self, *sinks):
+        self.sinks = list(sinks)
+        self._local = threading.local()
+        self._wrapped: dict[int, CountingGenerator] = {}
+
+    def add_sink(self, sink) -> None:
+        self.sinks.append(sink)
+
+    # ------------------------------------------------------------------
+    #  Analizörün çağırdığı ölçüm noktaları
+    # ------------------------------------------------------------------
+
+    def begin(self, word: str) -> bool:
+        """Kelime profilini başlatır; iç içe parse() çağrısında False döner."""
+        local = self._local
+        if getattr(local, "record", None) is not None:
+            return False
+        local.record = ParseRecord(word)
+        local.stage = None
+        local.started = time.perf_counter()
+        return True
+
+    def end(self, multi) -> None:
+        """Kelime profilini bitirir ve çıkışlara verir."""
+        local = self._local
+        record = local.record
+        record.seconds = time.perf_counter() - local.started
+        local.record = None
+        local.stage = None
+        if multi is not None:
+            record.results = multi.count
+        for sink in self.sinks:
+            sink.record(record)
+
+    def cache_hit(self) -> None:
+        record = getattr(self._local, "record", None)
+        if record is not None:
+            record.cached = True
+
+    def run_stage(self, name: str, parser, word: str):
+        """parser(word)'ü `name` aşaması olarak ölçer."""
+        local = self._local
+        record = getattr(local, "record", None)
+        if record is None or local.stage is not None:
+            return parser(word)
+        stats = StageStats()
+        local.stage = stats
+        started = time.perf_counter()
+        try:
+            results = parser(word)
+        finally:
+            stats.seconds = time.perf_counter() - started
+            local.stage = None
+        stats.calls = 1
+        # Alt çözümleyiciler liste, kopula denemesi MultiAnalysisResult döndürür
+        stats.matches = len(getattr(results, "results", results))
+        previous = record.stages.get(name)
+        if previous is None:
+            record.stages[name] = stats
+        else:
+            previous.add(stats)
+        return results
+
+    def count_generation(self, n: int = 1) -> None:
+        stage = getattr(self._local, "stage", None)
+        if stage is not None:
+            stage.generator_calls += n
+
+    def count_candidates(self, n: int) -> None:
+        stage = getattr(self._local, "stage", None)
+        if stage is not None:
+            stage.candidates += n
+
+    def counting(self, generator) -> CountingGenerator:
+        """Generator'ın sayan sarmalayıcısı (generator başına bir kez oluşturulur)."""
+        wrapped = self._wrapped.get(id(generator))
+        if wrapped is None or wrapped._generator is not generator:
+            wrapped = CountingGenerator(generator, self)
+            self._wrapped[id(generator)] = wrapped
+        return wrapped
+
+
+# ==============================================================================
+#  ÇIKIŞLAR
+# ==============================================================================
+
+class MemorySink:
+    """
+    Bellek içi toplam sayaçlar.
+
+    Args:
+        hot_words: Tutulan en yavaş kelime sayısı
+    """
+
+    def __init__(self, hot_words: int = HOT_WORDS):
+        self.hot_words = hot_words
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.parses = 0
+            self.cache_hits = 0
+            self.seconds = 0.0
+            self.stages: dict[str, StageStats] = {}
+            self._hot: list[tuple[float, str]] = []  # en-yığın (süre, kelime)
+
+    def record(self, record: ParseRecord) -> None:
+        with self._lock:
+            self.parses += 1
+            self.seconds += record.seconds
+            if record.cached:
+                self.cache_hits += 1
+            for name, stats in record.stages.items():
+                total = self.stages.get(name)
+                if total is None:
+                    total = self.stages[name] = StageStats()
+                total.add(stats)
+            if self.hot_words and not record.cached:
+                item = (record.seconds, record.word)
+                if len(self._hot) < self.hot_words:
+                    heapq.heappush(self._hot, item)
+                elif item > self._hot[0]:
+                    heapq.heapreplace(self._hot, item)
+
+    def hot(self) -> list[tuple[str, float]]:
+        """En yavaş kelimeler, (kelime, sn) yavaştan hızlıya."""
+        with self._lock:
+            return [(word, seconds) for seconds, word in sorted(self._hot, reverse=True)]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            stages = {name: self.stages[name].to_dict()
+                      for name in STAGES if name in self.stages}
+            return {
+                "parses": self.parses,
+                "cache_hits": self.cache_hits,
+                "seconds": round(self.seconds, 6),
+                "stages": stages,
+            }
+
+
+# (metrik adı, StageStats alanı, açıklama)
+_STAGE_METRICS = (
+    ("turkmen_fst_stage_calls_total", "calls", "Alt çözümleyici çağrı sayısı"),
+    ("turkmen_fst_stage_seconds_total", "seconds", "Alt çözümleyicide geçen süre (sn)"),
+    ("turkmen_fst_stage_generator_calls_total", "generator_calls", "Generator çağrı sayısı"),
+    ("turkmen_fst_stage_candidates_total", "candidates", "Denenen kök adayı sayısı"),
+    ("turkmen_fst_stage_matches_total", "matches", "Bulunan çözümleme sayısı"),
+)
+
+
+class PrometheusSink(MemorySink):
+    """MemorySink sayaçlarını Prometheus metin biçiminde (0.0.4) sunar."""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def render(self) -> str:
+        snap = self.snapshot()
+        lines = []
+
+        def counter(name, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in samples:
+                lines.append(f"{name}{labels} {value}")
+
+        counter("turkmen_fst_parses_total", "parse() çağrı sayısı", [("", snap["parses"])])
+        counter("turkmen_fst_parse_cache_hits_total", "Önbellekten dönen parse() sayısı",
+                [("", snap["cache_hits"])])
+        counter("turkmen_fst_parse_seconds_total", "parse() içinde geçen süre (sn)",
+                [("", snap["seconds"])])
+        for name, field, help_text in _STAGE_METRICS:
+            counter(name, help_text, [(f'{{stage="{stage}"}}', stats[field])
+                                      for stage, stats in snap["stages"].items()])
+        return "\n".join(lines) + "\n"
+
+
+class JsonLogSink:
+    """
+    Her kaydı bir JSON satırı olarak loglar.
+
+    Args:
+        logger: Hedef logger (None → "turkmen_fst.profile")
+        min_seconds: Bundan hızlı çözümlemeler loglanmaz (yavaş kelime avı)
+        level: Log seviyesi
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None,
+                 min_seconds: float = 0.0, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger("turkmen_fst.profile")
+        self.min_seconds = min_seconds
+        self.level = level
+
+    def record(self, record: ParseRecord) -> None:
+        if record.seconds < self.min_seconds:
+            return
+        self.logger.log(self.level, json.dumps(record.to_dict(), ensure_ascii=False))
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Gölge Mod Fark Denetleyicisi (shadow.py)
+
+MorphologicalAnalyzer'ın davranışı üret-ve-karşılaştır döngüsüyle
+tanımlıdır; hızlandırmalar (form dizinleri, FST, önbellek, kök trie'si,
+ek kuyruğu otomatı, ek kalıbı trie'si, bilinen form kümesi) bu döngüyle
+aynı sonucu vermek zorundadır. Bu modül hızlı yolun sonucunu tüm
+hızlandırmaları kapalı ReferenceAnalyzer'ınkiyle karşılaştırır ve
+farkları, iki yolun sürelerini JSON Lines günlüğüne yazar.
+
+İki denetim türü:
+    - "analysis": parse() çözümleme (`breakdown`) kümeleri
+    - "known": is_known() kabulü ↔ referans parse()'ta bilinen çözümleme
+      var mı (yazım denetimi)
+
+İki kullanım:
+    - Canlı trafik: istek kendi hızlı yolunun sonucunu ve süresini verir
+      (enqueue() / enqueue_known()); referans çözümleme arka plan iş
+      parçacığında yapılır, istek yanıtı beklemez. Kuyruk doluysa kelime
+      atlanır (sayılır).
+    - Çevrimdışı: check_many() bir corpus'un tamamını denetler
+      (`python -m turkmen_fst shadow --file corpus.txt`). Hızlı yol
+      önbelleksiz ve profilsiz bir kopya üzerinde ölçülür.
+
+Günlük satırı:
+    {"word", "source", "check", "match", "only_fast", "only_reference",
+     "fast_ms", "reference_ms", "speedup"}
+
+Kullanım:
+    shadow = ShadowChecker(analyzer, sample_rate=0.01, log_path="shadow.jsonl")
+    if shadow.sampled():
+        shadow.enqueue("kitabym", "analyze", breakdowns(multi), seconds)
+    shadow.stats()   # checked, mismatches, speedup ...
+"""
+
+from __future__ import annotations
+import copy
+import json
+import queue
+import random
+import threading
+import time
+from typing import Iterable, Optional
+
+from turkmen_fst.analyzer import MorphologicalAnalyzer
+from turkmen_fst.pattern_trie import SuffixPatternScan
+
+
+# Canlı trafikte denetlenen istek oranı ve bekleyen kelime sınırı
+SHADOW_SAMPLE_RATE = 0.01
+SHADOW_QUEUE_SIZE = 256
+
+# stats() içinde tutulan son farklı kelime sayısı
+RECENT_MISMATCHES = 20
+
+
+class ReferenceAnalyzer(MorphologicalAnalyzer):
+    """
+    Hızlandırmasız çözümleyici: kök adayları ham ek soyma ile üretilip
+    sözlükte aranır, her aday tüm çekim kombinasyonlarıyla denenir, ek
+    kalıpları `endswith` ile taranır.
+
+    Kapalı: form dizinleri, FST, önbellek, profil, bilinen form kümesi,
+    StemTrie, ek kuyruğu otomatı, ek kalıbı trie'si. Açık kalan tek
+    hızlandırma saf fonksiyon belleğidir (stem_profile() lru_cache'i);
+    generator'lar hızlı yolla aynıdır, çünkü davranışı onlar tanımlar.
+    """
+
+    _PATTERN_TRIE = SuffixPatternScan(MorphologicalAnalyzer._PATTERN_TABLES)
+
+    def __init__(self, lexicon=None):
+        super().__init__(lexicon)
+
+    @property
+    def tail_automaton(self):
+        return None
+
+    def _generate_stem_candidates(self, word: str) -> list[str]:
+        lexicon = self.lexicon
+        if not lexicon:
+            return sorted(self._raw_stem_candidates(word), key=len, reverse=True)
+        found = [c for c in self._raw_stem_candidates(word) if lexicon.exists(c)]
+        return sorted(found, key=lambda c: (-len(c), c))
+
+    def _noun_hits(self, word: str, stem: str):
+        return None
+
+    def _verb_hits(self, word: str, stem: str):
+        return None
+
+
+def breakdowns(multi) -> frozenset:
+    """Çözümleme kümesi (sıra önemsiz)."""
+    return frozenset(r.breakdown for r in multi.results)
+
+
+def accepted(multi) -> bool:
+    """Yazım denetimi kabulü: en az bir bilinen çözümleme var mı?"""
+    return any(r.word_type != "unknown" for r in multi.results)
+
+
+# "known" denetiminde kabul kararı tek elemanlı küme olarak karşılaştırılır
+_ACCEPTED = frozenset(["known"])
+_REJECTED = frozenset()
+
+
+def _uncached(analyzer: MorphologicalAnalyzer) -> MorphologicalAnalyzer:
+    """
+    Aynı hızlı yollarla (dizinler, trie'ler, bilinen form kümesi) ama
+    önbelleksiz ve profilsiz kopya: gölge çözümlemeler canlı önbelleğe ve
+    /metrics'e karışmaz, ölçülen süre önbellek isabeti olmaz.
+    """
+    view = copy.copy(analyzer)
+    view.cache = None
+    view.profiler = None
+    return view
+
+
+class ShadowRecord:
+    """Tek kelimenin karşılaştırması."""
+
+    __slots__ = ("word", "source", "check", "only_fast", "only_reference",
+                 "fast_seconds", "reference_seconds")
+
+    def __init__(self, word: str, source: str, fast: frozenset, reference: frozenset,
+                 fast_seconds: float, reference_seconds: float, check: str = "analysis"):
+        self.word = word
+        self.source = source
+        self.check = check
+        self.only_fast = sorted(fast - reference)
+        self.only_reference = sorted(reference - fast)
+        self.fast_seconds = fast_seconds
+        self.reference_seconds = reference_seconds
+
+    @property
+    def match(self) -> bool:
+        return not self.only_fast and not self.only_reference
+
+    @property
+    def speedup(self) -> Optional[float]:
+        if self.fast_seconds <= 0:
+            return None
+        return self.reference_seconds / self.fast_seconds
+
+    def to_dict(self) -> dict:
+        speedup = self.speedup
+        return {
+            "word": self.word,
+            "source": self.source,
+            "check": self.check,
+            "match": self.match,
+            "only_fast": self.only_fast,
+            "only_reference": self.only_reference,
+            "fast_ms": round(self.fast_seconds * 1000, 3),
+            "reference_ms": round(self.reference_seconds * 1000, 3),
+            "speedup": round(speedup, 2) if speedup is not None else None,
+        }
+
+
+class ShadowChecker:
+    """
+    Hızlı çözümleyiciyi referansa karşı denetler.
+
+    Args:
+        fast: Denetlenen çözümleyici (dizinli, FST'li, önbellekli …)
+        reference: Referans çözümleyici (None → ReferenceAnalyzer(fast.lexicon))
+        sample_rate: sampled() / submit() ile denetlenen istek oranı (0–1)
+        log_path: JSON Lines günlüğü (None → günlük yazılmaz)
+        log_matches: False ise yalnızca farklı sonuçlar günlüğe yazılır
+        queue_size: Arka planda bekleyen en fazla kelime
+        seed: Örnekleme tohumu (testler için)
+    """
+
+    CHECKS = ("analysis", "known")
+
+    def __init__(self, fast: MorphologicalAnalyzer,
+                 reference: Optional[MorphologicalAnalyzer] = None,
+                 sample_rate: float = SHADOW_SAMPLE_RATE,
+                 log_path: Optional[str] = None, log_matches: bool = True,
+                 queue_size: int = SHADOW_QUEUE_SIZE, seed: Optional[int] = None):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate 0 ile 1 arasında olmalı")
+        self.fast = fast
+        self.reference = reference if reference is not None else ReferenceAnalyzer(fast.lexicon)
+        self.sample_rate = sample_rate
+        self.log_path = log_path
+        self.log_matches = log_matches
+        self._fast_view = _uncached(fast)
+        self._random = random.Random(seed)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.dropped = 0
+            self.errors = 0
+            # denetim türü → [denetlenen, fark, hızlı sn, referans sn]
+            self._totals = {check: [0, 0, 0.0, 0.0] for check in self.CHECKS}
+            self._recent: list[str] = []
+
+    @property
+    def checked(self) -> int:
+        return sum(totals[0] for totals in self._totals.values())
+
+    @property
+    def mismatches(self) -> int:
+        return sum(totals[1] for totals in self._totals.values())
+
+    # ------------------------------------------------------------------
+    #  Denetim
+    # ------------------------------------------------------------------
+
+    def check(self, word: str, source: str = "offline", fast: Optional[frozenset] = None,
+              fast_seconds: Optional[float] = None) -> ShadowRecord:
+        """
+        Çözümleme kümelerini karşılaştırır ve kaydeder.
+
+        Args:
+            word: Kelime
+            source: Günlükteki kaynak etiketi
+            fast: İsteğe hizmet eden yolun breakdowns() kümesi (None → hızlı
+                  yol önbelleksiz kopyada çalıştırılır)
+            fast_seconds: O yolun süresi
+        """
+        perf = time.perf_counter
+        if fast is None:
+            started = perf()
+            fast = breakdowns(self._fast_view.parse(word))
+            fast_seconds = perf() - started
+        started = perf()
+        reference = breakdowns(self.reference.parse(word))
+        reference_seconds = perf() - started
+        return self._record(ShadowRecord(word, source, fast, reference,
+                                         fast_seconds or 0.0, reference_seconds))
+
+    def check_known(self, word: str, source: str = "offline", known: Optional[bool] = None,
+                    fast_seconds: Optional[float] = None) -> ShadowRecord:
+        """
+        is_known() kabulünü referans parse()'ın kabulüyle karşılaştırır.
+
+        Args:
+            known: İsteğe hizmet eden yolun kararı (None → is_known()
+                   önbelleksiz kopyada çalıştırılır)
+            fast_seconds: O yolun süresi
+        """
+        perf = time.perf_counter
+        if known is None:
+            started = perf()
+            known = self._fast_view.is_known(word)
+            fast_seconds = perf() - started
+        started = perf()
+        reference = accepted(self.reference.parse(word))
+        reference_seconds = perf() - started
+        return self._record(ShadowRecord(
+            word, source, _ACCEPTED if known else _REJECTED,
+            _ACCEPTED if reference else _REJECTED,
+            fast_seconds or 0.0, reference_seconds, check="known"))
+
+    def _record(self, record: ShadowRecord) -> ShadowRecord:
+        with self._lock:
+            totals = self._totals[record.check]
+            totals[0] += 1
+            totals[2] += record.fast_seconds
+            totals[3] += record.reference_seconds
+            if not record.match:
+                totals[1] += 1
+                self._recent.append(record.word)
+                del self._recent[:-RECENT_MISMATCHES]
+        if self.log_path and (self.log_matches or not record.match):
+            line = json.dumps(record.to_dict(), ensure_ascii=False)
+            with self._log_lock, open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        return record
+
+    def check_many(self, words: Iterable[str], source: str = "offline") -> list[ShadowRecord]:
+        """Kelimelerin tamamını sırayla denetler (çevrimdışı corpus)."""
+        return [self.check(word, source) for word in words]
+
+    # ------------------------------------------------------------------
+    #  Canlı trafik
+    # ------------------------------------------------------------------
+
+    def sampled(self) -> bool:
+        """Bu istek denetlenecek mi? (sample_rate olasılığıyla)"""
+        rate = self.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and self._random.random() < rate)
+
+    def enqueue(self, word: str, source: str = "live", fast: Optional[frozenset] = None,
+                fast_seconds: Optional[float] = None) -> bool:
+        """
+        Örneklenmiş isteğin kelimesini check() için kuyruğa ekler.
+
+        Returns:
+            Kuyruğa eklendiyse True (kuyruk doluysa kelime atlanır)
+        """
+        return self._put(("analysis", word, source, fast, fast_seconds))
+
+    def enqueue_known(self, word: str, source: str = "live", known: Optional[bool] = None,
+                      fast_seconds: Optional[float] = None) -> bool:
+        """Örneklenmiş isteğin kelimesini check_known() için kuyruğa ekler."""
+        return self._put(("known", word, source, known, fast_seconds))
+
+    def submit(self, word: str, source: str = "live") -> bool:
+        """Kelimeyi örneklenirse check() için kuyruğa ekler (hızlı yol arka planda çalışır)."""
+        return self.sampled() and self.enqueue(word, source)
+
+    def submit_many(self, words: Iterable[str], source: str = "live") -> int:
+        """İstek başına tek örnekleme kararı: örneklenirse tüm kelimeler kuyruğa eklenir."""
+        if not self.sampled():
+            return 0
+        return sum(self.enqueue(word, source) for word in words)
+
+    def _put(self, item: tuple) -> bool:
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def join(self) -> None:
+        """Kuyruktaki tüm kelimeler denetlenene kadar bekler."""
+        self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="turkmen-fst-shadow",
+                                                daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            check, word, source, fast, fast_seconds = self._queue.get()
+            try:
+                if check == "known":
+                    self.check_known(word, source, fast, fast_seconds)
+                else:
+                    self.check(word, source, fast, fast_seconds)
+            except Exception:
+                # Gölge denetim canlı trafiği asla etkilememeli
+                with self._lock:
+                    self.errors += 1
+            finally:
+                self._queue.task_done()
+
+    # ------------------------------------------------------------------
+    #  Özet
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _summary(checked: int, mismatches: int, fast_seconds: float,
+                 reference_seconds: float) -> dict:
+        return {
+            "checked": checked,
+            "mismatches": mismatches,
+            "mismatch_rate": round(mismatches / checked, 6) if checked else 0.0,
+            "fast_seconds": round(fast_seconds, 6),
+            "reference_seconds": round(reference_seconds, 6),
+            "speedup": (round(reference_seconds / fast_seconds, 2)
+                        if fast_seconds > 0 else None),
+        }
+
+    def stats(self) -> dict:
+        """Toplam özet ve denetim türü başına ("checks") özet."""
+        with self._lock:
+            totals = [sum(column) for column in zip(*self._totals.values())]
+            stats = {"sample_rate": self.sample_rate}
+            stats.update(self._summary(*totals))
+            stats.update(
+                dropped=self.dropped,
+                errors=self.errors,
+                pending=self._queue.qsize(),
+                checks={check: self._summary(*values) for check, values in self._totals.items()},
+                recent_mismatches=list(self._recent),
+            )
+            return stats
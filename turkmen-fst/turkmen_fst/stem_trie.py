@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Ters Fonoloji Kök Trie'si (stem_trie.py)
+
+MorphologicalAnalyzer._raw_stem_candidates() her önek için ses
+değişimlerini geri alır ve adaylar tek tek sözlükte aranır. Bu modül aynı
+dönüşümleri ters yönde, sözlük anahtarlarına bir kez uygular: her kökün
+yüzeyde görünebileceği biçimler (yumuşamış, ünlüsü düşmüş, yuvarlaklaşmış)
+bir önek trie'sine yazılır ve kelimenin soldan sağa tek yürüyüşü sözlükte
+doğrulanmış tüm kökleri verir.
+
+İki çıktı türü vardır:
+    - önek çıktısı: kelimenin 1–12 harfi soyulmuş öneklerinde geçerli
+      (kök, yumuşama, ünlü düşmesi, yuvarlaklaşma, ä→e geri alma)
+    - tam kelime çıktısı: kelimenin kendisinde geçerli
+      (kök ve yönelme hali ä→e/i/ü/ö, a→y geri alma)
+
+Kullanım:
+    trie = StemTrie.for_lexicon(lexicon)
+    trie.candidates("kitabymyz")  # ["kitap", ...]
+"""
+
+from __future__ import annotations
+import threading
+import weakref
+
+from turkmen_fst.phonology import (
+    HARDENING_TABLE, VOWEL_DROP_CANDIDATES, VOWEL_DROP_EXCEPTIONS,
+    YUVARLAKLASMA_LISTESI
+)
+
+
+# Sert ünsüz → yumuşamış yüzey harfi (p→b, ç→j, t→d, k→g)
+_SOFTENED = {hard: soft for soft, hard in HARDENING_TABLE.items()}
+
+# En fazla soyulan ek uzunluğu
+MAX_STRIP = 12
+
+# Sözlük → (nesil, StemTrie); aynı sözlüğü kullanan analizörler paylaşır
+_SHARED: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_SHARED_LOCK = threading.Lock()
+
+
+class StemTrie:
+    """
+    Sözlük köklerinin yüzey varyantları üzerinde önek trie'si.
+
+    Geçişler `_delta[(durum << 21) | ord(harf)]` sözlüğündedir; durum 0
+    köktür. `_prefix_out` ve `_full_out` durum → kök tuple'ı eşlemeleridir.
+    """
+
+    def __init__(self):
+        self._delta: dict[int, int] = {}
+        self._prefix_out: dict[int, tuple] = {}
+        self._full_out: dict[int, tuple] = {}
+        self._num_states = 1
+
+    @classmethod
+    def build(cls, lexicon) -> "StemTrie":
+        """Sözlükteki tüm anahtarlar için trie'yi oluşturur."""
+        trie = cls()
+        prefix_out: dict[str, list] = {}
+        full_out: dict[str, list] = {}
+
+        def add(table, surface, stem):
+            if surface:
+                table.setdefault(surface, []).append(stem)
+
+        for key in lexicon.all_words():
+            if not key:
+                continue
+            add(prefix_out, key, key)
+            add(full_out, key, key)
+            last = key[-1]
+
+            # Ünsüz yumuşaması: kitap ← kitab
+            if last in _SOFTENED:
+                add(prefix_out, key[:-1] + _SOFTENED[last], key)
+
+            # Ünlü düşmesi: burun ← burn, asyl ← asl (+ yumuşamış hali)
+            dropped = []
+            if key in VOWEL_DROP_EXCEPTIONS:
+                dropped.append(VOWEL_DROP_EXCEPTIONS[key])
+            if key in VOWEL_DROP_CANDIDATES:
+                dropped.append(key[:-2] + key[-1])
+            for form in dropped:
+                add(prefix_out, form, key)
+                if form[-1] in _SOFTENED:
+                    add(prefix_out, form[:-1] + _SOFTENED[form[-1]], key)
+
+            # Yuvarlaklaşma listesi: guzy… ← guzu…
+            for orig, rounded in YUVARLAKLASMA_LISTESI.items():
+                if key.startswith(orig):
+                    add(prefix_out, rounded + key[len(orig):], key)
+
+            # Son harf yuvarlaklaşması (y ← u, i ← ü) ve ä→e
+            if last == "y":
+                add(prefix_out, key[:-1] + "u", key)
+            elif last == "i":
+                add(prefix_out, key[:-1] + "ü", key)
+            elif last == "e":
+                add(prefix_out, key[:-1] + "ä", key)
+
+            # Yönelme hali, yalnızca tam kelimede: dereje ← derejä, guzy ← guza
+            if last in "eiüö":
+                add(full_out, key[:-1] + "ä", key)
+            elif last == "y" and len(key) > 2:
+                add(full_out, key[:-1] + "a", key)
+
+        for table, out in ((prefix_out, trie._prefix_out), (full_out, trie._full_out)):
+            for surface, stems in table.items():
+                out[trie._insert(surface)] = tuple(dict.fromkeys(stems))
+        return trie
+
+    @classmethod
+    def for_lexicon(cls, lexicon) -> "StemTrie":
+        """
+        Sözlüğün paylaşılan trie'si; yoksa veya sözlük yeniden
+        yüklendiyse oluşturur (eşzamanlı çağrılar tek kurulumu bekler).
+        """
+        with _SHARED_LOCK:
+            cached = _SHARED.get(lexicon)
+            if cached is None or cached[0] != lexicon.generation:
+                cached = (lexicon.generation, cls.build(lexicon))
+                _SHARED[lexicon] = cached
+            return cached[1]
+
+    def _insert(self, surface: str) -> int:
+        state = 0
+        delta = self._delta
+        for ch in surface:
+            key = (state << 21) | ord(ch)
+            nxt = delta.get(key)
+            if nxt is None:
+                nxt = self._num_states
+                self._num_states += 1
+                delta[key] = nxt
+            state = nxt
+        return state
+
+    def candidates(self, word: str) -> list[str]:
+        """
+        Kelimenin sözlükte doğrulanmış kök adayları, uzundan kısaya.
+
+        _generate_stem_candidates() ile aynı kümeyi verir; aynı
+        uzunluktakiler arasındaki sıra belirlenimlidir.
+        """
+        w = word.lower()
+        n = len(w)
+        lo = n - MAX_STRIP
+        found: dict[str, None] = {}
+        delta = self._delta
+        prefix_out = self._prefix_out
+        state = 0
+        for i, ch in enumerate(w, 1):
+            state = delta.get((state << 21) | ord(ch))
+            if state is None:
+                break
+            if i == n:
+                for stem in self._full_out.get(state, ()):
+                    found[stem] = None
+            elif i >= lo:
+                for stem in prefix_out.get(state, ()):
+                    found[stem] = None
+        return sorted(found, key=len, reverse=True)
+
+    @property
+    def num_states(self) -> int:
+        return self._num_states
+
+    def __repr__(self) -> str:
+        return f"StemTrie(states={self._num_states})"
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Çekim Duyarlı Yazım Önerileri (suggest.py)
+
+Yanlış yazılmış kelimenin yalnızca kökünü düzeltir, ekleri korur:
+
+    1. Kelime her noktadan (kök kısmı, ek kuyruğu) diye bölünür; kuyruğun
+       tanınan bir ek zinciri olması gerekir (SuffixTailTable).
+    2. Kök kısmı SymSpellIndex ile sözlük köklerine eşlenir.
+    3. Ekler düzeltilmiş köke NounGenerator / VerbGenerator ile yeniden
+       eklenir (ünlü uyumu, yumuşama, ünlü düşmesi kökle birlikte doğar).
+    4. Adaylar klavye karışıklığı ağırlıklı uzaklıkla sıralanır.
+
+Arama kelime başına bir zaman bütçesiyle sınırlıdır; bütçe dolduğunda o
+ana kadar bulunan en iyi adaylar döndürülür.
+
+Kullanım:
+    engine = SuggestionEngine(analyzer)
+    engine.suggest("kitaplarim")   # ["kitaplarym", ...]
+"""
+
+from __future__ import annotations
+import threading
+import time
+import weakref
+
+from turkmen_fst.fuzzy import SymSpellIndex, weighted_edit_distance
+from turkmen_fst.form_index import (
+    NOUN_COMBOS, VERB_COMBOS, NOUN_POS, noun_softening_variants
+)
+from turkmen_fst.generator import NounGenerator, VerbGenerator
+from turkmen_fst.phonology import PhonologyRules, VowelSystem
+
+
+# Kelime başına arama bütçesi (ms) ve kabul edilen en büyük ağırlıklı uzaklık
+SUGGEST_BUDGET_MS = 25.0
+MAX_COST = 2.0
+
+# Ek çekimi alan isim-benzeri sözcük türleri
+INFLECTING_POS = NOUN_POS + ("adj",)
+
+# Kuyruk anahtarı: ünlü uyumu varyantları ve klavye karışıklıkları tek
+# harfe indirgenir ("larym", "lerim", "larim" → aynı anahtar); doğru
+# yüzey kökle yeniden üretimde ortaya çıkar.
+_TAIL_FOLD = str.maketrans({
+    "a": "A", "e": "A", "ä": "A", "y": "I", "i": "I", "u": "U", "ü": "U",
+    "o": "O", "ö": "O", "ý": "j", "ň": "n", "ş": "s", "ç": "c", "ž": "z",
+})
+
+# Sözlük → (nesil, SuffixTailTable)
+_SHARED: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_SHARED_LOCK = threading.Lock()
+
+
+def _stem_class(stem: str, extra=()) -> tuple:
+    """Ek yüzeyini belirleyen kök özellikleri (temsilci seçimi için)."""
+    syllables = sum(ch in VowelSystem.ALL for ch in stem)
+    return (PhonologyRules.get_vowel_quality(stem),
+            PhonologyRules.has_rounded_vowel(stem),
+            stem[-1], min(syllables, 2)) + tuple(extra)
+
+
+def _tail(stem: str, surface: str) -> str:
+    """Yüzey formunun kökle ortak önekten sonraki kısmı."""
+    i = 0
+    for a, b in zip(stem, surface):
+        if a != b:
+            break
+        i += 1
+    return surface[i:]
+
+
+def tail_key(tail: str) -> str:
+    """Ek kuyruğunun uyumdan bağımsız arama anahtarı."""
+    return tail.translate(_TAIL_FOLD)
+
+
+def _verb_surface(word: str) -> str:
+    """Üretilen fiil formunun zamirsiz kısmı ("men geljek" → "geljek")."""
+    return word.lower().split()[-1]
+
+
+class SuffixTailTable:
+    """
+    Ek kuyruğu → üretim kombinasyonları tablosu.
+
+    Sözlükteki her kök sınıfından (ünlü niteliği, yuvarlaklık, son harf,
+    hece sayısı, yumuşama) bir temsilci kök tüm NOUN_COMBOS / VERB_COMBOS
+    ile üretilir; formun kökten ayrılan kısmı kuyruk olarak kaydedilir.
+    Anahtarlar _TAIL_FOLD ile indirgenir; değerler ("n", kombinasyon_no)
+    ve ("v", kombinasyon_no) tuple'larıdır.
+    """
+
+    def __init__(self):
+        self._tails: dict[str, tuple] = {}
+        self.max_len = 0
+
+    @classmethod
+    def build(cls, lexicon) -> "SuffixTailTable":
+        """Temsilci köklerden tabloyu oluşturur (~1 sn)."""
+        noun_reps: dict[tuple, str] = {}
+        verb_reps: dict[tuple, str] = {}
+        for key in lexicon.all_words():
+            if len(key) < 2 or not key.isalpha():
+                continue
+            entries = lexicon.lookup(key)
+            if any(e.pos in INFLECTING_POS for e in entries):
+                soft = any(e.allows_softening for e in entries)
+                noun_reps.setdefault(_stem_class(key, (soft,)), key)
+            if any(e.pos == "v" for e in entries):
+                verb_reps.setdefault(_stem_class(key), key)
+
+        tails: dict[str, dict] = {}
+        noun_gen = NounGenerator(lexicon)
+        verb_gen = VerbGenerator(lexicon)
+        for stem in noun_reps.values():
+            for yumusama_izni, _ in noun_softening_variants(lexicon, stem):
+                for ci, (plural, poss, poss_type, case, daky) in enumerate(NOUN_COMBOS):
+                    try:
+                        gen = noun_gen.generate(stem, plural, poss, poss_type, case,
+                                                yumusama_izni=yumusama_izni, daky=daky)
+                    except Exception:
+                        continue
+                    if gen.is_valid:
+                        tails.setdefault(tail_key(_tail(stem, gen.word.lower())), {})[("n", ci)] = None
+        for stem in verb_reps.values():
+            for ci, (tense, person, neg) in enumerate(VERB_COMBOS):
+                try:
+                    gen = verb_gen.generate(stem, tense, person, neg)
+                except Exception:
+                    continue
+                if gen.is_valid:
+                    tails.setdefault(tail_key(_tail(stem, _verb_surface(gen.word))), {})[("v", ci)] = None
+
+        table = cls()
+        table._tails = {tail: tuple(combos) for tail, combos in tails.items() if tail}
+        table.max_len = max(map(len, table._tails), default=0)
+        return table
+
+    @classmethod
+    def for_lexicon(cls, lexicon) -> "SuffixTailTable":
+        """Sözlüğün paylaşılan tablosu; sözlük yeniden yüklendiyse yeniden kurulur."""
+        with _SHARED_LOCK:
+            cached = _SHARED.get(lexicon)
+            if cached is None or cached[0] != lexicon.generation:
+                cached = (lexicon.generation, cls.build(lexicon))
+                _SHARED[lexicon] = cached
+            return cached[1]
+
+    def get(self, tail: str) -> tuple:
+        """Kuyruğu üretebilen kombinasyonlar (tanınmıyorsa boş)."""
+        return self._tails.get(tail_key(tail), ())
+
+    def __len__(self) -> int:
+        return len(self._tails)
+
+    def __repr__(self) -> str:
+        return f"SuffixTailTable(tails={len(self._tails)}, max_len={self.max_len})"
+
+
+class SuggestionEngine:
+    """
+    Çekimli yüzey formları öneren yazım düzeltici.
+
+    Ağır yapılar (SymSpellIndex, SuffixTailTable) sözlük başına paylaşılır;
+    motor nesnesi ucuzdur ve istek başına oluşturulabilir.
+    """
+
+    def __init__(self, analyzer, budget_ms: float = SUGGEST_BUDGET_MS,
+                 max_cost: float = MAX_COST):
+        self.analyzer = analyzer
+        self.lexicon = analyzer.lexicon
+        self.budget_ms = budget_ms
+        self.max_cost = max_cost
+
+    def suggest(self, word: str, max_suggestions: int = 5) -> list[str]:
+        """
+        Kelime için en yakın geçerli formlar, en olasıdan başlayarak.
+
+        Args:
+            word: Yanlış yazılmış kelime
+            max_suggestions: En fazla öneri sayısı
+        """
+        return [form for _, form in self.rank(word)[:max_suggestions]]
+
+    def rank(self, word: str) -> list[tuple[float, str]]:
+        """(ağırlıklı uzaklık, form) çiftleri, artan uzaklık sırasıyla."""
+        w = word.lower().strip()
+        if not w or not self.lexicon:
+            return []
+        index = SymSpellIndex.for_lexicon(self.lexicon)
+        tails = SuffixTailTable.for_lexicon(self.lexicon)
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+
+        scored: dict[str, float] = {}
+        tried: set[tuple] = set()
+        # Uzun kök kısmından başla: ek yok → tüm kelime kök sayılır
+        for i in range(len(w), max(1, len(w) - tails.max_len) - 1, -1):
+            stem_part, tail = w[:i], w[i:]
+            combos = tails.get(tail) if tail else ()
+            if tail and not combos:
+                continue
+            for root in self._roots(stem_part, index):
+                if tail:
+                    forms = self._inflect(root, combos, tried)
+                else:
+                    forms = [root]
+                for form in forms:
+                    if form == w or form in scored:
+                        continue
+                    cost = weighted_edit_distance(w, form)
+                    if cost <= self.max_cost:
+                        scored[form] = cost
+                if time.perf_counter() > deadline:
+                    return self._sorted(scored)
+        return self._sorted(scored)
+
+    @staticmethod
+    def _sorted(scored: dict[str, float]) -> list[tuple[float, str]]:
+        return sorted((cost, form) for form, cost in scored.items())
+
+    def _roots(self, stem_part: str, index: SymSpellIndex) -> list[str]:
+        """Kök kısmının kendisi (sözlükteyse) ve yakın sözlük kökleri."""
+        if len(stem_part) < 2:
+            return []
+        roots = [stem_part] if self.lexicon.lookup(stem_part) else []
+        # Kısa köklerde 2 uzaklık neredeyse her şeyi eşler
+        max_distance = 1 if len(stem_part) <= 4 else 2
+        roots.extend(key for _, key in index.lookup(stem_part, max_distance))
+        return roots
+
+    def _inflect(self, root: str, combos: tuple, tried: set) -> list[str]:
+        """Kuyruğun kombinasyonlarını köke uygular (aynı kök+kombinasyon bir kez)."""
+        entries = self.lexicon.lookup(root)
+        is_noun = any(e.pos in INFLECTING_POS for e in entries)
+        is_verb = any(e.pos == "v" for e in entries)
+        forms = []
+        for combo in combos:
+            kind, ci = combo
+            if (kind == "n" and not is_noun) or (kind == "v" and not is_verb):
+                continue
+            if (root, combo) in tried:
+                continue
+            tried.add((root, combo))
+            try:
+                if kind == "n":
+                    plural, poss, poss_type, case, daky = NOUN_COMBOS[ci]
+                    for yumusama_izni, _ in noun_softening_variants(self.lexicon, root):
+                        gen = self.analyzer.noun_gen.generate(
+                            root, plural, poss, poss_type, case,
+                            yumusama_izni=yumusama_izni, daky=daky)
+                        if gen.is_valid:
+                            forms.append(gen.word.lower())
+                else:
+                    gen = self.analyzer.verb_gen.generate(root, *VERB_COMBOS[ci])
+                    if gen.is_valid:
+                        forms.append(_verb_surface(gen.word))
+            except Exception:
+                continue
+        return forms
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+TurkmenFST — Ek Kuyruğu Otomatı (tail_automaton.py)
+
+parse_noun() / parse_verb() her kök adayı için tüm çekim kombinasyonlarını
+üretip girişle karşılaştırır. Adayların çoğunda kelimenin kökten sonra
+kalan kısmı hiçbir ek dizisinin yüzeyi olamaz ("kitaplarym" için "kit" →
+"aplarym"); bu otomat böyle (kök, kelime) çiftlerini generator
+çağrılmadan eler.
+
+Kuyruk, yuvarlaklaşma anahtarlarının (u→y, ü→i) ortak önekinden sonraki
+kısımdır; kökün yumuşayan / düşen son harfleri kuyruğa dahil olur
+("kitap" → "kitaby": "by"). Kuyruğun yüzeyi yalnızca generator'ın okuduğu
+kök özelliklerine bağlıdır:
+    isim: son iki harf, ünlü niteliği, yuvarlaklık, kısa kök (≤ 4 harf),
+          yumuşama varyantları
+    fiil: son iki harf, ünlü niteliği, tek heceli yuvarlaklık, hece sayısı
+Kelimeye özgü kurallı kökler (ünlü düşmesi, yuvarlaklaşma, eş sesli,
+özel yumuşama ve yardımcı fiiller) kendi sınıflarıdır. Her sınıftan bir
+temsilci kök tüm NOUN_COMBOS / VERB_COMBOS ile üretilir; aynı kuyruk
+kümesine sahip sınıflar tek kabul bitini paylaşır.
+
+Sözlükte olmayan ve çok kelimeli kökler elenmez; otomat sonuçları
+değiştirmez.
+
+Kullanım:
+    tails = SuffixTailAutomaton.for_lexicon(lexicon)
+    tails.noun_possible("kit", rounding_key("kitaplarym"))   # False
+"""
+
+from __future__ import annotations
+import threading
+import weakref
+
+from turkmen_fst.form_index import (
+    NOUN_COMBOS, VERB_COMBOS, VERB_TENSES, VERB_PERSONS,
+    noun_softening_variants, rounding_key
+)
+from turkmen_fst.generator import NounGenerator, VerbGenerator, TEK_HECELI_YUMUSAMA_FIIL
+from turkmen_fst.lexicon import HOMONYMS
+from turkmen_fst.morphotactics import VerbMorphotactics
+from turkmen_fst.phonology import (
+    stem_profile, VOWEL_DROP_CANDIDATES, VOWEL_DROP_EXCEPTIONS, YUVARLAKLASMA_LISTESI
+)
+
+
+# Generator'ın kelimenin kendisine göre davrandığı kökler
+_NOUN_SPECIAL = (frozenset(VOWEL_DROP_CANDIDATES) | frozenset(VOWEL_DROP_EXCEPTIONS)
+                 | frozenset(YUVARLAKLASMA_LISTESI) | frozenset(HOMONYMS))
+_VERB_SPECIAL = frozenset(TEK_HECELI_YUMUSAMA_FIIL) | VerbGenerator.AUXILIARY_STEMS
+
+# Kökten bağımsız son kelimelerin kuyruk öneki (kelimelerde boşluk geçmez)
+DETACHED = " "
+
+_PRONOUNS = frozenset(VerbMorphotactics.PRONOUNS.values())
+
+# Sınıf anahtarı → kuyruk kümesi. Küme yalnızca sınıfa bağlı olduğundan
+# sözlük yeniden yüklendiğinde temsilciler tekrar üretilmez.
+_CLASS_TAILS: dict[tuple, frozenset] = {}
+
+# Sözlük → (nesil, SuffixTailAutomaton)
+_SHARED: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_SHARED_LOCK = threading.Lock()
+
+
+def tail_of(stem_key: str, word_key: str) -> str:
+    """Kelime anahtarının kök anahtarıyla ortak önekinden sonraki kısmı."""
+    i = 0
+    for a, b in zip(stem_key, word_key):
+        if a != b:
+            break
+        i += 1
+    return word_key[i:]
+
+
+def _verb_tail(stem_key: str, gen_word: str) -> str:
+    """
+    Üretilen fiil formunun kuyruğu.
+
+    Zamirden sonra birden çok kelime kalıyorsa ("gelýän däldi", "geler
+    bolsam") karşılaştırılan son kelime kökten türemez; kökten bağımsız
+    olarak DETACHED + kelime biçiminde kaydedilir.
+    """
+    tokens = gen_word.lower().split()
+    if len(tokens) > 1 and tokens[0] in _PRONOUNS:
+        tokens = tokens[1:]
+    if len(tokens) == 1:
+        return tail_of(stem_key, rounding_key(tokens[0]))
+    return DETACHED + rounding_key(tokens[-1])
+
+
+def _noun_class(lexicon, stem: str) -> tuple:
+    variants = tuple(yumusama for yumusama, _ in noun_softening_variants(lexicon, stem))
+    if stem in _NOUN_SPECIAL:
+        return (stem, variants)
+    p = stem_profile(stem)
+    return (None, stem[-2:], p.quality, p.rounded, len(stem) <= 4, variants)
+
+
+def _verb_class(stem: str) -> tuple:
+    if stem in _VERB_SPECIAL:
+        return (stem,)
+    p = stem_profile(stem)
+    return (None, stem[-2:], p.quality, p.single_rounded, min(p.vowel_count, 2))
+
+
+def _noun_tails(gen: NounGenerator, rep: str, variants: tuple) -> frozenset:
+    """Temsilci kökün tüm isim çekimlerinin kuyrukları."""
+    rep_key = rounding_key(rep)
+    profile = stem_profile(rep)
+    tails = set()
+    for yumusama_izni in variants:
+        for plural, poss, poss_type, case, daky in NOUN_COMBOS:
+            try:
+                r = gen.generate(rep, plural, poss, poss_type, case,
+                                 yumusama_izni=yumusama_izni, daky=daky, profile=profile)
+            except Exception:
+                continue
+            if r.is_valid:
+                tails.add(tail_of(rep_key, rounding_key(r.word)))
+    return frozenset(tails)
+
+
+def _verb_tails(gen: VerbGenerator, rep: str) -> frozenset:
+    """Temsilci kökün tüm fiil çekimlerinin kuyrukları."""
+    rep_key = rounding_key(rep)
+    grid = gen.generate_all(rep, VERB_TENSES, VERB_PERSONS, profile=stem_profile(rep))
+    return frozenset(_verb_tail(rep_key, r.word) for r in grid.values() if r.is_valid)
+
+
+class SuffixTailAutomaton:
+    """
+    Üretilebilir ek kuyruklarının deterministik otomatı.
+
+    Geçişler `_delta[(durum << 21) | ord(harf)]` sözlüğündedir (StemTrie
+    ile aynı kodlama); `_accept` durum → kabul eden kuyruk sınıflarının bit
+    maskesidir. Kökler `_noun_bit` / `_verb_bit` ile kendi sınıf bitine
+    eşlenir. Kuyruk yürüyüşü otomatta yolu olmayan ilk harfte durur.
+    """
+
+    def __init__(self):
+        self._delta: dict[int, int] = {}
+        self._accept: dict[int, int] = {}
+        self._num_states = 1
+        self._noun_bit: dict[str, int] = {}
+        self._verb_bit: dict[str, int] = {}
+        self._num_classes = 0
+
+    @classmethod
+    def build(cls, lexicon) -> "SuffixTailAutomaton":
+        """Sözlükteki tüm anahtarlar için otomatı oluşturur (ilk kurulum ~4 sn)."""
+        noun_members: dict[tuple, list[str]] = {}
+        verb_members: dict[tuple, list[str]] = {}
+        for stem in lexicon.all_words():
+            # Çok kelimeli kökler tek kelimelik kuyruk modeline uymaz; elenmezler
+            if not stem or " " in stem:
+                continue
+            noun_members.setdefault(_noun_class(lexicon, stem), []).append(stem)
+            verb_members.setdefault(_verb_class(stem), []).append(stem)
+
+        automaton = cls()
+        bits: dict[frozenset, int] = {}
+
+        noun_gen = NounGenerator(lexicon)
+        for key, members in noun_members.items():
+            tails = _CLASS_TAILS.get(("n",) + key)
+            if tails is None:
+                tails = _noun_tails(noun_gen, members[0], key[-1])
+                _CLASS_TAILS[("n",) + key] = tails
+            bit = automaton._class_bit(bits, tails)
+            for stem in members:
+                automaton._noun_bit[stem] = bit
+
+        verb_gen = VerbGenerator(lexicon)
+        for key, members in verb_members.items():
+            tails = _CLASS_TAILS.get(("v",) + key)
+            if tails is None:
+                tails = _verb_tails(verb_gen, members[0])
+                _CLASS_TAILS[("v",) + key] = tails
+            bit = automaton._class_bit(bits, tails)
+            for stem in members:
+                automaton._verb_bit[stem] = bit
+
+        automaton._num_classes = len(bits)
+        return automaton
+
+    @classmethod
+    def for_lexicon(cls, lexicon) -> "SuffixTailAutomaton":
+        """Sözlüğün paylaşılan otomatı; sözlük yeniden yüklendiyse yeniden kurulur."""
+        with _SHARED_LOCK:
+            cached = _SHARED.get(lexicon)
+            if cached is None or cached[0] != lexicon.generation:
+                cached = (lexicon.generation, cls.build(lexicon))
+                _SHARED[lexicon] = cached
+            return cached[1]
+
+    def _class_bit(self, bits: dict, tails: frozenset) -> int:
+        """Kuyruk kümesinin biti; yeni kümenin kuyrukları otomata yazılır."""
+        bit = bits.get(tails)
+        if bit is None:
+            bit = 1 << len(bits)
+            bits[tails] = bit
+            for tail in tails:
+                self._add(tail, bit)
+        return bit
+
+    def _add(self, tail: str, bit: int) -> None:
+        delta = self._delta
+        state = 0
+        for ch in tail:
+            code = (state << 21) | ord(ch)
+            nxt = delta.get(code)
+            if nxt is None:
+                nxt = self._num_states
+                self._num_states += 1
+                delta[code] = nxt
+            state = nxt
+        self._accept[state] = self._accept.get(state, 0) | bit
+
+    def _accepts(self, tail: str, bit: int) -> bool:
+        delta = self._delta
+        state = 0
+        for ch in tail:
+            state = delta.get((state << 21) | ord(ch))
+            if state is None:
+                return False
+        return bool(self._accept.get(state, 0) & bit)
+
+    def noun_possible(self, stem: str, word_key: str) -> bool:
+        """
+        Kökün herhangi bir isim çekimi bu kelimeyi üretebilir mi.
+
+        Args:
+            stem: Kök adayı (sözlük anahtarı)
+            word_key: Kelimenin rounding_key() anahtarı
+        """
+        bit = self._noun_bit.get(stem)
+        if bit is None:
+            return True
+        return self._accepts(tail_of(rounding_key(stem), word_key), bit)
+
+    def verb_possible(self, stem: str, word_key: str) -> bool:
+        """
+        Kökün herhangi bir fiil çekimi (zamirsiz kısmı) bu kelimeyi üretebilir mi.
+
+        Args:
+            stem: Kök adayı (sözlük anahtarı)
+            word_key: Tek kelimelik fiil formunun rounding_key() anahtarı
+        """
+        bit = self._verb_bit.get(stem)
+        if bit is None:
+            return True
+        return (self._accepts(tail_of(rounding_key(stem), word_key), bit)
+                or self._accepts(DETACHED + word_key, bit))
+
+    def __len__(self) -> int:
+        return self._num_states
+
+    def __repr__(self) -> str:
+        return (f"SuffixTailAutomaton(states={self._num_states}, "
+                f"classes={self._num_classes}, stems={len(self._noun_bit)})")
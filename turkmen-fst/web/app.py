@@ -16,7 +16,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from flask import Flask, render_template, request
 from turkmen_fst.generator import MorphologicalGenerator
 from turkmen_fst.analyzer import MorphologicalAnalyzer
-from turkmen_fst.lexicon import Lexicon
+from turkmen_fst.paradigm import ParadigmCache
+from turkmen_fst.preload import shared_lexicon
 
 
 # ==============================================================================
@@ -25,19 +26,12 @@ from turkmen_fst.lexicon import Lexicon
 
 app = Flask(__name__)
 
-# Sözlük yükleme
-_lexicon = Lexicon()
-_data_paths = [
-    os.path.join(os.path.dirname(__file__), "..", "data", "turkmence_sozluk.txt"),
-    os.path.join(os.path.dirname(__file__), "..", "..", "turkmence_sozluk.txt"),
-]
-for p in _data_paths:
-    if os.path.exists(p):
-        _lexicon.load(os.path.realpath(p))
-        break
+# Sözlük yükleme (süreç başına tek sözlük; bkz. preload.py)
+_lexicon = shared_lexicon()
 
 _generator = MorphologicalGenerator(_lexicon)
 _analyzer = MorphologicalAnalyzer(_lexicon)
+_paradigms = ParadigmCache(_generator)
 
 
 # ==============================================================================
@@ -192,13 +186,13 @@ def _build_paradigma(stem, ptype):
         cases = [None, "A2", "A3", "A4", "A5", "A6"]
         poss_codes = [None, "A1", "A2", "A3"]
 
+        table = _paradigms.noun(stem)
+
         def gen_row(plural, case):
             code, name = CASE_NAMES[case]
             row = {"code": code, "name": name, "forms": []}
             for poss in poss_codes:
-                r = _generator.generate_noun(stem, plural=plural,
-                                              possessive=poss, case=case)
-                row["forms"].append(r.word if r.is_valid else "—")
+                row["forms"].append(table.form(plural, poss, case) or "—")
             return row
 
         return {
@@ -211,16 +205,15 @@ def _build_paradigma(stem, ptype):
 
     elif ptype == "verb":
         persons = ["A1", "A2", "A3", "B1", "B2", "B3"]
+        table = _paradigms.verb(stem)
         tenses = []
         for t_code in ["1", "2", "3", "4", "5", "6", "7"]:
             rows = []
             for p_code in persons:
-                pos_r = _generator.generate_verb(stem, t_code, p_code, negative=False)
-                neg_r = _generator.generate_verb(stem, t_code, p_code, negative=True)
                 rows.append({
                     "person": PERSON_NAMES[p_code],
-                    "positive": pos_r.word if pos_r.is_valid else "—",
-                    "negative": neg_r.word if neg_r.is_valid else "—",
+                    "positive": table.form(t_code, p_code, False) or "—",
+                    "negative": table.form(t_code, p_code, True) or "—",
                 })
             tenses.append({
                 "code": t_code,